@@ -66,6 +66,11 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = "your-super-secret-jwt-key-here"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRES_IN_DAYS: int = 30
+    JWT_PUBLIC_KEY: str = ""              # RS256 사용 시 PEM 문자열 또는 파일 경로
+    JWT_LOCAL_VERIFY: bool = False        # True 면 로컬 검증 (auth-service 와 같은 시크릿 / 공개키 필요)
+    JWT_LEEWAY_SECONDS: int = 0
+    JWT_CACHE_MAX_ENTRIES: int = 10000
+    JWT_CACHE_TTL_SECONDS: float = 300.0
     
     # 로깅 설정
     LOG_LEVEL: str = "INFO"
@@ -73,7 +78,40 @@ class Settings(BaseSettings):
     # 요청 설정
     REQUEST_TIMEOUT: int = 30
     HEALTH_CHECK_INTERVAL: int = 30
-    
+    HEALTH_CHECK_ENABLED: bool = True
+    HEALTH_CHECK_TIMEOUT: float = 5.0
+    HEALTH_CHECK_UNHEALTHY_THRESHOLD: int = 2
+
+    # 서킷 브레이커 설정 (인스턴스 단위)
+    CIRCUIT_FAILURE_THRESHOLD: int = 5        # 연속 실패 횟수
+    CIRCUIT_RECOVERY_TIMEOUT: float = 30.0    # OPEN 유지 시간(초)
+    CIRCUIT_LATENCY_THRESHOLD: float = 20.0   # 이 시간(초)을 넘는 응답은 실패로 간주
+    CIRCUIT_HALF_OPEN_TIMEOUT: float = 30.0   # HALF_OPEN 시험 요청 결과를 기다리는 최대 시간(초)
+
+    # 업스트림 커넥션 풀 설정
+    UPSTREAM_MAX_CONNECTIONS: int = 100
+    UPSTREAM_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    UPSTREAM_KEEPALIVE_EXPIRY: float = 30.0
+    UPSTREAM_CONNECT_TIMEOUT: float = 5.0
+    UPSTREAM_HTTP2: bool = False
+
+    # 응답 캐시 설정 (읽기 위주 TCFD 엔드포인트)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    GATEWAY_ADMIN_TOKEN: str = ""         # 캐시 무효화 등 관리 API 용 (X-ADMIN-TOKEN)
+
+    # 동일 업스트림 GET 요청 병합 (single-flight)
+    SINGLE_FLIGHT_ENABLED: bool = True
+
+    # 배치 API (POST /api/v1/batch)
+    BATCH_MAX_REQUESTS: int = 20      # 배치당 최대 하위 요청 수
+    BATCH_MAX_CONCURRENCY: int = 6    # 배치당 동시 업스트림 요청 수
+
+    # 무거운 라우트(LLM 생성, 보고서 렌더링) 테넌트 단위 입장 제어
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_LIMITS_FILE: str = ""        # 라우트 클래스별 한도 JSON (변경 시 자동 재로딩)
+    ADMISSION_RELOAD_INTERVAL: float = 5.0
+
     # CORS 설정
     CORS_ORIGINS: List[str] = [
         "http://localhost:3000",
@@ -112,7 +150,49 @@ class Settings(BaseSettings):
         if isinstance(v, str):
             return parse_bool(v)
         return v
-    
+
+    @field_validator('HEALTH_CHECK_ENABLED', mode='before')
+    @classmethod
+    def validate_health_check_enabled(cls, v):
+        if isinstance(v, str):
+            return parse_bool(v)
+        return v
+
+    @field_validator('JWT_LOCAL_VERIFY', mode='before')
+    @classmethod
+    def validate_jwt_local_verify(cls, v):
+        if isinstance(v, str):
+            return parse_bool(v)
+        return v
+
+    @field_validator('UPSTREAM_HTTP2', mode='before')
+    @classmethod
+    def validate_upstream_http2(cls, v):
+        if isinstance(v, str):
+            return parse_bool(v)
+        return v
+
+    @field_validator('RESPONSE_CACHE_ENABLED', mode='before')
+    @classmethod
+    def validate_response_cache_enabled(cls, v):
+        if isinstance(v, str):
+            return parse_bool(v)
+        return v
+
+    @field_validator('SINGLE_FLIGHT_ENABLED', mode='before')
+    @classmethod
+    def validate_single_flight_enabled(cls, v):
+        if isinstance(v, str):
+            return parse_bool(v)
+        return v
+
+    @field_validator('ADMISSION_ENABLED', mode='before')
+    @classmethod
+    def validate_admission_enabled(cls, v):
+        if isinstance(v, str):
+            return parse_bool(v)
+        return v
+
     class Config:
         env_file = ".env"
         extra = "ignore"  # 추가 환경변수 무시 
\ No newline at end of file
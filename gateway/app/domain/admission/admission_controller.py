@@ -0,0 +1,258 @@
+"""
+테넌트 단위 입장 제어 (admission control)
+- LLM 생성 / 보고서 렌더링처럼 업스트림을 오래 점유하는 라우트 보호
+- 라우트 클래스별 한도: 토큰 버킷(요청률) + 동시 실행 수(테넌트 / 사용자 / 전체)
+- 한도 초과 시 대기열에 쌓지 않고 즉시 거절 (테넌트 한도 429, 전체 한도 503, Retry-After 포함)
+- 한도는 JSON 파일(mtime 감시) 또는 관리 API 로 무중단 변경
+"""
+import json
+import logging
+import math
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RouteClassLimits:
+    """라우트 클래스별 한도"""
+
+    rate_per_minute: float = 12.0        # 테넌트당 분당 허용 요청 수 (토큰 충전 속도)
+    burst: int = 5                       # 토큰 버킷 크기
+    max_concurrent_per_tenant: int = 3
+    max_concurrent_per_user: int = 2
+    max_concurrent_total: int = 16       # 라우트 클래스 전체 동시 실행 수
+    retry_after_seconds: int = 5         # 동시 실행 한도 초과 시 안내할 재시도 간격
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RouteClassLimits":
+        fields = cls.__dataclass_fields__
+        return cls(**{key: value for key, value in data.items() if key in fields})
+
+
+DEFAULT_LIMITS: Dict[str, RouteClassLimits] = {
+    # LLM 보고서 생성 (최대 60초 점유)
+    "llm": RouteClassLimits(rate_per_minute=12, burst=5, max_concurrent_per_tenant=3,
+                            max_concurrent_per_user=2, max_concurrent_total=16, retry_after_seconds=10),
+    # 보고서 초안 저장 / Word·PDF 렌더링 (WeasyPrint)
+    "report": RouteClassLimits(rate_per_minute=30, burst=10, max_concurrent_per_tenant=4,
+                               max_concurrent_per_user=2, max_concurrent_total=24, retry_after_seconds=5),
+}
+
+
+class AdmissionRejected(Exception):
+    """입장 거절 (status_code: 429 테넌트 한도 / 503 전체 한도)"""
+
+    def __init__(self, status_code: int, retry_after: int, reason: str):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class TokenBucket:
+    """초당 rate 만큼 충전되는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_acquire(self) -> Tuple[bool, float]:
+        """토큰 1개 사용 시도 → (성공 여부, 다음 토큰까지 남은 초)"""
+        now = time.monotonic()
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True, 0.0
+        if self.rate <= 0:
+            return False, 60.0
+        return False, (1 - self.tokens) / self.rate
+
+    def is_idle(self, now: float) -> bool:
+        """가득 찬 상태로 방치된 버킷 (정리 대상)"""
+        self._refill(now)
+        return self.tokens >= self.burst
+
+
+class AdmissionTicket:
+    """입장 허가 (release 는 여러 번 호출해도 한 번만 반영)"""
+
+    def __init__(self, controller: "AdmissionController", route_class: str, tenant: str, user: str):
+        self.controller = controller
+        self.route_class = route_class
+        self.tenant = tenant
+        self.user = user
+        self._released = False
+
+    def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        self.controller._release(self)
+
+
+class AdmissionController:
+    """라우트 클래스 × 테넌트 단위 토큰 버킷 + 동시 실행 제한"""
+
+    PRUNE_INTERVAL_SECONDS = 60.0
+
+    def __init__(self, limits: Optional[Dict[str, RouteClassLimits]] = None,
+                 limits_file: Optional[str] = None, reload_interval: float = 5.0):
+        self.limits: Dict[str, RouteClassLimits] = dict(limits or DEFAULT_LIMITS)
+        self.limits_file = limits_file or None
+        self.reload_interval = reload_interval
+        self._file_mtime = 0.0
+        self._next_reload_check = 0.0
+        self._next_prune = time.monotonic() + self.PRUNE_INTERVAL_SECONDS
+
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._tenant_active: Dict[Tuple[str, str], int] = {}
+        self._user_active: Dict[Tuple[str, str], int] = {}
+        self._class_active: Dict[str, int] = {}
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {"rate": 0, "tenant": 0, "user": 0, "total": 0}
+
+        self.maybe_reload(force=True)
+
+    @classmethod
+    def from_settings(cls, settings) -> "AdmissionController":
+        if settings is None:
+            return cls()
+        return cls(limits_file=settings.ADMISSION_LIMITS_FILE,
+                   reload_interval=settings.ADMISSION_RELOAD_INTERVAL)
+
+    # ------------------------------------------------------------------
+    # 입장 / 반환
+    # ------------------------------------------------------------------
+
+    def acquire(self, route_class: str, tenant: str, user: str) -> AdmissionTicket:
+        """한도 내면 AdmissionTicket 반환, 초과 시 AdmissionRejected"""
+        self.maybe_reload()
+        self._maybe_prune()
+
+        limits = self.limits.get(route_class)
+        if limits is None:
+            logger.warning(f"Unknown admission class '{route_class}', admitting without limits")
+            return AdmissionTicket(self, route_class, tenant, user)
+
+        class_active = self._class_active.get(route_class, 0)
+        tenant_key, user_key = (route_class, tenant), (route_class, user)
+        if class_active >= limits.max_concurrent_total:
+            self.rejected["total"] += 1
+            raise AdmissionRejected(503, limits.retry_after_seconds, "요청이 많아 잠시 후 다시 시도해주세요")
+        if self._tenant_active.get(tenant_key, 0) >= limits.max_concurrent_per_tenant:
+            self.rejected["tenant"] += 1
+            raise AdmissionRejected(429, limits.retry_after_seconds, "회사별 동시 요청 한도를 초과했습니다")
+        if self._user_active.get(user_key, 0) >= limits.max_concurrent_per_user:
+            self.rejected["user"] += 1
+            raise AdmissionRejected(429, limits.retry_after_seconds, "사용자별 동시 요청 한도를 초과했습니다")
+
+        bucket = self._bucket(route_class, tenant, limits)
+        allowed, wait_seconds = bucket.try_acquire()
+        if not allowed:
+            self.rejected["rate"] += 1
+            raise AdmissionRejected(429, max(1, math.ceil(wait_seconds)), "요청 빈도 한도를 초과했습니다")
+
+        self._class_active[route_class] = class_active + 1
+        self._tenant_active[tenant_key] = self._tenant_active.get(tenant_key, 0) + 1
+        self._user_active[user_key] = self._user_active.get(user_key, 0) + 1
+        self.admitted += 1
+        return AdmissionTicket(self, route_class, tenant, user)
+
+    def _release(self, ticket: AdmissionTicket) -> None:
+        if ticket.route_class not in self._class_active:
+            return
+        self._decrement(self._class_active, ticket.route_class)
+        self._decrement(self._tenant_active, (ticket.route_class, ticket.tenant))
+        self._decrement(self._user_active, (ticket.route_class, ticket.user))
+
+    @staticmethod
+    def _decrement(counter: Dict[Any, int], key: Any) -> None:
+        remaining = counter.get(key, 0) - 1
+        if remaining > 0:
+            counter[key] = remaining
+        else:
+            counter.pop(key, None)
+
+    def _bucket(self, route_class: str, tenant: str, limits: RouteClassLimits) -> TokenBucket:
+        key = (route_class, tenant)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(limits.rate_per_minute / 60.0, limits.burst)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _maybe_prune(self) -> None:
+        now = time.monotonic()
+        if now < self._next_prune:
+            return
+        self._next_prune = now + self.PRUNE_INTERVAL_SECONDS
+        idle = [key for key, bucket in self._buckets.items() if bucket.is_idle(now)]
+        for key in idle:
+            del self._buckets[key]
+
+    # ------------------------------------------------------------------
+    # 한도 변경 (무중단)
+    # ------------------------------------------------------------------
+
+    def update_limits(self, limits: Dict[str, RouteClassLimits]) -> None:
+        """한도 교체 (기존 버킷은 새 충전 속도/크기로 즉시 조정, 진행 중 요청은 유지)"""
+        self.limits = dict(limits)
+        for (route_class, _), bucket in self._buckets.items():
+            class_limits = self.limits.get(route_class)
+            if class_limits is not None:
+                bucket.rate = class_limits.rate_per_minute / 60.0
+                bucket.burst = class_limits.burst
+                bucket.tokens = min(bucket.tokens, bucket.burst)
+        logger.info(f"Admission limits updated: {sorted(self.limits)}")
+
+    def maybe_reload(self, force: bool = False) -> bool:
+        """limits_file 이 바뀌었으면 다시 읽음 (reload_interval 마다 mtime 확인)"""
+        if not self.limits_file:
+            return False
+        now = time.monotonic()
+        if not force and now < self._next_reload_check:
+            return False
+        self._next_reload_check = now + self.reload_interval
+
+        try:
+            mtime = os.path.getmtime(self.limits_file)
+            if not force and mtime == self._file_mtime:
+                return False
+            with open(self.limits_file, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            # 파일에 없는 항목은 기본 한도 유지
+            limits = {
+                name: RouteClassLimits.from_dict({**asdict(DEFAULT_LIMITS.get(name, RouteClassLimits())), **value})
+                for name, value in raw.items()
+            }
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Failed to load admission limits from {self.limits_file}: {e}")
+            return False
+
+        self._file_mtime = mtime
+        self.update_limits({**DEFAULT_LIMITS, **limits})
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limits": {name: asdict(limits) for name, limits in self.limits.items()},
+            "limits_file": self.limits_file,
+            "active": dict(self._class_active),
+            "active_tenants": {
+                f"{route_class}:{tenant}": count
+                for (route_class, tenant), count in self._tenant_active.items()
+            },
+            "buckets": len(self._buckets),
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+        }
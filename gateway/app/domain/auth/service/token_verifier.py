@@ -0,0 +1,227 @@
+"""
+Gateway 로컬 JWT 검증
+- auth-service jwt_utils.create_token 과 동일한 클레임(user_id, email, name, company_id, exp) 검증
+- HS256(공유 시크릿) / RS256(공개키) 지원
+- 검증 결과는 토큰 해시 기준 LRU + TTL 캐시에 보관 (exp 이후에는 절대 재사용하지 않음)
+- 로컬 검증이 불가능할 때만 auth-service 원격 검증으로 폴백
+"""
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import jwt
+    JWT_AVAILABLE = True
+except ImportError:
+    jwt = None
+    JWT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+USER_CLAIMS = ("user_id", "email", "name", "company_id")
+
+# 예시 설정 파일에 공개된 시크릿 (이 값으로는 누구나 토큰을 만들 수 있으므로 로컬 검증에 사용하지 않음)
+PLACEHOLDER_SECRETS = frozenset({
+    "your-super-secret-jwt-key-here",
+    "your-secret-key-here",
+})
+
+
+class TokenExpiredError(Exception):
+    """토큰 만료 (원격 검증으로 폴백하지 않음)"""
+
+
+class TokenCache:
+    """토큰 해시 → 사용자 정보 LRU + TTL 캐시"""
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        key = self.key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        user_info, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return user_info
+
+    def put(self, token: str, user_info: Dict[str, Any], exp: Optional[float] = None) -> None:
+        """exp(토큰 만료 시각)와 TTL 중 빠른 시점까지 보관"""
+        expires_at = time.time() + self.ttl_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= time.time():
+            return
+
+        key = self.key(token)
+        self._entries[key] = (user_info, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class TokenVerifier:
+    """로컬 JWT 검증기 (캐시 포함)"""
+
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = "HS256",
+        public_key: Optional[str] = None,
+        enabled: bool = False,
+        leeway_seconds: int = 0,
+        cache: Optional[TokenCache] = None,
+    ):
+        self.algorithm = algorithm.upper()
+        self.leeway_seconds = leeway_seconds
+        self.cache = cache or TokenCache()
+        self.verification_key = public_key if self.algorithm.startswith("RS") else secret_key
+        placeholder = not self.algorithm.startswith("RS") and (secret_key or "").strip() in PLACEHOLDER_SECRETS
+        self.enabled = enabled and JWT_AVAILABLE and bool(self.verification_key) and not placeholder
+        self.local_verified = 0
+        self.local_rejected = 0
+        self.remote_fallbacks = 0
+
+        if enabled and not JWT_AVAILABLE:
+            logger.warning("⚠️ PyJWT 미설치 - auth-service 원격 검증만 사용")
+        elif enabled and not self.verification_key:
+            logger.error(f"❌ {self.algorithm} 검증 키가 없어 로컬 검증 비활성화 - auth-service 원격 검증만 사용")
+        elif enabled and placeholder:
+            logger.error("❌ JWT_SECRET_KEY 가 예시 값 그대로라 로컬 검증 비활성화 - auth-service 원격 검증만 사용")
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "TokenVerifier":
+        """Settings 로부터 생성 (settings 가 없으면 환경변수 기본값)"""
+        if settings is None:
+            return cls(
+                secret_key=os.getenv("JWT_SECRET_KEY", ""),
+                enabled=os.getenv("JWT_LOCAL_VERIFY", "false").lower() == "true",
+            )
+        return cls(
+            secret_key=settings.JWT_SECRET_KEY,
+            algorithm=settings.JWT_ALGORITHM,
+            public_key=_load_public_key(settings.JWT_PUBLIC_KEY),
+            enabled=settings.JWT_LOCAL_VERIFY,
+            leeway_seconds=settings.JWT_LEEWAY_SECONDS,
+            cache=TokenCache(
+                max_entries=settings.JWT_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.JWT_CACHE_TTL_SECONDS,
+            ),
+        )
+
+    def verify(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        토큰 검증 후 auth-service /verify 와 동일한 형태의 응답 반환
+        - 캐시 히트 / 로컬 검증 성공: 검증 결과 dict
+        - 만료: TokenExpiredError
+        - 로컬 검증 불가(키 없음, 서명 불일치 등): None → 원격 검증으로 폴백
+        """
+        user_info = self.cache.get(token)
+        if user_info is not None:
+            return self._result(user_info, "cache")
+
+        if not self.enabled:
+            return None
+
+        try:
+            payload = jwt.decode(
+                token,
+                self.verification_key,
+                algorithms=[self.algorithm],
+                leeway=self.leeway_seconds,
+                options={"require": ["exp"]},
+            )
+        except jwt.ExpiredSignatureError:
+            self.local_rejected += 1
+            raise TokenExpiredError("토큰이 만료되었습니다")
+        except jwt.InvalidTokenError as e:
+            logger.warning(f"⚠️ 로컬 토큰 검증 실패 - 원격 검증으로 폴백: {str(e)}")
+            return None
+
+        user_info = {claim: payload.get(claim) for claim in USER_CLAIMS}
+        self.cache.put(token, user_info, payload.get("exp"))
+        self.local_verified += 1
+        return self._result(user_info, "local")
+
+    def remember_remote(self, token: str, verify_response: Dict[str, Any]) -> None:
+        """원격 검증 결과 캐시 (exp 는 서명 검증 없이 클레임에서만 읽음)"""
+        self.remote_fallbacks += 1
+        user_info = verify_response.get("user_info")
+        if not verify_response.get("valid", True) or not user_info or not JWT_AVAILABLE:
+            return
+        try:
+            exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+        except jwt.InvalidTokenError:
+            return
+        if exp is not None:
+            self.cache.put(token, user_info, exp)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "local_verification_enabled": self.enabled,
+            "algorithm": self.algorithm,
+            "local_verified": self.local_verified,
+            "local_rejected": self.local_rejected,
+            "remote_fallbacks": self.remote_fallbacks,
+            "cache": self.cache.stats(),
+        }
+
+    @staticmethod
+    def _result(user_info: Dict[str, Any], source: str) -> Dict[str, Any]:
+        return {
+            "valid": True,
+            "user_info": user_info,
+            "message": "토큰이 유효합니다",
+            "source": source,
+        }
+
+
+def _load_public_key(value: str) -> Optional[str]:
+    """PEM 문자열 또는 PEM 파일 경로에서 RS256 공개키 로드"""
+    if not value:
+        return None
+    if value.strip().startswith("-----BEGIN"):
+        return value.replace("\\n", "\n")
+    try:
+        with open(value, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError as e:
+        logger.error(f"❌ JWT 공개키 로드 실패: {str(e)}")
+        return None
@@ -0,0 +1,137 @@
+"""
+게이트웨이 응답 캐시
+- 읽기 위주 엔드포인트(표준, 행정구역, 회사 목록 등)의 업스트림 응답 보관
+- 키: 메서드 + 경로 + 업스트림 쿼리(사용자 파라미터 주입 후, 정렬·URL 인코딩) + 테넌트(company_id)
+- 라우트별 TTL, 전체 메모리 예산(bytes) 기준 LRU 제거
+- 본문 SHA-256 기반 강한 ETag 생성 (If-None-Match → 304)
+"""
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 업스트림 응답"""
+
+    status_code: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    etag: str
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers)
+
+
+def make_etag(body: bytes) -> str:
+    """본문 기반 강한 ETag"""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더 비교 (여러 값 / * / W/ 접두어 허용)"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+class ResponseCache:
+    """메모리 예산 기반 LRU + TTL 응답 캐시"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_entry_ratio: float = 0.1):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = int(max_bytes * max_entry_ratio)
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+
+    @staticmethod
+    def build_key(method: str, path: str, params: Iterable[Tuple[str, str]], tenant: str) -> str:
+        """
+        params 는 업스트림으로 보내는 쿼리 (주입된 company_id 등 포함)
+
+        정렬하여 순서 차이를 무시하고, 값의 & / = 가 다른 파라미터와 섞이지 않도록 URL 인코딩
+        """
+        query = urlencode(sorted(params))
+        return f"{method} {path}?{query}|{tenant}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.time():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, status_code: int, headers: List[Tuple[bytes, bytes]],
+            body: bytes, ttl: float) -> Optional[CachedResponse]:
+        entry = CachedResponse(
+            status_code=status_code,
+            headers=headers,
+            body=body,
+            etag=make_etag(body),
+            expires_at=time.time() + ttl,
+        )
+        if entry.size > self.max_entry_bytes:
+            logger.debug(f"응답이 캐시 항목 한도를 초과하여 저장하지 않음: {key} ({entry.size}B)")
+            return entry
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self.current_bytes += entry.size
+        while self.current_bytes > self.max_bytes and self._entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+        return entry
+
+    def purge(self, prefix: Optional[str] = None) -> int:
+        """prefix 로 시작하는 경로(예: /api/v1/tcfd/standards) 항목 삭제, 없으면 전체 삭제"""
+        if not prefix:
+            removed = len(self._entries)
+            self._entries.clear()
+            self.current_bytes = 0
+            return removed
+
+        keys = [key for key in self._entries if key.split(" ", 1)[1].startswith(prefix)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry.size
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,105 @@
+"""
+인스턴스 단위 서킷 브레이커
+- CLOSED: 정상 통과, 연속 실패(또는 지연 임계 초과)가 임계치에 도달하면 OPEN
+- OPEN: 요청 차단, recovery_timeout 경과 후 HALF_OPEN
+- HALF_OPEN: 제한된 시험 요청만 통과, 성공 시 CLOSED / 실패 시 다시 OPEN
+  결과가 보고되지 않은 시험 요청은 half_open_timeout 후 슬롯을 회수하여 다음 시험 요청 허용
+"""
+import time
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """연속 실패 / 지연 임계 기반 서킷 브레이커"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        latency_threshold: Optional[float] = None,
+        half_open_max_calls: int = 1,
+        half_open_timeout: float = 30.0,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.latency_threshold = latency_threshold
+        self.half_open_max_calls = half_open_max_calls
+        self.half_open_timeout = half_open_timeout
+
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+        self.half_open_started_at = 0.0
+        self.total_failures = 0
+        self.total_successes = 0
+        self.trips = 0
+
+    def allow_request(self) -> bool:
+        """요청 통과 여부 (OPEN 상태는 복구 대기시간 경과 시 HALF_OPEN 으로 전환)"""
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                return False
+            self._half_open()
+        if (self.half_open_calls >= self.half_open_max_calls
+                and time.monotonic() - self.half_open_started_at >= self.half_open_timeout):
+            # 결과를 보고하지 않는 호출자의 시험 요청 때문에 HALF_OPEN 에 갇히지 않도록 슬롯 회수
+            self.half_open_calls = 0
+        return self.half_open_calls < self.half_open_max_calls
+
+    def on_request(self) -> None:
+        """요청 시작 기록 (HALF_OPEN 시험 요청 수 제한용)"""
+        if self.state == CircuitState.HALF_OPEN:
+            self.half_open_calls += 1
+            self.half_open_started_at = time.monotonic()
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        """성공 기록 (지연 임계 초과 시 실패로 간주)"""
+        if self.latency_threshold is not None and latency is not None and latency > self.latency_threshold:
+            self.record_failure()
+            return
+        self.total_successes += 1
+        self.consecutive_failures = 0
+        if self.state != CircuitState.CLOSED:
+            self.state = CircuitState.CLOSED
+            self.half_open_calls = 0
+
+    def record_failure(self) -> None:
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        if self.state == CircuitState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def probe_succeeded(self) -> None:
+        """능동 헬스 체크 성공 시 OPEN 대기를 건너뛰고 시험 요청 허용"""
+        if self.state == CircuitState.OPEN:
+            self._half_open()
+
+    def _open(self) -> None:
+        if self.state != CircuitState.OPEN:
+            self.trips += 1
+        self.state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        self.half_open_calls = 0
+
+    def _half_open(self) -> None:
+        self.state = CircuitState.HALF_OPEN
+        self.half_open_calls = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "total_failures": self.total_failures,
+            "total_successes": self.total_successes,
+            "trips": self.trips,
+        }
@@ -0,0 +1,154 @@
+"""
+업스트림 HTTP 클라이언트 풀
+- 업스트림 서비스별로 장기 유지되는 httpx.AsyncClient 관리 (keep-alive 재사용)
+- 커넥션 수 제한 / keep-alive 만료 / 선택적 HTTP/2
+- 라우트별 타임아웃은 세션 단위로 지정
+"""
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    """HTTP/2 사용에 필요한 h2 패키지 설치 여부"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class RouteClient:
+    """풀 클라이언트를 감싸 라우트 기본 타임아웃을 적용하는 얇은 래퍼"""
+
+    def __init__(self, client: httpx.AsyncClient, timeout: Optional[float] = None):
+        self._client = client
+        self.timeout = timeout
+
+    def _with_timeout(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        return kwargs
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        return await self._client.request(method, url, **self._with_timeout(kwargs))
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    def stream(self, method: str, url: str, **kwargs):
+        return self._client.stream(method, url, **self._with_timeout(kwargs))
+
+
+class HttpClientPool:
+    """업스트림 서비스별 httpx.AsyncClient 풀"""
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 5.0,
+        default_timeout: float = 30.0,
+        http2: bool = False,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.connect_timeout = connect_timeout
+        self.default_timeout = default_timeout
+        self.http2 = http2 and _http2_available()
+        if http2 and not self.http2:
+            logger.warning("⚠️ h2 패키지가 없어 HTTP/1.1로 동작합니다 (pip install httpx[http2])")
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._closed = False
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "HttpClientPool":
+        """Settings 객체로부터 풀 생성 (settings가 없으면 기본값)"""
+        if settings is None:
+            return cls()
+        return cls(
+            max_connections=settings.UPSTREAM_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.UPSTREAM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.UPSTREAM_KEEPALIVE_EXPIRY,
+            connect_timeout=settings.UPSTREAM_CONNECT_TIMEOUT,
+            default_timeout=float(settings.REQUEST_TIMEOUT),
+            http2=settings.UPSTREAM_HTTP2,
+        )
+
+    def get_client(self, service_name: str) -> httpx.AsyncClient:
+        """서비스 전용 클라이언트 반환 (최초 호출 시 생성)"""
+        client = self._clients.get(service_name)
+        if client is None or client.is_closed:
+            if self._closed:
+                raise RuntimeError("HttpClientPool is closed")
+            client = httpx.AsyncClient(
+                limits=self.limits,
+                timeout=httpx.Timeout(self.default_timeout, connect=self.connect_timeout),
+                http2=self.http2,
+            )
+            self._clients[service_name] = client
+            logger.info(f"🔌 {service_name} 업스트림 클라이언트 생성 (http2={self.http2})")
+        return client
+
+    @asynccontextmanager
+    async def session(self, service_name: str, timeout: Optional[float] = None) -> AsyncIterator[RouteClient]:
+        """
+        `async with httpx.AsyncClient(...) as client:` 대체용 컨텍스트
+        - 종료 시 클라이언트를 닫지 않고 풀에 그대로 유지
+        """
+        yield RouteClient(self.get_client(service_name), timeout)
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """서비스별 커넥션 사용 현황 (active / idle / max) - 풀 포화도 메트릭용"""
+        stats: Dict[str, Dict[str, int]] = {}
+        for service_name, client in self._clients.items():
+            # httpx 는 풀 상태를 공개하지 않으므로 httpcore 커넥션 풀을 직접 조회
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            connections = list(getattr(pool, "connections", []) or [])
+            idle = sum(1 for connection in connections if connection.is_idle())
+            stats[service_name] = {
+                "active": len(connections) - idle,
+                "idle": idle,
+                "max": self.limits.max_connections or 0,
+            }
+        return stats
+
+    async def aclose(self) -> None:
+        """모든 클라이언트 종료 (lifespan 종료 시 호출)"""
+        self._closed = True
+        for service_name, client in list(self._clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"⚠️ {service_name} 클라이언트 종료 실패: {str(e)}")
+        self._clients.clear()
+        logger.info("🔌 업스트림 클라이언트 풀 종료")
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태 (서비스별 클라이언트 존재 여부)"""
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "clients": {name: not client.is_closed for name, client in self._clients.items()},
+        }
@@ -1,17 +1,28 @@
 import httpx
 import asyncio
 import logging
+import math
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+import os
 import random
 import time
 
+from app.domain.discovery.http_client_pool import HttpClientPool
+from app.domain.discovery.circuit_breaker import CircuitBreaker, CircuitState
+
 logger = logging.getLogger(__name__)
 
 class ServiceInstance:
     """서비스 인스턴스 정보"""
     
-    def __init__(self, host: str, port: int, weight: int = 1, metadata: Dict = None):
+    # 지연 EWMA 설정 (least_latency 로드 밸런서용)
+    EWMA_ALPHA = 0.3                # 새 관측값 가중치
+    EWMA_DECAY_SECONDS = 10.0       # 관측이 없으면 이 시간 상수로 감쇠 → 느렸던 인스턴스도 다시 시도됨
+    FAILURE_LATENCY_PENALTY = 5.0   # 실패한 요청을 지연(초)으로 환산한 값
+    
+    def __init__(self, host: str, port: int, weight: int = 1, metadata: Dict = None,
+                 circuit_breaker: CircuitBreaker = None):
         self.host = host
         self.port = port
         self.weight = weight
@@ -20,11 +31,55 @@ class ServiceInstance:
         self.last_health_check = datetime.now()
         self.connection_count = 0
         self.response_time = 0.0
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        # 능동 헬스 체크 상태 (연속 실패 수 / 다음 체크 시각)
+        self.probe_failures = 0
+        self.next_probe_at = 0.0
+        # 실제 요청 지연 EWMA (초)
+        self.ewma_latency: Optional[float] = None
+        self.ewma_updated_at = 0.0
+    
+    def record_latency(self, latency: float) -> None:
+        """요청 지연 관측값 반영 (peak-EWMA: 느려지면 즉시 반영, 빨라지면 서서히 반영)"""
+        current = self.latency_score()
+        if self.ewma_latency is None or latency > current:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency = self.EWMA_ALPHA * latency + (1 - self.EWMA_ALPHA) * current
+        self.ewma_updated_at = time.monotonic()
+    
+    def latency_score(self) -> float:
+        """시간 감쇠가 적용된 현재 EWMA (관측 전에는 0 → 우선 시도)"""
+        if self.ewma_latency is None:
+            return 0.0
+        elapsed = time.monotonic() - self.ewma_updated_at
+        return self.ewma_latency * math.exp(-elapsed / self.EWMA_DECAY_SECONDS)
+    
+    def load_score(self) -> float:
+        """EWMA × (진행 중 요청 + 1)"""
+        return self.latency_score() * (self.connection_count + 1)
+    
+    def is_available(self) -> bool:
+        """헬스 체크 통과 + 서킷이 요청을 허용하는 경우에만 선택 대상"""
+        return self.health and self.circuit_breaker.allow_request()
     
     @property
     def url(self) -> str:
         return f"http://{self.host}:{self.port}"
     
+    @property
+    def base_url(self) -> str:
+        """실제 요청용 베이스 URL (Railway https 도메인은 포트 생략)"""
+        host = self.host.rstrip("/")
+        if not host.startswith(("http://", "https://")):
+            if os.getenv("RAILWAY_ENVIRONMENT") in ["true", "production"]:
+                host = f"https://{host}"
+            else:
+                host = f"http://{host}"
+        if host.startswith("https://") or not self.port:
+            return host
+        return f"{host}:{self.port}"
+    
     def to_dict(self) -> Dict:
         return {
             "host": self.host,
@@ -34,6 +89,8 @@ class ServiceInstance:
             "last_health_check": self.last_health_check.isoformat(),
             "connection_count": self.connection_count,
             "response_time": self.response_time,
+            "ewma_latency": round(self.latency_score(), 4),
+            "circuit": self.circuit_breaker.to_dict(),
             "metadata": self.metadata
         }
 
@@ -79,17 +136,37 @@ class LoadBalancer:
                 return instance
         return healthy_instances[0]
 
+    @staticmethod
+    def least_latency(instances: List[ServiceInstance]) -> Optional[ServiceInstance]:
+        """Power of two choices: 임의의 두 인스턴스 중 EWMA × (진행 중 요청 + 1) 이 작은 쪽 선택"""
+        healthy_instances = [inst for inst in instances if inst.health]
+        if not healthy_instances:
+            return None
+        if len(healthy_instances) == 1:
+            return healthy_instances[0]
+        first, second = random.sample(healthy_instances, 2)
+        return first if first.load_score() <= second.load_score() else second
+
 class ServiceDiscovery:
     """서비스 디스커버리 클래스"""
     
-    def __init__(self, registry: Dict[str, Any] = None):
+    def __init__(self, registry: Dict[str, Any] = None, http_pool: HttpClientPool = None,
+                 breaker_config: Dict[str, Any] = None, health_check_timeout: float = 5.0,
+                 unhealthy_threshold: int = 2):
         self.registry = registry or {}
-        self.health_check_client = httpx.AsyncClient(timeout=5.0)
+        self.http_pool = http_pool or HttpClientPool()
+        self.breaker_config = breaker_config or {}
+        self.unhealthy_threshold = unhealthy_threshold
+        self.health_check_client = httpx.AsyncClient(timeout=health_check_timeout)
+        self.health_check_interval = 30.0
+        self._health_check_task: Optional[asyncio.Task] = None
         self.load_balancers = {
             "round_robin": LoadBalancer.round_robin,
             "least_connections": LoadBalancer.least_connections,
             "random": LoadBalancer.random,
-            "weighted_round_robin": LoadBalancer.weighted_round_robin
+            "weighted_round_robin": LoadBalancer.weighted_round_robin,
+            "least_latency": LoadBalancer.least_latency,
+            "p2c": LoadBalancer.least_latency
         }
     
     def register_service(self, service_name: str, instances: List[Dict], 
@@ -100,7 +177,8 @@ class ServiceDiscovery:
                 host=instance_data["host"],
                 port=instance_data["port"],
                 weight=instance_data.get("weight", 1),
-                metadata=instance_data.get("metadata", {})
+                metadata=instance_data.get("metadata", {}),
+                circuit_breaker=CircuitBreaker(**self.breaker_config)
             )
             service_instances.append(instance)
         
@@ -125,11 +203,18 @@ class ServiceDiscovery:
             logger.warning(f"No instances available for service {service_name}")
             return None
         
+        # 헬스 체크 실패 / 서킷 OPEN 인스턴스는 즉시 제외
+        available_instances = [inst for inst in instances if inst.is_available()]
+        if not available_instances:
+            logger.warning(f"No available instances for service {service_name} (unhealthy or circuit open)")
+            return None
+        
         load_balancer = self.load_balancers.get(load_balancer_type, LoadBalancer.round_robin)
-        instance = load_balancer(instances)
+        instance = load_balancer(available_instances)
         
         if instance:
             instance.connection_count += 1
+            instance.circuit_breaker.on_request()
             logger.debug(f"Selected instance {instance.host}:{instance.port} for service {service_name}")
         
         return instance
@@ -149,26 +234,127 @@ class ServiceDiscovery:
     def release_instance(self, service_name: str, instance: ServiceInstance) -> None:
         if instance:
             instance.connection_count = max(0, instance.connection_count - 1)
+    
+    def record_result(self, service_name: str, instance: ServiceInstance,
+                      success: bool, latency: Optional[float] = None) -> None:
+        """프록시 경로의 요청 결과를 서킷 브레이커에 기록 (수동 헬스 체크)"""
+        if not instance:
+            return
+        previous_state = instance.circuit_breaker.state
+        if success:
+            instance.circuit_breaker.record_success(latency)
+        else:
+            instance.circuit_breaker.record_failure()
+        if latency is not None:
+            instance.response_time = latency
+        
+        # least_latency 로드 밸런서용 EWMA 갱신 (실패는 페널티 지연으로 반영, 지연 없는 성공은 반영하지 않음)
+        if not success:
+            instance.record_latency(max(latency or 0.0, ServiceInstance.FAILURE_LATENCY_PENALTY))
+        elif latency is not None:
+            instance.record_latency(latency)
+        
+        current_state = instance.circuit_breaker.state
+        if current_state != previous_state:
+            logger.warning(
+                f"Circuit {previous_state.value} -> {current_state.value} "
+                f"for {service_name} ({instance.host}:{instance.port})"
+            )
+    
+    def get_client(self, service_name: str) -> httpx.AsyncClient:
+        """서비스별 풀링된 httpx 클라이언트 반환"""
+        return self.http_pool.get_client(service_name)
+    
+    def http_session(self, service_name: str, timeout: Optional[float] = None):
+        """라우트 타임아웃이 적용된 풀 클라이언트 컨텍스트 (종료 시 연결 유지)"""
+        return self.http_pool.session(service_name, timeout)
+    
+    async def aclose(self) -> None:
+        """헬스 체크 태스크, 풀 클라이언트 및 헬스 체크 클라이언트 종료"""
+        await self.stop_health_checks()
+        await self.http_pool.aclose()
+        await self.health_check_client.aclose()
 
-    # ✅ ✅ ✅ 여기만 수정됨 ✅ ✅ ✅
     async def health_check_instance(self, instance: ServiceInstance, health_check_path: str) -> bool:
-        """개발용 - 실제 요청 없이 건강하다고 간주"""
-        instance.health = True
+        """인스턴스의 health_check_path 를 실제로 호출하여 상태 갱신"""
+        started = time.perf_counter()
+        try:
+            response = await self.health_check_client.get(f"{instance.base_url}{health_check_path}")
+            healthy = response.status_code < 500
+        except Exception as e:
+            logger.debug(f"Health check failed for {instance.host}:{instance.port}: {str(e)}")
+            healthy = False
+        
         instance.last_health_check = datetime.now()
-        instance.response_time = 0.01
-        logger.debug(f"[DEV] Skipped real health check for {instance.host}:{instance.port} — marked as healthy.")
-        return True
+        if healthy:
+            instance.response_time = time.perf_counter() - started
+            instance.probe_failures = 0
+            if not instance.health:
+                logger.info(f"Instance {instance.host}:{instance.port} recovered")
+            instance.health = True
+            instance.circuit_breaker.probe_succeeded()
+        else:
+            instance.probe_failures += 1
+            if instance.health and instance.probe_failures >= self.unhealthy_threshold:
+                logger.warning(f"Instance {instance.host}:{instance.port} marked unhealthy "
+                               f"after {instance.probe_failures} failed probes")
+                instance.health = False
+        
+        instance.next_probe_at = time.monotonic() + self._next_probe_delay(instance)
+        return healthy
     
-    async def health_check_all_services(self) -> None:
+    def _next_probe_delay(self, instance: ServiceInstance) -> float:
+        """정상 인스턴스는 interval, 실패 인스턴스는 지수 백오프 (최대 8배) + ±20% 지터"""
+        backoff = 2 ** min(instance.probe_failures, 3) if instance.probe_failures else 1
+        return self.health_check_interval * backoff * random.uniform(0.8, 1.2)
+    
+    async def health_check_all_services(self, only_due: bool = False) -> None:
+        now = time.monotonic()
+        tasks = []
         for service_name, service in self.registry.items():
-            instances = service["instances"]
             health_check_path = service["health_check_path"]
-            tasks = [
-                self.health_check_instance(instance, health_check_path)
-                for instance in instances
-            ]
+            for instance in service["instances"]:
+                if only_due and instance.next_probe_at > now:
+                    continue
+                tasks.append(self.health_check_instance(instance, health_check_path))
+        if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
     
+    def start_health_checks(self, interval: float = 30.0) -> None:
+        """lifespan 에서 호출 - 백그라운드 헬스 체크 루프 시작"""
+        if self._health_check_task and not self._health_check_task.done():
+            return
+        self.health_check_interval = float(interval)
+        self._health_check_task = asyncio.create_task(self._health_check_loop())
+        logger.info(f"Background health checks started (interval={interval}s)")
+    
+    async def stop_health_checks(self) -> None:
+        if self._health_check_task and not self._health_check_task.done():
+            self._health_check_task.cancel()
+            try:
+                await self._health_check_task
+            except asyncio.CancelledError:
+                pass
+        self._health_check_task = None
+    
+    async def _health_check_loop(self) -> None:
+        while True:
+            try:
+                await self.health_check_all_services(only_due=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Health check loop error: {str(e)}")
+            
+            # 가장 빠른 다음 체크 시각까지 대기 (최소 1초)
+            next_due = [
+                inst.next_probe_at
+                for service in self.registry.values()
+                for inst in service["instances"]
+            ]
+            wait = min(next_due) - time.monotonic() if next_due else self.health_check_interval
+            await asyncio.sleep(max(1.0, wait))
+    
     def get_service_status(self, service_name: str) -> Optional[Dict]:
         if service_name not in self.registry:
             return None
@@ -180,6 +366,7 @@ class ServiceDiscovery:
             "service_name": service_name,
             "total_instances": len(instances),
             "healthy_instances": len([inst for inst in instances if inst.health]),
+            "open_circuits": len([inst for inst in instances if inst.circuit_breaker.state == CircuitState.OPEN]),
             "load_balancer_type": service["load_balancer_type"],
             "instances": [inst.to_dict() for inst in instances]
         }
@@ -204,7 +391,7 @@ class ServiceDiscovery:
                 raise Exception(f"Service {service_name} not available")
             
             # 요청 URL 구성
-            url = f"{instance.url}/{path}"
+            url = f"{instance.base_url}/{path}"
             
             # 요청 파라미터 구성
             request_kwargs = {
@@ -224,19 +411,26 @@ class ServiceDiscovery:
             if params:
                 request_kwargs["params"] = params
             
-            # 요청 전송
-            async with httpx.AsyncClient() as client:
+            # 요청 전송 (서비스별 풀 클라이언트 재사용)
+            client = self.get_client(service_name)
+            started = time.perf_counter()
+            try:
                 response = await client.request(**request_kwargs)
-                
-                # 응답 반환
-                if response.status_code < 400:
-                    return response.json()
-                else:
-                    return {
-                        "error": True,
-                        "status_code": response.status_code,
-                        "detail": response.text
-                    }
+            except httpx.HTTPError:
+                self.record_result(service_name, instance, success=False)
+                raise
+            self.record_result(service_name, instance, response.status_code < 500,
+                               time.perf_counter() - started)
+            
+            # 응답 반환
+            if response.status_code < 400:
+                return response.json()
+            else:
+                return {
+                    "error": True,
+                    "status_code": response.status_code,
+                    "detail": response.text
+                }
                     
         except Exception as e:
             logger.error(f"Request error: {str(e)}")
@@ -0,0 +1,158 @@
+"""
+게이트웨이 메트릭
+- 라우트별 요청 수 / 상태 코드 / 진행 중 요청 / 전체 지연
+- 업스트림 구간 지연과 게이트웨이 자체 오버헤드(전체 - 업스트림)를 분리 기록
+- 스크레이프 시점에 Service Discovery(풀 포화도, 서킷 상태), 캐시, single-flight, 입장 제어 상태 수집
+"""
+import time
+from typing import Any, Dict, Optional
+
+from app.domain.discovery.circuit_breaker import CircuitState
+from app.domain.metrics.metrics_registry import MetricsRegistry
+
+# ASGI scope 에 요청별 타이밍을 보관하는 키 (ReverseProxy 가 업스트림 시간을 누적)
+TIMING_SCOPE_KEY = "gateway.timing"
+
+CIRCUIT_STATE_VALUES = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class RequestTiming:
+    """요청 하나의 업스트림 누적 시간"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.upstream_seconds = 0.0
+        self.upstream_calls = 0
+
+    def add_upstream(self, seconds: float) -> None:
+        self.upstream_seconds += seconds
+        self.upstream_calls += 1
+
+
+class GatewayMetrics:
+    """게이트웨이 메트릭 정의 및 기록"""
+
+    def __init__(self):
+        self.registry = MetricsRegistry()
+        registry = self.registry
+
+        # 요청 (라우트 템플릿 기준 라벨: 경로 파라미터 값은 라벨에 넣지 않음)
+        self.requests_total = registry.counter(
+            "gateway_http_requests_total", "Gateway HTTP requests", ("route", "method", "status"))
+        self.requests_in_flight = registry.gauge(
+            "gateway_http_requests_in_flight", "Gateway HTTP requests in progress")
+        self.request_duration = registry.histogram(
+            "gateway_http_request_duration_seconds", "Total gateway request latency", ("route", "method"))
+        self.overhead_duration = registry.histogram(
+            "gateway_overhead_duration_seconds",
+            "Gateway-side latency excluding upstream time (auth, routing, buffering)", ("route",))
+
+        # 업스트림
+        self.upstream_requests_total = registry.counter(
+            "gateway_upstream_requests_total", "Upstream requests", ("service", "status"))
+        self.upstream_duration = registry.histogram(
+            "gateway_upstream_duration_seconds", "Upstream latency including response body", ("service",))
+
+        # Service Discovery (스크레이프 시 갱신)
+        self.pool_connections = registry.gauge(
+            "gateway_upstream_pool_connections", "Upstream pool connections", ("service", "state"))
+        self.pool_saturation = registry.gauge(
+            "gateway_upstream_pool_saturation", "Active upstream connections / max connections", ("service",))
+        self.instance_in_flight = registry.gauge(
+            "gateway_upstream_instance_in_flight", "Requests in flight per upstream instance", ("service", "instance"))
+        self.instance_healthy = registry.gauge(
+            "gateway_upstream_instance_healthy", "Upstream instance health (1 healthy, 0 unhealthy)", ("service", "instance"))
+        self.instance_latency = registry.gauge(
+            "gateway_upstream_instance_ewma_latency_seconds", "Decayed peak-EWMA latency", ("service", "instance"))
+        self.circuit_state = registry.gauge(
+            "gateway_circuit_state", "Circuit breaker state (0 closed, 1 half_open, 2 open)", ("service", "instance"))
+        self.circuit_trips = registry.counter(
+            "gateway_circuit_trips_total", "Times the circuit breaker opened", ("service", "instance"))
+
+        # 캐시 / single-flight / 입장 제어 (스크레이프 시 갱신, 누적 값은 counter)
+        self.cache_events = registry.counter(
+            "gateway_response_cache_events_total", "Response cache events by result", ("result",))
+        self.cache_bytes = registry.gauge(
+            "gateway_response_cache_bytes", "Response cache memory usage")
+        self.single_flight_requests = registry.counter(
+            "gateway_single_flight_requests_total", "Single-flight requests by outcome", ("outcome",))
+        self.admission_active = registry.gauge(
+            "gateway_admission_active", "Admitted requests in progress", ("route_class",))
+        self.admission_rejected = registry.counter(
+            "gateway_admission_rejected_total", "Rejected requests by reason", ("reason",))
+
+    # ------------------------------------------------------------------
+    # 요청 단위 기록
+    # ------------------------------------------------------------------
+
+    def observe_request(self, route: str, method: str, status: int, timing: RequestTiming) -> None:
+        total = time.perf_counter() - timing.started
+        self.requests_total.inc(route=route, method=method, status=str(status))
+        self.request_duration.observe(total, route=route, method=method)
+        # 배치 하위 요청처럼 업스트림이 병렬인 경우 합계가 전체를 넘을 수 있음
+        self.overhead_duration.observe(max(0.0, total - timing.upstream_seconds), route=route)
+
+    def observe_upstream(self, service: str, status: str, seconds: float,
+                         timing: Optional[RequestTiming] = None) -> None:
+        self.upstream_requests_total.inc(service=service, status=status)
+        self.upstream_duration.observe(seconds, service=service)
+        if timing is not None:
+            timing.add_upstream(seconds)
+
+    # ------------------------------------------------------------------
+    # 스크레이프
+    # ------------------------------------------------------------------
+
+    def render(self, state: Any) -> str:
+        self._collect(state)
+        return self.registry.render()
+
+    def _collect(self, state: Any) -> None:
+        service_discovery = getattr(state, "service_discovery", None)
+        if service_discovery is not None:
+            self._collect_discovery(service_discovery)
+
+        response_cache = getattr(state, "response_cache", None)
+        if response_cache is not None:
+            stats = response_cache.stats()
+            for result in ("hits", "misses", "not_modified", "evictions"):
+                self.cache_events.set_total(stats[result], result=result)
+            self.cache_bytes.set(stats["bytes"])
+
+        single_flight = getattr(state, "single_flight", None)
+        if single_flight is not None:
+            self.single_flight_requests.set_total(single_flight.executed, outcome="executed")
+            self.single_flight_requests.set_total(single_flight.collapsed, outcome="collapsed")
+
+        admission_controller = getattr(state, "admission_controller", None)
+        if admission_controller is not None:
+            stats = admission_controller.stats()
+            self.admission_active.clear()
+            for route_class in stats["limits"]:
+                self.admission_active.set(stats["active"].get(route_class, 0), route_class=route_class)
+            for reason, count in stats["rejected"].items():
+                self.admission_rejected.set_total(count, reason=reason)
+
+    def _collect_discovery(self, service_discovery: Any) -> None:
+        for metric in (self.pool_connections, self.pool_saturation, self.instance_in_flight,
+                       self.instance_healthy, self.instance_latency, self.circuit_state, self.circuit_trips):
+            metric.clear()
+
+        for service, stats in service_discovery.http_pool.connection_stats().items():
+            self.pool_connections.set(stats["active"], service=service, state="active")
+            self.pool_connections.set(stats["idle"], service=service, state="idle")
+            if stats["max"]:
+                self.pool_saturation.set(stats["active"] / stats["max"], service=service)
+
+        for service, entry in service_discovery.registry.items():
+            for instance in entry["instances"]:
+                labels: Dict[str, str] = {"service": service, "instance": f"{instance.host}:{instance.port}"}
+                self.instance_in_flight.set(instance.connection_count, **labels)
+                self.instance_healthy.set(1 if instance.health else 0, **labels)
+                self.instance_latency.set(instance.latency_score(), **labels)
+                self.circuit_state.set(CIRCUIT_STATE_VALUES[instance.circuit_breaker.state], **labels)
+                self.circuit_trips.set_total(instance.circuit_breaker.trips, **labels)
+
+
+# 미들웨어(앱 생성 시점)와 프록시가 함께 쓰는 프로세스 단일 인스턴스
+gateway_metrics = GatewayMetrics()
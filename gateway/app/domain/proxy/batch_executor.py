@@ -0,0 +1,206 @@
+"""
+배치(fan-out) 요청 실행기
+- 대시보드 초기 로딩처럼 여러 조회를 한 번의 왕복으로 처리
+- 토큰은 배치당 한 번만 검증하고, 하위 요청은 동시 실행 상한 안에서 병렬 전달
+- 하위 요청은 라우트 테이블 규칙(사용자 주입, 응답 캐시, single-flight)을 그대로 따름
+- 하위 요청 실패는 해당 항목 status 로만 반영 (다른 항목에 영향 없음)
+"""
+import asyncio
+import base64
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote, unquote, urlencode
+
+from fastapi import HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+
+from app.domain.proxy.proxy_route import ProxyRoute
+from app.domain.proxy.reverse_proxy import ReverseProxy
+from app.domain.proxy.route_table import ProxyRouteTable
+
+logger = logging.getLogger(__name__)
+
+# 하위 요청에 전달하지 않는 상위 요청 헤더 (본문은 하위 요청마다 새로 구성)
+BATCH_DROP_HEADERS = {b"content-length", b"content-type", b"transfer-encoding", b"accept", b"accept-encoding"}
+
+ResolvedRoute = Tuple[ProxyRoute, Dict[str, Any]]
+
+
+class BatchItem(BaseModel):
+    id: Optional[str] = Field(None, description="응답 매칭용 식별자 (없으면 순번)")
+    method: str = Field("GET", description="HTTP 메서드")
+    path: str = Field(..., description="게이트웨이 경로 (예: /api/v1/tcfd/standards)")
+    query: Dict[str, Union[str, List[str]]] = Field(default_factory=dict, description="쿼리 파라미터")
+    body: Optional[Any] = Field(None, description="JSON 본문 (POST/PUT)")
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem] = Field(..., min_length=1, description="하위 요청 목록")
+
+
+class BatchExecutor:
+    """라우트 테이블 기반 하위 요청 병렬 실행"""
+
+    def __init__(self, proxy: ReverseProxy, route_table: ProxyRouteTable,
+                 max_requests: int = 20, max_concurrency: int = 6):
+        self.proxy = proxy
+        self.route_table = route_table
+        self.max_requests = max_requests
+        self.max_concurrency = max_concurrency
+
+    async def run(self, request: Request, batch: BatchRequest) -> Dict[str, Any]:
+        """모든 하위 요청 완료 후 입력 순서대로 결과 반환"""
+        started = time.perf_counter()
+        resolved, user_data = await self._prepare(request, batch)
+        results = [result async for result in self._execute(request, batch, resolved, user_data)]
+        results.sort(key=lambda result: result["index"])
+        return {
+            "success": all(200 <= result["status"] < 400 for result in results),
+            "results": results,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    async def stream(self, request: Request, batch: BatchRequest) -> StreamingResponse:
+        """완료되는 순서대로 NDJSON 한 줄씩 전송 (검증/인증 오류는 스트리밍 시작 전에 반환)"""
+        resolved, user_data = await self._prepare(request, batch)
+
+        async def lines() -> AsyncIterator[bytes]:
+            async for result in self._execute(request, batch, resolved, user_data):
+                yield json.dumps(result, ensure_ascii=False).encode("utf-8") + b"\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    async def _prepare(self, request: Request, batch: BatchRequest) -> Tuple[List[Optional[ResolvedRoute]], Dict[str, Any]]:
+        if len(batch.requests) > self.max_requests:
+            raise HTTPException(
+                status_code=400,
+                detail=f"배치 요청은 최대 {self.max_requests}개까지 가능합니다 (요청: {len(batch.requests)}개)",
+            )
+
+        resolved = [self._resolve(item) for item in batch.requests]
+
+        # 인증이 필요한 하위 요청이 하나라도 있으면 토큰을 한 번만 검증
+        user_data: Dict[str, Any] = {}
+        if any(match is not None and match[0].auth_required for match in resolved):
+            user_data = await self.proxy.authenticate_user(request)
+        return resolved, user_data
+
+    async def _execute(self, request: Request, batch: BatchRequest,
+                       resolved: List[Optional[ResolvedRoute]],
+                       user_data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_item(index: int, item: BatchItem) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._run_item(request, index, item, resolved[index], user_data)
+
+        tasks = [asyncio.ensure_future(run_item(index, item)) for index, item in enumerate(batch.requests)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 스트리밍 중 클라이언트가 끊기면 남은 하위 요청 취소
+            for task in tasks:
+                task.cancel()
+
+    def _resolve(self, item: BatchItem) -> Optional[ResolvedRoute]:
+        path = unquote(item.path.split("?", 1)[0])
+        return self.route_table.resolve(item.method, path)
+
+    async def _run_item(self, request: Request, index: int, item: BatchItem,
+                        match: Optional[ResolvedRoute],
+                        user_data: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        result: Dict[str, Any] = {"index": index, "id": item.id if item.id is not None else str(index)}
+        if match is None:
+            result.update(status=404, body={"detail": f"배치로 호출할 수 없는 경로입니다: {item.method} {item.path}"})
+            return self._finish(result, started)
+
+        route, path_params = match
+        try:
+            sub_request = self._build_sub_request(request, item, path_params)
+            response = await self.proxy.dispatch(sub_request, route, user_data if route.auth_required else {})
+            body = await self._read_body(response)
+            result.update(status=response.status_code, **self._decode_body(response, body))
+        except HTTPException as e:
+            result.update(status=e.status_code, body={"detail": e.detail})
+        except Exception as e:
+            logger.error(f"❌ 배치 하위 요청 실패: {item.method} {item.path} - {str(e)}")
+            result.update(status=500, body={"detail": f"하위 요청 처리 실패: {str(e)}"})
+        return self._finish(result, started)
+
+    @staticmethod
+    def _finish(result: Dict[str, Any], started: float) -> Dict[str, Any]:
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    @staticmethod
+    def _build_sub_request(request: Request, item: BatchItem, path_params: Dict[str, Any]) -> Request:
+        """상위 요청의 헤더(Authorization, X-Forwarded-*)를 물려받은 하위 요청 구성"""
+        path, _, inline_query = item.path.partition("?")
+        path = unquote(path)
+        query_string = "&".join(
+            part for part in (inline_query, urlencode(item.query, doseq=True)) if part
+        )
+
+        body = b""
+        headers = [(key, value) for key, value in request.scope["headers"] if key not in BATCH_DROP_HEADERS]
+        # 스트리밍 라우트 본문도 그대로 JSON 에 담을 수 있도록 업스트림 압축 비활성화
+        headers.append((b"accept-encoding", b"identity"))
+        if item.body is not None:
+            body = json.dumps(item.body, ensure_ascii=False).encode("utf-8")
+            headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("latin-1"))]
+
+        scope = {
+            **request.scope,
+            "method": item.method.upper(),
+            "path": path,
+            "raw_path": quote(path).encode("latin-1"),
+            "query_string": query_string.encode("latin-1"),
+            "headers": headers,
+            "path_params": path_params,
+        }
+        body_sent = False
+
+        async def receive() -> Dict[str, Any]:
+            nonlocal body_sent
+            if body_sent:
+                return {"type": "http.disconnect"}
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return Request(scope, receive)
+
+    @staticmethod
+    async def _read_body(response: Response) -> bytes:
+        if not isinstance(response, StreamingResponse):
+            return response.body
+        chunks = [chunk async for chunk in response.body_iterator]
+        if response.background is not None:
+            await response.background()
+        return b"".join(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8") for chunk in chunks)
+
+    @staticmethod
+    def _decode_body(response: Response, body: bytes) -> Dict[str, Any]:
+        """JSON 은 그대로, 텍스트는 문자열, 그 외(파일 등)는 base64 로 반환"""
+        content_type = ""
+        for key, value in response.raw_headers:
+            if key.lower() == b"content-type":
+                content_type = value.decode("latin-1")
+        decoded: Dict[str, Any] = {"content_type": content_type or None}
+        if not body:
+            decoded["body"] = None
+        elif "json" in content_type:
+            try:
+                decoded["body"] = json.loads(body)
+            except ValueError:
+                decoded["body"] = body.decode("utf-8", errors="replace")
+        elif content_type.startswith("text/"):
+            decoded["body"] = body.decode("utf-8", errors="replace")
+        else:
+            decoded["body"] = base64.b64encode(body).decode("ascii")
+            decoded["encoding"] = "base64"
+        return decoded
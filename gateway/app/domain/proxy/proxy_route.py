@@ -0,0 +1,32 @@
+"""
+프록시 라우트 정의
+- 게이트웨이 경로 → 업스트림 서비스/경로 매핑을 선언적으로 기술
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from urllib.parse import quote
+
+
+@dataclass
+class ProxyRoute:
+    """게이트웨이 → 업스트림 프록시 라우트"""
+
+    method: str
+    path: str                   # 게이트웨이 경로 (라우터 prefix 기준, 예: "/standards/{category}")
+    service: str                # Service Discovery 에 등록된 서비스명
+    upstream_path: str          # 업스트림 경로 템플릿 (예: "/api/v1/tcfd/standards/{category}")
+    timeout: float = 30.0
+    auth_required: bool = False
+    inject_user: bool = False   # 검증된 사용자 정보를 쿼리 파라미터로 주입
+    query_aliases: Dict[str, str] = field(default_factory=dict)     # 예: {"additional_years[]": "additional_years"}
+    response_headers: Dict[str, str] = field(default_factory=dict)  # 응답에 추가할 헤더
+    cache_ttl: Optional[float] = None  # 지정 시 GET 응답을 게이트웨이 캐시에 보관(초)
+    coalesce: bool = False  # 동시에 들어온 동일 GET 요청을 업스트림 1회 호출로 병합
+    admission_class: Optional[str] = None  # 입장 제어 라우트 클래스 (예: "llm", "report")
+    summary: str = ""
+
+    def build_upstream_path(self, path_params: Dict[str, str]) -> str:
+        """경로 파라미터를 URL 인코딩하여 업스트림 경로 완성"""
+        return self.upstream_path.format(
+            **{key: quote(str(value), safe="") for key, value in path_params.items()}
+        )
@@ -0,0 +1,401 @@
+"""
+라우트 테이블 기반 스트리밍 리버스 프록시
+- 요청/응답 본문을 JSON 디코딩 없이 그대로 스트리밍 전달
+- hop-by-hop 헤더 제거 및 X-Forwarded-* 헤더 추가
+- 라우트 timeout 을 X-Request-Timeout 헤더로 전달 (업스트림이 게이트웨이보다 오래 작업하지 않도록)
+- JWT 검증 후 사용자 정보(user_id, email, name, company_id) 쿼리 파라미터 주입
+- Service Discovery 의 풀 클라이언트 사용
+- cache_ttl 이 지정된 GET 라우트는 응답 캐시(TTL + ETag) 경유
+- coalesce 라우트 / 캐시 미스는 동일 업스트림 요청을 single-flight 로 병합
+- admission_class 라우트는 테넌트 단위 입장 제어 후 전달 (초과 시 429/503 + Retry-After)
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.common.utility.single_flight import SingleFlight
+from app.domain.admission.admission_controller import AdmissionController, AdmissionRejected, AdmissionTicket
+from app.domain.cache.response_cache import ResponseCache, etag_matches
+from app.domain.discovery.service_discovery import ServiceDiscovery, ServiceInstance
+from app.domain.metrics.gateway_metrics import TIMING_SCOPE_KEY, RequestTiming, gateway_metrics
+from app.domain.proxy.proxy_route import ProxyRoute
+
+logger = logging.getLogger(__name__)
+
+# RFC 7230 hop-by-hop 헤더 (프록시 구간마다 새로 결정되므로 전달하지 않음)
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+}
+
+# 업스트림에 남은 처리 시간(초)을 알리는 헤더 (클라이언트 값이 라우트 timeout 보다 짧을 때만 그 값 사용)
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout"
+
+# 버퍼링 응답에서 게이트웨이가 다시 결정하는 헤더 (본문을 디코딩해서 보관하므로)
+BUFFERED_DROP_HEADERS = {b"content-length", b"content-encoding"}
+
+# 캐시 응답에서 게이트웨이가 다시 결정하는 검증 헤더
+CACHE_MANAGED_HEADERS = {b"etag", b"cache-control"}
+
+# 업스트림으로 주입하는 사용자 컨텍스트 파라미터
+USER_CONTEXT_PARAMS = ("user_id", "email", "name", "company_id")
+
+Authenticator = Callable[[Request, str], Awaitable[Dict[str, Any]]]
+
+
+class _UpstreamStream:
+    """업스트림 응답 스트림 + 인스턴스 반환을 한 번만 수행하도록 묶은 핸들"""
+
+    def __init__(self, response: httpx.Response, service_discovery: ServiceDiscovery,
+                 service_name: str, instance: ServiceInstance,
+                 started: float, timing: Optional[RequestTiming] = None):
+        self.response = response
+        self.service_discovery = service_discovery
+        self.service_name = service_name
+        self.instance = instance
+        self.started = started
+        self.timing = timing
+        self._closed = False
+        self._close_callbacks: List[Callable[[], None]] = []
+
+    def on_close(self, callback: Callable[[], None]) -> None:
+        """스트림 종료(정상 완료/클라이언트 중단) 시 호출할 콜백 등록"""
+        self._close_callbacks.append(callback)
+
+    async def body(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self.response.aiter_raw():
+                yield chunk
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self.response.aclose()
+        finally:
+            # 업스트림 구간 = 요청 전송 ~ 응답 본문 수신 완료 (게이트웨이 오버헤드와 분리)
+            gateway_metrics.observe_upstream(
+                self.service_name, str(self.response.status_code),
+                time.perf_counter() - self.started, self.timing,
+            )
+            self.service_discovery.release_instance(self.service_name, self.instance)
+            for callback in self._close_callbacks:
+                callback()
+
+
+@dataclass(frozen=True)
+class _BufferedUpstream:
+    """전체 수신된 업스트림 응답 (single-flight 대기자 간 공유되므로 불변)"""
+
+    status_code: int
+    headers: Tuple[Tuple[bytes, bytes], ...]
+    body: bytes
+
+
+class ReverseProxy:
+    """ProxyRoute 목록을 FastAPI 라우터에 등록하고 요청을 업스트림으로 스트리밍 전달"""
+
+    def __init__(self, authenticate: Optional[Authenticator] = None):
+        self.authenticate = authenticate
+
+    def include(self, router: APIRouter, routes: List[ProxyRoute]) -> None:
+        """라우트 테이블을 라우터에 등록"""
+        for route in routes:
+            router.add_api_route(
+                route.path,
+                self._make_endpoint(route),
+                methods=[route.method],
+                summary=route.summary or None,
+                name=f"proxy_{route.method.lower()}_{route.path}",
+            )
+
+    def _make_endpoint(self, route: ProxyRoute):
+        async def endpoint(request: Request):
+            return await self.forward(request, route)
+
+        endpoint.__doc__ = route.summary
+        return endpoint
+
+    async def forward(self, request: Request, route: ProxyRoute) -> Response:
+        """요청을 업스트림으로 전달하고 응답을 그대로 스트리밍 (캐시/병합 대상 라우트는 버퍼링)"""
+        user_data = await self._authenticate(request, route)
+        return await self.dispatch(request, route, user_data)
+
+    async def dispatch(self, request: Request, route: ProxyRoute, user_data: Dict[str, Any]) -> Response:
+        """인증이 끝난 요청 전달 (배치 API 는 토큰을 한 번만 검증한 뒤 직접 호출)"""
+        ticket = self._admit(request, route, user_data)
+        streaming = False
+        try:
+            if route.method == "GET":
+                response_cache: Optional[ResponseCache] = getattr(request.app.state, "response_cache", None)
+                if route.cache_ttl and response_cache is not None:
+                    return await self._forward_cached(request, route, user_data, response_cache)
+                if route.coalesce:
+                    buffered = await self._fetch_buffered(request, route, user_data)
+                    return self._buffered_response(buffered.status_code, list(buffered.headers), buffered.body)
+
+            upstream = await self._open_upstream(request, route, user_data)
+            if ticket is not None:
+                # 스트리밍 응답은 본문 전송이 끝나야 업스트림 점유가 끝남
+                upstream.on_close(ticket.release)
+            streaming = True
+        finally:
+            if ticket is not None and not streaming:
+                ticket.release()
+
+        proxied = StreamingResponse(
+            upstream.body(),
+            status_code=upstream.response.status_code,
+            background=BackgroundTask(upstream.close),
+        )
+        proxied.raw_headers = self._build_response_headers(upstream.response, route)
+        return proxied
+
+    @staticmethod
+    def _admit(request: Request, route: ProxyRoute, user_data: Dict[str, Any]) -> Optional[AdmissionTicket]:
+        """무거운 라우트 입장 제어 (company_id / user_id 기준, 미인증 라우트는 클라이언트 IP 기준)"""
+        if not route.admission_class:
+            return None
+        controller: Optional[AdmissionController] = getattr(request.app.state, "admission_controller", None)
+        if controller is None:
+            return None
+
+        client_key = f"ip:{request.client.host}" if request.client else "ip:unknown"
+        user = str(user_data.get("user_id") or client_key)
+        tenant = str(user_data.get("company_id") or user)
+        try:
+            return controller.acquire(route.admission_class, tenant, user)
+        except AdmissionRejected as e:
+            logger.warning(f"⛔ {route.admission_class} 요청 거절 (tenant={tenant}, user={user}): {e.reason}")
+            raise HTTPException(
+                status_code=e.status_code,
+                detail=e.reason,
+                headers={"Retry-After": str(e.retry_after)},
+            )
+
+    async def _open_upstream(self, request: Request, route: ProxyRoute,
+                             user_data: Dict[str, Any]) -> _UpstreamStream:
+        """인스턴스 선택 후 업스트림 요청 전송 (응답 헤더까지만 수신)"""
+        service_discovery: ServiceDiscovery = request.app.state.service_discovery
+        instance = service_discovery.get_service_instance(route.service)
+        if not instance:
+            logger.error(f"❌ {route.service}를 찾을 수 없습니다")
+            raise HTTPException(status_code=503, detail=f"{route.service}를 찾을 수 없습니다")
+
+        url = f"{instance.base_url}{route.build_upstream_path(request.path_params)}"
+        client = service_discovery.get_client(route.service)
+        upstream_request = client.build_request(
+            route.method,
+            url,
+            params=self._build_query(request, route, user_data),
+            headers=self._build_request_headers(request, route),
+            content=self._request_body(request),
+            timeout=route.timeout,
+        )
+
+        logger.info(f"📤 {route.method} {url}")
+        timing: Optional[RequestTiming] = request.scope.get(TIMING_SCOPE_KEY)
+        started = time.perf_counter()
+        try:
+            response = await client.send(upstream_request, stream=True)
+        except httpx.HTTPError as e:
+            service_discovery.record_result(route.service, instance, success=False)
+            service_discovery.release_instance(route.service, instance)
+            gateway_metrics.observe_upstream(route.service, "error", time.perf_counter() - started, timing)
+            if isinstance(e, httpx.TimeoutException):
+                logger.error(f"❌ {route.service} 응답 시간 초과: {str(e)}")
+                raise HTTPException(status_code=504, detail=f"{route.service} 응답 시간 초과")
+            if isinstance(e, httpx.ConnectError):
+                logger.error(f"❌ {route.service} 연결 실패: {str(e)}")
+                raise HTTPException(status_code=503, detail=f"{route.service} 연결 실패: {str(e)}")
+            logger.error(f"❌ {route.service} 요청 실패: {str(e)}")
+            raise HTTPException(status_code=502, detail=f"{route.service} 요청 실패: {str(e)}")
+
+        upstream_latency = time.perf_counter() - started
+        service_discovery.record_result(
+            route.service, instance, response.status_code < 500, upstream_latency
+        )
+        logger.info(
+            f"📥 {route.service} 응답 상태: {response.status_code} "
+            f"({upstream_latency * 1000:.1f}ms)"
+        )
+        return _UpstreamStream(response, service_discovery, route.service, instance, started, timing)
+
+    async def _fetch_buffered(self, request: Request, route: ProxyRoute,
+                              user_data: Dict[str, Any]) -> _BufferedUpstream:
+        """업스트림 응답 전체 수신 (동일한 업스트림 요청이 진행 중이면 single-flight 로 합류)"""
+        single_flight: Optional[SingleFlight] = getattr(request.app.state, "single_flight", None)
+        if single_flight is None:
+            return await self._read_upstream(request, route, user_data)
+
+        key = self._coalesce_key(request, route, user_data)
+        return await single_flight.do(key, lambda: self._read_upstream(request, route, user_data))
+
+    async def _read_upstream(self, request: Request, route: ProxyRoute,
+                             user_data: Dict[str, Any]) -> _BufferedUpstream:
+        upstream = await self._open_upstream(request, route, user_data)
+        try:
+            # 버퍼링 본문은 content-encoding 을 풀어서 보관 (클라이언트별 인코딩 차이 방지)
+            body = b"".join([chunk async for chunk in upstream.response.aiter_bytes()])
+        finally:
+            await upstream.close()
+
+        headers = tuple(
+            (key, value)
+            for key, value in self._build_response_headers(upstream.response, route)
+            if key not in BUFFERED_DROP_HEADERS
+        )
+        return _BufferedUpstream(upstream.response.status_code, headers, body)
+
+    def _coalesce_key(self, request: Request, route: ProxyRoute, user_data: Dict[str, Any]) -> str:
+        """실제 업스트림 요청(서비스 + 경로 + 주입된 사용자 파라미터 포함 쿼리) 기준 키"""
+        query = sorted(self._build_query(request, route, user_data))
+        return f"{route.service} {route.method} {route.build_upstream_path(request.path_params)}?{query}"
+
+    async def _forward_cached(self, request: Request, route: ProxyRoute,
+                              user_data: Dict[str, Any], cache: ResponseCache) -> Response:
+        """TTL + ETag 캐시 경유 전달 (테넌트 = company_id, 캐시 미스는 single-flight 로 병합)"""
+        tenant = str(user_data.get("company_id") or "anonymous")
+        key = cache.build_key(route.method, request.url.path, self._build_query(request, route, user_data), tenant)
+
+        entry = cache.get(key)
+        cache_status = "HIT"
+        if entry is None:
+            cache_status = "MISS"
+            upstream = await self._fetch_buffered(request, route, user_data)
+            headers = [(key_, value) for key_, value in upstream.headers if key_ not in CACHE_MANAGED_HEADERS]
+            if upstream.status_code != 200:
+                return self._buffered_response(upstream.status_code, headers, upstream.body)
+            entry = cache.put(key, upstream.status_code, headers, upstream.body, route.cache_ttl)
+
+        validators = [
+            (b"etag", entry.etag.encode("latin-1")),
+            (b"cache-control", b"private, no-cache"),
+            (b"x-cache", cache_status.encode("latin-1")),
+        ]
+        if etag_matches(request.headers.get("if-none-match"), entry.etag):
+            cache.not_modified += 1
+            not_modified = Response(status_code=304)
+            not_modified.raw_headers = validators
+            return not_modified
+        return self._buffered_response(entry.status_code, entry.headers + validators, entry.body)
+
+    @staticmethod
+    def _buffered_response(status_code: int, headers: List[Tuple[bytes, bytes]], body: bytes) -> Response:
+        response = Response(content=body, status_code=status_code)
+        response.raw_headers = headers + [(b"content-length", str(len(body)).encode("latin-1"))]
+        return response
+
+    async def _authenticate(self, request: Request, route: ProxyRoute) -> Dict[str, Any]:
+        """Bearer 토큰 검증 후 사용자 정보 반환"""
+        if not route.auth_required:
+            return {}
+        return await self.authenticate_user(request)
+
+    async def authenticate_user(self, request: Request) -> Dict[str, Any]:
+        """Authorization 헤더 검증 후 사용자 정보(user_info) 반환"""
+        authorization = request.headers.get("Authorization")
+        if not authorization or not authorization.startswith("Bearer "):
+            raise HTTPException(status_code=401, detail="Bearer 토큰이 필요합니다")
+        if self.authenticate is None:
+            return {}
+
+        user_info = await self.authenticate(request, authorization)
+        user_data = user_info.get("user_info", {}) or {}
+        if not user_data:
+            logger.warning("⚠️ 사용자 정보가 없습니다")
+        return user_data
+
+    @staticmethod
+    def _build_query(request: Request, route: ProxyRoute, user_data: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """클라이언트 쿼리 + 사용자 컨텍스트 (사용자 컨텍스트는 클라이언트 값을 덮어씀)"""
+        params: List[Tuple[str, str]] = []
+        for key, value in request.query_params.multi_items():
+            if key in route.query_aliases:
+                # 별칭 파라미터 (예: additional_years[]) 는 빈 값 제거 후 이름 변환
+                if not value.strip():
+                    continue
+                key, value = route.query_aliases[key], value.strip()
+            if route.inject_user and key in USER_CONTEXT_PARAMS:
+                continue
+            params.append((key, value))
+
+        if route.inject_user:
+            for key in USER_CONTEXT_PARAMS:
+                value = user_data.get(key)
+                if value is not None:
+                    params.append((key, str(value)))
+        return params
+
+    @staticmethod
+    def _build_request_headers(request: Request, route: ProxyRoute) -> List[Tuple[str, str]]:
+        """hop-by-hop / Host 헤더 제거 후 X-Forwarded-* / X-Request-Timeout 추가"""
+        headers = [
+            (key, value)
+            for key, value in request.headers.items()
+            if key.lower() not in HOP_BY_HOP_HEADERS
+            and key.lower() not in ("host", "x-request-timeout")
+            and not key.lower().startswith("x-forwarded-")
+        ]
+        client_host = request.client.host if request.client else ""
+        forwarded_for = request.headers.get("x-forwarded-for")
+        headers.append(("X-Forwarded-For", f"{forwarded_for}, {client_host}" if forwarded_for else client_host))
+        headers.append(("X-Forwarded-Host", request.headers.get("host", "")))
+        headers.append(("X-Forwarded-Proto", request.url.scheme))
+        headers.append((REQUEST_TIMEOUT_HEADER, f"{ReverseProxy._request_timeout(request, route):g}"))
+        return headers
+
+    @staticmethod
+    def _request_timeout(request: Request, route: ProxyRoute) -> float:
+        """라우트 timeout 과 클라이언트가 보낸 X-Request-Timeout 중 짧은 쪽"""
+        timeout = route.timeout
+        header = request.headers.get("x-request-timeout")
+        if header:
+            try:
+                requested = float(header)
+            except ValueError:
+                return timeout
+            if 0 < requested < timeout:
+                return requested
+        return timeout
+
+    @staticmethod
+    def _request_body(request: Request) -> Optional[AsyncIterator[bytes]]:
+        """본문이 있는 요청만 스트림으로 전달"""
+        has_body = (
+            request.headers.get("content-length", "0") != "0"
+            or "transfer-encoding" in request.headers
+        )
+        return request.stream() if has_body else None
+
+    @staticmethod
+    def _build_response_headers(response: httpx.Response, route: ProxyRoute) -> List[Tuple[bytes, bytes]]:
+        """업스트림 응답 헤더 전달 (본문 인코딩/길이는 그대로 유지, CORS 는 게이트웨이가 담당)"""
+        overridden = {key.lower() for key in route.response_headers}
+        raw_headers = []
+        for key, value in response.headers.raw:
+            name = key.decode("latin-1").lower()
+            if name in HOP_BY_HOP_HEADERS or name in overridden or name.startswith("access-control-"):
+                continue
+            raw_headers.append((name.encode("latin-1"), value))
+        raw_headers.extend(
+            (key.lower().encode("latin-1"), value.encode("latin-1"))
+            for key, value in route.response_headers.items()
+        )
+        return raw_headers
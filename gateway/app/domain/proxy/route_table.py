@@ -0,0 +1,38 @@
+"""
+프록시 라우트 조회 테이블
+- 게이트웨이 전체 경로(라우터 prefix + 라우트 경로)와 메서드로 ProxyRoute 검색
+- 배치 API 의 하위 요청을 기존 라우트 테이블 규칙(인증, 사용자 주입, 캐시)대로 처리하기 위해 사용
+"""
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from starlette.convertors import Convertor
+from starlette.routing import compile_path
+
+from app.domain.proxy.proxy_route import ProxyRoute
+
+
+class ProxyRouteTable:
+    """(메서드, 경로) → (ProxyRoute, 경로 파라미터)"""
+
+    def __init__(self):
+        self._entries: List[Tuple[ProxyRoute, Pattern[str], Dict[str, Convertor]]] = []
+
+    def add(self, prefix: str, routes: List[ProxyRoute]) -> "ProxyRouteTable":
+        for route in routes:
+            path_regex, _, convertors = compile_path(f"{prefix}{route.path}")
+            self._entries.append((route, path_regex, convertors))
+        return self
+
+    def resolve(self, method: str, path: str) -> Optional[Tuple[ProxyRoute, Dict[str, Any]]]:
+        method = method.upper()
+        for route, path_regex, convertors in self._entries:
+            if route.method != method:
+                continue
+            match = path_regex.match(path)
+            if match:
+                path_params = {
+                    key: convertors[key].convert(value)
+                    for key, value in match.groupdict().items()
+                }
+                return route, path_params
+        return None
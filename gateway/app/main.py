@@ -1,7 +1,7 @@
 from typing import Optional, List
 from fastapi import APIRouter, FastAPI, Request, UploadFile, File, Query, HTTPException, Form, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 import os
 import logging
 import sys
@@ -14,9 +14,20 @@ from app.router.auth_router import router as auth_router
 from app.router.tcfd_router import router as tcfd_router
 from app.router.tcfdreport_router import router as tcfdreport_router
 from app.router.faiss_router import router as faiss_router
+from app.router.llm_router import router as llm_router
+from app.router.cache_router import router as cache_router
+from app.router.batch_router import router as batch_router
+from app.router.admission_router import router as admission_router
 from app.www.jwt_auth_middleware import AuthMiddleware
+from app.www.metrics_middleware import MetricsMiddleware
+from app.domain.metrics.gateway_metrics import gateway_metrics
 from app.domain.discovery.service_discovery import ServiceDiscovery
+from app.domain.discovery.http_client_pool import HttpClientPool
 from app.domain.discovery.service_type import ServiceType
+from app.domain.auth.service.token_verifier import TokenVerifier
+from app.domain.cache.response_cache import ResponseCache
+from app.common.utility.single_flight import SingleFlight
+from app.domain.admission.admission_controller import AdmissionController
 from app.common.utility.constant.settings import Settings
 from app.common.utility.factory.response_factory import ResponseFactory
 # Gateway는 DB에 직접 접근하지 않음 (MSA 원칙)
@@ -41,10 +52,40 @@ async def lifespan(app: FastAPI):
         app.state.settings = Settings()
         logger.info("✅ Settings 초기화 성공")
         
-        # 서비스 디스커버리 초기화 및 서비스 등록
-        app.state.service_discovery = ServiceDiscovery()
+        # 서비스 디스커버리 초기화 및 서비스 등록 (업스트림 커넥션 풀 포함)
+        app.state.service_discovery = ServiceDiscovery(
+            http_pool=HttpClientPool.from_settings(app.state.settings),
+            breaker_config={
+                "failure_threshold": app.state.settings.CIRCUIT_FAILURE_THRESHOLD,
+                "recovery_timeout": app.state.settings.CIRCUIT_RECOVERY_TIMEOUT,
+                "latency_threshold": app.state.settings.CIRCUIT_LATENCY_THRESHOLD,
+                "half_open_timeout": app.state.settings.CIRCUIT_HALF_OPEN_TIMEOUT,
+            },
+            health_check_timeout=app.state.settings.HEALTH_CHECK_TIMEOUT,
+            unhealthy_threshold=app.state.settings.HEALTH_CHECK_UNHEALTHY_THRESHOLD,
+        )
         logger.info("✅ Service Discovery 초기화 성공")
         
+        # 로컬 JWT 검증기 (auth-service 왕복 없이 토큰 검증)
+        app.state.token_verifier = TokenVerifier.from_settings(app.state.settings)
+        logger.info(f"✅ Token Verifier 초기화 성공 (local={app.state.token_verifier.enabled})")
+        
+        # 읽기 위주 엔드포인트 응답 캐시 (TTL + ETag)
+        app.state.response_cache = (
+            ResponseCache(max_bytes=app.state.settings.RESPONSE_CACHE_MAX_BYTES)
+            if app.state.settings.RESPONSE_CACHE_ENABLED else None
+        )
+        logger.info(f"✅ Response Cache 초기화 성공 (enabled={app.state.response_cache is not None})")
+        
+        # 동시에 들어온 동일 업스트림 요청 병합
+        app.state.single_flight = SingleFlight() if app.state.settings.SINGLE_FLIGHT_ENABLED else None
+        
+        # LLM 생성 / 보고서 렌더링 라우트 테넌트 단위 입장 제어
+        app.state.admission_controller = (
+            AdmissionController.from_settings(app.state.settings)
+            if app.state.settings.ADMISSION_ENABLED else None
+        )
+        
         # Settings에서 환경변수 가져오기
         settings = app.state.settings
         use_railway_tcfd = settings.USE_RAILWAY_TCFD
@@ -59,6 +100,10 @@ async def lifespan(app: FastAPI):
         # 기본값으로 설정
         app.state.settings = None
         app.state.service_discovery = ServiceDiscovery()  # None 대신 새 인스턴스 생성
+        app.state.token_verifier = TokenVerifier.from_settings(None)
+        app.state.response_cache = ResponseCache()
+        app.state.single_flight = SingleFlight()
+        app.state.admission_controller = AdmissionController()
         use_railway_tcfd = False
         use_local_auth = True
         use_local_chatbot = True
@@ -87,11 +132,10 @@ async def lifespan(app: FastAPI):
     # Auth Service 연결 테스트
     if auth_service_url:
         try:
-            import httpx
             # 더 긴 타임아웃과 재시도 로직
             for attempt in range(3):
                 try:
-                    async with httpx.AsyncClient(timeout=10.0) as client:
+                    async with app.state.service_discovery.http_session("auth-service", timeout=10.0) as client:
                         response = await client.get(f"{auth_service_url}/health")
                         if response.status_code == 200:
                             logger.info(f"✅ Auth Service 연결 성공: {auth_service_url}")
@@ -221,7 +265,7 @@ async def lifespan(app: FastAPI):
             app.state.service_discovery.register_service(
                 service_name="llm-service",
                 instances=[{"host": llm_service_url, "port": 443, "weight": 1}],
-                load_balancer_type="round_robin"
+                load_balancer_type="least_latency"
             )
             logger.info(f"✅ Railway LLM Service 등록: {llm_service_url}")
         else:
@@ -230,13 +274,26 @@ async def lifespan(app: FastAPI):
         app.state.service_discovery.register_service(
             service_name="llm-service",
             instances=[{"host": "llm-service", "port": 8002, "weight": 1}],
-            load_balancer_type="round_robin"
+            load_balancer_type="least_latency"
         )
         logger.info("✅ 로컬 LLM Service 등록 완료")
     
     logger.info("✅ 모든 서비스 등록 완료")
+    
+    # 백그라운드 헬스 체크 시작 (서킷 브레이커와 함께 장애 인스턴스 차단)
+    settings = app.state.settings
+    if settings is None or settings.HEALTH_CHECK_ENABLED:
+        interval = settings.HEALTH_CHECK_INTERVAL if settings else 30
+        app.state.service_discovery.start_health_checks(interval=interval)
+    
     yield
     logger.info("🛑 Gateway API 서비스 종료")
+    
+    # 업스트림 커넥션 풀 정리
+    try:
+        await app.state.service_discovery.aclose()
+    except Exception as e:
+        logger.warning(f"⚠️ 커넥션 풀 종료 중 오류: {str(e)}")
 
 app = FastAPI(
     title="Gateway API",
@@ -266,6 +323,9 @@ app.add_middleware(
 
 app.add_middleware(AuthMiddleware)
 
+# 요청 메트릭 (가장 바깥에서 전체 지연 측정)
+app.add_middleware(MetricsMiddleware)
+
 # ✅ MSV 패턴의 Auth 도메인 컨트롤러 사용
 app.include_router(auth_router)
 
@@ -278,6 +338,18 @@ app.include_router(tcfdreport_router)
 # ✅ FAISS Service 라우터 추가
 app.include_router(faiss_router)
 
+# ✅ LLM Service 라우터 추가 (RAG 초안/윤문, SSE 스트리밍 전달)
+app.include_router(llm_router)
+
+# ✅ 응답 캐시 관리 라우터 추가
+app.include_router(cache_router)
+
+# ✅ 배치(fan-out) API 라우터 추가
+app.include_router(batch_router)
+
+# ✅ 입장 제어 관리 라우터 추가
+app.include_router(admission_router)
+
 # 404 에러 핸들러
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc):
@@ -317,6 +389,27 @@ async def health_check_db():
         "architecture": "MSV Pattern with Layered Architecture"
     }
 
+# 업스트림 서비스 상태 (헬스 체크 / 서킷 브레이커)
+@app.get("/health/services")
+async def health_check_services(request: Request):
+    return request.app.state.service_discovery.get_all_services_status()
+
+# 프록시 요청 병합 통계 (single-flight)
+@app.get("/health/proxy")
+async def health_check_proxy(request: Request):
+    single_flight = request.app.state.single_flight
+    return {
+        "single_flight": single_flight.stats() if single_flight else {"enabled": False},
+    }
+
+# Prometheus 메트릭 (요청 / 업스트림 지연, 풀 포화도, 서킷 상태)
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    return PlainTextResponse(
+        gateway_metrics.render(request.app.state),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
 # Gateway는 순수한 라우팅만 담당 (MSA 원칙)
 
 # ✅ 서버 실행
@@ -0,0 +1,58 @@
+"""
+입장 제어(admission control) 관리 라우터
+- 라우트 클래스별 한도 / 현재 점유 / 거절 통계 조회
+- 한도 무중단 변경 (PUT) 및 한도 파일 즉시 재로딩 (POST /reload)
+- X-ADMIN-TOKEN 헤더로 관리자 확인
+"""
+from fastapi import APIRouter, Body, Depends, HTTPException, Request
+import logging
+from typing import Any, Dict
+
+from app.domain.admission.admission_controller import AdmissionController, RouteClassLimits
+from app.www.admin_auth import verify_gateway_admin
+
+logger = logging.getLogger(__name__)
+router = APIRouter(
+    prefix="/api/v1/admin/admission",
+    tags=["admission"],
+    dependencies=[Depends(verify_gateway_admin)],
+)
+
+
+def get_admission_controller(request: Request) -> AdmissionController:
+    controller = getattr(request.app.state, "admission_controller", None)
+    if controller is None:
+        raise HTTPException(status_code=404, detail="입장 제어가 비활성화되어 있습니다")
+    return controller
+
+
+@router.get("")
+async def admission_stats(request: Request):
+    """라우트 클래스별 한도 및 현재 상태"""
+    return get_admission_controller(request).stats()
+
+
+@router.put("/limits")
+async def update_admission_limits(
+    request: Request,
+    limits: Dict[str, Dict[str, Any]] = Body(..., examples=[{"llm": {"rate_per_minute": 6, "max_concurrent_per_tenant": 2}}]),
+):
+    """라우트 클래스별 한도 변경 (지정한 클래스/항목만 덮어씀, 재시작 불필요)"""
+    controller = get_admission_controller(request)
+    merged = dict(controller.limits)
+    for name, values in limits.items():
+        current = merged.get(name, RouteClassLimits())
+        merged[name] = RouteClassLimits.from_dict({**current.__dict__, **values})
+    controller.update_limits(merged)
+    logger.info(f"🔧 입장 제어 한도 변경: {list(limits)}")
+    return {"success": True, "limits": controller.stats()["limits"]}
+
+
+@router.post("/reload")
+async def reload_admission_limits(request: Request):
+    """ADMISSION_LIMITS_FILE 즉시 재로딩"""
+    controller = get_admission_controller(request)
+    if not controller.limits_file:
+        raise HTTPException(status_code=400, detail="ADMISSION_LIMITS_FILE 이 설정되지 않았습니다")
+    reloaded = controller.maybe_reload(force=True)
+    return {"success": reloaded, "limits": controller.stats()["limits"]}
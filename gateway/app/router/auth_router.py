@@ -1,10 +1,11 @@
-from fastapi import APIRouter, HTTPException, Header, Depends
+from fastapi import APIRouter, HTTPException, Header, Depends, Request
 from fastapi.responses import JSONResponse
-import httpx
 import os
 import logging
 from typing import Optional
 
+from app.domain.auth.service.token_verifier import TokenExpiredError
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -20,10 +21,14 @@ def get_auth_service_url():
         return os.getenv("RAILWAY_AUTH_SERVICE_URL", "https://auth-service-production-1deb.up.railway.app")
     return os.getenv("AUTH_SERVICE_URL", "http://auth-service:8008")
 
+def auth_http_session(request: Request, timeout: float = 30.0):
+    """Auth Service 호출용 풀 클라이언트 컨텍스트 (Service Discovery 소유)"""
+    return request.app.state.service_discovery.http_session("auth-service", timeout=timeout)
+
 
 
 @router.post("/signup")
-async def signup(auth_data: dict):
+async def signup(request: Request, auth_data: dict):
     """회원가입 엔드포인트"""
     max_retries = 3
     retry_delay = 1.0
@@ -36,7 +41,7 @@ async def signup(auth_data: dict):
             logger.info(f"📤 요청 데이터: {auth_data}")
             
             # Auth Service로 회원가입 요청
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with auth_http_session(request) as client:
                 response = await client.post(
                     f"{auth_service_url}/api/v1/auth/signup",
                     json=auth_data
@@ -64,7 +69,7 @@ async def signup(auth_data: dict):
                 raise HTTPException(status_code=500, detail="회원가입 중 오류가 발생했습니다")
 
 @router.post("/login")
-async def login(auth_data: dict):
+async def login(request: Request, auth_data: dict):
     """로그인 엔드포인트"""
     max_retries = 3
     retry_delay = 1.0
@@ -77,7 +82,7 @@ async def login(auth_data: dict):
             logger.info(f"📤 요청 데이터: {auth_data}")
             
             # Auth Service로 로그인 요청
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with auth_http_session(request) as client:
                 response = await client.post(
                     f"{auth_service_url}/api/v1/auth/login",
                     json=auth_data
@@ -105,19 +110,30 @@ async def login(auth_data: dict):
                 raise HTTPException(status_code=500, detail="로그인 중 오류가 발생했습니다")
 
 @router.get("/verify")
-async def verify_token(authorization: str = Header(None)):
+async def verify_token(request: Request, authorization: str = Header(None)):
     """토큰 검증 엔드포인트"""
     try:
         if not authorization or not authorization.startswith('Bearer '):
             raise HTTPException(status_code=401, detail="Bearer 토큰이 필요합니다")
         
         token = authorization.replace('Bearer ', '')
-        auth_service_url = get_auth_service_url()
         
+        # 1) 로컬 검증 (캐시 → 서명/만료 검증)
+        token_verifier = getattr(request.app.state, "token_verifier", None)
+        if token_verifier is not None:
+            try:
+                local_result = token_verifier.verify(token)
+            except TokenExpiredError as e:
+                raise HTTPException(status_code=401, detail=str(e))
+            if local_result is not None:
+                return local_result
+        
+        # 2) 로컬 검증 불가 시에만 Auth Service 원격 검증
+        auth_service_url = get_auth_service_url()
         logger.info(f"🔍 Auth Service로 토큰 검증 요청: {auth_service_url}/api/v1/auth/verify")
         
         # Auth Service로 토큰 검증 요청
-        async with httpx.AsyncClient() as client:
+        async with auth_http_session(request, timeout=10.0) as client:
             response = await client.get(
                 f"{auth_service_url}/api/v1/auth/verify",
                 headers={"Authorization": f"Bearer {token}"}
@@ -125,7 +141,10 @@ async def verify_token(authorization: str = Header(None)):
             
             if response.status_code == 200:
                 logger.info("✅ 토큰 검증 성공")
-                return response.json()
+                result = response.json()
+                if token_verifier is not None:
+                    token_verifier.remember_remote(token, result)
+                return result
             else:
                 logger.error(f"❌ 토큰 검증 실패: {response.status_code}")
                 raise HTTPException(status_code=response.status_code, detail="토큰 검증 실패")
@@ -136,8 +155,16 @@ async def verify_token(authorization: str = Header(None)):
         logger.error(f"❌ 토큰 검증 처리 오류: {str(e)}")
         raise HTTPException(status_code=500, detail="토큰 검증 중 오류가 발생했습니다")
 
+@router.get("/verify/stats")
+async def get_token_verification_stats(request: Request):
+    """로컬 토큰 검증 / 캐시 적중률 통계"""
+    token_verifier = getattr(request.app.state, "token_verifier", None)
+    if token_verifier is None:
+        return {"local_verification_enabled": False}
+    return token_verifier.stats()
+
 @router.post("/refresh")
-async def refresh_token(authorization: str = Header(None)):
+async def refresh_token(request: Request, authorization: str = Header(None)):
     """토큰 갱신 엔드포인트"""
     try:
         if not authorization or not authorization.startswith('Bearer '):
@@ -149,7 +176,7 @@ async def refresh_token(authorization: str = Header(None)):
         logger.info(f"🔍 Auth Service로 토큰 갱신 요청: {auth_service_url}/api/v1/auth/refresh")
         
         # Auth Service로 토큰 갱신 요청
-        async with httpx.AsyncClient() as client:
+        async with auth_http_session(request) as client:
             response = await client.post(
                 f"{auth_service_url}/api/v1/auth/refresh",
                 headers={"Authorization": f"Bearer {token}"}
@@ -0,0 +1,54 @@
+"""
+배치 API 라우터
+- POST /api/v1/batch 로 여러 TCFD / TCFD Report 조회를 한 번에 요청
+- 토큰은 배치당 1회 검증, 하위 요청은 동시 실행 상한 안에서 병렬 처리
+- ?stream=true 또는 Accept: application/x-ndjson 이면 완료 순서대로 NDJSON 스트리밍
+"""
+from fastapi import APIRouter, Query, Request
+import logging
+
+from app.router.auth_router import verify_token
+from app.router.tcfd_router import TCFD_ROUTES, router as tcfd_router
+from app.router.tcfdreport_router import TCFDREPORT_ROUTES, router as tcfdreport_router
+from app.domain.proxy.batch_executor import BatchExecutor, BatchRequest
+from app.domain.proxy.reverse_proxy import ReverseProxy
+from app.domain.proxy.route_table import ProxyRouteTable
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/v1", tags=["batch"])
+
+BATCH_ROUTE_TABLE = (
+    ProxyRouteTable()
+    .add(tcfd_router.prefix, TCFD_ROUTES)
+    .add(tcfdreport_router.prefix, TCFDREPORT_ROUTES)
+)
+batch_proxy = ReverseProxy(authenticate=verify_token)
+
+
+def get_batch_executor(request: Request) -> BatchExecutor:
+    settings = getattr(request.app.state, "settings", None)
+    return BatchExecutor(
+        batch_proxy,
+        BATCH_ROUTE_TABLE,
+        max_requests=settings.BATCH_MAX_REQUESTS if settings else 20,
+        max_concurrency=settings.BATCH_MAX_CONCURRENCY if settings else 6,
+    )
+
+
+@router.post("/batch")
+async def batch(
+    request: Request,
+    batch_request: BatchRequest,
+    stream: bool = Query(False, description="완료 순서대로 NDJSON 스트리밍"),
+):
+    """
+    여러 하위 요청을 한 번에 처리합니다.
+
+    예: {"requests": [{"id": "standards", "path": "/api/v1/tcfd/standards"},
+                      {"id": "overview", "path": "/api/v1/tcfd/company-overview", "query": {"company_name": "삼성전자"}}]}
+    """
+    executor = get_batch_executor(request)
+    logger.info(f"📦 배치 요청: {len(batch_request.requests)}건")
+    if stream or "application/x-ndjson" in request.headers.get("accept", ""):
+        return await executor.stream(request, batch_request)
+    return await executor.run(request, batch_request)
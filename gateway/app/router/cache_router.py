@@ -0,0 +1,42 @@
+"""
+게이트웨이 응답 캐시 관리 라우터
+- 캐시 통계 조회 / 경로 prefix 단위 무효화 (데이터 업로드 스크립트 실행 후 호출)
+- X-ADMIN-TOKEN 헤더로 관리자 확인
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+import logging
+from typing import Optional
+
+from app.domain.cache.response_cache import ResponseCache
+from app.www.admin_auth import verify_gateway_admin
+
+logger = logging.getLogger(__name__)
+router = APIRouter(
+    prefix="/api/v1/admin/cache",
+    tags=["cache"],
+    dependencies=[Depends(verify_gateway_admin)],
+)
+
+
+def get_response_cache(request: Request) -> ResponseCache:
+    response_cache = getattr(request.app.state, "response_cache", None)
+    if response_cache is None:
+        raise HTTPException(status_code=404, detail="응답 캐시가 비활성화되어 있습니다")
+    return response_cache
+
+
+@router.get("/stats")
+async def cache_stats(request: Request):
+    """응답 캐시 통계 (항목 수, 메모리, 적중률)"""
+    return get_response_cache(request).stats()
+
+
+@router.delete("")
+async def purge_cache(
+    request: Request,
+    prefix: Optional[str] = Query(None, description="무효화할 경로 prefix (예: /api/v1/tcfd/standards), 없으면 전체"),
+):
+    """응답 캐시 무효화"""
+    removed = get_response_cache(request).purge(prefix)
+    logger.info(f"🧹 응답 캐시 무효화: prefix={prefix or '*'}, {removed}건")
+    return {"success": True, "prefix": prefix, "removed": removed}
@@ -1,9 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Request, Query
 from fastapi.responses import JSONResponse
-import httpx
 import logging
 from typing import Optional
 import os
+import httpx
 
 from ..www.jwt_auth_middleware import verify_token
 from ..common.utility.constant.settings import Settings
@@ -32,6 +32,7 @@ async def verify_admin_token(token: str = Depends(verify_token)) -> bool:
 
 @router.post("/upload")
 async def upload_faiss_files(
+    request: Request,
     index: UploadFile = File(..., description="FAISS 인덱스 파일"),
     store: UploadFile = File(..., description="문서 스토어 파일"),
     _: bool = Depends(verify_admin_token)
@@ -55,7 +56,7 @@ async def upload_faiss_files(
             raise HTTPException(status_code=400, detail="스토어 파일이 너무 큽니다 (100MB 제한)")
         
         # LLM 서비스로 파일 전달
-        async with httpx.AsyncClient(timeout=300.0) as client:  # 5분 타임아웃
+        async with request.app.state.service_discovery.http_session("llm-service", timeout=300.0) as client:  # 5분 타임아웃
             files = {
                 "index": (index.filename, index.file, "application/octet-stream"),
                 "store": (store.filename, store.file, "application/octet-stream")
@@ -104,12 +105,12 @@ async def upload_faiss_files(
 # =============================================================================
 
 @router.get("/status")
-async def get_faiss_status():
+async def get_faiss_status(request: Request):
     """LLM 서비스의 FAISS 상태를 확인합니다."""
     try:
         llm_service_url = os.getenv("LLM_SERVICE_URL", "http://llm-service:8002")
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with request.app.state.service_discovery.http_session("llm-service", timeout=30.0) as client:
             response = await client.get(f"{llm_service_url}/health")
             
             if response.status_code == 200:
@@ -141,6 +142,7 @@ async def get_faiss_status():
 
 @router.post("/swap")
 async def swap_faiss_files(
+    request: Request,
     index: UploadFile = File(..., description="새 FAISS 인덱스 파일"),
     store: UploadFile = File(..., description="새 문서 스토어 파일"),
     _: bool = Depends(verify_admin_token)
@@ -161,7 +163,7 @@ async def swap_faiss_files(
         llm_service_url = os.getenv("LLM_SERVICE_URL", "http://llm-service:8002")
         admin_token = os.getenv("LLM_ADMIN_TOKEN", "supersecret")
         
-        async with httpx.AsyncClient(timeout=300.0) as client:
+        async with request.app.state.service_discovery.http_session("llm-service", timeout=300.0) as client:
             files = {
                 "index": (temp_index_name, index.file, "application/octet-stream"),
                 "store": (temp_store_name, store.file, "application/octet-stream")
@@ -201,3 +203,122 @@ async def swap_faiss_files(
     except Exception as e:
         logger.error(f"FAISS 파일 교체 중 오류: {e}")
         raise HTTPException(status_code=500, detail=f"파일 교체 실패: {str(e)}")
+
+# =============================================================================
+# 📦 FAISS 청크 업로드 (재개 가능, 스트리밍 전달)
+# =============================================================================
+
+# 업로드 제어 요청 / 청크 1개 전송 타임아웃(초)
+CHUNK_UPLOAD_TIMEOUT = 120.0
+CHUNK_COMMIT_TIMEOUT = 300.0
+
+# LLM 서비스 응답 중 클라이언트에 그대로 전달할 헤더
+CHUNK_UPLOAD_RESPONSE_HEADERS = ("upload-offset",)
+
+
+async def _relay_upload_request(request: Request, method: str, path: str,
+                                timeout: float, **kwargs) -> JSONResponse:
+    """LLM 서비스 청크 업로드 API 호출 후 상태 코드 / 본문을 그대로 반환"""
+    llm_service_url = os.getenv("LLM_SERVICE_URL", "http://llm-service:8002")
+    headers = kwargs.pop("headers", {})
+    headers["X-ADMIN-TOKEN"] = os.getenv("LLM_ADMIN_TOKEN", "supersecret")
+
+    try:
+        async with request.app.state.service_discovery.http_session("llm-service", timeout=timeout) as client:
+            response = await client.request(
+                method,
+                f"{llm_service_url}/rag/faiss/uploads{path}",
+                headers=headers,
+                **kwargs
+            )
+    except httpx.TimeoutException:
+        logger.error(f"⏰ FAISS 청크 업로드 타임아웃: {method} {path}")
+        raise HTTPException(status_code=504, detail="LLM 서비스 응답 시간 초과")
+    except httpx.HTTPError as e:
+        logger.error(f"❌ FAISS 청크 업로드 전달 실패: {method} {path} - {e}")
+        raise HTTPException(status_code=502, detail=f"LLM 서비스 연결 실패: {str(e)}")
+
+    try:
+        content = response.json()
+    except ValueError:
+        content = {"detail": response.text}
+    relay_headers = {
+        name: response.headers[name]
+        for name in CHUNK_UPLOAD_RESPONSE_HEADERS
+        if name in response.headers
+    }
+    if response.status_code >= 400:
+        logger.warning(f"⚠️ FAISS 청크 업로드 응답 {response.status_code}: {method} {path} - {content}")
+    return JSONResponse(status_code=response.status_code, content=content, headers=relay_headers)
+
+
+@router.post("/uploads")
+async def init_chunked_upload(
+    request: Request,
+    _: bool = Depends(verify_admin_token)
+):
+    """
+    청크 업로드 세션을 생성합니다.
+
+    요청 본문: {"target": "sr_corpus", "index": {"size", "sha256"}, "store": {"size", "sha256"}}
+    """
+    body = await request.body()
+    return await _relay_upload_request(
+        request, "POST", "", CHUNK_UPLOAD_TIMEOUT,
+        content=body, headers={"Content-Type": "application/json"}
+    )
+
+
+@router.get("/uploads/{upload_id}")
+async def get_chunked_upload_status(
+    request: Request,
+    upload_id: str,
+    _: bool = Depends(verify_admin_token)
+):
+    """파일별 수신 offset 을 조회합니다 (중단된 업로드 이어받기용)."""
+    return await _relay_upload_request(request, "GET", f"/{upload_id}", CHUNK_UPLOAD_TIMEOUT)
+
+
+@router.put("/uploads/{upload_id}/{file_name}")
+async def put_chunked_upload(
+    request: Request,
+    upload_id: str,
+    file_name: str,
+    offset: int = Query(..., ge=0, description="청크 시작 위치 (바이트)"),
+    _: bool = Depends(verify_admin_token)
+):
+    """
+    청크를 LLM 서비스로 전달합니다.
+
+    요청 본문을 게이트웨이에 모으지 않고 수신하는 대로 업스트림에 흘려보냅니다.
+    """
+    headers = {"Content-Type": "application/octet-stream"}
+    for name in ("content-length", "x-chunk-sha256"):
+        if name in request.headers:
+            headers[name] = request.headers[name]
+
+    return await _relay_upload_request(
+        request, "PUT", f"/{upload_id}/{file_name}", CHUNK_UPLOAD_TIMEOUT,
+        params={"offset": offset}, content=request.stream(), headers=headers
+    )
+
+
+@router.post("/uploads/{upload_id}/commit")
+async def commit_chunked_upload(
+    request: Request,
+    upload_id: str,
+    _: bool = Depends(verify_admin_token)
+):
+    """체크섬 검증 후 인덱스를 교체하고 LLM 서비스의 인덱스를 재로딩합니다."""
+    logger.info(f"📦 FAISS 청크 업로드 완료 요청: {upload_id}")
+    return await _relay_upload_request(request, "POST", f"/{upload_id}/commit", CHUNK_COMMIT_TIMEOUT)
+
+
+@router.delete("/uploads/{upload_id}")
+async def abort_chunked_upload(
+    request: Request,
+    upload_id: str,
+    _: bool = Depends(verify_admin_token)
+):
+    """청크 업로드를 취소합니다."""
+    return await _relay_upload_request(request, "DELETE", f"/{upload_id}", CHUNK_UPLOAD_TIMEOUT)
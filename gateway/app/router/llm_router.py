@@ -0,0 +1,59 @@
+"""
+LLM Service 프록시 라우터
+- 라우트 테이블 기반으로 llm-service 의 RAG 초안/윤문 API 에 요청을 스트리밍 전달
+- ?stream=true 또는 Accept: text/event-stream 요청은 SSE 응답을 버퍼링 없이 그대로 전달
+- 생성 라우트는 "llm" 클래스 입장 제어 적용 (스트림 종료 시 반환)
+"""
+from fastapi import APIRouter
+import logging
+
+from app.router.auth_router import verify_token
+from app.domain.proxy.proxy_route import ProxyRoute
+from app.domain.proxy.reverse_proxy import ReverseProxy
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/llm", tags=["llm"])
+
+# 업스트림 타임아웃은 읽기 단위로 적용되므로 SSE 스트림은 토큰이 도착하는 동안 끊기지 않음
+# (비스트리밍 요청은 전체 생성 완료까지 이 시간 안에 응답해야 함)
+LLM_GENERATION_TIMEOUT = 120.0
+
+LLM_ROUTES = [
+    ProxyRoute(
+        "POST", "/rag/search", "llm-service", "/rag/search",
+        timeout=30.0, auth_required=True,
+        summary="RAG 문서 검색",
+    ),
+    ProxyRoute(
+        "POST", "/rag/draft", "llm-service", "/rag/draft",
+        timeout=LLM_GENERATION_TIMEOUT, auth_required=True,
+        admission_class="llm",
+        summary="섹션별 초안 생성 (stream=true 시 SSE)",
+    ),
+    ProxyRoute(
+        "POST", "/rag/polish", "llm-service", "/rag/polish",
+        timeout=LLM_GENERATION_TIMEOUT, auth_required=True,
+        admission_class="llm",
+        summary="텍스트 윤문 (stream=true 시 SSE)",
+    ),
+    ProxyRoute(
+        "POST", "/rag/draft-and-polish", "llm-service", "/rag/draft-and-polish",
+        timeout=LLM_GENERATION_TIMEOUT, auth_required=True,
+        admission_class="llm",
+        summary="초안 생성 + 윤문 (stream=true 시 SSE)",
+    ),
+    ProxyRoute(
+        "POST", "/tcfd/generate-recommendation", "llm-service", "/tcfd/generate-recommendation",
+        timeout=LLM_GENERATION_TIMEOUT, auth_required=True,
+        admission_class="llm",
+        summary="TCFD 권고사항 문장 생성 (stream=true 시 SSE)",
+    ),
+    ProxyRoute(
+        "POST", "/tcfd/generate-recommendations/batch", "llm-service", "/tcfd/generate-recommendations/batch",
+        timeout=LLM_GENERATION_TIMEOUT, auth_required=True,
+        admission_class="llm",
+        summary="TCFD 권고사항 일괄 생성 (stream=true 시 완료 순 SSE)",
+    ),
+]
+
+ReverseProxy(authenticate=verify_token).include(router, LLM_ROUTES)
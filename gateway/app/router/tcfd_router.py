@@ -1,972 +1,85 @@
-from fastapi import APIRouter, Request, HTTPException, Header, Depends, Query
-from app.domain.discovery.service_discovery import ServiceDiscovery
-from app.router.auth_router import verify_token
-import httpx
+"""
+TCFD Service 프록시 라우터
+- 라우트 테이블 기반으로 tcfd-service / llm-service 에 요청을 스트리밍 전달
+- JWT 검증 후 사용자 정보(user_id, email, name, company_id)를 쿼리 파라미터로 주입
+"""
+from fastapi import APIRouter
 import logging
-import traceback
-import os
-from typing import Optional, Dict, Any, List
+
+from app.router.auth_router import verify_token
+from app.domain.proxy.proxy_route import ProxyRoute
+from app.domain.proxy.reverse_proxy import ReverseProxy
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/tcfd", tags=["tcfd"])
 
-@router.get("/standards")
-async def get_tcfd_standards(request: Request, authorization: str = Header(None)):
-    """TCFD 표준 정보 전체 조회"""
-    try:
-        logger.info("🔍 TCFD 표준 정보 조회 요청 시작")
-        
-        # JWT 토큰 검증
-        if not authorization or not authorization.startswith('Bearer '):
-            raise HTTPException(status_code=401, detail="Bearer 토큰이 필요합니다")
-        
-        # 토큰 검증 및 사용자 정보 추출
-        user_info = await verify_token(authorization)
-        logger.info(f"✅ 토큰 검증 성공, 사용자: {user_info.get('user_info', {}).get('user_id', 'unknown')}")
-        
-        # Auth Service 응답 구조에 맞게 사용자 정보 추출
-        user_data = user_info.get('user_info', {})
-        if not user_data:
-            logger.warning("⚠️ 사용자 정보가 없습니다")
-            user_data = {}
-        
-        # Service Discovery를 통해 TCFD Service 인스턴스 가져오기
-        service_discovery: ServiceDiscovery = request.app.state.service_discovery
-        logger.info(f"📡 Service Discovery 상태: {service_discovery}")
-        
-        # 등록된 모든 TCFD Service 인스턴스 확인
-        all_tcfd_instances = service_discovery.get_service_instances("tcfd-service")
-        logger.info(f"🔍 등록된 모든 TCFD Service 인스턴스: {all_tcfd_instances}")
-        
-        tcfd_service = service_discovery.get_service_instance("tcfd-service")
-        logger.info(f"🎯 선택된 TCFD Service 인스턴스: {tcfd_service}")
-        
-        if not tcfd_service:
-            logger.error("❌ TCFD Service를 찾을 수 없습니다")
-            raise HTTPException(status_code=503, detail="TCFD Service를 찾을 수 없습니다")
-        
-        # TCFD Service로 요청 전달
-        host = tcfd_service.host
-        port = tcfd_service.port
-        logger.info(f"🔍 원본 TCFD Service host: {host}")
-        logger.info(f"🔍 TCFD Service port: {port}")
-        logger.info(f"🔍 RAILWAY_ENVIRONMENT: {os.getenv('RAILWAY_ENVIRONMENT')}")
-        logger.info(f"🔍 USE_RAILWAY_TCFD: {os.getenv('USE_RAILWAY_TCFD')}")
-        
-        # URL이 이미 완전한 형태인지 확인
-        if not host.startswith(('http://', 'https://')):
-            # Docker 환경에서는 http:// 사용, Railway에서는 https:// 사용
-            if os.getenv("RAILWAY_ENVIRONMENT") in ["true", "production"]:
-                host = f"https://{host}"
-                logger.info(f"🔧 Railway 환경: https:// 추가됨")
-            else:
-                host = f"http://{host}"
-                logger.info(f"🔧 Docker 환경: http:// 추가됨")
-        
-        logger.info(f"🌐 TCFD Service URL: {host}")
-        logger.info(f"📤 요청 엔드포인트: {host}/api/v1/tcfd/standards")
-        
-        # 사용자 정보를 쿼리 파라미터로 전달
-        user_params = {
-            "user_id": user_data.get("user_id"),
-            "email": user_data.get("email"),
-            "name": user_data.get("name"),
-            "company_id": user_data.get("company_id")
-        }
-        
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # HTTPS URL에는 포트를 추가하지 않음 (Railway는 기본 443 포트 사용)
-            if host.startswith("https://"):
-                url = f"{host}/api/v1/tcfd/standards"
-            else:
-                # HTTP URL에만 포트 추가 (Docker 환경)
-                url = f"{host}:{port}/api/v1/tcfd/standards" if port else f"{host}/api/v1/tcfd/standards"
-            
-            logger.info(f"📤 최종 요청 URL: {url}")
-            logger.info(f"📤 사용자 정보: {user_params}")
-            logger.info(f"📤 Authorization 헤더: {authorization}")
-            
-            # Authorization 헤더와 사용자 정보를 함께 전달
-            headers = {"Authorization": authorization}
-            response = await client.get(url, params=user_params, headers=headers)
-            logger.info(f"📥 TCFD Service 응답 상태: {response.status_code}")
-            logger.info(f"📥 TCFD Service 응답 헤더: {dict(response.headers)}")
-            
-            response.raise_for_status()
-            response_data = response.json()
-            logger.info(f"✅ TCFD Service 응답 데이터: {response_data}")
-            return response_data
-            
-    except HTTPException:
-        raise
-    except httpx.HTTPStatusError as e:
-        logger.error(f"❌ TCFD Service HTTP 응답 오류: {e.response.status_code}")
-        logger.error(f"❌ 응답 내용: {e.response.text}")
-        raise HTTPException(status_code=e.response.status_code, detail=f"TCFD Service 응답 오류: {e.response.status_code}")
-    except Exception as e:
-        logger.error(f"❌ TCFD Service 요청 실패: {str(e)}")
-        logger.error(f"❌ 오류 타입: {type(e).__name__}")
-        logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
-        raise HTTPException(status_code=500, detail=f"TCFD Service 요청 실패: {str(e)}")
-
-@router.get("/company-overview")
-async def get_company_overview(request: Request, company_name: str, authorization: str = Header(None)):
-    """회사별 기업개요 정보 조회"""
-    try:
-        logger.info(f"🔍 회사별 기업개요 정보 조회 요청 시작: {company_name}")
-        
-        # JWT 토큰 검증
-        if not authorization or not authorization.startswith('Bearer '):
-            raise HTTPException(status_code=401, detail="Bearer 토큰이 필요합니다")
-        
-        # 토큰 검증 및 사용자 정보 추출
-        user_info = await verify_token(authorization)
-        logger.info(f"✅ 토큰 검증 성공, 사용자: {user_info.get('user_info', {}).get('user_id', 'unknown')}")
-        
-        # Auth Service 응답 구조에 맞게 사용자 정보 추출
-        user_data = user_info.get('user_info', {})
-        if not user_data:
-            logger.warning("⚠️ 사용자 정보가 없습니다")
-            user_data = {}
-        
-        # Service Discovery를 통해 TCFD Service 인스턴스 가져오기
-        service_discovery: ServiceDiscovery = request.app.state.service_discovery
-        logger.info(f"📡 Service Discovery 상태: {service_discovery}")
-        
-        # 등록된 모든 TCFD Service 인스턴스 확인
-        all_tcfd_instances = service_discovery.get_service_instances("tcfd-service")
-        logger.info(f"🔍 등록된 모든 TCFD Service 인스턴스: {all_tcfd_instances}")
-        
-        tcfd_service = service_discovery.get_service_instance("tcfd-service")
-        logger.info(f"🎯 선택된 TCFD Service 인스턴스: {tcfd_service}")
-        
-        if not tcfd_service:
-            logger.error("❌ TCFD Service를 찾을 수 없습니다")
-            raise HTTPException(status_code=503, detail="TCFD Service를 찾을 수 없습니다")
-        
-        # TCFD Service로 요청 전달
-        host = tcfd_service.host
-        port = tcfd_service.port
-        logger.info(f"🔍 원본 TCFD Service host: {host}")
-        logger.info(f"🔍 TCFD Service port: {port}")
-        logger.info(f"🔍 RAILWAY_ENVIRONMENT: {os.getenv('RAILWAY_ENVIRONMENT')}")
-        logger.info(f"🔍 USE_RAILWAY_TCFD: {os.getenv('USE_RAILWAY_TCFD')}")
-        
-        # URL이 이미 완전한 형태인지 확인
-        if not host.startswith(('http://', 'https://')):
-            # Docker 환경에서는 http:// 사용, Railway에서는 https:// 사용
-            if os.getenv("RAILWAY_ENVIRONMENT") in ["true", "production"]:
-                host = f"https://{host}"
-                logger.info(f"🔧 Railway 환경: https:// 추가됨")
-            else:
-                host = f"http://{host}"
-                logger.info(f"🔧 Docker 환경: http:// 추가됨")
-        
-        logger.info(f"🌐 TCFD Service URL: {host}")
-        logger.info(f"📤 요청 엔드포인트: {host}/api/v1/tcfd/company-overview")
-        
-        # 사용자 정보를 쿼리 파라미터로 전달
-        user_params = {
-            "company_name": company_name,
-            "user_id": user_data.get("user_id"),
-            "email": user_data.get("email"),
-            "company_id": user_data.get("company_id")
-        }
-        
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # HTTPS URL에는 포트를 추가하지 않음 (Railway는 기본 443 포트 사용)
-            if host.startswith("https://"):
-                url = f"{host}/api/v1/tcfd/company-overview"
-            else:
-                # HTTP URL에만 포트 추가 (Docker 환경)
-                url = f"{host}:{port}/api/v1/tcfd/company-overview" if port else f"{host}/api/v1/tcfd/company-overview"
-            
-            logger.info(f"📤 최종 요청 URL: {url}")
-            logger.info(f"📤 사용자 정보: {user_params}")
-            logger.info(f"📤 Authorization 헤더: {authorization}")
-            
-            # Authorization 헤더와 사용자 정보를 함께 전달
-            headers = {"Authorization": authorization}
-            response = await client.get(url, params=user_params, headers=headers)
-            logger.info(f"📥 TCFD Service 응답 상태: {response.status_code}")
-            logger.info(f"📥 TCFD Service 응답 헤더: {dict(response.headers)}")
-            
-            response.raise_for_status()
-            response_data = response.json()
-            logger.info(f"✅ TCFD Service 응답 데이터: {response_data}")
-            return response_data
-            
-    except HTTPException:
-        raise
-    except httpx.HTTPStatusError as e:
-        logger.error(f"❌ TCFD Service HTTP 응답 오류: {e.response.status_code}")
-        logger.error(f"❌ 응답 내용: {e.response.text}")
-        raise HTTPException(status_code=e.response.status_code, detail=f"TCFD Service 응답 오류: {e.response.status_code}")
-    except Exception as e:
-        logger.error(f"❌ TCFD Service 요청 실패: {str(e)}")
-        logger.error(f"❌ 오류 타입: {type(e).__name__}")
-        logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
-        raise HTTPException(status_code=500, detail=f"TCFD Service 요청 실패: {str(e)}")
-
-@router.get("/standards/{category}")
-async def get_tcfd_standards_by_category(request: Request, category: str, authorization: str = Header(None)):
-    """카테고리별 TCFD 표준 정보 조회"""
-    try:
-        logger.info(f"🔍 카테고리별 TCFD 표준 정보 조회 요청 시작: {category}")
-        
-        # JWT 토큰 검증
-        if not authorization or not authorization.startswith('Bearer '):
-            raise HTTPException(status_code=401, detail="Bearer 토큰이 필요합니다")
-        
-        # 토큰 검증 및 사용자 정보 추출
-        user_info = await verify_token(authorization)
-        logger.info(f"✅ 토큰 검증 성공, 사용자: {user_info.get('user_info', {}).get('user_id', 'unknown')}")
-        
-        # Auth Service 응답 구조에 맞게 사용자 정보 추출
-        user_data = user_info.get('user_info', {})
-        if not user_data:
-            logger.warning("⚠️ 사용자 정보가 없습니다")
-            user_data = {}
-        
-        # Service Discovery를 통해 TCFD Service 인스턴스 가져오기
-        service_discovery: ServiceDiscovery = request.app.state.service_discovery
-        logger.info(f"📡 Service Discovery 상태: {service_discovery}")
-        
-        # 등록된 모든 TCFD Service 인스턴스 확인
-        all_tcfd_instances = service_discovery.get_service_instances("tcfd-service")
-        logger.info(f"🔍 등록된 모든 TCFD Service 인스턴스: {all_tcfd_instances}")
-        
-        tcfd_service = service_discovery.get_service_instance("tcfd-service")
-        logger.info(f"🎯 선택된 TCFD Service 인스턴스: {tcfd_service}")
-        
-        if not tcfd_service:
-            logger.error("❌ TCFD Service를 찾을 수 없습니다")
-            raise HTTPException(status_code=503, detail="TCFD Service를 찾을 수 없습니다")
-        
-        # TCFD Service로 요청 전달
-        host = tcfd_service.host
-        port = tcfd_service.port
-        logger.info(f"🔍 원본 TCFD Service host: {host}")
-        logger.info(f"🔍 TCFD Service port: {port}")
-        logger.info(f"🔍 RAILWAY_ENVIRONMENT: {os.getenv('RAILWAY_ENVIRONMENT')}")
-        logger.info(f"🔍 USE_RAILWAY_TCFD: {os.getenv('USE_RAILWAY_TCFD')}")
-        
-        # URL이 이미 완전한 형태인지 확인
-        if not host.startswith(('http://', 'https://')):
-            # Docker 환경에서는 http:// 사용, Railway에서는 https:// 사용
-            if os.getenv("RAILWAY_ENVIRONMENT") in ["true", "production"]:
-                host = f"https://{host}"
-                logger.info(f"🔧 Railway 환경: https:// 추가됨")
-            else:
-                host = f"http://{host}"
-                logger.info(f"🔧 Docker 환경: http:// 추가됨")
-        
-        logger.info(f"🌐 TCFD Service URL: {host}")
-        logger.info(f"📤 요청 엔드포인트: {host}/api/v1/tcfd/standards/{category}")
-        
-        # 사용자 정보를 쿼리 파라미터로 전달
-        user_params = {
-            "user_id": user_data.get("user_id"),
-            "email": user_data.get("email"),
-            "name": user_data.get("name"),
-            "company_id": user_data.get("company_id")
-        }
-        
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # HTTPS URL에는 포트를 추가하지 않음 (Railway는 기본 443 포트 사용)
-            if host.startswith("https://"):
-                url = f"{host}/api/v1/tcfd/standards/{category}"
-            else:
-                # HTTP URL에만 포트 추가 (Docker 환경)
-                url = f"{host}:{port}/api/v1/tcfd/standards/{category}" if port else f"{host}/api/v1/tcfd/standards/{category}"
-            
-            logger.info(f"📤 최종 요청 URL: {url}")
-            logger.info(f"📤 사용자 정보: {user_params}")
-            logger.info(f"📤 Authorization 헤더: {authorization}")
-            
-            # Authorization 헤더와 사용자 정보를 함께 전달
-            headers = {"Authorization": authorization}
-            response = await client.get(url, params=user_params, headers=headers)
-            logger.info(f"📥 TCFD Service 응답 상태: {response.status_code}")
-            logger.info(f"📥 TCFD Service 응답 헤더: {dict(response.headers)}")
-            
-            response.raise_for_status()
-            response_data = response.json()
-            logger.info(f"✅ TCFD Service 응답 데이터: {response_data}")
-            return response_data
-            
-    except HTTPException:
-        raise
-    except httpx.HTTPStatusError as e:
-        logger.error(f"❌ TCFD Service HTTP 응답 오류: {e.response.status_code}")
-        logger.error(f"❌ 응답 내용: {e.response.text}")
-        raise HTTPException(status_code=e.response.status_code, detail=f"TCFD Service 응답 오류: {e.response.status_code}")
-    except Exception as e:
-        logger.error(f"❌ TCFD Service 요청 실패: {str(e)}")
-        logger.error(f"❌ 오류 타입: {type(e).__name__}")
-        logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
-        raise HTTPException(status_code=500, detail=f"TCFD Service 요청 실패: {str(e)}")
-
-@router.get("/companies")
-async def get_companies(request: Request, authorization: str = Header(None)):
-    """회사 목록 조회"""
-    try:
-        logger.info("🔍 회사 목록 조회 요청 시작")
-        
-        # JWT 토큰 검증
-        if not authorization or not authorization.startswith('Bearer '):
-            raise HTTPException(status_code=401, detail="Bearer 토큰이 필요합니다")
-        
-        # 토큰 검증 및 사용자 정보 추출
-        user_info = await verify_token(authorization)
-        logger.info(f"✅ 토큰 검증 성공, 사용자: {user_info.get('user_info', {}).get('user_id', 'unknown')}")
-        
-        # Auth Service 응답 구조에 맞게 사용자 정보 추출
-        user_data = user_info.get('user_info', {})
-        if not user_data:
-            logger.warning("⚠️ 사용자 정보가 없습니다")
-            user_data = {}
-        
-        # Service Discovery를 통해 TCFD Service 인스턴스 가져오기
-        service_discovery: ServiceDiscovery = request.app.state.service_discovery
-        logger.info(f"📡 Service Discovery 상태: {service_discovery}")
-        
-        # 등록된 모든 TCFD Service 인스턴스 확인
-        all_tcfd_instances = service_discovery.get_service_instances("tcfd-service")
-        logger.info(f"🔍 등록된 모든 TCFD Service 인스턴스: {all_tcfd_instances}")
-        
-        tcfd_service = service_discovery.get_service_instance("tcfd-service")
-        logger.info(f"🎯 선택된 TCFD Service 인스턴스: {tcfd_service}")
-        
-        if not tcfd_service:
-            logger.error("❌ TCFD Service를 찾을 수 없습니다")
-            raise HTTPException(status_code=503, detail="TCFD Service를 찾을 수 없습니다")
-        
-        # TCFD Service로 요청 전달
-        host = tcfd_service.host
-        port = tcfd_service.port
-        logger.info(f"🔍 원본 TCFD Service host: {host}")
-        logger.info(f"🔍 TCFD Service port: {port}")
-        logger.info(f"🔍 RAILWAY_ENVIRONMENT: {os.getenv('RAILWAY_ENVIRONMENT')}")
-        logger.info(f"🔍 USE_RAILWAY_TCFD: {os.getenv('USE_RAILWAY_TCFD')}")
-        
-        # URL이 이미 완전한 형태인지 확인
-        if not host.startswith(('http://', 'https://')):
-            # Docker 환경에서는 http:// 사용, Railway에서는 https:// 사용
-            if os.getenv("RAILWAY_ENVIRONMENT") in ["true", "production"]:
-                host = f"https://{host}"
-                logger.info(f"🔧 Railway 환경: https:// 추가됨")
-            else:
-                host = f"http://{host}"
-                logger.info(f"🔧 Docker 환경: http:// 추가됨")
-        
-        logger.info(f"🌐 TCFD Service URL: {host}")
-        logger.info(f"📤 요청 엔드포인트: {host}/api/v1/tcfd/companies")
-        
-        # 사용자 정보를 쿼리 파라미터로 전달
-        user_params = {
-            "user_id": user_data.get("user_id"),
-            "email": user_data.get("email"),
-            "name": user_data.get("name"),
-            "company_id": user_data.get("company_id")
-        }
-        
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # HTTPS URL에는 포트를 추가하지 않음 (Railway는 기본 443 포트 사용)
-            if host.startswith("https://"):
-                url = f"{host}/api/v1/tcfd/companies"
-            else:
-                # HTTP URL에만 포트 추가 (Docker 환경)
-                url = f"{host}:{port}/api/v1/tcfd/companies" if port else f"{host}/api/v1/tcfd/companies"
-            
-            logger.info(f"📤 최종 요청 URL: {url}")
-            logger.info(f"📤 사용자 정보: {user_params}")
-            logger.info(f"📤 Authorization 헤더: {authorization}")
-            
-            # Authorization 헤더와 사용자 정보를 함께 전달
-            headers = {"Authorization": authorization}
-            response = await client.get(url, params=user_params, headers=headers)
-            logger.info(f"📥 TCFD Service 응답 상태: {response.status_code}")
-            logger.info(f"📥 TCFD Service 응답 헤더: {dict(response.headers)}")
-            
-            response.raise_for_status()
-            response_data = response.json()
-            logger.info(f"✅ TCFD Service 응답 데이터: {response_data}")
-            return response_data
-            
-    except HTTPException:
-        raise
-    except httpx.HTTPStatusError as e:
-        logger.error(f"❌ TCFD Service HTTP 응답 오류: {e.response.status_code}")
-        logger.error(f"❌ 응답 내용: {e.response.text}")
-        raise HTTPException(status_code=e.response.status_code, detail=f"TCFD Service 응답 오류: {e.response.status_code}")
-    except Exception as e:
-        logger.error(f"❌ TCFD Service 요청 실패: {str(e)}")
-        logger.error(f"❌ 오류 타입: {type(e).__name__}")
-        logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
-        raise HTTPException(status_code=500, detail=f"TCFD Service 요청 실패: {str(e)}")
-
-@router.get("/company-financial-data")
-async def get_company_financial_data(request: Request, company_name: str, authorization: str = Header(None)):
-    """회사별 재무정보 조회"""
-    try:
-        logger.info(f"🔍 회사별 재무정보 조회 요청 시작: {company_name}")
-        
-        # JWT 토큰 검증
-        if not authorization or not authorization.startswith('Bearer '):
-            raise HTTPException(status_code=401, detail="Bearer 토큰이 필요합니다")
-        
-        # 토큰 검증 및 사용자 정보 추출
-        user_info = await verify_token(authorization)
-        logger.info(f"✅ 토큰 검증 성공, 사용자: {user_info.get('user_info', {}).get('user_id', 'unknown')}")
-        
-        # Auth Service 응답 구조에 맞게 사용자 정보 추출
-        user_data = user_info.get('user_info', {})
-        if not user_data:
-            logger.warning("⚠️ 사용자 정보가 없습니다")
-            user_data = {}
-        
-        # Service Discovery를 통해 TCFD Service 인스턴스 가져오기
-        service_discovery: ServiceDiscovery = request.app.state.service_discovery
-        logger.info(f"📡 Service Discovery 상태: {service_discovery}")
-        
-        # 등록된 모든 TCFD Service 인스턴스 확인
-        all_tcfd_instances = service_discovery.get_service_instances("tcfd-service")
-        logger.info(f"🔍 등록된 모든 TCFD Service 인스턴스: {all_tcfd_instances}")
-        
-        tcfd_service = service_discovery.get_service_instance("tcfd-service")
-        logger.info(f"🎯 선택된 TCFD Service 인스턴스: {tcfd_service}")
-        
-        if not tcfd_service:
-            logger.error("❌ TCFD Service를 찾을 수 없습니다")
-            raise HTTPException(status_code=503, detail="TCFD Service를 찾을 수 없습니다")
-        
-        # TCFD Service로 요청 전달
-        host = tcfd_service.host
-        port = tcfd_service.port
-        logger.info(f"🔍 원본 TCFD Service host: {host}")
-        logger.info(f"🔍 TCFD Service port: {port}")
-        logger.info(f"🔍 RAILWAY_ENVIRONMENT: {os.getenv('RAILWAY_ENVIRONMENT')}")
-        logger.info(f"🔍 USE_RAILWAY_TCFD: {os.getenv('USE_RAILWAY_TCFD')}")
-        
-        # URL이 이미 완전한 형태인지 확인
-        if not host.startswith(('http://', 'https://')):
-            # Docker 환경에서는 http:// 사용, Railway에서는 https:// 사용
-            if os.getenv("RAILWAY_ENVIRONMENT") in ["true", "production"]:
-                host = f"https://{host}"
-                logger.info(f"🔧 Railway 환경: https:// 추가됨")
-            else:
-                host = f"http://{host}"
-                logger.info(f"🔧 Docker 환경: http:// 추가됨")
-        
-        logger.info(f"🌐 TCFD Service URL: {host}")
-        logger.info(f"📤 요청 엔드포인트: {host}/api/v1/tcfd/company-financial-data")
-        logger.info(f"📤 요청 파라미터: company_name={company_name}")
-        
-        # 사용자 정보를 쿼리 파라미터로 전달
-        user_params = {
-            "user_id": user_data.get("user_id"),
-            "email": user_data.get("email"),
-            "name": user_data.get("name"),
-            "company_id": user_data.get("company_id")
-        }
-        
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # 포트가 있는 경우에만 포트 추가
-            if host.startswith("https://"):
-                url = f"{host}/api/v1/tcfd/company-financial-data"
-            else:
-                url = f"{host}:{port}/api/v1/tcfd/company-financial-data" if port else f"{host}/api/v1/tcfd/company-financial-data"
-            
-            logger.info(f"📤 최종 요청 URL: {url}")
-            logger.info(f"📤 사용자 정보: {user_params}")
-            logger.info(f"📤 Authorization 헤더: {authorization}")
-            
-            # Authorization 헤더와 사용자 정보를 함께 전달
-            headers = {"Authorization": authorization}
-            response = await client.get(
-                url,
-                params={"company_name": company_name, **user_params},
-                headers=headers
-            )
-            logger.info(f"📥 TCFD Service 응답 상태: {response.status_code}")
-            logger.info(f"📥 TCFD Service 응답 헤더: {dict(response.headers)}")
-            
-            response.raise_for_status()
-            response_data = response.json()
-            logger.info(f"✅ TCFD Service 응답 데이터: {response_data}")
-            return response_data
-            
-    except HTTPException:
-        raise
-    except httpx.HTTPStatusError as e:
-        logger.error(f"❌ TCFD Service HTTP 응답 오류: {e.response.status_code}")
-        logger.error(f"❌ 응답 내용: {e.response.text}")
-        raise HTTPException(status_code=e.response.status_code, detail=f"TCFD Service 응답 오류: {e.response.status_code}")
-    except Exception as e:
-        logger.error(f"❌ TCFD Service 요청 실패: {str(e)}")
-        logger.error(f"❌ 오류 타입: {type(e).__name__}")
-        logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
-        raise HTTPException(status_code=500, detail=f"TCFD Service 요청 실패: {str(e)}")
-
-
-
-@router.get("/inputs")
-async def get_tcfd_inputs(request: Request, authorization: str = Header(None)):
-    """TCFD 입력 데이터 조회 (가장 최신 데이터 포함)"""
-    try:
-        logger.info("🔍 TCFD 입력 데이터 조회 요청 시작")
-        
-        # JWT 토큰 검증
-        if not authorization or not authorization.startswith('Bearer '):
-            raise HTTPException(status_code=401, detail="Bearer 토큰이 필요합니다")
-        
-        # 토큰 검증 및 사용자 정보 추출
-        user_info = await verify_token(authorization)
-        logger.info(f"✅ 토큰 검증 성공, 사용자: {user_info.get('user_info', {}).get('user_id', 'unknown')}")
-        
-        # Auth Service 응답 구조에 맞게 사용자 정보 추출
-        user_data = user_info.get('user_info', {})
-        if not user_data:
-            logger.warning("⚠️ 사용자 정보가 없습니다")
-            user_data = {}
-        
-        # Service Discovery를 통해 TCFD Service 인스턴스 가져오기
-        service_discovery: ServiceDiscovery = request.app.state.service_discovery
-        logger.info(f"📡 Service Discovery 상태: {service_discovery}")
-        
-        tcfd_service = service_discovery.get_service_instance("tcfd-service")
-        logger.info(f"🎯 선택된 TCFD Service 인스턴스: {tcfd_service}")
-        
-        if not tcfd_service:
-            logger.error("❌ TCFD Service를 찾을 수 없습니다")
-            raise HTTPException(status_code=503, detail="TCFD Service를 찾을 수 없습니다")
-        
-        # TCFD Service로 요청 전달
-        host = tcfd_service.host
-        port = tcfd_service.port
-        logger.info(f"🔍 원본 TCFD Service host: {host}")
-        logger.info(f"🔍 TCFD Service port: {port}")
-        logger.info(f"🔍 RAILWAY_ENVIRONMENT: {os.getenv('RAILWAY_ENVIRONMENT')}")
-        
-        # URL이 이미 완전한 형태인지 확인
-        if not host.startswith(('http://', 'https://')):
-            # Docker 환경에서는 http:// 사용, Railway에서는 https:// 사용
-            if os.getenv("RAILWAY_ENVIRONMENT") in ["true", "production"]:
-                host = f"https://{host}"
-                logger.info(f"🔧 Railway 환경: https:// 추가됨")
-            else:
-                host = f"http://{host}"
-                logger.info(f"🔧 Docker 환경: http:// 추가됨")
-        
-        logger.info(f"🌐 TCFD Service URL: {host}")
-        logger.info(f"📤 요청 엔드포인트: {host}/api/v1/tcfd/inputs")
-        
-        # 사용자 정보를 쿼리 파라미터로 전달
-        user_params = {
-            "user_id": user_data.get("user_id"),
-            "email": user_data.get("email"),
-            "company_id": user_data.get("company_id")
-        }
-        
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # Docker 환경에서는 컨테이너 이름과 포트 사용, Railway에서는 환경변수 사용
-            if os.getenv("RAILWAY_ENVIRONMENT") in ["true", "production"]:
-                # Railway 환경에서는 환경변수에서 직접 TCFD Service URL 가져오기
-                railway_tcfd_url = os.getenv("RAILWAY_TCFD_SERVICE_URL")
-                if railway_tcfd_url:
-                    url = f"{railway_tcfd_url}/api/v1/tcfd/inputs"
-                    logger.info(f"🔧 Railway 환경에서 TCFD Service URL: {url}")
-                else:
-                    # 환경변수가 없으면 Service Discovery에서 가져온 URL 사용
-                    url = f"{host}/api/v1/tcfd/inputs"
-                    logger.info(f"🔧 Railway 환경에서 Service Discovery TCFD Service URL: {url}")
-            else:
-                # Docker 환경에서는 컨테이너 이름과 포트 사용
-                url = f"http://tcfd-service:8005/api/v1/tcfd/inputs"
-                logger.info(f"🔧 Docker 환경에서 TCFD Service URL: {url}")
-            
-            logger.info(f"📤 최종 요청 URL: {url}")
-            logger.info(f"📤 사용자 정보: {user_params}")
-            logger.info(f"📤 Authorization 헤더: {authorization}")
-            
-            # Authorization 헤더와 사용자 정보를 함께 전달
-            headers = {"Authorization": authorization}
-            response = await client.get(
-                url,
-                params=user_params,
-                headers=headers
-            )
-            logger.info(f"📥 TCFD Service 응답 상태: {response.status_code}")
-            logger.info(f"📥 TCFD Service 응답 헤더: {dict(response.headers)}")
-            
-            response.raise_for_status()
-            response_data = response.json()
-            logger.info(f"✅ TCFD Service 응답 데이터: {response_data}")
-            return response_data
-            
-    except HTTPException:
-        raise
-    except httpx.HTTPStatusError as e:
-        logger.error(f"❌ TCFD Service HTTP 응답 오류: {e.response.status_code}")
-        logger.error(f"❌ 응답 내용: {e.response.text}")
-        raise HTTPException(status_code=e.response.status_code, detail=f"TCFD Service 응답 오류: {e.response.status_code}")
-    except Exception as e:
-        logger.error(f"❌ TCFD Service 요청 실패: {str(e)}")
-        logger.error(f"❌ 오류 타입: {type(e).__name__}")
-        logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
-        raise HTTPException(status_code=500, detail=f"TCFD Service 요청 실패: {str(e)}")
-
-@router.post("/generate-report")
-async def generate_tcfd_report(request: Request, authorization: str = Header(None)):
-    """TCFD 보고서 생성 (LLM Service로 요청 전달)"""
-    try:
-        logger.info("🔍 TCFD 보고서 생성 요청 시작")
-        
-        # JWT 토큰 검증
-        if not authorization or not authorization.startswith('Bearer '):
-            raise HTTPException(status_code=401, detail="Bearer 토큰이 필요합니다")
-        
-        # 토큰 검증 및 사용자 정보 추출
-        user_info = await verify_token(authorization)
-        logger.info(f"✅ 토큰 검증 성공, 사용자: {user_info.get('user_info', {}).get('user_id', 'unknown')}")
-        
-        # Auth Service 응답 구조에 맞게 사용자 정보 추출
-        user_data = user_info.get('user_info', {})
-        if not user_data:
-            logger.warning("⚠️ 사용자 정보가 없습니다")
-            user_data = {}
-        
-        # Service Discovery를 통해 LLM Service 인스턴스 가져오기
-        service_discovery: ServiceDiscovery = request.app.state.service_discovery
-        logger.info(f"📡 Service Discovery 상태: {service_discovery}")
-        
-        llm_service = service_discovery.get_service_instance("llm-service")
-        logger.info(f"🎯 선택된 LLM Service 인스턴스: {llm_service}")
-        
-        if not llm_service:
-            logger.error("❌ LLM Service를 찾을 수 없습니다")
-            raise HTTPException(status_code=503, detail="LLM Service를 찾을 수 없습니다")
-        
-        # LLM Service로 요청 전달
-        host = llm_service.host
-        port = llm_service.port
-        logger.info(f"🔍 원본 LLM Service host: {host}")
-        logger.info(f"🔍 LLM Service port: {port}")
-        logger.info(f"🔍 RAILWAY_ENVIRONMENT: {os.getenv('RAILWAY_ENVIRONMENT')}")
-        
-        # URL이 이미 완전한 형태인지 확인
-        if not host.startswith(('http://', 'https://')):
-            # Docker 환경에서는 http:// 사용, Railway에서는 https:// 사용
-            if os.getenv("RAILWAY_ENVIRONMENT") in ["true", "production"]:
-                host = f"https://{host}"
-                logger.info(f"🔧 Railway 환경: https:// 추가됨")
-            else:
-                host = f"http://{host}"
-                logger.info(f"🔧 Docker 환경: http:// 추가됨")
-        
-        logger.info(f"🌐 LLM Service URL: {host}")
-        logger.info(f"📤 요청 엔드포인트: {host}/tcfd/generate-report")
-        
-        # 사용자 정보를 쿼리 파라미터로 전달
-        user_params = {
-            "user_id": user_data.get("user_id"),
-            "email": user_data.get("email"),
-            "company_id": user_data.get("company_id")
-        }
-        
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # Railway 환경에서는 실제 서비스 URL 사용, Docker에서는 컨테이너 이름 사용
-            railway_llm_url = os.getenv("RAILWAY_LLM_SERVICE_URL")
-            if railway_llm_url:
-                url = f"{railway_llm_url}/tcfd/generate-report"
-                logger.info(f"🔧 Railway/Vercel 환경에서 환경변수 LLM Service URL: {url}")
-            else:
-                # Docker 환경에서는 컨테이너 이름과 포트 사용
-                url = f"http://llm-service:8002/tcfd/generate-report"
-                logger.info(f"🔧 Docker 환경에서 LLM Service URL: {url}")
-            
-            logger.info(f"📤 최종 요청 URL: {url}")
-            logger.info(f"📤 사용자 정보: {user_params}")
-            logger.info(f"📤 Authorization 헤더: {authorization}")
-            
-            # 요청 본문 읽기
-            request_body = await request.json()
-            logger.info(f"📤 요청 본문: {request_body}")
-            
-            # Authorization 헤더와 사용자 정보를 함께 전달
-            headers = {"Authorization": authorization}
-            response = await client.post(
-                url,
-                json=request_body,
-                headers=headers
-            )
-            logger.info(f"📥 LLM Service 응답 상태: {response.status_code}")
-            logger.info(f"📥 LLM Service 응답 헤더: {dict(response.headers)}")
-            
-            response.raise_for_status()
-            response_data = response.json()
-            logger.info(f"✅ LLM Service 응답 데이터: {response_data}")
-            return response_data
-            
-    except HTTPException:
-        raise
-    except httpx.HTTPStatusError as e:
-        logger.error(f"❌ LLM Service HTTP 응답 오류: {e.response.status_code}")
-        logger.error(f"❌ 응답 내용: {e.response.text}")
-        raise HTTPException(status_code=e.response.status_code, detail=f"LLM Service 응답 오류: {e.response.status_code}")
-    except Exception as e:
-        logger.error(f"❌ LLM Service 요청 실패: {str(e)}")
-        logger.error(f"❌ 오류 타입: {type(e).__name__}")
-        logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
-        raise HTTPException(status_code=500, detail=f"LLM Service 요청 실패: {str(e)}")
-
-@router.get("/climate-scenarios")
-async def get_climate_scenarios(
-    request: Request,
-    scenario_code: Optional[str] = Query(None, description="시나리오 코드 (SSP126, SSP585)"),
-    variable_code: Optional[str] = Query(None, description="기후변수 코드 (HW33, RN, TA, TR25, RAIN80)"),
-    year: Optional[int] = Query(None, description="연도 (2021-2100)"),
-    authorization: str = Header(None)
-):
-    """
-    기후 시나리오 데이터 조회
-    """
-    try:
-        logger.info("🔍 기후 시나리오 데이터 조회 요청 시작")
-        
-        # JWT 토큰 검증
-        if not authorization or not authorization.startswith('Bearer '):
-            raise HTTPException(status_code=401, detail="Bearer 토큰이 필요합니다")
-        
-        # 토큰 검증 및 사용자 정보 추출
-        user_info = await verify_token(authorization)
-        logger.info(f"✅ 토큰 검증 성공, 사용자: {user_info.get('user_info', {}).get('user_id', 'unknown')}")
-        
-        # Service Discovery를 통해 TCFD Service 인스턴스 가져오기
-        service_discovery: ServiceDiscovery = request.app.state.service_discovery
-        tcfd_service = service_discovery.get_service_instance("tcfd-service")
-        
-        if not tcfd_service:
-            logger.error("❌ TCFD Service를 찾을 수 없습니다")
-            raise HTTPException(status_code=503, detail="TCFD Service를 찾을 수 없습니다")
-        
-        # TCFD Service URL 구성
-        host = tcfd_service.host
-        port = tcfd_service.port
-        
-        if not host.startswith(('http://', 'https://')):
-            if os.getenv("RAILWAY_ENVIRONMENT") in ["true", "production"]:
-                host = f"https://{host}"
-            else:
-                host = f"http://{host}"
-        
-        # 쿼리 파라미터 구성
-        params = {}
-        if scenario_code:
-            params["scenario_code"] = scenario_code
-        if variable_code:
-            params["variable_code"] = variable_code
-        if year:
-            params["year"] = year
-        
-        # TCFD Service 호출
-        url = f"{host}/api/v1/tcfd/climate-scenarios"
-        if not host.startswith("https://") and port:
-            url = f"{host}:{port}/api/v1/tcfd/climate-scenarios"
-        
-        logger.info(f"📤 TCFD Service 호출: {url}")
-        logger.info(f"📤 파라미터: {params}")
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                url,
-                params=params,
-                headers={"Authorization": authorization},
-                timeout=30.0
-            )
-            
-            if response.status_code == 200:
-                logger.info("✅ 기후 시나리오 데이터 조회 성공")
-                return response.json()
-            else:
-                logger.error(f"❌ TCFD Service 응답 오류: {response.status_code}")
-                logger.error(f"❌ 응답 내용: {response.text}")
-                raise HTTPException(status_code=response.status_code, detail="TCFD Service 오류")
-                
-    except Exception as e:
-        logger.error(f"❌ 기후 시나리오 데이터 조회 실패: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"기후 시나리오 데이터 조회 실패: {str(e)}")
+# 업로드 스크립트 실행 시에만 바뀌는 읽기 위주 데이터 캐시 TTL(초)
+# 데이터 업로드 후에는 DELETE /api/v1/admin/cache 로 즉시 무효화
+STANDARDS_CACHE_TTL = 3600
+COMPANY_CACHE_TTL = 1800
+REGIONS_CACHE_TTL = 86400
 
-@router.get("/climate-scenarios/chart-image")
-async def generate_climate_chart_image(
-    request: Request,
-    scenario_code: str = Query(..., description="시나리오 코드 (SSP126, SSP585)"),
-    variable_code: str = Query(..., description="기후변수 코드 (HW33, RN, TA, TR25, RAIN80)"),
-    start_year: int = Query(2021, description="시작 연도"),
-    end_year: int = Query(2030, description="종료 연도"),
-    additional_years: Optional[List[int]] = Query(None, description="추가 연도 목록"),
-    region: Optional[str] = Query(None, description="행정구역명 (강남구, 해남군 등)"),
-    authorization: str = Header(None)
-):
-    """
-    기후 시나리오 데이터를 막대그래프 차트로 생성
-    """
-    try:
-        logger.info("🔍 기후 시나리오 막대그래프 차트 생성 요청 시작")
-        
-        # JWT 토큰 검증
-        if not authorization or not authorization.startswith('Bearer '):
-            raise HTTPException(status_code=401, detail="Bearer 토큰이 필요합니다")
-        
-        # 토큰 검증 및 사용자 정보 추출
-        user_info = await verify_token(authorization)
-        logger.info(f"✅ 토큰 검증 성공, 사용자: {user_info.get('user_info', {}).get('user_id', 'unknown')}")
-        
-        # Service Discovery를 통해 TCFD Service 인스턴스 가져오기
-        service_discovery: ServiceDiscovery = request.app.state.service_discovery
-        tcfd_service = service_discovery.get_service_instance("tcfd-service")
-        
-        if not tcfd_service:
-            logger.error("❌ TCFD Service를 찾을 수 없습니다")
-            raise HTTPException(status_code=503, detail="TCFD Service를 찾을 수 없습니다")
-        
-        # TCFD Service URL 구성
-        host = tcfd_service.host
-        port = tcfd_service.port
-        
-        if not host.startswith(('http://', 'https://')):
-            if os.getenv("RAILWAY_ENVIRONMENT") in ["true", "production"]:
-                host = f"https://{host}"
-            else:
-                host = f"http://{host}"
-        
-        # 쿼리 파라미터 구성
-        params = {
-            "scenario_code": scenario_code,
-            "variable_code": variable_code,
-            "start_year": start_year,
-            "end_year": end_year,
-            "region": region  # 행정구역 파라미터 추가
-        }
-        
-        # 추가 연도가 있으면 파라미터에 추가
-        if additional_years and len(additional_years) > 0:
-            params["additional_years"] = additional_years
-        
-        # 쿼리 파라미터에서 additional_years[] 직접 파싱 (FastAPI Query 파라미터 문제 해결)
-        query_params = dict(request.query_params)
-        additional_years_list = []
-        
-        # additional_years[] 파라미터가 여러 개 있을 수 있음
-        for key, value in query_params.items():
-            if key == 'additional_years[]':
-                if value and value.strip():  # 빈 값이 아닌 경우만 처리
-                    try:
-                        year_value = int(value.strip())
-                        additional_years_list.append(year_value)
-                        logger.info(f"🔍 추가 연도 파싱: {key} = {value} -> {year_value}")
-                    except ValueError:
-                        logger.warning(f"⚠️ 잘못된 추가 연도 값: {value}")
-        
-        # 중복 제거 및 정렬
-        if additional_years_list:
-            additional_years_list = sorted(list(set(additional_years_list)))
-            params["additional_years"] = additional_years_list
-            logger.info(f"🔍 최종 파싱된 추가 연도: {additional_years_list}")
-        else:
-            logger.info("🔍 추가 연도 파라미터가 없거나 빈 값")
-        
-        logger.info(f"🔍 원본 쿼리 파라미터: {dict(request.query_params)}")
-        logger.info(f"🔍 최종 파라미터: {params}")
-        
-        # TCFD Service 호출
-        url = f"{host}/api/v1/tcfd/climate-scenarios/chart-image"
-        if not host.startswith("https://") and port:
-            url = f"{host}:{port}/api/v1/tcfd/climate-scenarios/chart-image"
-        
-        logger.info(f"📤 TCFD Service 호출: {url}")
-        logger.info(f"📤 파라미터: {params}")
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                url,
-                params=params,
-                headers={"Authorization": authorization},
-                timeout=30.0
-            )
-            
-            if response.status_code == 200:
-                logger.info("✅ 기후 시나리오 막대그래프 차트 생성 성공")
-                return response.json()
-            else:
-                logger.error(f"❌ TCFD Service 응답 오류: {response.status_code}")
-                logger.error(f"❌ 응답 내용: {response.text}")
-                raise HTTPException(status_code=500, detail="TCFD Service 오류")
-                
-    except Exception as e:
-        logger.error(f"❌ 막대그래프 차트 생성 실패: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"막대그래프 차트 생성 실패: {str(e)}")
+TCFD_ROUTES = [
+    ProxyRoute(
+        "GET", "/standards", "tcfd-service", "/api/v1/tcfd/standards",
+        timeout=60.0, auth_required=True, inject_user=True,
+        cache_ttl=STANDARDS_CACHE_TTL,
+        summary="TCFD 표준 정보 전체 조회",
+    ),
+    ProxyRoute(
+        "GET", "/company-overview", "tcfd-service", "/api/v1/tcfd/company-overview",
+        timeout=60.0, auth_required=True, inject_user=True,
+        cache_ttl=COMPANY_CACHE_TTL,
+        summary="회사별 기업개요 정보 조회 (company_name)",
+    ),
+    ProxyRoute(
+        "GET", "/standards/{category}", "tcfd-service", "/api/v1/tcfd/standards/{category}",
+        timeout=60.0, auth_required=True, inject_user=True,
+        cache_ttl=STANDARDS_CACHE_TTL,
+        summary="카테고리별 TCFD 표준 정보 조회",
+    ),
+    ProxyRoute(
+        "GET", "/companies", "tcfd-service", "/api/v1/tcfd/companies",
+        timeout=60.0, auth_required=True, inject_user=True,
+        cache_ttl=COMPANY_CACHE_TTL,
+        summary="회사 목록 조회",
+    ),
+    ProxyRoute(
+        "GET", "/company-financial-data", "tcfd-service", "/api/v1/tcfd/company-financial-data",
+        timeout=60.0, auth_required=True, inject_user=True,
+        coalesce=True,
+        summary="회사별 재무정보 조회 (company_name)",
+    ),
+    ProxyRoute(
+        "GET", "/inputs", "tcfd-service", "/api/v1/tcfd/inputs",
+        timeout=60.0, auth_required=True, inject_user=True,
+        summary="TCFD 입력 데이터 조회 (가장 최신 데이터 포함)",
+    ),
+    ProxyRoute(
+        "POST", "/generate-report", "llm-service", "/tcfd/generate-report",
+        timeout=60.0, auth_required=True, inject_user=True,
+        admission_class="llm",
+        summary="TCFD 보고서 생성 (LLM Service, stream=true 시 SSE)",
+    ),
+    ProxyRoute(
+        "GET", "/climate-scenarios", "tcfd-service", "/api/v1/tcfd/climate-scenarios",
+        timeout=30.0, auth_required=True,
+        coalesce=True,
+        summary="기후 시나리오 데이터 조회 (scenario_code, variable_code, year)",
+    ),
+    ProxyRoute(
+        "GET", "/climate-scenarios/chart-image", "tcfd-service", "/api/v1/tcfd/climate-scenarios/chart-image",
+        timeout=30.0, auth_required=True,
+        coalesce=True,
+        query_aliases={"additional_years[]": "additional_years"},
+        summary="기후 시나리오 데이터를 막대그래프 차트로 생성",
+    ),
+    ProxyRoute(
+        "GET", "/administrative-regions", "tcfd-service", "/api/v1/tcfd/administrative-regions",
+        timeout=30.0, auth_required=True,
+        cache_ttl=REGIONS_CACHE_TTL,
+        summary="행정구역 목록 조회",
+    ),
+]
 
-@router.get("/administrative-regions")
-async def get_administrative_regions(
-    request: Request,
-    authorization: str = Header(None)
-):
-    """
-    행정구역 목록 조회
-    """
-    try:
-        logger.info("🔍 행정구역 목록 조회 요청 시작")
-        
-        # JWT 토큰 검증
-        if not authorization or not authorization.startswith('Bearer '):
-            raise HTTPException(status_code=401, detail="Bearer 토큰이 필요합니다")
-        
-        # 토큰 검증 및 사용자 정보 추출
-        user_info = await verify_token(authorization)
-        logger.info(f"✅ 토큰 검증 성공, 사용자: {user_info.get('user_info', {}).get('user_id', 'unknown')}")
-        
-        # Service Discovery를 통해 TCFD Service 인스턴스 가져오기
-        service_discovery: ServiceDiscovery = request.app.state.service_discovery
-        tcfd_service = service_discovery.get_service_instance("tcfd-service")
-        
-        if not tcfd_service:
-            logger.error("❌ TCFD Service를 찾을 수 없습니다")
-            raise HTTPException(status_code=503, detail="TCFD Service를 찾을 수 없습니다")
-        
-        # TCFD Service URL 구성
-        host = tcfd_service.host
-        port = tcfd_service.port
-        
-        if not host.startswith(('http://', 'https://')):
-            if os.getenv("RAILWAY_ENVIRONMENT") in ["true", "production"]:
-                host = f"https://{host}"
-            else:
-                host = f"http://{host}"
-        
-        # TCFD Service 호출
-        url = f"{host}/api/v1/tcfd/administrative-regions"
-        if not host.startswith("https://") and port:
-            url = f"{host}:{port}/api/v1/tcfd/administrative-regions"
-        
-        logger.info(f"📤 TCFD Service 호출: {url}")
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                url,
-                headers={"Authorization": authorization},
-                timeout=30.0
-            )
-            
-            if response.status_code == 200:
-                logger.info("✅ 행정구역 목록 조회 성공")
-                return response.json()
-            else:
-                logger.error(f"❌ TCFD Service 응답 오류: {response.status_code}")
-                logger.error(f"❌ 응답 내용: {response.text}")
-                raise HTTPException(status_code=response.status_code, detail="TCFD Service 오류")
-                
-    except Exception as e:
-        logger.error(f"❌ 행정구역 목록 조회 실패: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"행정구역 목록 조회 실패: {str(e)}")
\ No newline at end of file
+ReverseProxy(authenticate=verify_token).include(router, TCFD_ROUTES)
@@ -0,0 +1,16 @@
+"""
+게이트웨이 관리 API 인증
+- X-ADMIN-TOKEN 헤더를 GATEWAY_ADMIN_TOKEN 설정값과 비교 (설정이 비어 있으면 관리 API 차단)
+"""
+import os
+import secrets
+from typing import Optional
+
+from fastapi import Header, HTTPException, Request
+
+
+async def verify_gateway_admin(request: Request, x_admin_token: Optional[str] = Header(None)) -> None:
+    settings = getattr(request.app.state, "settings", None)
+    expected = settings.GATEWAY_ADMIN_TOKEN if settings else os.getenv("GATEWAY_ADMIN_TOKEN", "")
+    if not expected or not x_admin_token or not secrets.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다")
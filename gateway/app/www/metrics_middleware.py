@@ -0,0 +1,45 @@
+"""
+요청 메트릭 ASGI 미들웨어
+- 라우트 템플릿(예: /api/v1/tcfd/standards/{category}) 단위 요청 수 / 상태 / 진행 중 / 지연 기록
+- 응답 본문 전송 완료 시점까지를 전체 지연으로 측정 (스트리밍 응답 포함)
+"""
+import logging
+
+from app.domain.metrics.gateway_metrics import TIMING_SCOPE_KEY, GatewayMetrics, RequestTiming, gateway_metrics
+
+logger = logging.getLogger(__name__)
+
+# 매칭되는 라우트가 없는 요청은 하나의 라벨로 묶음 (임의 경로로 라벨 수가 늘어나는 것 방지)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    def __init__(self, app, metrics: GatewayMetrics = gateway_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        timing = RequestTiming()
+        scope[TIMING_SCOPE_KEY] = timing
+        status_code = 500
+        self.metrics.requests_in_flight.inc()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.metrics.requests_in_flight.dec()
+            # 라우팅이 끝나면 FastAPI 가 scope["route"] 에 매칭된 라우트를 기록
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            try:
+                self.metrics.observe_request(route, scope["method"], status_code, timing)
+            except Exception as e:
+                logger.warning(f"Metrics recording failed: {e}")
@@ -0,0 +1,138 @@
+"""테넌트 단위 입장 제어: 토큰 버킷 / 동시 실행 한도 / 한도 파일 재로딩"""
+import json
+import os
+
+import pytest
+
+from app.domain.admission import admission_controller as admission_module
+from app.domain.admission.admission_controller import (
+    AdmissionController, AdmissionRejected, RouteClassLimits, TokenBucket,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(admission_module.time, "monotonic", clock)
+    return clock
+
+
+def make_controller(**kwargs) -> AdmissionController:
+    limits = dict(rate_per_minute=60, burst=2, max_concurrent_per_tenant=10,
+                  max_concurrent_per_user=10, max_concurrent_total=10, retry_after_seconds=7)
+    limits.update(kwargs)
+    return AdmissionController(limits={"llm": RouteClassLimits(**limits)})
+
+
+def test_token_bucket_refills_at_rate(clock):
+    bucket = TokenBucket(rate=1.0, burst=2)
+    assert bucket.try_acquire() == (True, 0.0)
+    assert bucket.try_acquire() == (True, 0.0)
+    allowed, wait = bucket.try_acquire()
+    assert not allowed and wait == pytest.approx(1.0)
+
+    clock.now += 0.5
+    allowed, wait = bucket.try_acquire()
+    assert not allowed and wait == pytest.approx(0.5)
+    clock.now += 0.5
+    assert bucket.try_acquire()[0]
+
+
+def test_token_bucket_never_exceeds_burst(clock):
+    bucket = TokenBucket(rate=1.0, burst=2)
+    clock.now += 3600
+    assert [bucket.try_acquire()[0] for _ in range(3)] == [True, True, False]
+
+
+def test_rate_limit_is_per_tenant(clock):
+    controller = make_controller()
+    for _ in range(2):
+        controller.acquire("llm", "c1", "u1").release()
+    with pytest.raises(AdmissionRejected) as rejected:
+        controller.acquire("llm", "c1", "u1")
+    assert rejected.value.status_code == 429 and rejected.value.retry_after == 1
+    assert controller.rejected["rate"] == 1
+
+    controller.acquire("llm", "c2", "u2").release()
+
+
+def test_concurrency_limits(clock):
+    controller = make_controller(burst=100, max_concurrent_per_tenant=2, max_concurrent_per_user=1,
+                                 max_concurrent_total=3)
+    first = controller.acquire("llm", "c1", "u1")
+    with pytest.raises(AdmissionRejected) as user_limit:
+        controller.acquire("llm", "c1", "u1")
+    assert user_limit.value.status_code == 429 and user_limit.value.retry_after == 7
+
+    controller.acquire("llm", "c1", "u2")
+    with pytest.raises(AdmissionRejected):
+        controller.acquire("llm", "c1", "u3")
+    assert controller.rejected["tenant"] == 1
+
+    controller.acquire("llm", "c2", "u4")
+    with pytest.raises(AdmissionRejected) as total_limit:
+        controller.acquire("llm", "c3", "u5")
+    assert total_limit.value.status_code == 503
+
+    first.release()
+    first.release()  # 중복 반환은 한 번만 반영
+    assert controller.stats()["active"] == {"llm": 2}
+    controller.acquire("llm", "c3", "u5")
+
+
+def test_unknown_class_is_admitted(clock):
+    controller = make_controller()
+    controller.acquire("unknown", "c1", "u1").release()
+    assert controller.admitted == 0
+
+
+def test_idle_buckets_are_pruned(clock):
+    controller = make_controller()
+    controller.acquire("llm", "c1", "u1").release()
+    assert controller.stats()["buckets"] == 1
+
+    clock.now += AdmissionController.PRUNE_INTERVAL_SECONDS + 1
+    controller.acquire("llm", "c2", "u2").release()
+    assert controller.stats()["buckets"] == 1
+
+
+def test_update_limits_resizes_existing_buckets(clock):
+    controller = make_controller(burst=5)
+    controller.acquire("llm", "c1", "u1").release()
+    controller.update_limits({"llm": RouteClassLimits(rate_per_minute=60, burst=1)})
+
+    controller.acquire("llm", "c1", "u1").release()
+    with pytest.raises(AdmissionRejected):
+        controller.acquire("llm", "c1", "u1")
+
+
+def test_limits_file_is_reloaded_when_changed(clock, tmp_path):
+    path = tmp_path / "limits.json"
+    path.write_text(json.dumps({"llm": {"burst": 1}}), encoding="utf-8")
+    controller = AdmissionController(limits_file=str(path), reload_interval=5)
+    assert controller.limits["llm"].burst == 1
+    # 파일에 없는 항목은 기본 한도 유지
+    assert controller.limits["llm"].max_concurrent_total == admission_module.DEFAULT_LIMITS["llm"].max_concurrent_total
+    assert "report" in controller.limits
+
+    path.write_text(json.dumps({"llm": {"burst": 9}}), encoding="utf-8")
+    os.utime(path, (2_000_000_000, 2_000_000_000))
+    assert not controller.maybe_reload()
+    clock.now += 5
+    assert controller.maybe_reload()
+    assert controller.limits["llm"].burst == 9
+
+
+def test_invalid_limits_file_keeps_current_limits(clock, tmp_path):
+    path = tmp_path / "limits.json"
+    path.write_text("{not json", encoding="utf-8")
+    controller = AdmissionController(limits_file=str(path))
+    assert controller.limits["llm"] == admission_module.DEFAULT_LIMITS["llm"]
@@ -0,0 +1,147 @@
+"""인스턴스 서킷 브레이커 상태 전이와 least_latency 지연 관측"""
+import pytest
+
+from app.domain.discovery import circuit_breaker as circuit_module
+from app.domain.discovery import service_discovery as discovery_module
+from app.domain.discovery.circuit_breaker import CircuitBreaker, CircuitState
+from app.domain.discovery.service_discovery import LoadBalancer, ServiceDiscovery, ServiceInstance
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_module.time, "monotonic", clock)
+    return clock
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    kwargs.setdefault("failure_threshold", 3)
+    kwargs.setdefault("recovery_timeout", 10.0)
+    return CircuitBreaker(**kwargs)
+
+
+def trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    trip(breaker)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.trips == 1
+    assert not breaker.allow_request()
+
+
+def test_half_open_trial_success_closes(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.now += 10.0
+    assert breaker.allow_request()
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.on_request()
+    assert not breaker.allow_request()  # 시험 요청 1개만 허용
+
+    breaker.record_success(0.1)
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_half_open_trial_failure_reopens(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.now += 10.0
+    breaker.allow_request()
+    breaker.on_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.trips == 2
+    assert not breaker.allow_request()
+
+
+def test_unreported_half_open_trial_is_reclaimed_after_timeout(clock):
+    breaker = make_breaker(half_open_timeout=5.0)
+    trip(breaker)
+    clock.now += 10.0
+    assert breaker.allow_request()
+    breaker.on_request()  # 결과를 보고하지 않는 호출자
+
+    clock.now += 4.9
+    assert not breaker.allow_request()
+    clock.now += 0.1
+    assert breaker.allow_request()
+    breaker.on_request()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_slow_success_counts_as_failure(clock):
+    breaker = make_breaker(latency_threshold=2.0)
+    for _ in range(3):
+        breaker.record_success(latency=3.0)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.total_successes == 0
+
+
+def test_probe_success_skips_recovery_wait(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    breaker.probe_succeeded()
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+
+
+def register(discovery: ServiceDiscovery, count: int = 2):
+    discovery.register_service(
+        "svc", [{"host": f"h{i}", "port": 80} for i in range(count)], load_balancer_type="least_latency"
+    )
+    return discovery.get_service_instances("svc")
+
+
+def test_success_without_latency_does_not_apply_failure_penalty():
+    discovery = ServiceDiscovery()
+    instance = register(discovery, 1)[0]
+    discovery.record_result("svc", instance, success=True)
+    assert instance.ewma_latency is None
+
+    discovery.record_result("svc", instance, success=True, latency=0.2)
+    assert instance.ewma_latency == pytest.approx(0.2)
+    discovery.record_result("svc", instance, success=False)
+    assert instance.ewma_latency == ServiceInstance.FAILURE_LATENCY_PENALTY
+
+
+def test_least_latency_prefers_lower_load_score(monkeypatch):
+    discovery = ServiceDiscovery()
+    fast, slow = register(discovery)
+    discovery.record_result("svc", fast, success=True, latency=0.05)
+    discovery.record_result("svc", slow, success=True, latency=1.5)
+    monkeypatch.setattr(discovery_module.random, "sample", lambda items, k: [slow, fast])
+    assert LoadBalancer.least_latency([fast, slow]) is fast
+
+    # 진행 중 요청이 많으면 지연이 짧아도 밀림
+    fast.connection_count = 100
+    assert LoadBalancer.least_latency([fast, slow]) is slow
+
+
+def test_open_circuit_instance_is_not_selected():
+    discovery = ServiceDiscovery(breaker_config={"failure_threshold": 1})
+    first, second = register(discovery)
+    discovery.record_result("svc", first, success=False)
+    for _ in range(10):
+        instance = discovery.get_service_instance("svc")
+        assert instance is second
+        discovery.release_instance("svc", instance)
@@ -0,0 +1,89 @@
+"""게이트웨이 응답 캐시 키 / TTL / 바이트 예산 LRU / ETag"""
+from starlette.requests import Request
+
+from app.domain.cache import response_cache as cache_module
+from app.domain.cache.response_cache import ResponseCache, etag_matches, make_etag
+from app.domain.proxy.proxy_route import ProxyRoute
+from app.domain.proxy.reverse_proxy import ReverseProxy
+
+ROUTE = ProxyRoute(
+    method="GET", path="/companies", service="tcfd-service",
+    upstream_path="/api/v1/tcfd/companies", auth_required=True, inject_user=True, cache_ttl=60,
+)
+
+
+def make_request(query: str, path: str = "/api/v1/tcfd/companies") -> Request:
+    return Request({
+        "type": "http", "method": "GET", "path": path, "headers": [],
+        "query_string": query.encode("latin-1"),
+    })
+
+
+def upstream_key(query: str, user_data) -> str:
+    params = ReverseProxy._build_query(make_request(query), ROUTE, user_data)
+    return ResponseCache.build_key("GET", "/api/v1/tcfd/companies", params, str(user_data.get("company_id")))
+
+
+def test_values_containing_separators_do_not_collide():
+    first = ResponseCache.build_key("GET", "/p", [("a", "1&b=2")], "t")
+    second = ResponseCache.build_key("GET", "/p", [("a", "1"), ("b", "2")], "t")
+    assert first != second
+
+
+def test_query_order_is_ignored():
+    assert (ResponseCache.build_key("GET", "/p", [("b", "2"), ("a", "1")], "t")
+            == ResponseCache.build_key("GET", "/p", [("a", "1"), ("b", "2")], "t"))
+
+
+def test_key_uses_injected_company_id_not_client_value():
+    user = {"company_id": "c1"}
+    spoofed = upstream_key("company_id=c2&page=1", user)
+    assert spoofed == upstream_key("page=1", user)
+    assert "company_id=c1" in spoofed and "c2" not in spoofed
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = ResponseCache()
+    cache.put("k", 200, [], b"body", ttl=10)
+    assert cache.get("k").body == b"body"
+    now[0] += 11
+    assert cache.get("k") is None
+    assert cache.current_bytes == 0
+
+
+def test_lru_eviction_by_bytes():
+    cache = ResponseCache(max_bytes=100, max_entry_ratio=0.5)
+    cache.put("a", 200, [], b"x" * 40, ttl=60)
+    cache.put("b", 200, [], b"x" * 40, ttl=60)
+    cache.get("a")
+    cache.put("c", 200, [], b"x" * 40, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.current_bytes == 80 and cache.evictions == 1
+
+
+def test_oversized_entry_is_not_stored():
+    cache = ResponseCache(max_bytes=100, max_entry_ratio=0.1)
+    entry = cache.put("k", 200, [], b"x" * 20, ttl=60)
+    assert entry.body == b"x" * 20
+    assert cache.get("k") is None
+
+
+def test_purge_by_path_prefix():
+    cache = ResponseCache()
+    cache.put(ResponseCache.build_key("GET", "/api/v1/tcfd/standards", [], "t"), 200, [], b"1", ttl=60)
+    cache.put(ResponseCache.build_key("GET", "/api/v1/tcfd/companies", [], "t"), 200, [], b"2", ttl=60)
+    assert cache.purge("/api/v1/tcfd/standards") == 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_etag_matching():
+    etag = make_etag(b"body")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Gateway 업스트림 커넥션 풀 벤치마크
+- 로컬 스텁 업스트림(uvicorn)을 띄우고 동일한 요청을 두 방식으로 전송
+  1) 요청마다 httpx.AsyncClient 생성/종료 (기존 라우터 방식)
+  2) HttpClientPool 의 장기 유지 클라이언트 재사용 (keep-alive)
+- 방식별 p50 / p99 지연(ms)과 처리량(req/s) 출력
+
+사용 예:
+  python scripts/bench_gateway_pool.py --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import httpx
+import uvicorn
+
+# ---------- 경로 설정 (gateway 패키지 import) ----------
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "gateway"))
+
+from app.domain.discovery.http_client_pool import HttpClientPool  # noqa: E402
+
+STUB_BODY = b'{"status":"success","data":[{"category":"governance","disclosure_id":"G-1"}]}'
+
+
+async def stub_app(scope, receive, send):
+    """표준 정보 응답을 흉내내는 최소 ASGI 업스트림"""
+    if scope["type"] != "http":
+        return
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json")],
+    })
+    await send({"type": "http.response.body", "body": STUB_BODY})
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_case(name: str, total: int, concurrency: int, send_one) -> None:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            response = await send_one()
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    wall_started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    wall = time.perf_counter() - wall_started
+
+    print(
+        f"{name:<22} p50={percentile(latencies, 50):7.2f}ms  "
+        f"p99={percentile(latencies, 99):7.2f}ms  "
+        f"mean={statistics.mean(latencies):7.2f}ms  "
+        f"throughput={total / wall:8.1f} req/s"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    config = uvicorn.Config(stub_app, host="127.0.0.1", port=args.port, log_level="warning")
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    url = f"http://127.0.0.1:{args.port}/api/v1/tcfd/standards"
+    params = {"user_id": "1", "company_id": "bench"}
+
+    async def per_request_client():
+        async with httpx.AsyncClient(timeout=60.0) as client:
+            return await client.get(url, params=params)
+
+    pool = HttpClientPool(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async def pooled_client():
+        async with pool.session("tcfd-service", timeout=60.0) as client:
+            return await client.get(url, params=params)
+
+    print(f"requests={args.requests} concurrency={args.concurrency} upstream={url}")
+    # 워밍업
+    await run_case("warmup (pooled)", min(100, args.requests), args.concurrency, pooled_client)
+    await run_case("per-request client", args.requests, args.concurrency, per_request_client)
+    await run_case("pooled client", args.requests, args.concurrency, pooled_client)
+
+    await pool.aclose()
+    server.should_exit = True
+    await server_task
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gateway 업스트림 커넥션 풀 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000, help="방식별 총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--port", type=int, default=18905, help="스텁 업스트림 포트")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+FAISS 문서 저장소(index.pkl) → 컬럼형 저장소(docstore/) 변환
+- rag_embed_faiss.py 로 만든 컬렉션 디렉토리마다 index.pkl 을 한 번 읽어
+  offsets.npy + text.bin + 메타데이터 코드 배열로 기록 (llm-service 가 memory-map 으로 로딩)
+- LangChain Document 를 unpickle 해야 하므로 임베딩 환경(requirements.embedding.txt)에서 실행
+
+사용 예:
+  python scripts/convert_doc_store.py service/llm-service/vectordb/sr_corpus service/llm-service/vectordb/standards
+"""
+
+import argparse
+import pickle
+import sys
+import time
+from pathlib import Path
+
+# ---------- 경로 설정 (llm-service 패키지 import) ----------
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "service" / "llm-service"))
+
+from app.common.config import DOC_STORE_DIR_NAME  # noqa: E402
+from app.domain.rag.doc_store import (  # noqa: E402
+    ColumnarDocStore, file_fingerprint, split_doc_store, write_columnar_store
+)
+
+
+def convert(collection_dir: Path, force: bool = False) -> None:
+    pickle_file = collection_dir / "index.pkl"
+    out_dir = collection_dir / DOC_STORE_DIR_NAME
+    if not pickle_file.exists():
+        print(f"❌ index.pkl 이 없습니다: {pickle_file}")
+        return
+
+    source = file_fingerprint(pickle_file)
+    if not force and (out_dir / "manifest.json").exists():
+        try:
+            if ColumnarDocStore(out_dir).source == source:
+                print(f"⏭️  최신 상태 (건너뜀): {out_dir}")
+                return
+        except Exception as e:
+            print(f"⚠️ 기존 변환본을 읽을 수 없어 다시 생성: {e}")
+
+    started = time.time()
+    with open(pickle_file, "rb") as f:
+        doc_store, id_map = split_doc_store(pickle.load(f))
+    write_columnar_store(doc_store, id_map, out_dir, source=source)
+
+    store = ColumnarDocStore(out_dir)
+    print(
+        f"✅ {collection_dir.name}: {len(store)}개 문서, 메타데이터 필드 {len(store.columns)}개, "
+        f"{store.nbytes() / 1024 / 1024:.1f}MB (index.pkl {source['size'] / 1024 / 1024:.1f}MB), "
+        f"{time.time() - started:.1f}초"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="FAISS index.pkl → 컬럼형 문서 저장소 변환")
+    parser.add_argument("collections", nargs="+", type=Path, help="index.pkl 이 있는 컬렉션 디렉토리")
+    parser.add_argument("--force", action="store_true", help="최신 변환본이 있어도 다시 생성")
+    args = parser.parse_args()
+
+    for collection in args.collections:
+        convert(collection.resolve(), force=args.force)
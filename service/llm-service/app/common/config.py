@@ -17,6 +17,7 @@ SERVICE_PORT = int(os.getenv("PORT", "8000"))  # Docker Compose(8009) 및 Railwa
 FAISS_VOLUME_PATH = os.getenv("FAISS_VOLUME_PATH", "/data")
 FAISS_INDEX_NAME = os.getenv("FAISS_INDEX_NAME", "sr_corpus")
 FAISS_STORE_NAME = os.getenv("FAISS_STORE_NAME", "sr_corpus")
+FAISS_STANDARDS_INDEX_NAME = os.getenv("FAISS_STANDARDS_INDEX_NAME", "standards")
 
 def get_faiss_index_path():
     """FAISS 인덱스 파일 경로를 동적으로 생성"""
@@ -72,6 +73,40 @@ TCFD_STORE_PATH = get_tcfd_store_path()
 # =============================================================================
 # 기존 FAISS 인덱스의 차원 (차원 일치 검증용)
 EMBED_DIM = int(os.getenv("EMBED_DIM", "768"))
+# 쿼리 임베딩 모델 (scripts/rag_embed_faiss.py 와 동일 모델, 정규화 벡터)
+EMBED_MODEL_NAME = os.getenv("EMBED_MODEL_NAME", "intfloat/multilingual-e5-base")
+# auto: sentence-transformers 설치 시 로컬, 없으면 Hugging Face feature-extraction API
+EMBED_BACKEND = os.getenv("EMBED_BACKEND", "auto")  # auto, local, api
+EMBED_DEVICE = os.getenv("EMBED_DEVICE", "cpu")
+EMBED_QUERY_PREFIX = os.getenv("EMBED_QUERY_PREFIX", "query: ")  # E5 계열 쿼리 접두어
+HF_EMBED_API_URL = os.getenv(
+    "HF_EMBED_API_URL",
+    f"https://api-inference.huggingface.co/pipeline/feature-extraction/{EMBED_MODEL_NAME}"
+)
+
+# 벡터 수가 이 값 이상인 Flat 인덱스는 로딩 시 HNSW 로 변환 (0 이면 변환하지 않음)
+RAG_ANN_MIN_VECTORS = int(os.getenv("RAG_ANN_MIN_VECTORS", "20000"))
+RAG_HNSW_M = int(os.getenv("RAG_HNSW_M", "32"))
+RAG_HNSW_EF_SEARCH = int(os.getenv("RAG_HNSW_EF_SEARCH", "64"))
+
+# BM25 키워드 인덱스 (index.faiss 와 같은 디렉토리에 저장)
+BM25_K1 = float(os.getenv("BM25_K1", "1.2"))
+BM25_B = float(os.getenv("BM25_B", "0.75"))
+BM25_FILE_NAME = os.getenv("BM25_FILE_NAME", "index.bm25.npz")
+
+# 컬럼형 문서 저장소 (index.pkl 변환본, 컬렉션 디렉토리 아래 docstore/)
+DOC_STORE_DIR_NAME = os.getenv("DOC_STORE_DIR_NAME", "docstore")
+DOC_STORE_AUTO_CONVERT = os.getenv("DOC_STORE_AUTO_CONVERT", "true").lower() == "true"
+
+# 하이브리드 검색 (FAISS + BM25, Reciprocal Rank Fusion)
+RAG_RRF_K = int(os.getenv("RAG_RRF_K", "60"))
+RAG_HYBRID_CANDIDATES = int(os.getenv("RAG_HYBRID_CANDIDATES", "50"))  # 검색기별 후보 수 하한
+RAG_FILTER_EXACT_MAX = int(os.getenv("RAG_FILTER_EXACT_MAX", "4096"))  # 필터 통과 문서가 이 이하면 부분집합 정확 검색
+RAG_RETRIEVAL_WORKERS = int(os.getenv("RAG_RETRIEVAL_WORKERS", "4"))
+
+# 검색 캐시 (쿼리 임베딩 LRU / 인덱스 버전별 검색 결과 LRU, 0 이면 사용 안 함)
+RAG_EMBED_CACHE_BYTES = int(os.getenv("RAG_EMBED_CACHE_BYTES", str(16 * 1024 * 1024)))
+RAG_RESULT_CACHE_BYTES = int(os.getenv("RAG_RESULT_CACHE_BYTES", str(8 * 1024 * 1024)))
 # OpenAI API 키 (텍스트 생성용만)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 
@@ -93,12 +128,43 @@ HF_API_TOKEN = os.getenv("HF_API_TOKEN", "")  # 빈 문자열이면 fallback 모
 HF_MODEL = os.getenv("HF_MODEL", "jeongtaeyeong/tcfd-polyglot-3.8b-merged")
 HF_TIMEOUT = int(os.getenv("HF_TIMEOUT", "30"))
 
+# LLM 제공자 비동기 호출 (제공자별 keep-alive 커넥션 풀 / 동시 호출 상한 / 재시도)
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))
+HF_ENDPOINT_TIMEOUT = float(os.getenv("HF_ENDPOINT_TIMEOUT", "120"))  # CPU 엔드포인트는 생성이 느림
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "32"))
+HF_MAX_CONCURRENCY = int(os.getenv("HF_MAX_CONCURRENCY", "8"))
+LLM_POOL_MAX_CONNECTIONS = int(os.getenv("LLM_POOL_MAX_CONNECTIONS", "64"))
+LLM_POOL_KEEPALIVE_SECONDS = float(os.getenv("LLM_POOL_KEEPALIVE_SECONDS", "30"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))  # 429 / 5xx / 연결 오류 재시도 횟수
+LLM_RETRY_BACKOFF_BASE = float(os.getenv("LLM_RETRY_BACKOFF_BASE", "0.5"))
+LLM_RETRY_BACKOFF_MAX = float(os.getenv("LLM_RETRY_BACKOFF_MAX", "8"))
+# Inference Endpoint 마이크로 배칭 (최대 대기 ms / 배치 크기, 1 이면 배칭 없이 개별 호출) 과 백그라운드 상태 점검 주기
+HF_BATCH_MAX_WAIT_MS = float(os.getenv("HF_BATCH_MAX_WAIT_MS", "20"))
+HF_BATCH_MAX_SIZE = int(os.getenv("HF_BATCH_MAX_SIZE", "8"))
+# 배열 입력이 거부된 뒤 다시 배칭을 시도하기까지 (초, 연속 거부 시 2배씩 증가)
+HF_BATCH_RETRY_SECONDS = float(os.getenv("HF_BATCH_RETRY_SECONDS", "300"))
+HF_PROBE_INTERVAL_SECONDS = float(os.getenv("HF_PROBE_INTERVAL_SECONDS", "30"))
+# 요청 deadline 상한 (게이트웨이는 라우트 timeout 을 X-Request-Timeout 헤더로 보내고 더 짧은 쪽 적용, 0 이면 제한 없음)
+LLM_REQUEST_DEADLINE = float(os.getenv("LLM_REQUEST_DEADLINE", "120"))
+# 초안 섹션 병렬 생성 (요청당 동시 섹션 수, 초안 전체 deadline 초 - 요청 deadline 보다 길어지지 않음)
+RAG_DRAFT_SECTION_CONCURRENCY = int(os.getenv("RAG_DRAFT_SECTION_CONCURRENCY", "4"))
+RAG_DRAFT_DEADLINE = float(os.getenv("RAG_DRAFT_DEADLINE", "90"))
+# LLM 생성 결과 캐시 (SQLite, 요청에 cache=bypass 면 조회하지 않고 갱신, 0 바이트면 사용 안 함)
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", str(Path(FAISS_VOLUME_PATH) / ".cache" / "llm_completions.sqlite3"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
 # Hugging Face Hub 직접 모델 로딩용 토큰
 HF_TOKEN = os.getenv("HF_TOKEN", "")  # Hugging Face Hub에서 모델 다운로드용 토큰
 
 # Hugging Face 로컬 모델 설정 (Railway에서 직접 모델 로딩용)
 HF_LOCAL_MODEL_PATH = os.getenv("HF_LOCAL_MODEL_PATH", "")  # 로컬 모델 경로 (설정되면 API 대신 로컬 모델 사용)
 
+# 생성 모델 입력 토큰 예산 (컨텍스트 패킹, 최대 길이에서 생성 토큰을 뺀 만큼 근거를 채움)
+HF_MODEL_MAX_TOKENS = int(os.getenv("HF_MODEL_MAX_TOKENS", "2048"))
+# 토큰 수 계산용 토크나이저 (tokenizer.json 이 있는 로컬 경로 또는 Hub 모델 ID, 비우면 HF_MODEL)
+HF_TOKENIZER_NAME = os.getenv("HF_TOKENIZER_NAME", "")
+
 # =============================================================================
 # 🔒 보안 설정
 # =============================================================================
@@ -48,10 +48,27 @@ class DraftSection(BaseModel):
     section: str = Field(..., description="섹션명")
     content: str = Field(..., description="섹션 내용")
 
+class SectionTiming(BaseModel):
+    """섹션별 초안 생성 시간"""
+    section: str = Field(..., description="섹션명")
+    status: str = Field(..., description="생성 결과 (ok, failed, timeout)")
+    started_ms: float = Field(..., description="요청 시작부터 섹션 생성 시작까지 (ms)")
+    elapsed_ms: float = Field(..., description="섹션 생성 소요 시간 (ms)")
+    error: Optional[str] = Field(None, description="실패 사유")
+
+class DraftTimings(BaseModel):
+    """초안 생성 구간별 시간 (섹션은 병렬 생성)"""
+    search_ms: float = Field(..., description="컨텍스트 검색 시간 (ms)")
+    generation_ms: float = Field(..., description="섹션 병렬 생성 구간 (ms)")
+    total_ms: float = Field(..., description="전체 소요 시간 (ms)")
+    critical_section: Optional[str] = Field(None, description="가장 늦게 끝난 섹션 (임계 경로)")
+    sections: List[SectionTiming] = Field(default_factory=list, description="섹션별 생성 시간 (요청 순서)")
+
 class DraftResponse(BaseModel):
     """초안 생성 응답"""
     draft: str = Field(..., description="생성된 초안 텍스트")
     service_used: str = Field(..., description="사용된 RAG 서비스")
+    timings: Optional[DraftTimings] = Field(None, description="검색 / 섹션별 생성 시간")
 
 # =============================================================================
 # ✨ 윤문 관련 스키마
@@ -88,6 +105,7 @@ class DraftAndPolishResponse(BaseModel):
     draft: str = Field(..., description="생성된 초안 텍스트")
     polished: str = Field(..., description="정제된 텍스트")
     service_used: str = Field(..., description="사용된 RAG 서비스")
+    timings: Optional[DraftTimings] = Field(None, description="초안 단계의 검색 / 섹션별 생성 시간")
 
 # =============================================================================
 # 📁 FAISS 업로드 관련 스키마
@@ -98,6 +116,7 @@ class UploadResponse(BaseModel):
     ok: bool = Field(..., description="업로드 성공 여부")
     size: Dict[str, int] = Field(..., description="업로드된 파일 크기 (바이트)")
     load_results: Dict[str, bool] = Field(..., description="RAG 서비스별 인덱스 로딩 결과")
+    version: Optional[int] = Field(None, description="활성화된 인덱스 버전 (sr_corpus/v{n})")
 
 # =============================================================================
 # 💚 헬스체크 관련 스키마
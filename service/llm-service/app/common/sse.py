@@ -0,0 +1,71 @@
+"""
+Server-Sent Events 응답 유틸리티
+- 생성 결과를 (event, data) 단위로 즉시 전송하여 첫 바이트 지연을 줄임
+- 이벤트: start → (context / section / delta ...) → done, 실패 시 error
+- delta 이벤트의 text 를 이어 붙이면 비스트리밍 응답과 같은 본문이 됨
+"""
+import json
+import logging
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Tuple, Union
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# 프록시(nginx 등) / 게이트웨이 구간에서 버퍼링하지 않도록 지정
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+SSEEvent = Tuple[str, Dict[str, Any]]
+
+
+def wants_event_stream(request: Request, stream: bool = False) -> bool:
+    """?stream=true 또는 Accept: text/event-stream 요청 여부"""
+    return stream or SSE_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """SSE 메시지 1건 직렬화 (data 는 한 줄 JSON)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+def _encode_events(events: Iterable[SSEEvent], request_id: str) -> Iterator[str]:
+    try:
+        for event, data in events:
+            yield format_sse(event, data)
+    except Exception as e:
+        # 스트림이 시작된 뒤에는 상태 코드를 바꿀 수 없으므로 error 이벤트로 전달
+        logger.error(f"[{request_id}] 스트리밍 생성 실패: {e}")
+        yield format_sse("error", {"detail": str(e), "request_id": request_id})
+
+
+async def _aencode_events(events: AsyncIterable[SSEEvent], request_id: str) -> AsyncIterator[str]:
+    try:
+        async for event, data in events:
+            yield format_sse(event, data)
+    except Exception as e:
+        logger.error(f"[{request_id}] 스트리밍 생성 실패: {e}")
+        yield format_sse("error", {"detail": str(e), "request_id": request_id})
+
+
+def sse_response(events: Union[Iterable[SSEEvent], AsyncIterable[SSEEvent]], request_id: str) -> StreamingResponse:
+    """
+    (event, data) 이터레이터를 SSE 응답으로 변환
+
+    동기 이터레이터는 Starlette 가 스레드풀에서 순회하므로 LLM 호출이 이벤트 루프를 막지 않음
+    비동기 이터레이터(여러 생성을 동시에 진행하며 완료 순으로 전송 등)는 이벤트 루프에서 그대로 순회
+    """
+    encoded = (
+        _aencode_events(events, request_id) if hasattr(events, "__aiter__")
+        else _encode_events(events, request_id)
+    )
+    return StreamingResponse(
+        encoded,
+        media_type=SSE_MEDIA_TYPE,
+        headers={**SSE_HEADERS, "X-Request-ID": request_id},
+    )
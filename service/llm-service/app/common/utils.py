@@ -13,13 +13,17 @@ def generate_request_id() -> str:
     """고유한 요청 ID를 생성합니다."""
     return str(uuid.uuid4())
 
-def log_request_info(request_id: str, endpoint: str, **kwargs):
-    """요청 정보를 로깅합니다."""
-    logger.info(f"[{request_id}] {endpoint} 호출 - {kwargs}")
+def _format_log_details(details) -> str:
+    """로그 항목을 공백으로 연결합니다. (실수는 소요 시간으로 간주)"""
+    return " ".join(f"{detail:.2f}초" if isinstance(detail, float) else str(detail) for detail in details)
 
-def log_response_info(request_id: str, endpoint: str, response_time: float, **kwargs):
-    """응답 정보를 로깅합니다."""
-    logger.info(f"[{request_id}] {endpoint} 완료 - {response_time:.2f}초 - {str(kwargs)}")
+def log_request_info(request_id: str, *details: Any, **kwargs):
+    """요청 정보를 로깅합니다. (예: log_request_info(request_id, "POST", "/rag/draft", {...}))"""
+    logger.info(f"[{request_id}] {_format_log_details(details)} 호출 - {kwargs}")
+
+def log_response_info(request_id: str, *details: Any, **kwargs):
+    """응답 정보를 로깅합니다. (예: log_response_info(request_id, 200, response_data))"""
+    logger.info(f"[{request_id}] {_format_log_details(details)} 완료 - {kwargs}")
 
 def timing_decorator(func):
     """함수 실행 시간을 측정하는 데코레이터"""
@@ -61,6 +65,18 @@ def ensure_directory_exists(directory_path: str) -> bool:
         logger.error(f"디렉토리 생성 실패 {directory_path}: {e}")
         return False
 
+def save_upload_files(files: Dict[str, Any], directory: Path) -> Dict[str, Path]:
+    """업로드 파일({저장 파일명: UploadFile})을 디렉토리에 스트림으로 기록합니다."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    saved = {}
+    for file_name, upload in files.items():
+        path = directory / file_name
+        with open(path, "wb") as f:
+            shutil.copyfileobj(upload.file, f, length=1024 * 1024)
+        saved[file_name] = path
+    return saved
+
 def safe_file_operation(operation_func):
     """파일 작업을 안전하게 수행하는 데코레이터"""
     @wraps(operation_func)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 import logging
+from .provider_client import run_from_thread
 
 logger = logging.getLogger(__name__)
 
@@ -12,15 +13,27 @@ class BaseLLMService(ABC):
         logger.info(f"{service_name} LLM 서비스 초기화")
     
     @abstractmethod
-    def generate_draft_section(self, question: str, context: str, section: str, style_guide: str = "") -> str:
+    async def generate_draft_section(self, question: str, context: str, section: str, style_guide: str = "") -> str:
         """섹션별 초안을 생성합니다."""
         pass
     
     @abstractmethod
-    def polish_text(self, text: str, tone: str = "공식적", style_guide: str = "") -> str:
+    async def polish_text(self, text: str, tone: str = "공식적", style_guide: str = "") -> str:
         """텍스트를 윤문합니다."""
         pass
     
+    def is_failure_notice(self, text: str) -> bool:
+        """예외 대신 반환된 실패 안내 문구인지 (기본: 실패는 예외로 전달되므로 항상 False)"""
+        return False
+    
+    def stream_draft_section(self, question: str, context: str, section: str, style_guide: str = "") -> Iterator[str]:
+        """섹션별 초안을 조각 단위로 생성합니다. (기본: 완성된 결과를 한 번에 반환, SSE 스레드풀에서 순회)"""
+        yield run_from_thread(self.generate_draft_section, question, context, section, style_guide)
+    
+    def stream_polish_text(self, text: str, tone: str = "공식적", style_guide: str = "") -> Iterator[str]:
+        """텍스트를 조각 단위로 윤문합니다. (기본: 완성된 결과를 한 번에 반환, SSE 스레드풀에서 순회)"""
+        yield run_from_thread(self.polish_text, text, tone, style_guide)
+    
     def _create_draft_prompt(self, question: str, context: str, section: str, style_guide: str = "") -> str:
         """초안 생성 프롬프트를 생성합니다."""
         prompt = f"""다음 '근거'를 바탕으로 ESG 보고서의 섹션 초안을 작성하세요.
@@ -0,0 +1,273 @@
+"""
+LLM 생성 결과 캐시 (SQLite, 디스크 영속)
+- 키: (제공자, 모델, 생성 파라미터, 정규화 프롬프트) SHA-256 → 같은 입력·검색 컨텍스트로 다시 생성하면 즉시 반환
+- TTL 이 지난 항목은 조회되지 않고, 전체 크기가 상한을 넘으면 오래 사용되지 않은 항목부터 삭제
+- 요청 단위 cache=bypass (쿼리 파라미터 / X-LLM-Cache 헤더) 면 조회하지 않고 새로 생성한 결과로 갱신
+- 실패한 생성(예외 / 오류 안내 문구)은 저장하지 않음
+"""
+import asyncio
+import contextvars
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Union
+
+from ...common.config import LLM_CACHE_MAX_BYTES, LLM_CACHE_PATH, LLM_CACHE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# 요청 단위 캐시 모드
+CACHE_USE = "use"
+CACHE_BYPASS = "bypass"
+CACHE_MODES = (CACHE_USE, CACHE_BYPASS)
+
+_cache_mode: contextvars.ContextVar[str] = contextvars.ContextVar("llm_completion_cache_mode", default=CACHE_USE)
+
+_LINE_SPACES = re.compile(r"[ \t]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+# 상한 초과 시 이 비율까지 줄여 삽입마다 삭제가 반복되지 않도록 함
+_EVICT_TARGET_RATIO = 0.9
+
+Prompt = Union[str, List[Dict[str, str]]]
+
+
+@contextmanager
+def completion_cache_mode(mode: Optional[str]) -> Iterator[str]:
+    """블록 안의 생성 호출에 적용할 캐시 모드 (알 수 없는 값은 기본값 유지)"""
+    if mode not in CACHE_MODES:
+        yield _cache_mode.get()
+        return
+    token = _cache_mode.set(mode)
+    try:
+        yield mode
+    finally:
+        _cache_mode.reset(token)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """NFKC + 줄 단위 공백 정리 (줄바꿈 구조는 유지)"""
+    text = unicodedata.normalize("NFKC", prompt).replace("\r\n", "\n")
+    text = "\n".join(_LINE_SPACES.sub(" ", line).strip() for line in text.split("\n"))
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+
+def completion_key(provider: str, model: str, params: Dict[str, Any], prompt: Prompt) -> str:
+    """제공자 / 모델 / 파라미터 / 정규화 프롬프트(문자열 또는 chat messages)의 SHA-256"""
+    if isinstance(prompt, str):
+        normalized: Any = normalize_prompt(prompt)
+    else:
+        normalized = [{**message, "content": normalize_prompt(message.get("content", ""))} for message in prompt]
+    payload = json.dumps(
+        {"provider": provider, "model": model, "params": params, "prompt": normalized},
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """SQLite 기반 생성 결과 캐시 (TTL + 바이트 상한 LRU, 스레드 안전)"""
+
+    def __init__(self, path: str = LLM_CACHE_PATH, max_bytes: int = LLM_CACHE_MAX_BYTES,
+                 ttl_seconds: float = LLM_CACHE_TTL_SECONDS):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.expired = 0
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS completions ("
+                " key TEXT PRIMARY KEY, provider TEXT NOT NULL, model TEXT NOT NULL,"
+                " completion TEXT NOT NULL, bytes INTEGER NOT NULL,"
+                " created_at REAL NOT NULL, last_access REAL NOT NULL, hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS completions_last_access ON completions(last_access)")
+            self._bytes = conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM completions").fetchone()[0]
+            self._conn = conn
+            logger.info(f"🗄️ LLM 생성 캐시 열기: {self.path} ({self._bytes} bytes)")
+        return self._conn
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장 (동기, 이벤트 루프에서는 aget / aput 사용)
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        if _cache_mode.get() == CACHE_BYPASS:
+            self.bypasses += 1
+            return None
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute("SELECT completion, created_at, bytes FROM completions WHERE key = ?", (key,)).fetchone()
+                now = time.time()
+                if row is None:
+                    self.misses += 1
+                    return None
+                completion, created_at, nbytes = row
+                if self.ttl_seconds > 0 and now - created_at > self.ttl_seconds:
+                    conn.execute("DELETE FROM completions WHERE key = ?", (key,))
+                    self._bytes -= nbytes
+                    self.expired += 1
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE completions SET last_access = ?, hits = hits + 1 WHERE key = ?", (now, key))
+                self.hits += 1
+                return completion
+        except sqlite3.Error as e:
+            # 캐시 장애는 생성 경로를 막지 않음
+            self.errors += 1
+            logger.warning(f"⚠️ LLM 생성 캐시 조회 실패: {e}")
+            return None
+
+    def put(self, key: str, provider: str, model: str, completion: str) -> None:
+        if not self.enabled:
+            return
+        nbytes = len(completion.encode("utf-8")) + len(key)
+        if nbytes > self.max_bytes:
+            return
+        try:
+            with self._lock:
+                conn = self._connection()
+                now = time.time()
+                previous = conn.execute("SELECT bytes FROM completions WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO completions (key, provider, model, completion, bytes, created_at, last_access, hits)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                    (key, provider, model, completion, nbytes, now, now)
+                )
+                self._bytes += nbytes - (previous[0] if previous else 0)
+                self.writes += 1
+                if self._bytes > self.max_bytes:
+                    self._evict(conn)
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"⚠️ LLM 생성 캐시 저장 실패: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """만료 항목 → 오래 사용되지 않은 항목 순으로 상한의 90% 까지 삭제 (lock 보유 상태에서 호출)"""
+        if self.ttl_seconds > 0:
+            cursor = conn.execute("DELETE FROM completions WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            self.expired += max(cursor.rowcount, 0)
+            self._bytes = conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM completions").fetchone()[0]
+
+        target = self.max_bytes * _EVICT_TARGET_RATIO
+        removed = 0
+        while self._bytes > target:
+            rows = conn.execute("SELECT key, bytes FROM completions ORDER BY last_access LIMIT 64").fetchall()
+            if not rows:
+                break
+            victims = []
+            for key, nbytes in rows:
+                victims.append((key,))
+                self._bytes -= nbytes
+                if self._bytes <= target:
+                    break
+            conn.executemany("DELETE FROM completions WHERE key = ?", victims)
+            removed += len(victims)
+        if removed:
+            self.evictions += removed
+            logger.info(f"🧹 LLM 생성 캐시 {removed}건 삭제 (상한 {self.max_bytes} bytes)")
+
+    async def aget(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, provider: str, model: str, completion: str) -> None:
+        if self.enabled:
+            await asyncio.to_thread(self.put, key, provider, model, completion)
+
+    async def cached(self, provider: str, model: str, params: Dict[str, Any], prompt: Prompt,
+                     generate: Callable[[], Awaitable[str]],
+                     is_success: Callable[[str], bool] = lambda text: True) -> str:
+        """캐시에 있으면 반환, 없으면 generate() 결과를 (성공한 경우만) 저장 후 반환"""
+        if not self.enabled:
+            return await generate()
+        key = completion_key(provider, model, params, prompt)
+        completion = await self.aget(key)
+        if completion is not None:
+            logger.info(f"⚡ LLM 생성 캐시 적중: {provider}/{model}")
+            return completion
+        completion = await generate()
+        if completion and is_success(completion):
+            await self.aput(key, provider, model, completion)
+        return completion
+
+    # ------------------------------------------------------------------
+    # 관리 / 지표
+    # ------------------------------------------------------------------
+
+    def clear(self) -> int:
+        with self._lock:
+            conn = self._connection()
+            removed = conn.execute("DELETE FROM completions").rowcount
+            self._bytes = 0
+        logger.info(f"🧹 LLM 생성 캐시 전체 삭제: {removed}건")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        entries = 0
+        if self.enabled:
+            try:
+                with self._lock:
+                    entries = self._connection().execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+            except sqlite3.Error:
+                pass
+        return {
+            "enabled": self.enabled,
+            "path": str(self.path),
+            "entries": entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "bypasses": self.bypasses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "expired": self.expired,
+            "errors": self.errors,
+        }
+
+
+_default_cache: Optional[CompletionCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_completion_cache() -> CompletionCache:
+    """프로세스 공용 생성 결과 캐시"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = CompletionCache()
+    return _default_cache
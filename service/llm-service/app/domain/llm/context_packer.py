@@ -0,0 +1,212 @@
+"""
+토큰 예산 기반 컨텍스트 패킹
+- 생성 모델 토크나이저(tokenizer.json)로 토큰 수 계산, 토크나이저가 준비되기 전에는 보수적 추정치 사용
+- 청크 분할 시 겹침(chunk_overlap=150)으로 중복된 앞부분 / 다른 근거에 포함된 근거 제거
+- 점수(검색 순위) 높은 근거부터 예산 안에 채우고, 남은 예산보다 긴 근거는 문장 경계에서 자름
+"""
+import logging
+import math
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+from ...common.config import (
+    HF_LOCAL_MODEL_PATH, HF_MODEL, HF_MODEL_MAX_TOKENS, HF_TOKEN, HF_TOKENIZER_NAME,
+)
+
+logger = logging.getLogger(__name__)
+
+# BaseRAGService.search 가 근거를 잇는 구분자
+PASSAGE_SEPARATOR = "\n\n---\n\n"
+# 특수 토큰 / 토크나이저 차이를 위한 여유분
+_SAFETY_MARGIN_TOKENS = 16
+# 남은 예산이 이보다 작으면 근거를 잘라 넣지 않음 (문장 조각만 들어가는 것 방지)
+_MIN_PARTIAL_TOKENS = 48
+# 겹침 탐지 범위 (청크 겹침 150자보다 넉넉하게)
+_MIN_OVERLAP_CHARS = 30
+_MAX_OVERLAP_CHARS = 400
+
+_PASSAGE = re.compile(r"^(\[\d+\]\s*)?(.*?)(\s*\(출처: [^()]*\))?$", re.S)
+# 문장 부호 뒤 공백 / 줄바꿈 위치 ("3.5" 같은 숫자 안의 마침표는 제외)
+_SENTENCE_END = re.compile(r"(?<=[.!?。])(?=\s|$)|(?=\n)")
+_HANGUL = re.compile(r"[가-힣]")
+
+_tokenizer: Any = None
+_tokenizer_state = "unloaded"  # unloaded | loading | ready | unavailable
+_tokenizer_lock = threading.Lock()
+
+
+def _load_tokenizer() -> None:
+    global _tokenizer, _tokenizer_state
+    name = HF_TOKENIZER_NAME or HF_LOCAL_MODEL_PATH or HF_MODEL
+    try:
+        from tokenizers import Tokenizer
+        local = Path(name) / "tokenizer.json"
+        if local.exists():
+            tokenizer = Tokenizer.from_file(str(local))
+        else:
+            tokenizer = Tokenizer.from_pretrained(name, auth_token=HF_TOKEN or None)
+        _tokenizer, _tokenizer_state = tokenizer, "ready"
+        logger.info(f"🔤 토크나이저 로딩 완료: {name}")
+    except Exception as e:
+        _tokenizer_state = "unavailable"
+        logger.warning(f"⚠️ 토크나이저 로딩 실패, 추정 토큰 수 사용: {name} ({type(e).__name__}: {e})")
+
+
+def get_tokenizer() -> Optional[Any]:
+    """
+    캐시된 토크나이저 (없으면 None)
+
+    첫 호출에서 백그라운드 로딩을 시작하고 즉시 반환하므로 이벤트 루프에서 호출해도 막히지 않음
+    """
+    global _tokenizer_state
+    if _tokenizer_state == "unloaded":
+        with _tokenizer_lock:
+            if _tokenizer_state == "unloaded":
+                _tokenizer_state = "loading"
+                threading.Thread(target=_load_tokenizer, name="tokenizer-loader", daemon=True).start()
+    return _tokenizer
+
+
+@lru_cache(maxsize=4096)
+def _count_tokens(text: str, exact: bool) -> int:
+    if exact:
+        return len(_tokenizer.encode(text, add_special_tokens=False).ids)
+    # 한글 1.5자 / 그 외 3자당 1토큰으로 넉넉하게 추정 (polyglot-ko 실측보다 큼)
+    hangul = len(_HANGUL.findall(text))
+    other = len(text) - hangul - text.count(" ")
+    return math.ceil(hangul / 1.5) + math.ceil(max(other, 0) / 3)
+
+
+def count_tokens(text: str) -> int:
+    """텍스트 토큰 수 (같은 근거는 섹션마다 반복되므로 결과를 캐시)"""
+    if not text:
+        return 0
+    return _count_tokens(text, get_tokenizer() is not None)
+
+
+def input_token_budget(reserved_output_tokens: int, max_tokens: int = HF_MODEL_MAX_TOKENS) -> int:
+    """모델 최대 길이에서 생성 예약 토큰과 여유분을 뺀 입력 토큰 수"""
+    return max(0, max_tokens - reserved_output_tokens - _SAFETY_MARGIN_TOKENS)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, suffix: str = "...") -> str:
+    """토큰 예산 안으로 자르기 (가능하면 문장 경계, 잘렸으면 suffix 부착)"""
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    budget = max_tokens - count_tokens(suffix)
+    kept = ""
+    for match in _sentence_spans(text):
+        candidate = text[:match]
+        if count_tokens(candidate) > budget:
+            break
+        kept = candidate
+    if not kept:
+        # 첫 문장부터 예산 초과 → 글자 단위 이분 탐색
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if count_tokens(text[:mid]) <= budget:
+                low = mid
+            else:
+                high = mid - 1
+        kept = text[:low]
+    return kept.rstrip() + suffix
+
+
+def _sentence_spans(text: str) -> List[int]:
+    """문장이 끝나는 위치 목록"""
+    ends = [m.start() for m in _SENTENCE_END.finditer(text) if m.start() > 0]
+    return sorted(set(ends))
+
+
+def _overlap(previous: str, current: str) -> int:
+    """previous 의 끝과 current 의 앞이 겹치는 글자 수 (청크 겹침)"""
+    longest = min(len(previous), len(current), _MAX_OVERLAP_CHARS)
+    for size in range(longest, _MIN_OVERLAP_CHARS - 1, -1):
+        if previous.endswith(current[:size]):
+            return size
+    return 0
+
+
+def dedupe_passages(bodies: Sequence[str]) -> List[str]:
+    """
+    순위 순서의 근거 본문에서 중복 제거
+
+    - 앞선 근거에 통째로 포함된 근거는 빈 문자열
+    - 앞선 근거의 끝과 겹치는 앞부분은 잘라냄
+    """
+    kept: List[str] = []
+    result = []
+    for body in bodies:
+        text = body.strip()
+        if any(text in previous for previous in kept):
+            result.append("")
+            continue
+        for previous in kept:
+            size = _overlap(previous, text)
+            if size:
+                text = text[size:].lstrip()
+        kept.append(body.strip())
+        result.append(text)
+    return result
+
+
+def pack_passages(passages: Sequence[str], budget_tokens: int,
+                  scores: Optional[Sequence[float]] = None,
+                  separator: str = PASSAGE_SEPARATOR) -> Tuple[str, int]:
+    """
+    근거를 토큰 예산 안에 채워 컨텍스트 문자열로 반환 (컨텍스트, 사용 토큰 수)
+
+    - passages 는 "[n] 본문 (출처: ...)" 또는 본문, scores 가 없으면 목록 순서를 순위로 봄
+    - 출력은 원래 순위 순서를 유지 (인용 번호 [n] 은 그대로)
+    """
+    parts = [_PASSAGE.match(passage.strip()).groups() for passage in passages]
+    bodies = dedupe_passages([body for _, body, _ in parts])
+    order = range(len(passages)) if scores is None else sorted(range(len(passages)), key=lambda i: -scores[i])
+
+    separator_tokens = count_tokens(separator)
+    remaining = budget_tokens
+    selected = {}
+    for i in order:
+        label, _, source = parts[i]
+        body = bodies[i]
+        if not body:
+            continue
+        label, source = label or "", source or ""
+        cost = separator_tokens if selected else 0
+        text = f"{label}{body}{source}"
+        tokens = count_tokens(text)
+        if cost + tokens > remaining:
+            # 남은 예산이 충분하면 본문만 문장 경계에서 잘라 넣고, 작은 근거가 더 들어갈 수 있으므로 계속 진행
+            fixed = count_tokens(label) + count_tokens(source) + cost
+            if remaining - fixed < _MIN_PARTIAL_TOKENS:
+                continue
+            text = f"{label}{truncate_to_tokens(body, remaining - fixed)}{source}"
+            tokens = count_tokens(text)
+            if cost + tokens > remaining:
+                continue
+        selected[i] = text
+        remaining -= cost + tokens
+
+    context = separator.join(selected[i] for i in sorted(selected))
+    used = budget_tokens - remaining
+    if len(selected) < len(passages):
+        logger.info(f"📦 컨텍스트 패킹: 근거 {len(selected)}/{len(passages)}개, {used}/{budget_tokens} 토큰")
+    return context, used
+
+
+def pack_context(context: str, budget_tokens: int, separator: str = PASSAGE_SEPARATOR) -> str:
+    """검색 결과 컨텍스트 문자열(구분자로 이어진 순위순 근거)을 토큰 예산 안으로 패킹"""
+    if not context:
+        return context
+    if separator not in context:
+        return truncate_to_tokens(context, budget_tokens)
+    passages = [passage for passage in context.split(separator) if passage.strip()]
+    packed, _ = pack_passages(passages, budget_tokens, separator=separator)
+    return packed
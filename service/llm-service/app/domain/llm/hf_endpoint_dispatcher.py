@@ -0,0 +1,344 @@
+"""
+Hugging Face Inference Endpoint 마이크로 배칭 디스패처 / 상태 점검
+- 동시에 들어온 프롬프트를 최대 HF_BATCH_MAX_WAIT_MS 동안 또는 HF_BATCH_MAX_SIZE 개까지 모아
+  "inputs" 배열 1회 호출로 보내고, 응답 배열을 순서대로 각 호출자에게 돌려줌
+- 엔드포인트가 배열 입력을 거부(400 / 413 / 422, 응답 개수 불일치)하면 개별 호출로 전환하고
+  HF_BATCH_RETRY_SECONDS 후 배열 입력을 다시 시도 (연속 거부 시 간격 2배, 최대 1시간)
+- 개별 재전송에서도 같은 프롬프트가 거부되면 배열 미지원이 아니라 프롬프트 문제로 보고 배칭 유지
+- 엔드포인트 상태(ready / loading / paused / unauthorized / unreachable)는 호출마다 확인하지 않고
+  백그라운드 점검 task 가 주기적으로 갱신
+"""
+import asyncio
+import contextvars
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from ...common.config import (
+    HF_API_TOKEN, HF_API_URL, HF_BATCH_MAX_SIZE, HF_BATCH_MAX_WAIT_MS, HF_BATCH_RETRY_SECONDS,
+    HF_PROBE_INTERVAL_SECONDS,
+)
+from .provider_client import DeadlineExceeded, ProviderClient, get_provider_client, remaining_time, request_deadline
+
+logger = logging.getLogger(__name__)
+
+# 배열 입력을 지원하지 않는 엔드포인트로 보는 상태 코드
+_BATCH_REJECTED_STATUS = frozenset({400, 413, 422})
+# 배열 입력 재시도 간격 상한 (초)
+_BATCH_RETRY_MAX_SECONDS = 3600.0
+
+ENDPOINT_UNKNOWN = "unknown"
+ENDPOINT_READY = "ready"
+ENDPOINT_LOADING = "loading"
+ENDPOINT_PAUSED = "paused"
+ENDPOINT_UNAUTHORIZED = "unauthorized"
+ENDPOINT_UNREACHABLE = "unreachable"
+
+
+class EndpointResponseError(RuntimeError):
+    """엔드포인트가 200 이외로 응답 (호출자가 상태 코드별로 처리하도록 응답을 그대로 전달)"""
+
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"Inference Endpoint 응답 {response.status_code}")
+        self.response = response
+
+
+@dataclass
+class _Pending:
+    prompt: str
+    future: asyncio.Future
+    deadline: Optional[float]
+
+
+@dataclass
+class _Batch:
+    parameters: Dict[str, Any]
+    items: List[_Pending] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class HFEndpointDispatcher:
+    """Inference Endpoint 호출을 마이크로 배치로 묶는 디스패처 + 백그라운드 상태 점검"""
+
+    def __init__(self, url: str = HF_API_URL, token: str = HF_API_TOKEN,
+                 max_batch_size: int = HF_BATCH_MAX_SIZE, max_wait_ms: float = HF_BATCH_MAX_WAIT_MS,
+                 probe_interval: float = HF_PROBE_INTERVAL_SECONDS,
+                 batch_retry_seconds: float = HF_BATCH_RETRY_SECONDS,
+                 client_factory: Callable[[], ProviderClient] = lambda: get_provider_client("huggingface")):
+        self.url = url
+        self.token = token
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.probe_interval = probe_interval
+        self.batch_retry_seconds = max(0.0, batch_retry_seconds)
+        self._client_factory = client_factory
+        # (이벤트 루프, 생성 파라미터) 별로 모으는 중인 배치
+        self._pending: Dict[Tuple[asyncio.AbstractEventLoop, str], _Batch] = {}
+        # 배열 입력 거부 후 다시 시도할 시각 (monotonic) / 연속 거부 횟수
+        self._batch_retry_at: Optional[float] = None
+        self._batch_rejections = 0
+        self._probe_task: Optional[asyncio.Task] = None
+        self.endpoint_state = ENDPOINT_UNKNOWN
+        self.endpoint_detail = ""
+        self.last_probe_at: Optional[float] = None
+        self.last_probe_ms: Optional[float] = None
+        self.requests = 0
+        self.batches = 0
+        self.batched_prompts = 0
+        self.max_observed_batch = 0
+        self.batch_fallbacks = 0
+
+    @property
+    def batching(self) -> bool:
+        """지금 배열 입력으로 보낼지 여부 (거부 후 재시도 시각이 지나면 다시 시도)"""
+        if self.max_batch_size <= 1:
+            return False
+        return self._batch_retry_at is None or time.monotonic() >= self._batch_retry_at
+
+    def _headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}", "Content-Type": "application/json"}
+
+    # ------------------------------------------------------------------
+    # 생성 (배칭)
+    # ------------------------------------------------------------------
+
+    async def generate(self, prompt: str, parameters: Dict[str, Any]) -> str:
+        """
+        프롬프트 1개 생성 (같은 파라미터의 동시 호출과 묶여 전송될 수 있음)
+
+        - 200 이외 응답은 EndpointResponseError, 호출자 deadline 초과는 DeadlineExceeded
+        - 반환값은 엔드포인트의 generated_text 원문 (정리는 호출자 몫)
+        """
+        loop = asyncio.get_running_loop()
+        remaining = remaining_time()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceeded("Inference Endpoint 호출 전에 요청 deadline 초과")
+
+        self.requests += 1
+        future = loop.create_future()
+        item = _Pending(prompt, future, None if remaining is None else time.monotonic() + remaining)
+        key = (loop, json.dumps(parameters, sort_keys=True))
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _Batch(parameters)
+            if self.batching:
+                batch.timer = loop.call_later(self.max_wait, self._flush, key)
+        batch.items.append(item)
+        if not self.batching or len(batch.items) >= self.max_batch_size:
+            self._flush(key)
+
+        try:
+            if remaining is None:
+                return await asyncio.shield(future)
+            return await asyncio.wait_for(asyncio.shield(future), remaining)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded("Inference Endpoint 응답 대기 중 요청 deadline 초과") from None
+        finally:
+            if not future.done():
+                # 호출자가 먼저 끝나면 배치 결과는 버림
+                future.cancel()
+
+    def _flush(self, key: Tuple[asyncio.AbstractEventLoop, str]) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        # 배치 호출은 특정 호출자의 deadline 이 아니라 배치 안 가장 늦은 deadline 을 따름
+        key[0].create_task(self._send(batch), context=contextvars.Context())
+
+    async def _send(self, batch: _Batch) -> None:
+        items = [item for item in batch.items if not item.future.done()]
+        if not items:
+            return
+        deadlines = [item.deadline for item in items]
+        timeout = None if None in deadlines else max(deadlines) - time.monotonic()
+        try:
+            with request_deadline(timeout):
+                if len(items) == 1 or not self.batching:
+                    await asyncio.gather(*(self._send_single(item, batch.parameters) for item in items))
+                else:
+                    await self._send_batch(items, batch.parameters)
+        except BaseException as e:
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+
+    async def _post(self, inputs: Any, parameters: Dict[str, Any]) -> httpx.Response:
+        return await self._client_factory().post(
+            self.url, headers=self._headers(), json={"inputs": inputs, "parameters": parameters}
+        )
+
+    async def _send_single(self, item: _Pending, parameters: Dict[str, Any]) -> None:
+        try:
+            response = await self._post(item.prompt, parameters)
+            if response.status_code != 200:
+                raise EndpointResponseError(response)
+            result = response.json()
+            text = _generated_text(result[0] if isinstance(result, list) and result else result)
+        except Exception as e:
+            if not item.future.done():
+                item.future.set_exception(e)
+            return
+        if not item.future.done():
+            item.future.set_result(text)
+
+    async def _send_batch(self, items: List[_Pending], parameters: Dict[str, Any]) -> None:
+        started = time.perf_counter()
+        response = await self._post([item.prompt for item in items], parameters)
+        result = None
+        if response.status_code == 200:
+            result = response.json()
+            if isinstance(result, list) and len(result) == len(items):
+                self.batches += 1
+                self.batched_prompts += len(items)
+                self.max_observed_batch = max(self.max_observed_batch, len(items))
+                self._batch_retry_at, self._batch_rejections = None, 0
+                logger.info(f"📦 Inference Endpoint 배치 {len(items)}건 생성 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+                for item, output in zip(items, result):
+                    if not item.future.done():
+                        item.future.set_result(_generated_text(output))
+                return
+        elif response.status_code not in _BATCH_REJECTED_STATUS or _is_paused(response):
+            error = EndpointResponseError(response)
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(error)
+            return
+
+        # 배열 거부 → 이번 배치는 개별 재전송
+        self.batch_fallbacks += 1
+        await asyncio.gather(*(self._send_single(item, parameters) for item in items))
+        if response.status_code != 200 and any(_is_rejected(item.future) for item in items):
+            # 개별 호출도 거부된 프롬프트가 있음 → 배열 문제가 아니므로 배칭 유지
+            logger.warning(f"⚠️ Inference Endpoint 배치 거부 (상태 {response.status_code}) - 프롬프트 문제로 보고 배칭 유지")
+            return
+
+        # 배열 입력 미지원 → 일정 시간 개별 호출 후 다시 시도
+        self._batch_rejections += 1
+        retry_after = min(self.batch_retry_seconds * 2 ** (self._batch_rejections - 1), _BATCH_RETRY_MAX_SECONDS)
+        self._batch_retry_at = time.monotonic() + retry_after
+        logger.warning(
+            f"⚠️ Inference Endpoint 가 배열 입력을 지원하지 않아 개별 호출로 전환, {retry_after:.0f}초 후 재시도 "
+            f"(상태 {response.status_code}, 응답 {type(result).__name__})"
+        )
+
+    # ------------------------------------------------------------------
+    # 상태 점검
+    # ------------------------------------------------------------------
+
+    async def probe(self) -> str:
+        """엔드포인트 상태 1회 점검 (GET, 재시도 없음)"""
+        started = time.perf_counter()
+        try:
+            response = await self._client_factory().get(self.url, headers=self._headers(), timeout=10, retry=False)
+            state, detail = _endpoint_state(response)
+        except Exception as e:
+            state, detail = ENDPOINT_UNREACHABLE, f"{type(e).__name__}: {e}"
+        if state != self.endpoint_state:
+            logger.info(f"🩺 Inference Endpoint 상태 {self.endpoint_state} → {state} {detail}".rstrip())
+        self.endpoint_state, self.endpoint_detail = state, detail
+        self.last_probe_at = time.time()
+        self.last_probe_ms = round((time.perf_counter() - started) * 1000, 1)
+        return state
+
+    async def _probe_loop(self) -> None:
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.probe_interval)
+
+    def start_probe(self) -> None:
+        """백그라운드 상태 점검 시작 (애플리케이션 시작 시 1회)"""
+        if self.probe_interval > 0 and (self._probe_task is None or self._probe_task.done()):
+            self._probe_task = asyncio.get_running_loop().create_task(self._probe_loop())
+
+    async def aclose(self) -> None:
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "endpoint_state": self.endpoint_state,
+            "endpoint_detail": self.endpoint_detail,
+            "last_probe_at": self.last_probe_at,
+            "last_probe_ms": self.last_probe_ms,
+            "batching": self.batching,
+            "batch_retry_in": (
+                round(max(0.0, self._batch_retry_at - time.monotonic()), 1) if self._batch_retry_at is not None else None
+            ),
+            "batch_fallbacks": self.batch_fallbacks,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": round(self.batched_prompts / self.batches, 2) if self.batches else 0.0,
+            "max_observed_batch": self.max_observed_batch,
+        }
+
+
+def _generated_text(output: Any) -> str:
+    """배열 응답 원소 ({"generated_text"} 또는 [{"generated_text"}]) 에서 텍스트 추출"""
+    if isinstance(output, list):
+        output = output[0] if output else {}
+    if isinstance(output, dict):
+        return output.get("generated_text", "")
+    return str(output)
+
+
+def _is_rejected(future: asyncio.Future) -> bool:
+    """개별 호출이 400 / 413 / 422 로 거부되었는지"""
+    if future.cancelled() or not future.done():
+        return False
+    error = future.exception()
+    return isinstance(error, EndpointResponseError) and error.response.status_code in _BATCH_REJECTED_STATUS
+
+
+def _is_paused(response: httpx.Response) -> bool:
+    try:
+        return "paused" in str(response.json().get("error", "")).lower()
+    except Exception:
+        return False
+
+
+def _endpoint_state(response: httpx.Response) -> Tuple[str, str]:
+    """점검 응답 → (상태, 설명)"""
+    if response.status_code == 200:
+        try:
+            data = response.json()
+        except ValueError:
+            return ENDPOINT_READY, ""
+        if isinstance(data, dict) and "error" in data:
+            return ENDPOINT_LOADING, str(data["error"])[:200]
+        return ENDPOINT_READY, ""
+    if response.status_code in (401, 403):
+        return ENDPOINT_UNAUTHORIZED, "API 토큰 확인 필요"
+    if _is_paused(response):
+        return ENDPOINT_PAUSED, "Hugging Face 웹사이트에서 엔드포인트 재시작 필요"
+    if response.status_code == 503:
+        return ENDPOINT_LOADING, "모델 로딩 중"
+    # 생성 전용 엔드포인트는 GET 에 405 등으로 응답하지만 연결은 정상
+    if response.status_code < 500:
+        return ENDPOINT_READY, f"GET {response.status_code}"
+    return ENDPOINT_UNREACHABLE, f"GET {response.status_code}"
+
+
+_dispatcher: Optional[HFEndpointDispatcher] = None
+
+
+def get_hf_dispatcher() -> HFEndpointDispatcher:
+    """프로세스 공용 Inference Endpoint 디스패처"""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = HFEndpointDispatcher()
+    return _dispatcher
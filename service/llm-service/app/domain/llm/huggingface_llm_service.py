@@ -1,15 +1,41 @@
 import requests
 import logging
 import os
-from typing import Optional
+import json
+from typing import Iterator, Optional
 from ...common.config import (
-    HF_API_TOKEN, HF_MODEL, HF_API_URL, HF_LOCAL_MODEL_PATH
+    HF_API_TOKEN, HF_MODEL, HF_API_URL, HF_LOCAL_MODEL_PATH, HF_ENDPOINT_TIMEOUT
 )
 from .base_llm_service import BaseLLMService
+from .completion_cache import get_completion_cache
+from .context_packer import count_tokens, input_token_budget, pack_context, truncate_to_tokens
+from .hf_endpoint_dispatcher import (
+    ENDPOINT_PAUSED, ENDPOINT_READY, ENDPOINT_UNKNOWN, EndpointResponseError, get_hf_dispatcher,
+)
+from .provider_client import DeadlineExceeded, get_provider_client, run_from_thread
 import re
 
 logger = logging.getLogger(__name__)
 
+# 호출 실패는 "[연결 오류] ..." 같은 안내 문구로 반환되므로 생성 결과 캐시에 저장하지 않음 ("[1]" 인용 표기는 제외)
+_FAILURE_NOTICE = re.compile(r"^\[[^\]\d][^\]]*\]")
+
+# 초안 프롬프트의 질문 최대 토큰 수 (나머지 예산은 근거에 사용)
+DRAFT_QUESTION_MAX_TOKENS = 128
+
+MODEL_PROMPT_TEMPLATE = """다음 질문에 대해 TCFD 보고서 초안을 작성해주세요.
+
+작성 규칙:
+- TCFD 프레임워크(거버넌스, 전략, 위험관리, 지표 및 목표)에 맞게 작성
+- 기후 관련 재무정보 공시 가이드라인 준수
+- 전문적이고 객관적인 문체 사용
+- 특수문자(#, =, -, *, ~)를 5번 이상 연속으로 사용하지 말 것
+- 구체적이고 실용적인 내용으로 작성
+
+질문: {prompt}
+
+TCFD 보고서 초안:"""
+
 class HuggingFaceLLMService(BaseLLMService):
     """Hugging Face 기반 LLM 서비스 (코알파, RoLA 학습용)"""
     
@@ -52,8 +78,100 @@ class HuggingFaceLLMService(BaseLLMService):
         logger.info("Inference Endpoint 사용으로 인해 로컬 모델 로딩 비활성화")
         self.use_local_model = False
     
-    def _call_hf_inference_endpoint(self, prompt: str) -> str:
-        """Hugging Face Inference Endpoint를 호출하여 텍스트를 생성합니다."""
+    def _build_endpoint_payload(self, formatted_prompt: str, stream: bool = False) -> dict:
+        """Inference Endpoint 요청 본문을 생성합니다."""
+        # 모델 특성에 최적화된 파라미터 (사용자 학습 모델 기준)
+        payload = {
+            "inputs": formatted_prompt,
+            "parameters": {
+                "max_new_tokens": 256,      # 모델 최대 길이(2048) 고려하여 조정
+                "temperature": 0.7,         # 창의성과 일관성 균형
+                "do_sample": True,
+                "return_full_text": False,
+                "top_p": 0.9,               # 토큰 선택 범위
+                "repetition_penalty": 1.1,  # 반복 방지
+                "no_repeat_ngram_size": 3,  # 3-gram 반복 방지
+                "early_stopping": True,     # 조기 종료
+                "pad_token_id": 2,          # <|endoftext|> 토큰 ID
+                "eos_token_id": 2           # <|endoftext|> 토큰 ID
+            }
+        }
+        if stream:
+            # TGI 호환 엔드포인트는 stream=True 시 토큰 단위 SSE 로 응답
+            payload["stream"] = True
+        return payload
+    
+    @staticmethod
+    def _clean_generated_text(generated_text: str, formatted_prompt: str) -> str:
+        """프롬프트 / 특수 토큰 / 반복 문자를 제거합니다."""
+        # 프롬프트 부분 제거하고 생성된 텍스트만 반환
+        if formatted_prompt in generated_text:
+            generated_text = generated_text.replace(formatted_prompt, '').strip()
+        
+        # 특수 토큰 및 반복 문자 제거
+        generated_text = generated_text.replace('<|sep|>', '').replace('<|endoftext|>', '').strip()
+        # ################# 같은 반복 문자 제거
+        generated_text = re.sub(r'#{3,}', '', generated_text)  # 3개 이상의 # 제거
+        generated_text = re.sub(r'[=]{3,}', '', generated_text)  # 3개 이상의 = 제거
+        generated_text = re.sub(r'[-]{3,}', '', generated_text)  # 3개 이상의 - 제거
+        generated_text = re.sub(r'[*]{3,}', '', generated_text)  # 3개 이상의 * 제거
+        generated_text = re.sub(r'[~]{3,}', '', generated_text)  # 3개 이상의 ~ 제거
+        return generated_text.strip()
+    
+    def _stream_hf_inference_endpoint(self, prompt: str) -> Iterator[str]:
+        """Hugging Face Inference Endpoint 생성 결과를 토큰 단위로 반환합니다."""
+        if not HF_API_TOKEN:
+            logger.error("HF_API_TOKEN이 설정되지 않음")
+            yield "[오류] Hugging Face API 토큰이 설정되지 않았습니다."
+            return
+        
+        formatted_prompt = self._format_prompt_for_model(prompt)
+        headers = {
+            "Authorization": f"Bearer {HF_API_TOKEN}",
+            "Content-Type": "application/json",
+            "Accept": "text/event-stream"
+        }
+        payload = self._build_endpoint_payload(formatted_prompt, stream=True)
+        
+        with requests.post(HF_API_URL, headers=headers, json=payload, stream=True, timeout=HF_ENDPOINT_TIMEOUT) as response:
+            if response.status_code != 200:
+                # 일시정지 / fallback 처리는 비스트리밍 경로에 위임
+                logger.warning(f"Inference Endpoint 스트리밍 실패: {response.status_code} - 비스트리밍 호출로 대체")
+                yield run_from_thread(self._call_hf_inference_endpoint, prompt)
+                return
+            
+            if "text/event-stream" not in response.headers.get("content-type", ""):
+                # 스트리밍 미지원 엔드포인트는 전체 결과를 한 번에 반환
+                result = response.json()
+                if isinstance(result, list) and result:
+                    result = result[0]
+                generated_text = result.get("generated_text", "") if isinstance(result, dict) else str(result)
+                yield self._clean_generated_text(generated_text, formatted_prompt)
+                return
+            
+            for line in response.iter_lines():
+                # charset 미지정 SSE 응답도 UTF-8 로 해석
+                if not line.startswith(b"data:"):
+                    continue
+                data = json.loads(line[len(b"data:"):].decode("utf-8"))
+                if "error" in data:
+                    raise RuntimeError(f"Inference Endpoint 스트리밍 오류: {data['error']}")
+                token = data.get("token") or {}
+                if token.get("special"):
+                    continue
+                text = token.get("text", "").replace('<|sep|>', '').replace('<|endoftext|>', '')
+                if text:
+                    yield text
+    
+    def _stream_text(self, prompt: str) -> Iterator[str]:
+        """텍스트 생성 방식에 따라 조각 단위 생성 결과를 반환합니다. (SSE 스레드풀에서 순회)"""
+        if self.use_inference_endpoint:
+            yield from self._stream_hf_inference_endpoint(prompt)
+        else:
+            yield run_from_thread(self._generate_text, prompt)
+    
+    async def _call_hf_inference_endpoint(self, prompt: str) -> str:
+        """Hugging Face Inference Endpoint를 호출하여 텍스트를 생성합니다. (공용 커넥션 풀, 동시 호출 상한 / deadline / 재시도 적용)"""
         try:
             # API 토큰 확인
             if not HF_API_TOKEN:
@@ -65,142 +183,69 @@ class HuggingFaceLLMService(BaseLLMService):
             # 프롬프트 전처리
             formatted_prompt = self._format_prompt_for_model(prompt)
             
-            headers = {
-                "Authorization": f"Bearer {HF_API_TOKEN}",
-                "Content-Type": "application/json"
-            }
+            payload = self._build_endpoint_payload(formatted_prompt)
             
-            # 모델 특성에 최적화된 파라미터 (사용자 학습 모델 기준)
-            payload = {
-                "inputs": formatted_prompt,
-                "parameters": {
-                    "max_new_tokens": 256,      # 모델 최대 길이(2048) 고려하여 조정
-                    "temperature": 0.7,         # 창의성과 일관성 균형
-                    "do_sample": True,
-                    "return_full_text": False,
-                    "top_p": 0.9,              # 토큰 선택 범위
-                    "repetition_penalty": 1.1,  # 반복 방지
-                    "no_repeat_ngram_size": 3,  # 3-gram 반복 방지
-                    "early_stopping": True,     # 조기 종료
-                    "pad_token_id": 2,          # <|endoftext|> 토큰 ID
-                    "eos_token_id": 2           # <|endoftext|> 토큰 ID
-                }
-            }
+            # 엔드포인트 상태는 백그라운드 점검 결과 사용 (호출마다 헬스체크하지 않음)
+            dispatcher = get_hf_dispatcher()
+            if dispatcher.endpoint_state == ENDPOINT_PAUSED:
+                logger.error("Inference Endpoint가 일시정지 상태입니다. (상태 점검 결과)")
+                return "[Inference Endpoint 일시정지] 모델이 일시정지 상태입니다. Hugging Face 웹사이트에서 엔드포인트를 재시작해주세요."
+            if dispatcher.endpoint_state not in (ENDPOINT_READY, ENDPOINT_UNKNOWN):
+                logger.warning(f"Endpoint 상태 {dispatcher.endpoint_state}: {dispatcher.endpoint_detail}")
             
-            # Endpoint 헬스체크 먼저 시도
+            # 동시 요청과 묶어 배치로 호출 (CPU 환경을 고려한 긴 타임아웃 HF_ENDPOINT_TIMEOUT)
             try:
-                health_response = requests.get(HF_API_URL, timeout=10)
-                logger.info(f"Endpoint 헬스체크: {health_response.status_code}")
-                
-                # 모델 준비 상태 확인
-                if health_response.status_code == 200:
-                    try:
-                        health_data = health_response.json()
-                        logger.info(f"헬스체크 응답: {health_data}")
-                        if "error" in health_data:
-                            logger.warning(f"모델 준비 중: {health_data['error']}")
-                    except:
-                        logger.info(f"헬스체크 응답 텍스트: {health_response.text}")
-                elif health_response.status_code == 401:
-                    logger.error("인증 실패 - API 토큰 확인 필요")
-                elif health_response.status_code == 503:
-                    logger.warning("서비스 일시적 사용 불가 - 모델 로딩 중일 수 있음")
-                else:
-                    logger.warning(f"헬스체크 예상치 못한 상태: {health_response.status_code}")
-                    
-            except Exception as e:
-                logger.warning(f"Endpoint 헬스체크 실패: {e}")
+                generated_text = await dispatcher.generate(formatted_prompt, payload["parameters"])
+            except EndpointResponseError as e:
+                response = e.response
+            else:
+                logger.info(f"생성된 텍스트: {generated_text}")
+                return self._clean_generated_text(generated_text, formatted_prompt)
             
-            # Inference Endpoint URL 직접 사용 (CPU 환경을 고려한 긴 타임아웃)
-            response = requests.post(
-                HF_API_URL,
-                headers=headers,
-                json=payload,
-                timeout=120  # CPU 환경에서는 더 긴 타임아웃 필요
-            )
+            logger.error(f"Hugging Face Inference Endpoint 호출 실패: {response.status_code} - {response.text}")
+            logger.error(f"요청 URL: {HF_API_URL}")
+            logger.error(f"요청 페이로드: {payload}")
             
-            if response.status_code == 200:
-                result = response.json()
-                logger.info(f"응답 결과: {result}")
-                if isinstance(result, list) and len(result) > 0:
-                    generated_text = result[0].get("generated_text", "")
-                    logger.info(f"생성된 텍스트: {generated_text}")
-                    # 프롬프트 부분 제거하고 생성된 텍스트만 반환
-                    if formatted_prompt in generated_text:
-                        generated_text = generated_text.replace(formatted_prompt, '').strip()
-                    
-                    # 특수 토큰 및 반복 문자 제거
-                    generated_text = generated_text.replace('<|sep|>', '').replace('<|endoftext|>', '').strip()
-                    # ################# 같은 반복 문자 제거
-                    generated_text = re.sub(r'#{3,}', '', generated_text)  # 3개 이상의 # 제거
-                    generated_text = re.sub(r'[=]{3,}', '', generated_text)  # 3개 이상의 = 제거
-                    generated_text = re.sub(r'[-]{3,}', '', generated_text)  # 3개 이상의 - 제거
-                    generated_text = re.sub(r'[*]{3,}', '', generated_text)  # 3개 이상의 * 제거
-                    generated_text = re.sub(r'[~]{3,}', '', generated_text)  # 3개 이상의 ~ 제거
-                    generated_text = generated_text.strip()
-                    
-                    return generated_text
-                elif isinstance(result, dict):
-                    generated_text = result.get("generated_text", "")
-                    if formatted_prompt in generated_text:
-                        generated_text = generated_text.replace(formatted_prompt, '').strip()
-                    
-                    # 특수 토큰 및 반복 문자 제거
-                    generated_text = generated_text.replace('<|sep|>', '').replace('<|endoftext|>', '').strip()
-                    # ################# 같은 반복 문자 제거
-                    generated_text = re.sub(r'#{3,}', '', generated_text)  # 3개 이상의 # 제거
-                    generated_text = re.sub(r'[=]{3,}', '', generated_text)  # 3개 이상의 = 제거
-                    generated_text = re.sub(r'[-]{3,}', '', generated_text)  # 3개 이상의 - 제거
-                    generated_text = re.sub(r'[*]{3,}', '', generated_text)  # 3개 이상의 * 제거
-                    generated_text = re.sub(r'[~]{3,}', '', generated_text)  # 3개 이상의 ~ 제거
-                    generated_text = generated_text.strip()
-                    
-                    return generated_text
-                else:
-                    return str(result)
-            else:
-                logger.error(f"Hugging Face Inference Endpoint 호출 실패: {response.status_code} - {response.text}")
-                logger.error(f"요청 URL: {HF_API_URL}")
-                logger.error(f"요청 헤더: {headers}")
-                logger.error(f"요청 페이로드: {payload}")
-                
-                # 특수 오류 처리 (paused endpoint 등)
-                if response.status_code == 400:
-                    try:
-                        error_data = response.json()
-                        if "error" in error_data and "paused" in error_data["error"].lower():
-                            logger.error("Inference Endpoint가 일시정지 상태입니다.")
-                            return "[Inference Endpoint 일시정지] 모델이 일시정지 상태입니다. Hugging Face 웹사이트에서 엔드포인트를 재시작해주세요."
-                    except:
-                        pass
-                
-                # 500 오류 시 더 자세한 정보 로깅
-                if response.status_code == 500:
-                    logger.error("=== 500 오류 상세 분석 ===")
-                    logger.error(f"응답 헤더: {dict(response.headers)}")
-                    logger.error(f"응답 크기: {len(response.content)} bytes")
-                    try:
-                        error_detail = response.json()
-                        logger.error(f"오류 상세: {error_detail}")
-                    except:
-                        logger.error(f"응답 텍스트: {response.text}")
-                    logger.error("========================")
-                
-                # Inference Endpoint 실패 시 Hugging Face API로 fallback
-                logger.info("Inference Endpoint 실패 - Hugging Face API로 fallback 시도")
-                fallback_result = self._call_hf_api_fallback(prompt)
-                
-                # Fallback도 실패하면 기본 메시지 반환
-                if "실패" in fallback_result or "오류" in fallback_result:
-                    return f"[Inference Endpoint 오류] {response.status_code} - {response.text[:100]}... (Fallback도 실패)"
-                
-                return fallback_result
-                
+            # 특수 오류 처리 (paused endpoint 등)
+            if response.status_code == 400:
+                try:
+                    error_data = response.json()
+                    if "error" in error_data and "paused" in error_data["error"].lower():
+                        logger.error("Inference Endpoint가 일시정지 상태입니다.")
+                        return "[Inference Endpoint 일시정지] 모델이 일시정지 상태입니다. Hugging Face 웹사이트에서 엔드포인트를 재시작해주세요."
+                except:
+                    pass
+            
+            # 500 오류 시 더 자세한 정보 로깅
+            if response.status_code == 500:
+                logger.error("=== 500 오류 상세 분석 ===")
+                logger.error(f"응답 헤더: {dict(response.headers)}")
+                logger.error(f"응답 크기: {len(response.content)} bytes")
+                try:
+                    error_detail = response.json()
+                    logger.error(f"오류 상세: {error_detail}")
+                except:
+                    logger.error(f"응답 텍스트: {response.text}")
+                logger.error("========================")
+            
+            # Inference Endpoint 실패 시 Hugging Face API로 fallback
+            logger.info("Inference Endpoint 실패 - Hugging Face API로 fallback 시도")
+            fallback_result = await self._call_hf_api_fallback(prompt)
+            
+            # Fallback도 실패하면 기본 메시지 반환
+            if "실패" in fallback_result or "오류" in fallback_result:
+                return f"[Inference Endpoint 오류] {response.status_code} - {response.text[:100]}... (Fallback도 실패)"
+            
+            return fallback_result
+        
+        except DeadlineExceeded:
+            # 요청 deadline 초과는 라우터에서 504 로 응답
+            raise
         except Exception as e:
             logger.error(f"Hugging Face Inference Endpoint 호출 중 오류: {e}")
             return f"[연결 오류] Hugging Face Inference Endpoint 연결에 실패했습니다: {str(e)}"
     
-    def _call_hf_api_fallback(self, prompt: str) -> str:
+    async def _call_hf_api_fallback(self, prompt: str) -> str:
         """Hugging Face API로 fallback합니다."""
         try:
             # Hugging Face API URL 사용 (실제 존재하는 모델로 테스트)
@@ -227,7 +272,7 @@ class HuggingFaceLLMService(BaseLLMService):
                 }
             }
             
-            response = requests.post(
+            response = await get_provider_client("huggingface").post(
                 api_url,
                 headers=headers,
                 json=payload,
@@ -245,12 +290,14 @@ class HuggingFaceLLMService(BaseLLMService):
             else:
                 logger.error(f"Hugging Face API fallback도 실패: {response.status_code} - {response.text}")
                 return f"[Fallback 실패] Hugging Face API 호출도 실패했습니다. (상태 코드: {response.status_code})"
-                
+        
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Hugging Face API fallback 중 오류: {e}")
             return f"[Fallback 오류] Hugging Face API 연결에 실패했습니다: {str(e)}"
     
-    def _call_hf_api(self, prompt: str) -> str:
+    async def _call_hf_api(self, prompt: str) -> str:
         """Hugging Face API를 호출합니다. (기존 방식 보존)"""
         # API 키가 없으면 fallback 메시지 반환
         if not HF_API_TOKEN:
@@ -273,7 +320,7 @@ class HuggingFaceLLMService(BaseLLMService):
                 }
             }
             
-            response = requests.post(
+            response = await get_provider_client("huggingface").post(
                 HF_API_URL,
                 headers=headers,
                 json=payload,
@@ -291,62 +338,76 @@ class HuggingFaceLLMService(BaseLLMService):
             else:
                 logger.error(f"Hugging Face API 호출 실패: {response.status_code} - {response.text}")
                 return f"[API 오류] Hugging Face API 호출에 실패했습니다. (상태 코드: {response.status_code})"
-                
+        
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Hugging Face API 호출 중 오류: {e}")
             return f"[연결 오류] Hugging Face API 연결에 실패했습니다: {str(e)}"
     
-    def _generate_with_loaded_model(self, prompt: str) -> str:
+    async def _generate_with_loaded_model(self, prompt: str) -> str:
         """로딩된 모델로 텍스트를 생성합니다. (Inference Endpoint 사용으로 인해 비활성화)"""
         logger.warning("로딩된 모델 사용 시도 - Inference Endpoint로 fallback")
-        return self._call_hf_inference_endpoint(prompt)
+        return await self._call_hf_inference_endpoint(prompt)
+    
+    def _input_token_budget(self) -> int:
+        """모델 입력 토큰 예산 (최대 길이 - 생성 예약 토큰 - 모델용 프롬프트 틀)"""
+        reserved = self._build_endpoint_payload("")["parameters"]["max_new_tokens"]
+        return input_token_budget(reserved) - count_tokens(MODEL_PROMPT_TEMPLATE.format(prompt=""))
     
     def _format_prompt_for_model(self, prompt: str) -> str:
         """모델용 프롬프트를 포맷팅합니다. (TCFD 보고서 초안 작성 최적화)"""
         # 특수 토큰 충돌 방지를 위해 <|sep|> 토큰은 사용하지 않음
         
-        # 입력 데이터 길이 제한 (모델 최대 길이 2048 토큰 고려)
-        if len(prompt) > 600:  # 토큰 길이 제한을 고려하여 조정
-            prompt = prompt[:600] + "..."
+        # 입력 데이터 길이 제한 (모델 최대 길이에서 생성 토큰을 뺀 예산, 문장 경계에서 자름)
+        prompt = truncate_to_tokens(prompt, self._input_token_budget())
         
         # TCFD 보고서 초안 작성에 특화된 프롬프트 구조
-        system_instruction = """다음 질문에 대해 TCFD 보고서 초안을 작성해주세요.
-
-작성 규칙:
-- TCFD 프레임워크(거버넌스, 전략, 위험관리, 지표 및 목표)에 맞게 작성
-- 기후 관련 재무정보 공시 가이드라인 준수
-- 전문적이고 객관적인 문체 사용
-- 특수문자(#, =, -, *, ~)를 5번 이상 연속으로 사용하지 말 것
-- 구체적이고 실용적인 내용으로 작성
-
-질문: {prompt}
-
-TCFD 보고서 초안:"""
-        
-        return system_instruction.format(prompt=prompt)
+        return MODEL_PROMPT_TEMPLATE.format(prompt=prompt)
     
-    def _generate_text(self, prompt: str) -> str:
-        """텍스트 생성 방식에 따라 적절한 메서드를 호출합니다."""
+    def _generation_backend(self) -> tuple:
+        """생성 결과 캐시 키에 들어갈 (백엔드, 모델 식별자, 생성 파라미터)"""
         if self.use_inference_endpoint:
-            # Hugging Face Inference Endpoint 사용
-            return self._call_hf_inference_endpoint(prompt)
-        elif self.pipeline:
-            # 로딩된 모델 사용
-            return self._generate_with_loaded_model(prompt)
-        else:
-            # 기존 API 호출 방식
-            return self._call_hf_api(prompt)
+            return "endpoint", HF_API_URL, self._build_endpoint_payload("")["parameters"]
+        if self.pipeline:
+            return "local", HF_LOCAL_MODEL_PATH or HF_MODEL, {}
+        return "api", HF_API_URL or HF_MODEL, {"max_new_tokens": 1000, "temperature": 0.7}
+    
+    def is_failure_notice(self, text: str) -> bool:
+        """실패 안내 문구("[연결 오류] ..." 등)인지 ("[1]" 인용으로 시작하는 정상 결과는 제외)"""
+        return bool(_FAILURE_NOTICE.match(text))
+    
+    async def _generate_text(self, prompt: str) -> str:
+        """텍스트 생성 방식에 따라 적절한 메서드를 호출합니다. (같은 프롬프트는 생성 결과 캐시에서 반환)"""
+        backend, model, params = self._generation_backend()
+        
+        async def generate() -> str:
+            if self.use_inference_endpoint:
+                # Hugging Face Inference Endpoint 사용
+                return await self._call_hf_inference_endpoint(prompt)
+            elif self.pipeline:
+                # 로딩된 모델 사용
+                return await self._generate_with_loaded_model(prompt)
+            else:
+                # 기존 API 호출 방식
+                return await self._call_hf_api(prompt)
+        
+        return await get_completion_cache().cached(
+            provider=f"huggingface:{backend}",
+            model=model,
+            params=params,
+            prompt=prompt,
+            generate=generate,
+            is_success=lambda text: not self.is_failure_notice(text)
+        )
     
     def _create_draft_prompt(self, question: str, context: str, section: str, style_guide: str = "") -> str:
         """초안 생성 프롬프트를 생성합니다. (TCFD 보고서 초안 작성 최적화)"""
-        # 입력 길이 제한 (토큰 제한 고려)
-        if len(context) > 800:
-            context = context[:800] + "..."
-        if len(question) > 200:
-            question = question[:200] + "..."
+        # 입력 길이 제한 (토큰 예산 고려)
+        question = truncate_to_tokens(question, DRAFT_QUESTION_MAX_TOKENS)
         
         # TCFD 보고서 초안 작성에 특화된 프롬프트 구조
-        prompt = f"""다음 근거를 바탕으로 TCFD 보고서의 {section} 섹션 초안을 작성해주세요.
+        head = f"""다음 근거를 바탕으로 TCFD 보고서의 {section} 섹션 초안을 작성해주세요.
 
 TCFD 보고서 작성 요구사항:
 - TCFD 프레임워크(거버넌스, 전략, 위험관리, 지표 및 목표)에 맞게 작성
@@ -357,12 +418,16 @@ TCFD 보고서 작성 요구사항:
 
 질문: {question}
 
-근거: {context}
+근거: """
+        tail = f"""
 
 {style_guide if style_guide else ""}
 
 TCFD 보고서 초안:"""
-        return prompt
+        
+        # 근거는 남은 토큰 예산 안에서 검색 순위순으로 채움 (겹치는 청크 제거)
+        budget = self._input_token_budget() - count_tokens(head) - count_tokens(tail)
+        return f"{head}{pack_context(context, budget)}{tail}"
     
     def _create_polish_prompt(self, text: str, tone: str = "공식적", style_guide: str = "") -> str:
         """윤문 프롬프트를 생성합니다. (TCFD 보고서 윤문 최적화)"""
@@ -389,28 +454,44 @@ TCFD 보고서 윤문 요구사항:
 윤문된 TCFD 보고서:"""
         return prompt
 
-    def generate_draft_section(self, question: str, context: str, section: str, style_guide: str = "") -> str:
+    async def generate_draft_section(self, question: str, context: str, section: str, style_guide: str = "") -> str:
         """섹션별 초안을 생성합니다."""
         try:
             prompt = self._create_draft_prompt(question, context, section, style_guide)
             
-            content = self._generate_text(prompt)
+            content = await self._generate_text(prompt)
             logger.info(f"Hugging Face 초안 생성 완료: {section}")
             return content
-            
+        
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Hugging Face 초안 생성 실패: {e}")
             return f"[오류] {section} 섹션 초안 생성에 실패했습니다: {str(e)}"
     
-    def polish_text(self, text: str, tone: str = "공식적", style_guide: str = "") -> str:
+    async def polish_text(self, text: str, tone: str = "공식적", style_guide: str = "") -> str:
         """텍스트를 윤문합니다."""
         try:
             prompt = self._create_polish_prompt(text, tone, style_guide)
             
-            content = self._generate_text(prompt)
+            content = await self._generate_text(prompt)
             logger.info("Hugging Face 윤문 완료")
             return content
-            
+        
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Hugging Face 윤문 실패: {e}")
             return f"[오류] 텍스트 윤문에 실패했습니다: {str(e)}"
+    
+    def stream_draft_section(self, question: str, context: str, section: str, style_guide: str = "") -> Iterator[str]:
+        """섹션별 초안을 토큰 단위로 스트리밍합니다."""
+        prompt = self._create_draft_prompt(question, context, section, style_guide)
+        yield from self._stream_text(prompt)
+        logger.info(f"Hugging Face 초안 스트리밍 완료: {section}")
+    
+    def stream_polish_text(self, text: str, tone: str = "공식적", style_guide: str = "") -> Iterator[str]:
+        """윤문 결과를 토큰 단위로 스트리밍합니다."""
+        prompt = self._create_polish_prompt(text, tone, style_guide)
+        yield from self._stream_text(prompt)
+        logger.info("Hugging Face 윤문 스트리밍 완료")
@@ -1,11 +1,44 @@
 import os
 import json
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 import logging
+from .completion_cache import get_completion_cache
+from .provider_client import DeadlineExceeded, get_provider_client
 
 logger = logging.getLogger(__name__)
 
+OPENAI_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+
+
+class _OpenAIStatusError(RuntimeError):
+    """OpenAI 가 200 이외 상태 코드로 응답 (캐시에 저장하지 않고 안내 문구로 반환)"""
+
+
+def stream_openai_chat(headers: Dict[str, str], data: Dict[str, Any]) -> Iterator[str]:
+    """Chat Completions SSE 응답의 토큰 delta 를 도착하는 대로 반환 (data 에 stream=True 필요)"""
+    with requests.post(
+        OPENAI_CHAT_COMPLETIONS_URL,
+        headers=headers,
+        json=data,
+        stream=True,
+        timeout=60
+    ) as response:
+        if response.status_code != 200:
+            logger.error(f"OpenAI API 스트리밍 호출 실패: {response.status_code} - {response.text}")
+            raise RuntimeError(f"OpenAI API 호출 실패: {response.status_code}")
+        
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            payload = line[len(b"data:"):].strip()
+            if payload == b"[DONE]":
+                break
+            choices = json.loads(payload.decode("utf-8")).get("choices") or []
+            content = choices[0].get("delta", {}).get("content") if choices else None
+            if content:
+                yield content
+
 class LLMService:
     """LLM 서비스 - OpenAI와 Hugging Face API 지원"""
     
@@ -13,73 +46,116 @@ class LLMService:
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
         self.hf_api_token = os.getenv('HF_API_TOKEN')
         self.hf_api_url = os.getenv('HF_API_URL', 'https://api-inference.huggingface.co/models/EleutherAI/polyglot-ko-3.8b')
+        self._hf = None
         
-    def generate_with_openai(self, prompt: str, report_type: str = "draft") -> str:
-        """OpenAI API를 사용하여 텍스트 생성"""
+    def _system_message(self, report_type: str) -> str:
+        """보고서 유형별 시스템 메시지"""
+        return f"당신은 TCFD 기후 관련 재무정보 공시 보고서 작성 전문가입니다. {report_type} 형태로 전문적이고 체계적인 보고서를 작성해주세요."
+    
+    def _build_openai_request(self, prompt: str, report_type: str, stream: bool = False):
+        """OpenAI Chat Completions 요청 헤더 / 본문 생성"""
+        headers = {
+            "Authorization": f"Bearer {self.openai_api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        data = {
+            "model": os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
+            "messages": [
+                {
+                    "role": "system",
+                    "content": self._system_message(report_type)
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": int(os.getenv('OPENAI_MAX_TOKENS', '2000')),
+            "temperature": float(os.getenv('OPENAI_TEMPERATURE', '0.3'))
+        }
+        if stream:
+            data["stream"] = True
+        return headers, data
+    
+    async def generate_with_openai(self, prompt: str, report_type: str = "draft") -> str:
+        """OpenAI API를 사용하여 텍스트 생성 (공용 커넥션 풀, 동시 호출 상한 / deadline / 재시도, 생성 결과 캐시 적용)"""
         try:
             if not self.openai_api_key:
                 logger.error("OpenAI API 키가 설정되지 않았습니다")
                 return "OpenAI API 키가 설정되지 않았습니다."
             
             # OpenAI API 호출
-            headers = {
-                "Authorization": f"Bearer {self.openai_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            data = {
-                "model": os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": f"당신은 TCFD 기후 관련 재무정보 공시 보고서 작성 전문가입니다. {report_type} 형태로 전문적이고 체계적인 보고서를 작성해주세요."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "max_tokens": int(os.getenv('OPENAI_MAX_TOKENS', '2000')),
-                "temperature": float(os.getenv('OPENAI_TEMPERATURE', '0.3'))
-            }
-            
-            response = requests.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=60
-            )
+            headers, data = self._build_openai_request(prompt, report_type)
             
-            if response.status_code == 200:
+            async def request() -> str:
+                response = await get_provider_client("openai").post(
+                    OPENAI_CHAT_COMPLETIONS_URL,
+                    headers=headers,
+                    json=data
+                )
+                if response.status_code != 200:
+                    logger.error(f"OpenAI API 호출 실패: {response.status_code} - {response.text}")
+                    raise _OpenAIStatusError(f"OpenAI API 호출 실패: {response.status_code}")
                 result = response.json()
-                content = result['choices'][0]['message']['content']
                 logger.info("OpenAI API 호출 성공")
-                return content
-            else:
-                logger.error(f"OpenAI API 호출 실패: {response.status_code} - {response.text}")
-                return f"OpenAI API 호출 실패: {response.status_code}"
-                
+                return result['choices'][0]['message']['content']
+            
+            return await get_completion_cache().cached(
+                provider="openai",
+                model=data["model"],
+                params={"max_tokens": data["max_tokens"], "temperature": data["temperature"]},
+                prompt=data["messages"],
+                generate=request
+            )
+        
+        except DeadlineExceeded:
+            # 요청 deadline 초과는 라우터에서 504 로 응답
+            raise
+        except _OpenAIStatusError as e:
+            return str(e)
         except Exception as e:
             logger.error(f"OpenAI API 호출 중 오류 발생: {str(e)}")
             return f"OpenAI API 호출 중 오류 발생: {str(e)}"
     
-    def generate_with_huggingface(self, prompt: str, report_type: str = "draft") -> str:
+    def _hf_service(self):
+        """Hugging Face LLM 서비스 (최초 사용 시 1회 생성)"""
+        if self._hf is None:
+            from .huggingface_llm_service import HuggingFaceLLMService
+            self._hf = HuggingFaceLLMService()
+        return self._hf
+    
+    async def generate_with_huggingface(self, prompt: str, report_type: str = "draft") -> str:
         """Hugging Face API를 사용하여 텍스트 생성 (로컬 모델 또는 API 호출)"""
         try:
-            # HuggingFaceLLMService 인스턴스 생성하여 사용
-            from .huggingface_llm_service import HuggingFaceLLMService
-            hf_service = HuggingFaceLLMService()
-            
             # 시스템 메시지가 포함된 프롬프트 생성
-            system_message = f"당신은 TCFD 기후 관련 재무정보 공시 보고서 작성 전문가입니다. {report_type} 형태로 전문적이고 체계적인 보고서를 작성해주세요."
-            full_prompt = f"{system_message}\n\n{prompt}"
+            full_prompt = f"{self._system_message(report_type)}\n\n{prompt}"
             
             # HuggingFaceLLMService의 _generate_text 메서드 사용
-            content = hf_service._generate_text(full_prompt)
+            content = await self._hf_service()._generate_text(full_prompt)
             
             logger.info("Hugging Face 텍스트 생성 완료")
             return content
-                
+        
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Hugging Face 텍스트 생성 중 오류 발생: {str(e)}")
             return f"Hugging Face 텍스트 생성 중 오류 발생: {str(e)}"
+    
+    def stream_with_openai(self, prompt: str, report_type: str = "draft") -> Iterator[str]:
+        """OpenAI API 스트리밍 호출 - 토큰 delta 를 도착하는 대로 반환"""
+        if not self.openai_api_key:
+            logger.error("OpenAI API 키가 설정되지 않았습니다")
+            yield "OpenAI API 키가 설정되지 않았습니다."
+            return
+        
+        headers, data = self._build_openai_request(prompt, report_type, stream=True)
+        yield from stream_openai_chat(headers, data)
+        logger.info("OpenAI API 스트리밍 호출 완료")
+    
+    def stream_with_huggingface(self, prompt: str, report_type: str = "draft") -> Iterator[str]:
+        """Hugging Face 스트리밍 생성 (Inference Endpoint 토큰 단위, 그 외는 전체 결과 1회)"""
+        full_prompt = f"{self._system_message(report_type)}\n\n{prompt}"
+        yield from self._hf_service()._stream_text(full_prompt)
+        logger.info("Hugging Face 스트리밍 생성 완료")
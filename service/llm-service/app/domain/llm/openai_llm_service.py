@@ -1,14 +1,20 @@
 import openai
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 from ...common.config import (
     OPENAI_API_KEY, OPENAI_MODEL, 
     OPENAI_MAX_TOKENS, OPENAI_TEMPERATURE
 )
 from .base_llm_service import BaseLLMService
+from .completion_cache import get_completion_cache
+from .llm_service import OPENAI_CHAT_COMPLETIONS_URL, stream_openai_chat
+from .provider_client import get_provider_client
 
 logger = logging.getLogger(__name__)
 
+DRAFT_SYSTEM_MESSAGE = "당신은 ESG 보고서 작성 전문가입니다. 주어진 근거를 바탕으로 정확하고 전문적인 초안을 작성해주세요."
+POLISH_SYSTEM_MESSAGE = "당신은 ESG 보고서 윤문 전문가입니다. 주어진 텍스트를 전문적이고 일관성 있게 윤문해주세요."
+
 class OpenAILLMService(BaseLLMService):
     """OpenAI 기반 LLM 서비스"""
     
@@ -22,22 +28,64 @@ class OpenAILLMService(BaseLLMService):
         else:
             logger.warning("OpenAI API 키가 설정되지 않음")
     
-    def generate_draft_section(self, question: str, context: str, section: str, style_guide: str = "") -> str:
+    def _chat_messages(self, system_message: str, prompt: str) -> list:
+        return [
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": prompt}
+        ]
+    
+    async def _chat_completion(self, system_message: str, prompt: str) -> str:
+        """Chat Completion API 호출 (공용 커넥션 풀, 동시 호출 상한 / deadline / 재시도, 생성 결과 캐시 적용)"""
+        messages = self._chat_messages(system_message, prompt)
+        
+        async def request() -> str:
+            response = await get_provider_client("openai").post(
+                OPENAI_CHAT_COMPLETIONS_URL,
+                headers={
+                    "Authorization": f"Bearer {OPENAI_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": OPENAI_MODEL,
+                    "messages": messages,
+                    "max_tokens": OPENAI_MAX_TOKENS,
+                    "temperature": OPENAI_TEMPERATURE
+                }
+            )
+            if response.status_code != 200:
+                raise RuntimeError(f"OpenAI API 호출 실패: {response.status_code} - {response.text[:200]}")
+            return response.json()["choices"][0]["message"]["content"]
+        
+        return await get_completion_cache().cached(
+            provider="openai",
+            model=OPENAI_MODEL,
+            params={"max_tokens": OPENAI_MAX_TOKENS, "temperature": OPENAI_TEMPERATURE},
+            prompt=messages,
+            generate=request
+        )
+    
+    def _stream_chat(self, system_message: str, prompt: str) -> Iterator[str]:
+        """토큰 delta 를 도착하는 대로 반환합니다. (SSE 스레드풀에서 순회)"""
+        yield from stream_openai_chat(
+            headers={
+                "Authorization": f"Bearer {OPENAI_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            data={
+                "model": OPENAI_MODEL,
+                "messages": self._chat_messages(system_message, prompt),
+                "max_tokens": OPENAI_MAX_TOKENS,
+                "temperature": OPENAI_TEMPERATURE,
+                "stream": True
+            }
+        )
+    
+    async def generate_draft_section(self, question: str, context: str, section: str, style_guide: str = "") -> str:
         """섹션별 초안을 생성합니다."""
         try:
             prompt = self._create_draft_prompt(question, context, section, style_guide)
             
-            response = openai.ChatCompletion.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "당신은 ESG 보고서 작성 전문가입니다. 주어진 근거를 바탕으로 정확하고 전문적인 초안을 작성해주세요."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=OPENAI_MAX_TOKENS,
-                temperature=OPENAI_TEMPERATURE
-            )
-            
-            content = response.choices[0].message.content
+            content = await self._chat_completion(DRAFT_SYSTEM_MESSAGE, prompt)
             logger.info(f"OpenAI 초안 생성 완료: {section}")
             return content
             
@@ -45,25 +93,27 @@ class OpenAILLMService(BaseLLMService):
             logger.error(f"OpenAI 초안 생성 실패: {e}")
             raise
     
-    def polish_text(self, text: str, tone: str = "공식적", style_guide: str = "") -> str:
+    async def polish_text(self, text: str, tone: str = "공식적", style_guide: str = "") -> str:
         """텍스트를 윤문합니다."""
         try:
             prompt = self._create_polish_prompt(text, tone, style_guide)
             
-            response = openai.ChatCompletion.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "당신은 ESG 보고서 윤문 전문가입니다. 주어진 텍스트를 전문적이고 일관성 있게 윤문해주세요."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=OPENAI_MAX_TOKENS,
-                temperature=OPENAI_TEMPERATURE
-            )
-            
-            content = response.choices[0].message.content
+            content = await self._chat_completion(POLISH_SYSTEM_MESSAGE, prompt)
             logger.info("OpenAI 윤문 완료")
             return content
             
         except Exception as e:
             logger.error(f"OpenAI 윤문 실패: {e}")
             raise
+    
+    def stream_draft_section(self, question: str, context: str, section: str, style_guide: str = "") -> Iterator[str]:
+        """섹션별 초안을 토큰 단위로 스트리밍합니다."""
+        prompt = self._create_draft_prompt(question, context, section, style_guide)
+        yield from self._stream_chat(DRAFT_SYSTEM_MESSAGE, prompt)
+        logger.info(f"OpenAI 초안 스트리밍 완료: {section}")
+    
+    def stream_polish_text(self, text: str, tone: str = "공식적", style_guide: str = "") -> Iterator[str]:
+        """윤문 결과를 토큰 단위로 스트리밍합니다."""
+        prompt = self._create_polish_prompt(text, tone, style_guide)
+        yield from self._stream_chat(POLISH_SYSTEM_MESSAGE, prompt)
+        logger.info("OpenAI 윤문 스트리밍 완료")
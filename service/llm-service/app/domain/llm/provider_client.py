@@ -0,0 +1,294 @@
+"""
+LLM 제공자 비동기 HTTP 클라이언트
+- 제공자(openai / huggingface)별 keep-alive 커넥션 풀(httpx.AsyncClient)을 프로세스에서 공유
+- 제공자별 동시 호출 상한(asyncio.Semaphore), 초과 요청은 이벤트 루프를 막지 않고 대기
+- 요청 deadline(contextvar)을 넘지 않도록 시도별 timeout / 슬롯 대기 / 재시도 대기를 줄임
+- 429 / 5xx / 연결 오류는 지수 백오프 + full jitter 로 재시도 (Retry-After 헤더 우선)
+"""
+import asyncio
+import contextvars
+import logging
+import random
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
+
+import httpx
+
+from ...common.config import (
+    HF_ENDPOINT_TIMEOUT, HF_MAX_CONCURRENCY, LLM_MAX_RETRIES, LLM_POOL_KEEPALIVE_SECONDS,
+    LLM_POOL_MAX_CONNECTIONS, LLM_RETRY_BACKOFF_BASE, LLM_RETRY_BACKOFF_MAX,
+    OPENAI_MAX_CONCURRENCY, OPENAI_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+# 일시적 오류로 보고 재시도하는 상태 코드
+RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# 요청 단위 deadline (time.monotonic 기준 절대 시각, None 이면 제한 없음)
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("llm_request_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """요청 deadline 안에 제공자 응답을 받지 못함"""
+
+
+@contextmanager
+def request_deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    블록 안의 제공자 호출에 적용할 deadline 설정 (바깥 deadline 보다 늦춰지지 않음)
+
+    contextvar 이므로 같은 요청에서 만든 task / asyncio.to_thread 에도 전달됨
+    """
+    if not seconds or seconds <= 0:
+        yield _deadline.get()
+        return
+    deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """현재 요청 deadline 까지 남은 시간 (초, deadline 이 없으면 None)"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+class _LoopState:
+    """이벤트 루프에 묶이는 자원 (커넥션 풀 / 세마포어)"""
+
+    def __init__(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore):
+        self.client = client
+        self.semaphore = semaphore
+
+
+class ProviderClient:
+    """제공자 1곳에 대한 공용 비동기 클라이언트 (커넥션 풀 + 동시 호출 상한 + deadline + 재시도)"""
+
+    def __init__(self, name: str, max_concurrency: int, timeout: float,
+                 max_retries: int = LLM_MAX_RETRIES,
+                 backoff_base: float = LLM_RETRY_BACKOFF_BASE,
+                 backoff_max: float = LLM_RETRY_BACKOFF_MAX,
+                 max_connections: int = LLM_POOL_MAX_CONNECTIONS,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_connections = max(max_connections, self.max_concurrency)
+        self._transport = transport
+        # asyncio 자원은 생성한 루프에서만 쓸 수 있으므로 루프별로 보관 (서비스는 루프 1개)
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+        self.in_flight = 0
+        self.waiting = 0
+
+    def _state(self) -> _LoopState:
+        global _service_loop
+        loop = asyncio.get_running_loop()
+        if _service_loop is None or not _service_loop.is_running():
+            _service_loop = loop
+        state = self._states.get(loop)
+        if state is None:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=LLM_POOL_KEEPALIVE_SECONDS,
+                ),
+                transport=self._transport,
+            )
+            state = _LoopState(client, asyncio.Semaphore(self.max_concurrency))
+            self._states[loop] = state
+        return state
+
+    def _attempt_timeout(self, timeout: Optional[float]) -> float:
+        """시도 1회의 timeout (남은 deadline 으로 절삭, 이미 지났으면 DeadlineExceeded)"""
+        timeout = timeout or self.timeout
+        remaining = remaining_time()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise DeadlineExceeded(f"{self.name} 호출 전에 요청 deadline 초과")
+        return min(timeout, remaining)
+
+    def _backoff(self, attempt: int) -> float:
+        """full jitter: [0, min(max, base * 2^attempt)]"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        value = response.headers.get("retry-after")
+        try:
+            return max(0.0, float(value)) if value else None
+        except ValueError:
+            return None
+
+    @asynccontextmanager
+    async def _slot(self, state: _LoopState):
+        """동시 호출 슬롯 확보 (deadline 까지만 대기)"""
+        self.waiting += 1
+        try:
+            remaining = remaining_time()
+            if remaining is None:
+                await state.semaphore.acquire()
+            else:
+                try:
+                    await asyncio.wait_for(state.semaphore.acquire(), max(remaining, 0))
+                except asyncio.TimeoutError:
+                    raise DeadlineExceeded(
+                        f"{self.name} 동시 호출 슬롯 대기 중 요청 deadline 초과 (상한 {self.max_concurrency})"
+                    ) from None
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            state.semaphore.release()
+
+    async def request(self, method: str, url: str, *, retry: bool = True,
+                      timeout: Optional[float] = None, **kwargs: Any) -> httpx.Response:
+        """
+        제공자 HTTP 호출 (httpx.AsyncClient.request 인자 그대로 전달)
+
+        - 재시도 대상 상태 코드는 재시도를 모두 쓰면 마지막 응답을 그대로 반환 (상태 코드 해석은 호출자 몫)
+        - 연결 오류 / timeout 은 재시도를 모두 쓰면 예외 전달
+        - deadline 으로 절삭된 시도가 timeout 나거나 남은 시간이 없으면 DeadlineExceeded
+        """
+        state = self._state()
+        attempts = 1 + (self.max_retries if retry else 0)
+        for attempt in range(attempts):
+            attempt_timeout = timeout or self.timeout
+            clipped = False
+            response: Optional[httpx.Response] = None
+            try:
+                async with self._slot(state):
+                    # 슬롯 대기 후 남은 deadline 으로 시도 timeout 결정
+                    attempt_timeout = self._attempt_timeout(timeout)
+                    clipped = attempt_timeout < (timeout or self.timeout)
+                    # httpx timeout 은 읽기/쓰기 단위이므로 시도 전체 시간도 제한
+                    response = await asyncio.wait_for(
+                        state.client.request(method, url, timeout=attempt_timeout, **kwargs),
+                        attempt_timeout
+                    )
+            except DeadlineExceeded:
+                raise
+            except (httpx.TimeoutException, asyncio.TimeoutError) as e:
+                if clipped:
+                    raise DeadlineExceeded(f"{self.name} 응답 대기 중 요청 deadline 초과") from e
+                if attempt + 1 >= attempts:
+                    raise
+                reason, delay = f"timeout {attempt_timeout:.0f}s", self._backoff(attempt)
+            except httpx.TransportError as e:
+                if attempt + 1 >= attempts:
+                    raise
+                reason, delay = f"{type(e).__name__}: {e}", self._backoff(attempt)
+            else:
+                if response.status_code not in RETRYABLE_STATUS or attempt + 1 >= attempts:
+                    return response
+                retry_after = self._retry_after(response)
+                reason = f"HTTP {response.status_code}"
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+
+            remaining = remaining_time()
+            if remaining is not None and delay >= remaining:
+                # 대기 후 재시도할 시간이 남지 않으면 마지막 결과로 종료
+                logger.warning(f"⏱️ {self.name} 재시도 생략 ({reason}): deadline 까지 {max(remaining, 0):.1f}s")
+                if response is not None:
+                    return response
+                raise DeadlineExceeded(f"{self.name} 재시도 전에 요청 deadline 초과 ({reason})")
+
+            logger.warning(f"🔁 {self.name} 호출 재시도 {attempt + 1}/{self.max_retries} ({reason}), {delay:.2f}s 후")
+            await asyncio.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_retries": self.max_retries,
+            "timeout": self.timeout,
+        }
+
+    async def aclose(self) -> None:
+        """현재 루프의 커넥션 풀 종료"""
+        state = self._states.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            await state.client.aclose()
+
+
+_PROVIDER_SETTINGS = {
+    "openai": lambda: ProviderClient("openai", OPENAI_MAX_CONCURRENCY, OPENAI_TIMEOUT),
+    "huggingface": lambda: ProviderClient("huggingface", HF_MAX_CONCURRENCY, HF_ENDPOINT_TIMEOUT),
+}
+
+_clients: Dict[str, ProviderClient] = {}
+_clients_lock = threading.Lock()
+
+# 제공자 호출이 처음 일어난 (서비스) 이벤트 루프, 스레드에서의 호출을 위임할 대상
+_service_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_provider_client(provider: str) -> ProviderClient:
+    """프로세스 공용 제공자 클라이언트 (openai, huggingface)"""
+    client = _clients.get(provider)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(provider)
+            if client is None:
+                if provider not in _PROVIDER_SETTINGS:
+                    raise ValueError(f"지원하지 않는 LLM 제공자: {provider}")
+                client = _clients[provider] = _PROVIDER_SETTINGS[provider]()
+    return client
+
+
+def provider_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: client.stats() for name, client in _clients.items()}
+
+
+async def close_provider_clients() -> None:
+    """애플리케이션 종료 시 커넥션 풀 정리"""
+    for client in list(_clients.values()):
+        await client.aclose()
+
+
+def run_from_thread(func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+    """
+    동기 코드(SSE 이터레이터 등 스레드풀)에서 비동기 제공자 호출 실행
+
+    서비스 이벤트 루프가 돌고 있으면 그 루프에 위임하여 같은 커넥션 풀 / 동시 호출 상한을 사용
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("이벤트 루프 스레드에서는 await 로 호출해야 합니다")
+
+    loop = _service_loop
+    if loop is not None and loop.is_running():
+        return asyncio.run_coroutine_threadsafe(func(*args), loop).result()
+    # 이벤트 루프 밖(스크립트 등)에서 호출된 경우
+    return asyncio.run(func(*args))
@@ -1,38 +1,233 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Iterator, Tuple, Optional
+import asyncio
 import logging
-from ...common.schemas import SearchHit
+import threading
+import time
+from ...common.config import FAISS_INDEX_NAME, RAG_DRAFT_DEADLINE, RAG_DRAFT_SECTION_CONCURRENCY
+from ...common.schemas import DraftTimings, SearchHit, SectionTiming
+from ..llm.provider_client import remaining_time, request_deadline
+from .doc_store import extract_text, extract_metadata
+from .hybrid_retriever import HybridRetriever
+from .index_registry import CollectionHandle, get_index_registry
+from .query_embedder import get_query_embedder
 
 logger = logging.getLogger(__name__)
 
 class BaseRAGService(ABC):
     """RAG 서비스의 기본 추상 클래스"""
     
-    def __init__(self, service_name: str):
+    def __init__(self, service_name: str, collection_name: str = FAISS_INDEX_NAME):
         self.service_name = service_name
+        self.collection_name = collection_name
         self.is_loaded = False
+        self.handle: Optional[CollectionHandle] = None
+        # 동시 검색(asyncio.to_thread)에서 핸들 교체가 겹쳐 교체된 핸들이 반납되지 않는 것 방지
+        self._handle_lock = threading.Lock()
+        self.retriever = HybridRetriever(get_query_embedder())
         logger.info(f"{service_name} RAG 서비스 초기화")
     
-    @abstractmethod
     def load_index(self) -> bool:
-        """FAISS 인덱스와 문서 스토어를 로드합니다."""
-        pass
+        """공용 인덱스 레지스트리에서 컬렉션 핸들을 받습니다 (이미 로딩된 컬렉션은 공유)."""
+        try:
+            handle = get_index_registry().acquire(self.collection_name)
+        except Exception as e:
+            logger.error(f"인덱스 로딩 실패: {e}")
+            self.is_loaded = False
+            return False
+        
+        with self._handle_lock:
+            previous, self.handle = self.handle, handle
+        if previous is not None:
+            previous.release()
+        self.is_loaded = True
+        logger.info(f"{self.service_name} 인덱스 연결 완료: {self.collection_name} ({handle.index.ntotal}개 벡터)")
+        return True
     
-    @abstractmethod
-    def search(self, query: str, top_k: int = 5) -> Tuple[List[SearchHit], str]:
-        """쿼리로 검색을 수행합니다."""
-        pass
+    def _current_handle(self) -> CollectionHandle:
+        """재로딩으로 교체된 핸들이면 최신 컬렉션으로 갈아탑니다."""
+        handle = self.handle
+        if handle is None or not handle.stale:
+            return handle
+        with self._handle_lock:
+            handle = self.handle
+            if handle is not None and handle.stale:
+                fresh = get_index_registry().acquire_if_loaded(self.collection_name)
+                if fresh is not None:
+                    self.handle = fresh
+                    handle.release()
+                    handle = fresh
+        return handle
     
-    @abstractmethod
-    def generate_draft(self, question: str, sections: List[str], top_k: int = 8) -> str:
-        """초안을 생성합니다."""
-        pass
+    def search(self, query: str, top_k: int = 5,
+               filters: Optional[Dict[str, Any]] = None) -> Tuple[List[SearchHit], str]:
+        """하이브리드 검색(FAISS + BM25, RRF 병합)을 수행합니다."""
+        if not self.is_loaded or self.handle is None:
+            raise RuntimeError("RAG 서비스가 초기화되지 않음")
+        
+        try:
+            started = time.time()
+            collection = self._current_handle().collection
+            hits = []
+            context_parts = []
+            for fused in self.retriever.search([collection], query, top_k, filters=filters):
+                doc = collection.lookup(fused.doc_id)
+                if doc is None:
+                    continue
+                text = extract_text(doc)
+                meta = extract_metadata(doc)
+                hits.append(SearchHit(
+                    rank=len(hits) + 1,
+                    id=str(fused.doc_id),
+                    score=fused.score,
+                    text=text,
+                    meta=meta
+                ))
+                
+                # 컨텍스트 구성
+                context_part = f"[{len(hits)}] {text}"
+                if meta.get('source'):
+                    context_part += f" (출처: {meta['source']})"
+                context_parts.append(context_part)
+            
+            # 컨텍스트 연결
+            context = "\n\n---\n\n".join(context_parts)
+            
+            logger.info(
+                f"{self.service_name} 검색 완료: {len(hits)}개 결과, top_k={top_k}, "
+                f"{(time.time() - started) * 1000:.1f}ms"
+            )
+            return hits, context
+            
+        except Exception as e:
+            logger.error(f"검색 실패: {e}")
+            raise
+    
+    async def generate_draft(self, question: str, sections: List[str], top_k: int = 8) -> str:
+        """섹션별 초안을 생성합니다."""
+        draft, _ = await self.generate_draft_with_timings(question, sections, top_k)
+        return draft
+    
+    async def generate_draft_with_timings(self, question: str, sections: List[str],
+                                          top_k: int = 8) -> Tuple[str, DraftTimings]:
+        """
+        섹션별 초안을 병렬 생성하고 구간별 시간을 함께 반환합니다.
+        
+        - 검색 1회 후 섹션들을 동시에 생성 (요청당 RAG_DRAFT_SECTION_CONCURRENCY, 제공자별 상한은 provider_client)
+        - 결과는 요청한 섹션 순서로 조립, 섹션 단위 실패 / 시간 초과는 해당 섹션만 안내 문구로 대체
+        - 초안 전체 deadline (RAG_DRAFT_DEADLINE, 요청 deadline 보다 길어지지 않음)
+        """
+        if not self.is_loaded:
+            raise RuntimeError("RAG 서비스가 초기화되지 않음")
+        
+        started = time.perf_counter()
+        with request_deadline(RAG_DRAFT_DEADLINE):
+            try:
+                # 컨텍스트 검색 (임베딩 / FAISS 검색은 이벤트 루프 밖에서)
+                hits, context = await asyncio.to_thread(self.search, question, top_k)
+            except Exception as e:
+                logger.error(f"초안 생성 실패: {e}")
+                raise
+            search_done = time.perf_counter()
+            
+            limit = asyncio.Semaphore(max(1, RAG_DRAFT_SECTION_CONCURRENCY))
+            results = await asyncio.gather(*[
+                self._draft_section(question, context, section, limit, started) for section in sections
+            ])
+        finished = time.perf_counter()
+        
+        draft = "\n\n".join(f"## {section}\n\n{content}" for section, (content, _) in zip(sections, results))
+        section_timings = [timing for _, timing in results]
+        critical = max(section_timings, key=lambda t: t.started_ms + t.elapsed_ms, default=None)
+        timings = DraftTimings(
+            search_ms=round((search_done - started) * 1000, 1),
+            generation_ms=round((finished - search_done) * 1000, 1),
+            total_ms=round((finished - started) * 1000, 1),
+            critical_section=critical.section if critical else None,
+            sections=section_timings
+        )
+        logger.info(
+            f"⚡ {self.service_name} 초안 {len(sections)}개 섹션 병렬 생성: 검색 {timings.search_ms}ms, "
+            f"생성 {timings.generation_ms}ms (임계 경로: {timings.critical_section})"
+        )
+        return draft, timings
+    
+    async def _draft_section(self, question: str, context: str, section: str,
+                             limit: asyncio.Semaphore, request_started: float) -> Tuple[str, SectionTiming]:
+        """섹션 1개 생성 (실패 / 시간 초과는 예외 대신 안내 문구와 상태로 반환)"""
+        async with limit:
+            started = time.perf_counter()
+            status, error = "ok", None
+            try:
+                remaining = remaining_time()
+                if remaining is not None and remaining <= 0:
+                    raise asyncio.TimeoutError()
+                content = await asyncio.wait_for(
+                    self.llm_service.generate_draft_section(question=question, context=context, section=section),
+                    remaining
+                )
+                if self.llm_service.is_failure_notice(content):
+                    # Hugging Face 는 호출 실패를 "[연결 오류] ..." 같은 안내 문구로 반환
+                    status, error = "failed", content
+                    logger.error(f"섹션 {section} 초안 생성 실패: {content[:200]}")
+            except (asyncio.TimeoutError, TimeoutError) as e:
+                status, error = "timeout", str(e) or "deadline 초과"
+                logger.error(f"섹션 {section} 초안 생성 시간 초과: {error}")
+                content = "초안 생성 시간이 초과되었습니다."
+            except Exception as e:
+                # 섹션 단위 실패는 다른 섹션 생성에 영향을 주지 않음
+                logger.error(f"섹션 {section} 초안 생성 실패: {e}")
+                status, error = "failed", str(e)
+                content = "초안 생성에 실패했습니다."
+            finished = time.perf_counter()
+        
+        return content, SectionTiming(
+            section=section,
+            status=status,
+            started_ms=round((started - request_started) * 1000, 1),
+            elapsed_ms=round((finished - started) * 1000, 1),
+            error=error
+        )
     
     @abstractmethod
-    def polish_text(self, text: str, tone: str = "공식적", style_guide: str = "") -> str:
+    async def polish_text(self, text: str, tone: str = "공식적", style_guide: str = "") -> str:
         """텍스트를 윤문합니다."""
         pass
     
+    def stream_draft(self, question: str, sections: List[str], top_k: int = 8) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        섹션별 초안을 (event, data) 단위로 스트리밍합니다.
+        
+        - context: 검색 완료 (hits 수)
+        - section: 섹션 생성 시작
+        - delta: 생성된 텍스트 조각 (이어 붙이면 generate_draft 결과와 같은 형식)
+        """
+        if not self.is_loaded:
+            raise RuntimeError("RAG 서비스가 초기화되지 않음")
+        
+        hits, context = self.search(question, top_k)
+        yield "context", {"hits": len(hits)}
+        
+        for index, section in enumerate(sections):
+            yield "section", {"section": section}
+            separator = "\n\n" if index else ""
+            yield "delta", {"section": section, "text": f"{separator}## {section}\n\n"}
+            try:
+                for text in self.llm_service.stream_draft_section(
+                    question=question,
+                    context=context,
+                    section=section
+                ):
+                    yield "delta", {"section": section, "text": text}
+            except Exception as e:
+                # 섹션 단위 실패는 다른 섹션 생성에 영향을 주지 않음
+                logger.error(f"섹션 {section} 초안 스트리밍 실패: {e}")
+                yield "delta", {"section": section, "text": "초안 생성에 실패했습니다."}
+    
+    def stream_polish_text(self, text: str, tone: str = "공식적", style_guide: str = "") -> Iterator[str]:
+        """윤문 결과를 조각 단위로 스트리밍합니다."""
+        return self.llm_service.stream_polish_text(text, tone, style_guide)
+    
     def get_context_for_sections(self, question: str, top_k: int = 8) -> Tuple[List[SearchHit], str]:
         """섹션별 초안 생성을 위한 컨텍스트를 가져옵니다."""
         return self.search(question, top_k)
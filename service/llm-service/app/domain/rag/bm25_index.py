@@ -0,0 +1,239 @@
+"""
+BM25 역색인 (키워드 검색 경로)
+- 한국어는 형태소 분석기 없이 음절 bigram, 영문/숫자는 단어 단위로 토큰화
+- 로딩 시 한 번 구축한 CSR 형태 postings(term → doc id, tf) 를 index.faiss 옆에 저장하여 재사용
+- 질의 시에는 질의 토큰의 postings 만 순회하고 heap 으로 top-k 선택
+"""
+import heapq
+import io
+import json
+import logging
+import os
+import re
+import time
+import unicodedata
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ...common.config import BM25_K1, BM25_B, BM25_FILE_NAME
+from .doc_store import file_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# 토큰화 규칙이 바뀌면 올려서 저장된 인덱스를 재구축하게 함
+TOKENIZER_VERSION = "char-bigram-v1"
+
+_TOKEN_PATTERN = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+_HANGUL_PATTERN = re.compile(r"[가-힣]")
+_MAX_WORD_LENGTH = 32
+
+
+def tokenize(text: str) -> List[str]:
+    """한글 연속 구간은 음절 bigram(1음절이면 그대로), 그 외 단어는 소문자 단어 토큰"""
+    tokens = []
+    for match in _TOKEN_PATTERN.finditer(unicodedata.normalize("NFKC", text).lower()):
+        word = match.group()
+        if _HANGUL_PATTERN.match(word):
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word[:_MAX_WORD_LENGTH])
+    return tokens
+
+
+class BM25Index:
+    """CSR postings 기반 BM25 (doc id = FAISS 벡터 id)"""
+
+    def __init__(self, vocab: Dict[str, int], offsets: np.ndarray, doc_ids: np.ndarray,
+                 term_freqs: np.ndarray, doc_lengths: np.ndarray,
+                 k1: float = BM25_K1, b: float = BM25_B, source: Optional[Dict] = None):
+        self.vocab = vocab
+        self.offsets = offsets
+        self.doc_ids = doc_ids
+        self.term_freqs = term_freqs
+        self.doc_lengths = doc_lengths
+        self.k1 = k1
+        self.b = b
+        self.source = source or {}
+
+        num_docs = len(doc_lengths)
+        avg_length = float(doc_lengths.mean()) if num_docs else 0.0
+        doc_freqs = np.diff(offsets).astype("float32")
+        # 질의마다 다시 계산하지 않도록 idf 와 문서 길이 정규화 항을 미리 계산
+        self.idf = np.log1p((num_docs - doc_freqs + 0.5) / (doc_freqs + 0.5)).astype("float32")
+        self.length_norm = (
+            k1 * (1.0 - b + b * doc_lengths / avg_length) if avg_length else np.full(num_docs, k1)
+        ).astype("float32")
+
+    @property
+    def num_docs(self) -> int:
+        return len(self.doc_lengths)
+
+    def nbytes(self) -> int:
+        """postings 배열 + 사전 계산 항 + 어휘 사전(근사) 크기"""
+        arrays = (self.offsets, self.doc_ids, self.term_freqs, self.doc_lengths, self.idf, self.length_norm)
+        return sum(array.nbytes for array in arrays) + len(self.vocab) * 100
+
+    @classmethod
+    def build(cls, texts: Iterable[str], k1: float = BM25_K1, b: float = BM25_B,
+              source: Optional[Dict] = None) -> "BM25Index":
+        """문서 텍스트(벡터 id 순서)로 인덱스 구축"""
+        vocab: Dict[str, int] = {}
+        # (term, tf) 쌍을 문서 순서대로 누적한 뒤 term 기준으로 정렬해 CSR 로 변환
+        term_ids = array("I")
+        term_freqs = array("I")
+        unique_counts = array("I")
+        doc_lengths = array("I")
+
+        for text in texts:
+            counts = Counter(tokenize(text))
+            for term, tf in counts.items():
+                term_ids.append(vocab.setdefault(term, len(vocab)))
+                term_freqs.append(tf)
+            unique_counts.append(len(counts))
+            doc_lengths.append(sum(counts.values()))
+
+        term_ids = np.frombuffer(term_ids, dtype="uint32") if term_ids else np.zeros(0, "uint32")
+        order = np.argsort(term_ids, kind="stable")
+        doc_ids = np.repeat(
+            np.arange(len(unique_counts), dtype="int32"),
+            np.frombuffer(unique_counts, dtype="uint32") if unique_counts else np.zeros(0, "uint32")
+        )[order]
+        offsets = np.zeros(len(vocab) + 1, dtype="int64")
+        np.cumsum(np.bincount(term_ids, minlength=len(vocab)), out=offsets[1:])
+        tfs = (np.frombuffer(term_freqs, dtype="uint32") if term_freqs else np.zeros(0, "uint32"))[order]
+
+        return cls(
+            vocab=vocab,
+            offsets=offsets,
+            doc_ids=doc_ids,
+            term_freqs=np.minimum(tfs, np.iinfo("uint16").max).astype("uint16"),
+            doc_lengths=np.frombuffer(doc_lengths, dtype="uint32").astype("float32")
+            if doc_lengths else np.zeros(0, "float32"),
+            k1=k1,
+            b=b,
+            source=source
+        )
+
+    def search(self, query: str, top_k: int = 5,
+               allowed: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """
+        (doc id, BM25 점수) 를 점수 내림차순으로 최대 top_k 개 반환
+
+        allowed 는 문서별 bool 마스크 (메타데이터 사전 필터), 허용되지 않은 문서는 점수 계산에서 제외
+        """
+        query_terms = Counter(
+            self.vocab[token] for token in tokenize(query) if token in self.vocab
+        )
+        if not query_terms or top_k <= 0:
+            return []
+
+        scores = np.zeros(self.num_docs, dtype="float32")
+        k1_plus_1 = self.k1 + 1.0
+        for term_id, query_tf in query_terms.items():
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            docs = self.doc_ids[start:end]
+            tf = self.term_freqs[start:end].astype("float32")
+            if allowed is not None:
+                keep = allowed[docs]
+                docs, tf = docs[keep], tf[keep]
+            # term 당 postings 의 doc id 는 유일하므로 fancy index 누적이 안전
+            scores[docs] += query_tf * self.idf[term_id] * tf * k1_plus_1 / (tf + self.length_norm[docs])
+
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > top_k * 64:
+            # 흔한 토큰으로 후보가 많으면 부분 정렬로 먼저 top_k 만 남김
+            candidates = candidates[np.argpartition(scores[candidates], -top_k)[-top_k:]]
+        return heapq.nlargest(
+            top_k,
+            zip(candidates.tolist(), scores[candidates].tolist()),
+            key=lambda item: item[1]
+        )
+
+    def save(self, path: Path) -> None:
+        """npz 로 원자적 저장 (pickle 미사용)"""
+        meta = {
+            "tokenizer": TOKENIZER_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "source": self.source,
+        }
+        terms = sorted(self.vocab, key=self.vocab.get)
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            vocab=np.frombuffer("\n".join(terms).encode("utf-8"), dtype="uint8"),
+            offsets=self.offsets,
+            doc_ids=self.doc_ids,
+            term_freqs=self.term_freqs,
+            doc_lengths=self.doc_lengths,
+            meta=np.frombuffer(json.dumps(meta).encode("utf-8"), dtype="uint8"),
+        )
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(buffer.getvalue())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BM25Index":
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+            if meta.get("tokenizer") != TOKENIZER_VERSION:
+                raise ValueError(f"토크나이저 버전 불일치: {meta.get('tokenizer')}")
+            vocab_blob = data["vocab"].tobytes().decode("utf-8")
+            terms = vocab_blob.split("\n") if vocab_blob else []
+            return cls(
+                vocab={term: i for i, term in enumerate(terms)},
+                offsets=data["offsets"],
+                doc_ids=data["doc_ids"],
+                term_freqs=data["term_freqs"],
+                doc_lengths=data["doc_lengths"],
+                k1=meta["k1"],
+                b=meta["b"],
+                source=meta.get("source"),
+            )
+
+
+def load_or_build_bm25(index_dir: Path, store_file: Path,
+                       texts_factory: Callable[[], Iterable[str]]) -> Optional[BM25Index]:
+    """
+    index.faiss 옆의 BM25 파일을 로딩, 없거나 문서 저장소가 바뀌었으면 재구축 후 저장
+
+    texts_factory 는 재구축이 필요할 때만 호출 (벡터 id 순서의 문서 텍스트)
+    """
+    index_dir = Path(index_dir)
+    bm25_path = index_dir / BM25_FILE_NAME
+    fingerprint = file_fingerprint(store_file)
+
+    if bm25_path.exists():
+        try:
+            started = time.time()
+            bm25 = BM25Index.load(bm25_path)
+            if bm25.source == fingerprint and bm25.k1 == BM25_K1 and bm25.b == BM25_B:
+                logger.info(
+                    f"✅ BM25 인덱스 로딩: {bm25_path} ({bm25.num_docs}개 문서, "
+                    f"{len(bm25.vocab)}개 토큰, {time.time() - started:.2f}초)"
+                )
+                return bm25
+            logger.info(f"🔄 문서 저장소 변경 감지, BM25 인덱스 재구축: {bm25_path}")
+        except Exception as e:
+            logger.warning(f"⚠️ BM25 인덱스 로딩 실패, 재구축: {e}")
+
+    started = time.time()
+    bm25 = BM25Index.build(texts_factory(), source=fingerprint)
+    logger.info(
+        f"🔨 BM25 인덱스 구축 완료: {bm25.num_docs}개 문서, {len(bm25.vocab)}개 토큰, "
+        f"{time.time() - started:.1f}초"
+    )
+    try:
+        bm25.save(bm25_path)
+    except OSError as e:
+        # 읽기 전용 볼륨이면 메모리 인덱스만 사용
+        logger.warning(f"⚠️ BM25 인덱스 저장 실패 (메모리에서만 사용): {e}")
+    return bm25
@@ -0,0 +1,286 @@
+"""
+FAISS 문서 저장소 접근 유틸리티
+- LangChain save_local 형식 (InMemoryDocstore, index_to_docstore_id) 과 list / dict 저장소를 같은 방식으로 조회
+- 벡터 id 는 index.faiss 의 벡터 순번과 같음 (BM25 등 보조 인덱스도 같은 id 사용)
+- index.pkl 을 변환한 컬럼형 저장소(docstore/)가 있으면 pickle 대신 memory-map 으로 열어 사용
+  (offsets.npy + UTF-8 text.bin + 메타데이터 필드별 사전 인코딩 코드 배열)
+"""
+import json
+import logging
+import os
+import pickle
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from ...common.config import DOC_STORE_DIR_NAME, DOC_STORE_AUTO_CONVERT
+
+logger = logging.getLogger(__name__)
+
+COLUMNAR_FORMAT = "columnar-v1"
+_MISSING = -1
+
+
+class StoredDocument(NamedTuple):
+    """컬렉션 문서 1건 (LangChain Document 와 같은 page_content / metadata 속성)"""
+    page_content: str
+    metadata: Dict[str, Any]
+
+
+class ColumnarDocStore:
+    """
+    memory-map 컬럼형 문서 저장소 (행 번호 = 벡터 id)
+
+    파일은 읽기 전용으로 매핑하므로 uvicorn 워커들이 OS 페이지 캐시를 공유하고,
+    텍스트는 검색 결과로 선택된 행만 디코딩
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path / "manifest.json", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("format") != COLUMNAR_FORMAT:
+            raise ValueError(f"지원하지 않는 문서 저장소 형식: {self.manifest.get('format')}")
+
+        self.offsets = np.load(self.path / "offsets.npy", mmap_mode="r")
+        text_file = self.path / "text.bin"
+        self.text_blob = (
+            np.memmap(text_file, dtype=np.uint8, mode="r")
+            if text_file.stat().st_size else np.zeros(0, dtype=np.uint8)
+        )
+        self.columns: Dict[str, np.ndarray] = {}
+        self.column_values: Dict[str, List[Any]] = {}
+        for name, column in self.manifest["columns"].items():
+            self.columns[name] = np.load(self.path / column["file"], mmap_mode="r")
+            self.column_values[name] = column["values"]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def source(self) -> Dict[str, Any]:
+        return self.manifest.get("source") or {}
+
+    def text(self, idx: int) -> str:
+        return self.text_blob[self.offsets[idx]:self.offsets[idx + 1]].tobytes().decode("utf-8")
+
+    def metadata(self, idx: int) -> Dict[str, Any]:
+        meta = {}
+        for name, codes in self.columns.items():
+            code = codes[idx]
+            if code != _MISSING:
+                meta[name] = self.column_values[name][code]
+        return meta
+
+    def document(self, idx: int) -> Optional[StoredDocument]:
+        if not 0 <= idx < len(self):
+            return None
+        return StoredDocument(self.text(idx), self.metadata(idx))
+
+    def iter_texts(self) -> Iterator[str]:
+        for idx in range(len(self)):
+            yield self.text(idx)
+
+    def nbytes(self) -> int:
+        """매핑된 파일 크기 합 (상주 메모리가 아니라 페이지 캐시 대상 크기)"""
+        return sum(f.stat().st_size for f in self.path.iterdir() if f.is_file())
+
+
+def split_doc_store(store) -> Tuple[Any, Optional[Dict[int, str]]]:
+    """LangChain save_local 형식 (docstore, index_to_docstore_id) 분리"""
+    if isinstance(store, tuple) and len(store) == 2 and isinstance(store[1], dict):
+        return store[0], store[1]
+    return store, None
+
+
+def lookup_doc(doc_store, id_map: Optional[Dict[int, str]], idx: int):
+    """벡터 id → 문서 객체 (없으면 None)"""
+    if isinstance(doc_store, ColumnarDocStore):
+        return doc_store.document(idx)
+    if id_map is not None:
+        doc_id = id_map.get(idx)
+        if doc_id is None:
+            return None
+        if hasattr(doc_store, '_dict'):
+            return doc_store._dict.get(doc_id)
+        if isinstance(doc_store, dict):
+            return doc_store.get(doc_id)
+        return doc_store.search(doc_id)
+    if isinstance(doc_store, (list, tuple)):
+        return doc_store[idx] if 0 <= idx < len(doc_store) else None
+    if isinstance(doc_store, dict):
+        return doc_store.get(idx, doc_store.get(str(idx)))
+    if hasattr(doc_store, '_dict'):
+        return doc_store._dict.get(str(idx))
+    return None
+
+
+def doc_count(doc_store, id_map: Optional[Dict[int, str]]) -> int:
+    """벡터 id 범위 (0 ~ doc_count-1)"""
+    if isinstance(doc_store, ColumnarDocStore):
+        return len(doc_store)
+    if id_map is not None:
+        return max(id_map) + 1 if id_map else 0
+    if hasattr(doc_store, '_dict'):
+        return len(doc_store._dict)
+    return len(doc_store)
+
+
+def extract_text(doc) -> str:
+    """문서 객체(LangChain Document / dict / str)에서 텍스트 추출"""
+    if hasattr(doc, 'page_content'):
+        return doc.page_content
+    if isinstance(doc, dict):
+        for key in ('page_content', 'text', 'content'):
+            if key in doc:
+                return doc[key]
+    return str(doc)
+
+
+def extract_metadata(doc) -> Dict[str, Any]:
+    """문서 메타데이터 사본 (LangChain metadata / dict 의 metadata·meta)"""
+    if hasattr(doc, 'metadata'):
+        return dict(doc.metadata or {})
+    if isinstance(doc, dict):
+        return dict(doc.get('metadata') or doc.get('meta') or {})
+    return {}
+
+
+def iter_texts(doc_store, id_map: Optional[Dict[int, str]]) -> Iterator[str]:
+    """벡터 id 순서대로 문서 텍스트 (빠진 id 는 빈 문자열)"""
+    if isinstance(doc_store, ColumnarDocStore):
+        yield from doc_store.iter_texts()
+        return
+    for idx in range(doc_count(doc_store, id_map)):
+        doc = lookup_doc(doc_store, id_map, idx)
+        yield extract_text(doc) if doc is not None else ""
+
+
+def file_fingerprint(path: Path) -> Dict[str, int]:
+    """파일 변경 감지용 (크기, mtime)"""
+    stat = Path(path).stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _encode_value(value: Any) -> Any:
+    """manifest 에 저장 가능한 JSON 값으로 변환"""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def write_columnar_store(doc_store, id_map: Optional[Dict[int, str]], out_dir: Path,
+                         source: Optional[Dict[str, Any]] = None) -> Path:
+    """
+    pickle 문서 저장소 → 컬럼형 저장소 변환 (임시 디렉토리에 쓴 뒤 교체)
+
+    행은 벡터 id 순서로 기록하고, 문서가 없는 id 는 빈 텍스트/메타데이터 행으로 채움
+    """
+    out_dir = Path(out_dir)
+    tmp_dir = out_dir.with_name(f".{out_dir.name}.tmp")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+
+    num_docs = doc_count(doc_store, id_map)
+    offsets = np.zeros(num_docs + 1, dtype=np.int64)
+    codes: Dict[str, np.ndarray] = {}
+    dictionaries: Dict[str, Dict[str, int]] = {}
+    values: Dict[str, List[Any]] = {}
+
+    with open(tmp_dir / "text.bin", "wb") as text_file:
+        position = 0
+        for idx in range(num_docs):
+            doc = lookup_doc(doc_store, id_map, idx)
+            if doc is not None:
+                encoded = extract_text(doc).encode("utf-8")
+                text_file.write(encoded)
+                position += len(encoded)
+                for name, value in extract_metadata(doc).items():
+                    value = _encode_value(value)
+                    if name not in codes:
+                        codes[name] = np.full(num_docs, _MISSING, dtype=np.int32)
+                        dictionaries[name] = {}
+                        values[name] = []
+                    key = json.dumps(value, ensure_ascii=False)
+                    code = dictionaries[name].get(key)
+                    if code is None:
+                        code = dictionaries[name][key] = len(values[name])
+                        values[name].append(value)
+                    codes[name][idx] = code
+            offsets[idx + 1] = position
+
+    np.save(tmp_dir / "offsets.npy", offsets)
+    columns = {}
+    for i, (name, column) in enumerate(codes.items()):
+        # 필드 이름은 임의 문자열일 수 있으므로 파일명은 순번으로
+        file_name = f"meta.{i}.npy"
+        np.save(tmp_dir / file_name, column)
+        columns[name] = {"file": file_name, "values": values[name]}
+    with open(tmp_dir / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump({
+            "format": COLUMNAR_FORMAT,
+            "num_docs": num_docs,
+            "source": source or {},
+            "created_at": time.time(),
+            "columns": columns,
+        }, f, ensure_ascii=False)
+
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    os.replace(tmp_dir, out_dir)
+    return out_dir
+
+
+def has_doc_store(store_dir: Path) -> bool:
+    """index.pkl 또는 컬럼형 저장소가 있는지"""
+    store_dir = Path(store_dir)
+    return (store_dir / "index.pkl").exists() or (store_dir / DOC_STORE_DIR_NAME / "manifest.json").exists()
+
+
+def load_doc_store(store_dir: Path, label: str = "") -> Tuple[Any, Optional[Dict[int, str]], Optional[Path]]:
+    """
+    컬렉션 디렉토리의 문서 저장소 로딩 → (doc_store, id_map, 변경 감지 기준 파일)
+
+    1. docstore/ 컬럼형 저장소가 있고 index.pkl 과 일치(또는 pkl 없음)하면 memory-map 으로 사용
+    2. 아니면 index.pkl 을 pickle 로 로딩하고, DOC_STORE_AUTO_CONVERT 면 컬럼형으로 변환해 둠
+    """
+    store_dir = Path(store_dir)
+    pickle_file = store_dir / "index.pkl"
+    columnar_dir = store_dir / DOC_STORE_DIR_NAME
+    pickle_source = file_fingerprint(pickle_file) if pickle_file.exists() else None
+
+    if (columnar_dir / "manifest.json").exists():
+        try:
+            started = time.time()
+            store = ColumnarDocStore(columnar_dir)
+            if pickle_source is None or store.source == pickle_source:
+                logger.info(
+                    f"✅ {label} 컬럼형 문서 저장소 매핑: {len(store)}개 문서, "
+                    f"{store.nbytes() / 1024 / 1024:.1f}MB, {(time.time() - started) * 1000:.0f}ms"
+                )
+                return store, None, pickle_file if pickle_source else columnar_dir / "manifest.json"
+            logger.info(f"🔄 {label} index.pkl 변경 감지, 컬럼형 저장소 재생성 필요")
+        except Exception as e:
+            logger.warning(f"⚠️ {label} 컬럼형 문서 저장소 로딩 실패, index.pkl 사용: {e}")
+
+    if pickle_source is None:
+        logger.warning(f"⚠️ {label} 문서 저장소 파일이 존재하지 않음: {pickle_file}")
+        return None, None, None
+
+    started = time.time()
+    with open(pickle_file, "rb") as f:
+        doc_store, id_map = split_doc_store(pickle.load(f))
+    logger.info(f"✅ {label} 문서 저장소(pickle) 로딩 완료: {doc_count(doc_store, id_map)}개 문서, {time.time() - started:.1f}초")
+
+    if DOC_STORE_AUTO_CONVERT:
+        try:
+            write_columnar_store(doc_store, id_map, columnar_dir, source=pickle_source)
+            logger.info(f"💾 {label} 컬럼형 문서 저장소 생성: {columnar_dir}")
+            return ColumnarDocStore(columnar_dir), None, pickle_file
+        except Exception as e:
+            logger.warning(f"⚠️ {label} 컬럼형 문서 저장소 변환 실패 (pickle 저장소 사용): {e}")
+    return doc_store, id_map, pickle_file
@@ -0,0 +1,284 @@
+"""
+하이브리드 검색 (FAISS 벡터 + BM25 키워드, Reciprocal Rank Fusion)
+- 두 검색기를 병렬로 실행하고 순위 기반(RRF)으로 병합하므로 점수 척도가 달라도 그대로 합칠 수 있음
+- scripts/rag_embed_faiss.py 가 청크에 남긴 메타데이터(company, year, pillar ...)로 사전 필터링
+- 필터는 facet 값별 문서 id 비트맵의 AND/OR 로 계산하여 점수 계산 전에 적용 (검색 후 버리는 방식이 아님)
+- 쿼리 임베딩과 병합 결과는 검색 캐시(retrieval_cache)를 거침
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ...common.config import (
+    RAG_RRF_K, RAG_HYBRID_CANDIDATES, RAG_FILTER_EXACT_MAX, RAG_RETRIEVAL_WORKERS, RAG_HNSW_EF_SEARCH
+)
+from .bm25_index import BM25Index
+from .doc_store import ColumnarDocStore, doc_count, extract_metadata, lookup_doc
+from .retrieval_cache import RetrievalCache, get_retrieval_cache
+
+logger = logging.getLogger(__name__)
+
+# 필터로 사용할 수 있는 청크 메타데이터 필드
+FACET_FIELDS = ("company", "year", "pillar", "tcfd_section", "requirement_id", "page_from")
+
+FilterValue = Union[str, int, Sequence[Union[str, int]]]
+
+_retrieval_executor = ThreadPoolExecutor(max_workers=RAG_RETRIEVAL_WORKERS, thread_name_prefix="rag-retrieval")
+
+
+def _normalize_facet_value(value: Any) -> str:
+    return str(value).strip().lower()
+
+
+class FacetIndex:
+    """facet 필드 값 → 문서 id 비트맵 (np.packbits, little bit order = FAISS IDSelectorBitmap 형식)"""
+
+    def __init__(self, num_docs: int, bitmaps: Dict[str, Dict[str, np.ndarray]]):
+        self.num_docs = num_docs
+        self.bitmaps = bitmaps
+
+    @classmethod
+    def build(cls, metadatas: Iterable[Dict[str, Any]], num_docs: int) -> "FacetIndex":
+        postings: Dict[str, Dict[str, List[int]]] = {name: {} for name in FACET_FIELDS}
+        for idx, meta in enumerate(metadatas):
+            for name in FACET_FIELDS:
+                value = meta.get(name)
+                if value is None or value == "":
+                    continue
+                postings[name].setdefault(_normalize_facet_value(value), []).append(idx)
+
+        bitmaps: Dict[str, Dict[str, np.ndarray]] = {}
+        for name, values in postings.items():
+            bitmaps[name] = {}
+            for value, ids in values.items():
+                mask = np.zeros(num_docs, dtype=bool)
+                mask[ids] = True
+                bitmaps[name][value] = np.packbits(mask, bitorder="little")
+        return cls(num_docs, bitmaps)
+
+    @classmethod
+    def from_columns(cls, store: ColumnarDocStore) -> "FacetIndex":
+        """컬럼형 저장소의 사전 인코딩 코드 배열로 바로 구축 (문서 단위 순회 없음)"""
+        num_docs = len(store)
+        bitmaps: Dict[str, Dict[str, np.ndarray]] = {}
+        for name in FACET_FIELDS:
+            bitmaps[name] = {}
+            codes = store.columns.get(name)
+            if codes is None:
+                continue
+            codes = np.asarray(codes)
+            for code, value in enumerate(store.column_values[name]):
+                if value is None or value == "":
+                    continue
+                key = _normalize_facet_value(value)
+                mask = np.packbits(codes == code, bitorder="little")
+                # 2023 / "2023" 처럼 정규화 후 같은 값은 하나의 비트맵으로 합침
+                existing = bitmaps[name].get(key)
+                bitmaps[name][key] = mask if existing is None else np.bitwise_or(existing, mask)
+        return cls(num_docs, bitmaps)
+
+    def values(self, name: str) -> List[str]:
+        return sorted(self.bitmaps.get(name, {}))
+
+    def packed_mask(self, filters: Optional[Dict[str, FilterValue]]) -> Optional[np.ndarray]:
+        """
+        필터 → 허용 문서 비트맵 (필터가 없으면 None)
+
+        같은 필드의 여러 값은 OR, 필드 간에는 AND
+        """
+        if not filters:
+            return None
+
+        packed = None
+        for name, value in filters.items():
+            if name not in FACET_FIELDS:
+                raise ValueError(f"지원하지 않는 필터 필드: {name} (가능: {', '.join(FACET_FIELDS)})")
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+
+            field_mask = np.zeros((self.num_docs + 7) // 8, dtype=np.uint8)
+            for item in values:
+                bitmap = self.bitmaps[name].get(_normalize_facet_value(item))
+                if bitmap is not None:
+                    np.bitwise_or(field_mask, bitmap, out=field_mask)
+            packed = field_mask if packed is None else np.bitwise_and(packed, field_mask)
+        return packed
+
+    def unpack(self, packed: np.ndarray) -> np.ndarray:
+        return np.unpackbits(packed, count=self.num_docs, bitorder="little").astype(bool)
+
+
+class RetrievalCollection:
+    """검색 단위 컬렉션 (FAISS 인덱스 + 문서 저장소 + BM25 + facet 비트맵, 모두 같은 벡터 id 사용)"""
+
+    def __init__(self, name: str, index, doc_store, id_map: Optional[Dict[int, str]],
+                 bm25: Optional[BM25Index] = None, version: Optional[int] = None):
+        self.name = name
+        self.version = version
+        self.index = index
+        self.doc_store = doc_store
+        self.id_map = id_map
+        self.bm25 = bm25
+        if isinstance(doc_store, ColumnarDocStore):
+            self.facets = FacetIndex.from_columns(doc_store)
+        else:
+            num_docs = doc_count(doc_store, id_map)
+            self.facets = FacetIndex.build(
+                (extract_metadata(doc) if doc is not None else {}
+                 for doc in (lookup_doc(doc_store, id_map, idx) for idx in range(num_docs))),
+                num_docs
+            )
+
+    def lookup(self, idx: int):
+        return lookup_doc(self.doc_store, self.id_map, idx)
+
+    def dense_search(self, query_vector: np.ndarray, k: int,
+                     packed: Optional[np.ndarray] = None,
+                     allowed: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """벡터 검색 → (doc id, 코사인 유사도)"""
+        import faiss
+
+        if self.index is None or self.index.ntotal == 0:
+            return []
+
+        if allowed is not None:
+            allowed_ids = np.flatnonzero(allowed[:self.index.ntotal])
+            if len(allowed_ids) == 0:
+                return []
+            if len(allowed_ids) <= RAG_FILTER_EXACT_MAX:
+                # 필터 통과 문서가 적으면 해당 벡터만 꺼내 정확 계산 (정규화 벡터라 내적 = 코사인)
+                vectors = self.index.reconstruct_batch(allowed_ids)
+                sims = vectors @ query_vector[0]
+                top = np.argsort(-sims)[:k]
+                return [(int(allowed_ids[i]), float(sims[i])) for i in top]
+
+            selector = faiss.IDSelectorBitmap(len(packed), faiss.swig_ptr(packed))
+            if isinstance(self.index, faiss.IndexHNSW):
+                params = faiss.SearchParametersHNSW(sel=selector, efSearch=max(RAG_HNSW_EF_SEARCH, k))
+            else:
+                params = faiss.SearchParameters(sel=selector)
+            distances, ids = self.index.search(query_vector, min(k, len(allowed_ids)), params=params)
+        else:
+            distances, ids = self.index.search(query_vector, min(k, self.index.ntotal))
+
+        if self.index.metric_type == faiss.METRIC_INNER_PRODUCT:
+            similarities = distances[0]
+        else:
+            # 정규화 벡터의 제곱 L2 거리 → 코사인 유사도
+            similarities = 1.0 - distances[0] / 2.0
+        return [(int(idx), float(sim)) for idx, sim in zip(ids[0], similarities) if idx >= 0]
+
+    def lexical_search(self, query: str, k: int,
+                       allowed: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        if self.bm25 is None:
+            return []
+        return self.bm25.search(query, k, allowed=allowed)
+
+
+@dataclass
+class FusedHit:
+    """RRF 병합 결과 1건"""
+    collection: RetrievalCollection
+    doc_id: int
+    score: float
+    dense_score: Optional[float] = None
+    bm25_score: Optional[float] = None
+    ranks: Dict[str, int] = field(default_factory=dict)
+
+
+class HybridRetriever:
+    """여러 컬렉션에 대해 벡터/키워드 검색을 병렬 실행하고 RRF 로 병합"""
+
+    def __init__(self, query_embedder, rrf_k: int = RAG_RRF_K, candidates: int = RAG_HYBRID_CANDIDATES,
+                 cache: Optional[RetrievalCache] = None):
+        self.query_embedder = query_embedder
+        self.rrf_k = rrf_k
+        self.candidates = candidates
+        self.cache = cache or get_retrieval_cache()
+
+    def search(self, collections: Sequence[RetrievalCollection], query: str, top_k: int = 5,
+               filters: Optional[Dict[str, FilterValue]] = None, mode: str = "hybrid") -> List[FusedHit]:
+        """
+        mode: hybrid(벡터+키워드) / dense / lexical
+
+        쿼리 임베딩을 쓸 수 없으면 키워드 결과만으로 병합 (이 경우 결과를 캐시하지 않음)
+        """
+        cache_key = self.cache.result_key(collections, query, top_k, filters, mode)
+        cached = self.cache.get_results(cache_key)
+        if cached is not None:
+            by_name = {collection.name: collection for collection in collections}
+            return [
+                FusedHit(by_name[name], doc_id, score, dense_score, bm25_score, dict(ranks))
+                for name, doc_id, score, dense_score, bm25_score, ranks in cached
+            ]
+
+        depth = max(top_k * 4, self.candidates)
+        masks = {}
+        for collection in collections:
+            packed = collection.facets.packed_mask(filters)
+            masks[collection.name] = (packed, None if packed is None else collection.facets.unpack(packed))
+
+        # 키워드 검색은 스레드풀에서, 쿼리 임베딩 + 벡터 검색은 현재 스레드에서 동시에 진행
+        lexical_futures = {}
+        if mode in ("hybrid", "lexical"):
+            for collection in collections:
+                lexical_futures[collection.name] = _retrieval_executor.submit(
+                    collection.lexical_search, query, depth, masks[collection.name][1]
+                )
+
+        # 컬렉션별 결과를 검색기 단위로 하나의 순위 목록으로 합친 뒤 RRF (작은 컬렉션이 1위를 독점하지 않도록)
+        ranked_lists: Dict[str, List[Tuple[RetrievalCollection, int, float]]] = {}
+        if mode in ("hybrid", "dense"):
+            try:
+                query_vector = self.cache.embed(self.query_embedder, query)
+                ranked_lists["dense"] = self._merge(
+                    (collection, collection.dense_search(query_vector, depth, *masks[collection.name]))
+                    for collection in collections
+                )
+            except Exception as e:
+                if mode == "dense":
+                    raise
+                logger.warning(f"⚠️ 벡터 검색 실패, 키워드 검색 결과만 사용: {e}")
+
+        if lexical_futures:
+            ranked_lists["bm25"] = self._merge(
+                (collection, lexical_futures[collection.name].result())
+                for collection in collections
+            )
+
+        hits = self._fuse(ranked_lists, top_k)
+        if mode == "lexical" or "dense" in ranked_lists:
+            self.cache.put_results(cache_key, [
+                (hit.collection.name, hit.doc_id, hit.score, hit.dense_score, hit.bm25_score, dict(hit.ranks))
+                for hit in hits
+            ])
+        return hits
+
+    @staticmethod
+    def _merge(per_collection) -> List[Tuple[RetrievalCollection, int, float]]:
+        merged = [
+            (collection, doc_id, score)
+            for collection, results in per_collection
+            for doc_id, score in results
+        ]
+        merged.sort(key=lambda item: item[2], reverse=True)
+        return merged
+
+    def _fuse(self, ranked_lists, top_k: int) -> List[FusedHit]:
+        """Reciprocal Rank Fusion: score = Σ 1 / (k + rank)"""
+        fused: Dict[Tuple[str, int], FusedHit] = {}
+        for retriever, results in ranked_lists.items():
+            for rank, (collection, doc_id, score) in enumerate(results, start=1):
+                key = (collection.name, doc_id)
+                hit = fused.get(key)
+                if hit is None:
+                    hit = fused[key] = FusedHit(collection=collection, doc_id=doc_id, score=0.0)
+                hit.score += 1.0 / (self.rrf_k + rank)
+                hit.ranks[retriever] = rank
+                if retriever == "dense":
+                    hit.dense_score = score
+                else:
+                    hit.bm25_score = score
+        return sorted(fused.values(), key=lambda hit: hit.score, reverse=True)[:top_k]
@@ -0,0 +1,422 @@
+"""
+프로세스 공용 인덱스 레지스트리
+- 컬렉션(sr_corpus, standards ...)별 FAISS 인덱스 / 문서 저장소 / BM25 / facet 비트맵을 한 번만 로딩
+- RAGManager 의 OpenAI·Hugging Face RAG 서비스와 TCFDReportService 의 RAGService 가 같은 객체를 읽기 전용으로 공유
+- 핸들은 참조 카운트로 관리하여, 재로딩으로 교체된 이전 컬렉션은 마지막 핸들이 반납될 때 해제
+- 새 인덱스 버전은 백그라운드 스레드에서 로딩·검증한 뒤 참조만 교체 (RCU: 진행 중인 검색은 이전 버전으로 완료)
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ...common.config import (
+    FAISS_VOLUME_PATH, EMBED_DIM, RAG_ANN_MIN_VECTORS, RAG_HNSW_M, RAG_HNSW_EF_SEARCH
+)
+from .bm25_index import load_or_build_bm25
+from .doc_store import ColumnarDocStore, doc_count, extract_text, has_doc_store, load_doc_store, iter_texts
+from .hybrid_retriever import RetrievalCollection
+from .index_versions import IndexVersionStore
+from .retrieval_cache import get_retrieval_cache
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 로딩·검증·버전 정리 전용 (요청 처리 스레드와 이벤트 루프를 막지 않도록)
+_loader_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="index-loader")
+
+
+def _build_ann_index(index, name: str):
+    """대규모 Flat 인덱스를 HNSW 로 변환 (검색 비용을 코퍼스 크기에 대해 준선형으로)"""
+    import faiss
+
+    if not RAG_ANN_MIN_VECTORS or index.ntotal < RAG_ANN_MIN_VECTORS:
+        return index
+    if not isinstance(index, (faiss.IndexFlatL2, faiss.IndexFlatIP)):
+        return index
+
+    started = time.time()
+    hnsw = faiss.IndexHNSWFlat(index.d, RAG_HNSW_M, index.metric_type)
+    hnsw.hnsw.efSearch = RAG_HNSW_EF_SEARCH
+    # 같은 순서로 추가하므로 벡터 id(→ 문서 저장소 행)는 그대로 유지
+    hnsw.add(index.reconstruct_n(0, index.ntotal))
+    logger.info(f"⚡ {name} 인덱스 HNSW 변환 완료: {index.ntotal}개 벡터, {time.time() - started:.1f}초")
+    return hnsw
+
+
+def _faiss_nbytes(index) -> int:
+    """FAISS 인덱스 상주 메모리 추정 (벡터 저장소 + HNSW 링크)"""
+    import faiss
+
+    nbytes = index.ntotal * index.d * 4
+    if isinstance(index, faiss.IndexHNSW):
+        hnsw = index.hnsw
+        nbytes += (hnsw.neighbors.size() + hnsw.levels.size()) * 4 + hnsw.offsets.size() * 8
+    return nbytes
+
+
+def _process_rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+class CollectionEntry:
+    """로딩된 컬렉션 1개 (레지스트리 내부 상태)"""
+
+    def __init__(self, name: str, version: Optional[int], directory: Path, collection: RetrievalCollection,
+                 source_file: Optional[Path], load_seconds: float):
+        self.name = name
+        self.version = version
+        self.directory = directory
+        self.collection = collection
+        self.source_file = source_file
+        self.loaded_at = time.time()
+        self.load_seconds = load_seconds
+        self.refcount = 0
+        self.retired = False
+        self._doc_store_nbytes: Optional[int] = None
+
+    def memory(self) -> Dict[str, Any]:
+        """구성 요소별 메모리 (bytes). 컬럼형 문서 저장소는 페이지 캐시 공유 대상이라 mapped 로 분리"""
+        collection = self.collection
+        report: Dict[str, Any] = {
+            "faiss_index": _faiss_nbytes(collection.index),
+            "bm25": collection.bm25.nbytes() if collection.bm25 is not None else 0,
+            "facets": sum(
+                bitmap.nbytes for values in collection.facets.bitmaps.values() for bitmap in values.values()
+            ),
+        }
+        if isinstance(collection.doc_store, ColumnarDocStore):
+            report["doc_store"] = 0
+            report["doc_store_mapped"] = collection.doc_store.nbytes()
+        else:
+            if self._doc_store_nbytes is None:
+                # pickle 저장소는 텍스트 UTF-8 크기로 근사 (최초 1회 계산)
+                self._doc_store_nbytes = sum(
+                    len(text.encode("utf-8")) for text in iter_texts(collection.doc_store, collection.id_map)
+                )
+            report["doc_store"] = self._doc_store_nbytes
+        report["resident_total"] = report["faiss_index"] + report["bm25"] + report["facets"] + report["doc_store"]
+        return report
+
+
+class CollectionHandle:
+    """컬렉션 읽기 전용 핸들 (release 또는 with 블록 종료 시 반납)"""
+
+    def __init__(self, registry: "IndexRegistry", entry: CollectionEntry):
+        self._registry = registry
+        self._entry = entry
+        self._released = False
+
+    @property
+    def name(self) -> str:
+        return self._entry.name
+
+    @property
+    def collection(self) -> RetrievalCollection:
+        return self._entry.collection
+
+    @property
+    def index(self):
+        return self._entry.collection.index
+
+    @property
+    def version(self) -> Optional[int]:
+        return self._entry.version
+
+    @property
+    def stale(self) -> bool:
+        """재로딩으로 레지스트리의 현재 컬렉션이 바뀌었는지"""
+        return self._entry.retired
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._registry._release(self._entry)
+
+    def __enter__(self) -> "CollectionHandle":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class IndexRegistry:
+    """컬렉션 이름(= FAISS_VOLUME_PATH 아래 디렉토리명) → 공유 컬렉션 (versions.json 의 active 버전)"""
+
+    def __init__(self, volume_path: str = FAISS_VOLUME_PATH, embed_dim: int = EMBED_DIM):
+        self.volume_path = Path(volume_path)
+        self.embed_dim = embed_dim
+        self.versions = IndexVersionStore(volume_path)
+        self._entries: Dict[str, CollectionEntry] = {}
+        self._retired: List[CollectionEntry] = []
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    def collection_dir(self, name: str) -> Path:
+        return self.versions.active_dir(name)
+
+    def _load_lock(self, name: str) -> threading.Lock:
+        with self._lock:
+            return self._load_locks.setdefault(name, threading.Lock())
+
+    def _load(self, name: str, version: Optional[int] = None) -> CollectionEntry:
+        import faiss
+
+        if version is None:
+            version = self.versions.active_version(name)
+        directory = self.collection_dir(name) if version is None else self.versions.version_dir(name, version)
+        label = name if version is None else f"{name}@v{version}"
+        index_file = directory / "index.faiss"
+        if not index_file.exists() or not has_doc_store(directory):
+            raise FileNotFoundError(f"{label} 컬렉션 파일이 존재하지 않음: {directory}")
+
+        started = time.time()
+        index = faiss.read_index(str(index_file))
+        if self.embed_dim and index.d != self.embed_dim:
+            raise ValueError(f"{label} 임베딩 차원 불일치: 인덱스={index.d}, 설정={self.embed_dim}")
+        logger.info(f"✅ {label} FAISS 인덱스 로딩 완료: {index.ntotal}개 벡터")
+
+        doc_store, id_map, source_file = load_doc_store(directory, label)
+        if doc_store is None:
+            raise FileNotFoundError(f"{label} 문서 저장소를 열 수 없음: {directory}")
+        index = _build_ann_index(index, label)
+
+        try:
+            bm25 = load_or_build_bm25(directory, source_file, lambda: iter_texts(doc_store, id_map))
+        except Exception as e:
+            logger.error(f"❌ {label} BM25 인덱스 준비 실패 (벡터 검색만 사용): {e}")
+            bm25 = None
+
+        collection = RetrievalCollection(name, index, doc_store, id_map, bm25, version=version)
+        entry = CollectionEntry(name, version, directory, collection, source_file, time.time() - started)
+        logger.info(f"📚 {label} 컬렉션 등록 완료 ({entry.load_seconds:.1f}초)")
+        return entry
+
+    @staticmethod
+    def _validate(entry: CollectionEntry) -> None:
+        """교체 전 검증: 벡터/문서 수 일치, 저장된 벡터로 자기 자신이 검색되는지 (스모크 쿼리)"""
+        collection = entry.collection
+        index = collection.index
+        if index.ntotal == 0:
+            raise ValueError(f"{entry.name} 인덱스에 벡터가 없습니다")
+        num_docs = doc_count(collection.doc_store, collection.id_map)
+        if num_docs < index.ntotal:
+            raise ValueError(f"{entry.name} 문서 수({num_docs})가 벡터 수({index.ntotal})보다 적습니다")
+
+        for probe in {0, index.ntotal - 1}:
+            distances, ids = index.search(index.reconstruct(probe).reshape(1, -1), 1)
+            hit = int(ids[0][0])
+            if hit < 0 or collection.lookup(hit) is None:
+                raise ValueError(f"{entry.name} 스모크 쿼리 실패: 벡터 {probe} → 문서 {hit}")
+        if collection.bm25 is not None:
+            text = extract_text(collection.lookup(0))
+            if text.strip() and not collection.bm25.search(text[:200], 1):
+                raise ValueError(f"{entry.name} BM25 스모크 쿼리 결과 없음")
+
+    def acquire(self, name: str) -> CollectionHandle:
+        """컬렉션 핸들 획득 (처음이면 로딩, 이후에는 같은 객체 공유)"""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                entry.refcount += 1
+                return CollectionHandle(self, entry)
+
+        with self._load_lock(name):
+            with self._lock:
+                entry = self._entries.get(name)
+                if entry is not None:
+                    entry.refcount += 1
+                    return CollectionHandle(self, entry)
+            entry = self._load(name)
+            with self._lock:
+                self._entries[name] = entry
+                entry.refcount += 1
+        return CollectionHandle(self, entry)
+
+    def acquire_if_loaded(self, name: str) -> Optional[CollectionHandle]:
+        """이미 로딩된 경우에만 핸들 반환 (요청 경로에서 디스크 로딩을 유발하지 않음)"""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            entry.refcount += 1
+            return CollectionHandle(self, entry)
+
+    def _swap(self, name: str, entry: CollectionEntry) -> None:
+        """현재 컬렉션 참조 교체 (이전 컬렉션은 참조가 0 이 되면 해제, 검색 캐시 무효화)"""
+        with self._lock:
+            previous = self._entries.get(name)
+            entry.retired = False
+            self._entries[name] = entry
+            if previous is not None and previous is not entry:
+                previous.retired = True
+                if previous.refcount > 0:
+                    self._retired.append(previous)
+                else:
+                    self._dispose(previous)
+        get_retrieval_cache().invalidate_collection(name)
+
+    def reload(self, name: str) -> CollectionEntry:
+        """
+        디스크에서 다시 로딩하여 교체
+
+        진행 중인 검색은 기존 핸들로 끝까지 수행되고, 이전 컬렉션은 참조가 0 이 되면 해제
+        """
+        with self._load_lock(name):
+            entry = self._load(name)
+            self._swap(name, entry)
+        return entry
+
+    def reload_all(self) -> Dict[str, bool]:
+        results = {}
+        for name in self.loaded_names():
+            try:
+                self.reload(name)
+                results[name] = True
+            except Exception as e:
+                logger.error(f"❌ {name} 컬렉션 재로딩 실패 (기존 컬렉션 유지): {e}")
+                results[name] = False
+        return results
+
+    def activate(self, name: str, version: int) -> CollectionEntry:
+        """
+        버전 로딩 → 검증 → active 포인터 기록 → 참조 교체
+
+        검증에 실패하면 failed 로 기록하고 기존 컬렉션을 그대로 유지
+        """
+        with self._load_lock(name):
+            entry = self._take_retired(name, version)
+            if entry is None:
+                try:
+                    entry = self._load(name, version)
+                    self._validate(entry)
+                except Exception as e:
+                    logger.error(f"❌ {name}@v{version} 활성화 실패 (기존 버전 유지): {e}")
+                    self.versions.mark_failed(name, version, str(e))
+                    raise
+            else:
+                logger.info(f"♻️ {name}@v{version} 메모리에 남아 있는 컬렉션 재사용")
+
+            self.versions.activate(name, version, {
+                "vectors": entry.collection.index.ntotal,
+                "dim": entry.collection.index.d,
+                "load_seconds": round(entry.load_seconds, 2),
+            })
+            self._swap(name, entry)
+        logger.info(f"🔀 {name} 활성 버전 전환: v{version}")
+        _loader_executor.submit(self._gc, name)
+        return entry
+
+    def activate_async(self, name: str, version: int) -> Future:
+        """백그라운드 로딩 스레드에서 activate 실행"""
+        return _loader_executor.submit(self.activate, name, version)
+
+    def publish(self, name: str, files: Dict[str, Path]) -> Future:
+        """업로드 파일을 새 버전으로 기록하고 백그라운드에서 활성화 ({파일명: 경로})"""
+        version = self.versions.stage(name, files)
+        return self.activate_async(name, version)
+
+    def rollback(self, name: str) -> Future:
+        """직전 버전으로 active 포인터 전환 (이전 컬렉션이 아직 메모리에 있으면 그대로 재사용)"""
+        previous = self.versions.read_manifest(name)["previous"]
+        if previous is None:
+            raise ValueError(f"{name} 에 롤백할 이전 버전이 없습니다")
+        return self.activate_async(name, previous)
+
+    def _take_retired(self, name: str, version: int) -> Optional[CollectionEntry]:
+        with self._lock:
+            for entry in self._retired:
+                if entry.name == name and entry.version == version and entry.collection is not None:
+                    self._retired.remove(entry)
+                    return entry
+        return None
+
+    def loaded_names(self) -> List[str]:
+        with self._lock:
+            return list(self._entries)
+
+    def _release(self, entry: CollectionEntry) -> None:
+        with self._lock:
+            entry.refcount -= 1
+            if entry.retired and entry.refcount <= 0 and entry in self._retired:
+                self._retired.remove(entry)
+                self._dispose(entry)
+
+    def _dispose(self, entry: CollectionEntry) -> None:
+        logger.info(f"🗑️ 교체된 {entry.name} 컬렉션 해제 (v{entry.version}, 로딩 시각 {time.ctime(entry.loaded_at)})")
+        entry.collection = None
+        if entry.version is not None:
+            _loader_executor.submit(self._gc, entry.name)
+
+    def _gc(self, name: str) -> None:
+        """메모리에서 참조되지 않는 이전 버전 디렉토리 정리"""
+        with self._lock:
+            in_use = {
+                entry.version for entry in [*self._entries.values(), *self._retired]
+                if entry.name == name and entry.version is not None
+            }
+        try:
+            self.versions.gc(name, in_use)
+        except Exception as e:
+            logger.warning(f"⚠️ {name} 이전 버전 정리 실패: {e}")
+
+    def version_report(self, name: str) -> Dict[str, Any]:
+        """versions.json 내용과 메모리에 로딩된 버전"""
+        manifest = self.versions.read_manifest(name)
+        with self._lock:
+            entry = self._entries.get(name)
+            manifest["loaded"] = entry.version if entry is not None else None
+            manifest["retired_pending"] = [e.version for e in self._retired if e.name == name]
+        return manifest
+
+    def memory_report(self) -> Dict[str, Any]:
+        """컬렉션별 메모리 사용량과 참조 수"""
+        with self._lock:
+            entries = list(self._entries.values())
+            retired = len(self._retired)
+
+        collections = {}
+        for entry in entries:
+            if entry.collection is None:
+                continue
+            collections[entry.name] = {
+                "version": entry.version,
+                "directory": str(entry.directory),
+                "vectors": entry.collection.index.ntotal,
+                "index_type": type(entry.collection.index).__name__,
+                "doc_store_type": type(entry.collection.doc_store).__name__,
+                "refcount": entry.refcount,
+                "loaded_at": entry.loaded_at,
+                "load_seconds": round(entry.load_seconds, 2),
+                "memory_bytes": entry.memory(),
+            }
+        return {
+            "collections": collections,
+            "retired_pending": retired,
+            "resident_total_bytes": sum(c["memory_bytes"]["resident_total"] for c in collections.values()),
+            "process_rss_bytes": _process_rss_bytes(),
+            "pid": os.getpid(),
+        }
+
+
+_default_registry: Optional[IndexRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_index_registry() -> IndexRegistry:
+    """프로세스 공용 인덱스 레지스트리"""
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = IndexRegistry()
+    return _default_registry
@@ -0,0 +1,160 @@
+"""
+컬렉션 인덱스 버전 관리
+- 업로드된 인덱스는 {FAISS_VOLUME_PATH}/{name}/v{n}/ 에 새 버전으로 기록하고, 기존 버전 파일은 수정하지 않음
+- 어떤 버전을 서비스할지는 {name}/versions.json 의 active 포인터로 결정 (원자적 교체)
+- previous 포인터로 직전 버전을 보존하여 롤백은 포인터 전환만으로 수행
+- 버전 디렉토리가 없던 기존 배포({name}/index.faiss 직접 배치)는 버전 0 으로 취급
+"""
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+VERSIONS_FILE = "versions.json"
+LEGACY_VERSION = 0
+
+# 버전 상태
+STAGED = "staged"
+ACTIVE = "active"
+RETIRED = "retired"
+FAILED = "failed"
+
+
+class IndexVersionStore:
+    """컬렉션별 버전 디렉토리와 versions.json 포인터 관리"""
+
+    def __init__(self, volume_path: str):
+        self.volume_path = Path(volume_path)
+        self._lock = threading.Lock()
+
+    def collection_root(self, name: str) -> Path:
+        return self.volume_path / name
+
+    def version_dir(self, name: str, version: int) -> Path:
+        if version == LEGACY_VERSION:
+            return self.collection_root(name)
+        return self.collection_root(name) / f"v{version}"
+
+    def read_manifest(self, name: str) -> Dict[str, Any]:
+        """versions.json (없으면 기존 배포 = 버전 0 활성 상태로 간주)"""
+        manifest_file = self.collection_root(name) / VERSIONS_FILE
+        if manifest_file.exists():
+            with open(manifest_file, encoding="utf-8") as f:
+                return json.load(f)
+        versions = {}
+        if (self.collection_root(name) / "index.faiss").exists():
+            versions[str(LEGACY_VERSION)] = {"status": ACTIVE, "legacy": True}
+        return {
+            "active": LEGACY_VERSION if versions else None,
+            "previous": None,
+            "versions": versions,
+        }
+
+    def _write_manifest(self, name: str, manifest: Dict[str, Any]) -> None:
+        root = self.collection_root(name)
+        root.mkdir(parents=True, exist_ok=True)
+        temp_file = root / f".{VERSIONS_FILE}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, root / VERSIONS_FILE)
+
+    def active_version(self, name: str) -> Optional[int]:
+        return self.read_manifest(name)["active"]
+
+    def active_dir(self, name: str) -> Path:
+        """현재 서비스 중인 버전 디렉토리 (버전 정보가 없으면 컬렉션 디렉토리)"""
+        active = self.active_version(name)
+        return self.collection_root(name) if active is None else self.version_dir(name, active)
+
+    def stage(self, name: str, files: Dict[str, Path]) -> int:
+        """
+        새 버전 디렉토리 생성 ({파일명: 원본 경로}, 원본은 같은 볼륨에서 이동)
+
+        임시 디렉토리에 모은 뒤 rename 하므로 v{n}/ 은 완성된 상태로만 보임
+        """
+        with self._lock:
+            manifest = self.read_manifest(name)
+            version = max((int(v) for v in manifest["versions"]), default=LEGACY_VERSION) + 1
+            while self.version_dir(name, version).exists():
+                version += 1
+
+            temp_dir = self.collection_root(name) / f".v{version}.tmp"
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir)
+            temp_dir.mkdir(parents=True)
+            sizes = {}
+            for file_name, source in files.items():
+                destination = temp_dir / file_name
+                try:
+                    os.replace(source, destination)
+                except OSError:
+                    # 다른 파일시스템이면 복사
+                    shutil.copyfile(source, destination)
+                sizes[file_name] = destination.stat().st_size
+            os.replace(temp_dir, self.version_dir(name, version))
+
+            manifest["versions"][str(version)] = {
+                "status": STAGED,
+                "created_at": time.time(),
+                "files": sizes,
+            }
+            self._write_manifest(name, manifest)
+        logger.info(f"📦 {name} 인덱스 버전 v{version} 준비: {sizes}")
+        return version
+
+    def activate(self, name: str, version: int, info: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """active 포인터를 version 으로 전환하고 직전 버전을 previous 로 기록 (직전 버전 반환)"""
+        with self._lock:
+            manifest = self.read_manifest(name)
+            key = str(version)
+            if key not in manifest["versions"]:
+                raise KeyError(f"{name} 에 v{version} 버전이 없습니다")
+
+            previous = manifest["active"]
+            if previous is not None and previous != version:
+                manifest["versions"][str(previous)]["status"] = RETIRED
+                manifest["previous"] = previous
+            manifest["active"] = version
+            manifest["versions"][key].update(info or {})
+            manifest["versions"][key].update({"status": ACTIVE, "activated_at": time.time()})
+            manifest["versions"][key].pop("error", None)
+            self._write_manifest(name, manifest)
+        return previous
+
+    def mark_failed(self, name: str, version: int, error: str) -> None:
+        with self._lock:
+            manifest = self.read_manifest(name)
+            entry = manifest["versions"].get(str(version))
+            if entry is None or entry["status"] == ACTIVE:
+                return
+            entry.update({"status": FAILED, "error": error})
+            self._write_manifest(name, manifest)
+
+    def gc(self, name: str, in_use: Iterable[int]) -> List[int]:
+        """
+        active / previous / 사용 중(메모리에 남은) 버전을 제외한 retired·failed 버전 디렉토리 삭제
+
+        기존 배포(버전 0)의 파일은 삭제하지 않음
+        """
+        removed = []
+        with self._lock:
+            manifest = self.read_manifest(name)
+            keep = {manifest["active"], manifest["previous"], LEGACY_VERSION, *in_use}
+            for key, entry in list(manifest["versions"].items()):
+                version = int(key)
+                if version in keep or entry["status"] not in (RETIRED, FAILED):
+                    continue
+                shutil.rmtree(self.version_dir(name, version), ignore_errors=True)
+                del manifest["versions"][key]
+                removed.append(version)
+            if removed:
+                self._write_manifest(name, manifest)
+        if removed:
+            logger.info(f"🧹 {name} 이전 인덱스 버전 삭제: {', '.join(f'v{v}' for v in removed)}")
+        return removed
@@ -0,0 +1,98 @@
+"""
+검색 쿼리 임베딩
+- 인덱스 구축(scripts/rag_embed_faiss.py)과 같은 multilingual-e5 모델 사용
+- E5 계열 규칙에 따라 쿼리에 "query: " 접두어 부여, L2 정규화 벡터 반환
+- 로컬(sentence-transformers) 또는 Hugging Face feature-extraction API 백엔드
+"""
+import logging
+import threading
+from typing import Optional
+
+import numpy as np
+import requests
+
+from ...common.config import (
+    EMBED_MODEL_NAME, EMBED_BACKEND, EMBED_DEVICE, EMBED_QUERY_PREFIX,
+    HF_EMBED_API_URL, HF_API_TOKEN, HF_TIMEOUT
+)
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEmbedder:
+    """쿼리 문자열 → 정규화된 float32 벡터"""
+
+    def __init__(self, model_name: str = EMBED_MODEL_NAME, backend: str = EMBED_BACKEND,
+                 device: str = EMBED_DEVICE, query_prefix: str = EMBED_QUERY_PREFIX):
+        self.model_name = model_name
+        self.device = device
+        self.query_prefix = query_prefix
+        self.backend = self._resolve_backend(backend)
+        self._model = None
+        self._model_lock = threading.Lock()
+        logger.info(f"🔤 쿼리 임베딩 초기화: model={model_name}, backend={self.backend}")
+
+    @staticmethod
+    def _resolve_backend(backend: str) -> str:
+        if backend != "auto":
+            return backend
+        try:
+            import sentence_transformers  # noqa: F401
+            return "local"
+        except ImportError:
+            return "api"
+
+    def embed(self, query: str) -> np.ndarray:
+        """(1, dim) float32 정규화 벡터 반환 (FAISS search 입력 형태)"""
+        text = f"{self.query_prefix}{query}"
+        if self.backend == "local":
+            vector = self._embed_local(text)
+        else:
+            vector = self._embed_api(text)
+
+        vector = np.asarray(vector, dtype="float32").reshape(1, -1)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def _embed_local(self, text: str) -> np.ndarray:
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+                    logger.info(f"📥 임베딩 모델 로딩: {self.model_name} ({self.device})")
+                    self._model = SentenceTransformer(self.model_name, device=self.device)
+        return self._model.encode([text], normalize_embeddings=True)[0]
+
+    def _embed_api(self, text: str) -> np.ndarray:
+        if not HF_API_TOKEN:
+            raise RuntimeError("HF_API_TOKEN이 설정되지 않아 쿼리 임베딩 API를 호출할 수 없습니다")
+
+        response = requests.post(
+            HF_EMBED_API_URL,
+            headers={"Authorization": f"Bearer {HF_API_TOKEN}"},
+            json={"inputs": text, "options": {"wait_for_model": True}},
+            timeout=HF_TIMEOUT
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"쿼리 임베딩 API 호출 실패: {response.status_code} - {response.text[:200]}")
+
+        vector = np.asarray(response.json(), dtype="float32")
+        # 문장 임베딩 (dim,) / 배치 (1, dim) / 토큰 임베딩 (tokens, dim) 응답 모두 처리
+        while vector.ndim > 2:
+            vector = vector[0]
+        if vector.ndim == 2:
+            vector = vector.mean(axis=0)
+        return vector
+
+
+_default_embedder: Optional[QueryEmbedder] = None
+
+
+def get_query_embedder() -> QueryEmbedder:
+    """프로세스 공용 쿼리 임베더 (모델은 첫 검색 시 로딩)"""
+    global _default_embedder
+    if _default_embedder is None:
+        _default_embedder = QueryEmbedder()
+    return _default_embedder
@@ -1,9 +1,12 @@
+import asyncio
 import logging
-from typing import Dict, Optional, List, Tuple
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 from .base_rag_service import BaseRAGService
 from .openai_rag_service import OpenAIRAGService
 from .huggingface_rag_service import HuggingFaceRAGService
-from ...common.schemas import SearchHit
+from .index_registry import get_index_registry
+from .retrieval_cache import get_retrieval_cache
+from ...common.schemas import DraftTimings, SearchHit
 
 logger = logging.getLogger(__name__)
 
@@ -40,9 +43,16 @@ class RAGManager:
         
         return self.services[service_name]
     
-    def load_all_indices(self) -> Dict[str, bool]:
-        """모든 RAG 서비스의 인덱스를 로드합니다."""
+    def load_all_indices(self, reload: bool = False) -> Dict[str, bool]:
+        """
+        모든 RAG 서비스의 인덱스를 로드합니다.
+        
+        reload=True 면 공용 레지스트리의 컬렉션을 디스크에서 다시 읽은 뒤 새 핸들로 교체합니다 (파일 업로드 후).
+        """
         results = {}
+        if reload:
+            reload_results = get_index_registry().reload_all()
+            logger.info(f"🔄 인덱스 레지스트리 재로딩 결과: {reload_results}")
         
         for service_name, service in self.services.items():
             try:
@@ -55,20 +65,57 @@ class RAGManager:
         
         return results
     
+    async def activate_index(self, name: str, version: int) -> Dict[str, bool]:
+        """
+        인덱스 버전을 백그라운드에서 로딩·검증한 뒤 교체하고, 서비스별 로딩 결과를 반환합니다.
+        
+        이벤트 루프를 막지 않으며, 교체 전에 시작된 검색은 이전 버전으로 끝까지 처리됩니다.
+        검증 실패 시 예외를 그대로 전달하고 기존 버전을 유지합니다.
+        """
+        await asyncio.wrap_future(get_index_registry().activate_async(name, version))
+        return await asyncio.to_thread(self.load_all_indices)
+    
+    async def rollback_index(self, name: str) -> Dict[str, bool]:
+        """직전 인덱스 버전으로 되돌립니다 (active 포인터 전환)."""
+        await asyncio.wrap_future(get_index_registry().rollback(name))
+        return await asyncio.to_thread(self.load_all_indices)
+    
+    def get_index_versions(self, name: str) -> Dict[str, Any]:
+        """컬렉션의 버전 목록과 active / previous 포인터를 반환합니다."""
+        return get_index_registry().version_report(name)
+    
     def search(self, query: str, top_k: int = 5, service_name: str = None) -> Tuple[List[SearchHit], str]:
         """지정된 RAG 서비스로 검색을 수행합니다."""
         service = self.get_service(service_name)
         return service.search(query, top_k)
     
-    def generate_draft(self, question: str, sections: List[str], top_k: int = 8, service_name: str = None) -> str:
+    async def generate_draft(self, question: str, sections: List[str], top_k: int = 8, service_name: str = None) -> str:
         """지정된 RAG 서비스로 초안을 생성합니다."""
         service = self.get_service(service_name)
-        return service.generate_draft(question, sections, top_k)
+        return await service.generate_draft(question, sections, top_k)
+    
+    async def generate_draft_with_timings(self, question: str, sections: List[str], top_k: int = 8,
+                                          service_name: str = None) -> Tuple[str, DraftTimings]:
+        """지정된 RAG 서비스로 섹션별 초안을 병렬 생성하고 검색 / 섹션별 생성 시간을 함께 반환합니다."""
+        service = self.get_service(service_name)
+        return await service.generate_draft_with_timings(question, sections, top_k)
     
-    def polish_text(self, text: str, tone: str = "공식적", style_guide: str = "", service_name: str = None) -> str:
+    async def polish_text(self, text: str, tone: str = "공식적", style_guide: str = "", service_name: str = None) -> str:
         """지정된 RAG 서비스로 텍스트를 윤문합니다."""
         service = self.get_service(service_name)
-        return service.polish_text(text, tone, style_guide)
+        return await service.polish_text(text, tone, style_guide)
+    
+    def stream_draft(self, question: str, sections: List[str], top_k: int = 8,
+                     service_name: str = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """지정된 RAG 서비스로 초안을 스트리밍 생성합니다."""
+        service = self.get_service(service_name)
+        return service.stream_draft(question, sections, top_k)
+    
+    def stream_polish_text(self, text: str, tone: str = "공식적", style_guide: str = "",
+                           service_name: str = None) -> Iterator[str]:
+        """지정된 RAG 서비스로 텍스트를 스트리밍 윤문합니다."""
+        service = self.get_service(service_name)
+        return service.stream_polish_text(text, tone, style_guide)
     
     def get_service_status(self) -> Dict[str, Dict]:
         """모든 서비스의 상태를 반환합니다."""
@@ -83,6 +130,14 @@ class RAGManager:
         
         return status
     
+    def get_index_memory(self) -> Dict[str, Any]:
+        """공용 인덱스 레지스트리의 컬렉션별 메모리 사용량을 반환합니다."""
+        return get_index_registry().memory_report()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """쿼리 임베딩 / 검색 결과 캐시의 크기와 적중률을 반환합니다."""
+        return get_retrieval_cache().stats()
+    
     def get_available_services(self) -> List[str]:
         """사용 가능한 서비스 목록을 반환합니다."""
         return list(self.services.keys())
@@ -0,0 +1,185 @@
+"""
+검색 캐시 (2단계)
+- 1단계: 정규화 쿼리 → 쿼리 임베딩 벡터 (임베딩 모델 호출 생략)
+- 2단계: (컬렉션별 인덱스 버전, 정규화 쿼리, k, 모드, 필터) → RRF 병합 결과 (문서 id + 점수, 본문은 저장하지 않음)
+- 두 캐시 모두 바이트 상한 LRU 이며, 인덱스 레지스트리가 컬렉션을 교체하면 자동 무효화
+"""
+import json
+import logging
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ...common.config import RAG_EMBED_CACHE_BYTES, RAG_RESULT_CACHE_BYTES
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# 항목당 키/컨테이너 등 고정 비용 추정치 (bytes)
+_ENTRY_OVERHEAD = 200
+_HIT_BYTES = 120
+
+# 캐시된 검색 결과 1건: (컬렉션 이름, doc id, RRF 점수, dense 점수, BM25 점수, 검색기별 순위)
+CachedHit = Tuple[str, int, float, Optional[float], Optional[float], Dict[str, int]]
+
+
+def normalize_query(query: str) -> str:
+    """NFKC + 공백 정리 (대소문자는 임베딩 결과가 달라지므로 유지)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", query)).strip()
+
+
+class ByteBoundedLRU:
+    """바이트 상한 LRU (스레드 안전, 적중/미스/축출 카운터 포함)"""
+
+    def __init__(self, name: str, max_bytes: int):
+        self.name = name
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        nbytes += _ENTRY_OVERHEAD
+        if not self.enabled or nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._items[key] = (value, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._items.popitem(last=False)
+                self._bytes -= evicted_bytes
+                self.evictions += 1
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """조건에 맞는 항목 삭제 (predicate 가 없으면 전체)"""
+        with self._lock:
+            keys = list(self._items) if predicate is None else [key for key in self._items if predicate(key)]
+            for key in keys:
+                self._bytes -= self._items.pop(key)[1]
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._items),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+class RetrievalCache:
+    """쿼리 임베딩 캐시 + 검색 결과 캐시"""
+
+    def __init__(self, embed_max_bytes: int = RAG_EMBED_CACHE_BYTES,
+                 result_max_bytes: int = RAG_RESULT_CACHE_BYTES):
+        self.embeddings = ByteBoundedLRU("embedding", embed_max_bytes)
+        self.results = ByteBoundedLRU("result", result_max_bytes)
+        # 컬렉션별 무효화 세대 (무효화 이전에 시작된 검색이 뒤늦게 저장한 결과는 다시 조회되지 않음)
+        self._generations: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # 1단계: 쿼리 임베딩
+    # ------------------------------------------------------------------
+
+    def embed(self, embedder, query: str) -> np.ndarray:
+        """캐시된 쿼리 벡터 (없으면 embedder.embed 호출 후 저장, 호출자는 사본을 받음)"""
+        if not self.embeddings.enabled:
+            return embedder.embed(query)
+
+        key = (getattr(embedder, "model_name", type(embedder).__name__), normalize_query(query))
+        vector = self.embeddings.get(key)
+        if vector is None:
+            vector = embedder.embed(query)
+            self.embeddings.put(key, vector, vector.nbytes + len(key[1].encode("utf-8")))
+        return vector.copy()
+
+    # ------------------------------------------------------------------
+    # 2단계: 검색 결과
+    # ------------------------------------------------------------------
+
+    def result_key(self, collections: Sequence[Any], query: str, top_k: int,
+                   filters: Optional[Dict[str, Any]], mode: str) -> Tuple:
+        """인덱스 버전이 키에 포함되므로 교체된 컬렉션의 결과는 다시 조회되지 않음"""
+        versions = tuple(sorted(
+            (c.name, getattr(c, "version", None), self._generations.get(c.name, 0)) for c in collections
+        ))
+        filter_key = json.dumps(filters, sort_keys=True, ensure_ascii=False, default=str) if filters else ""
+        return versions, normalize_query(query), top_k, mode, filter_key
+
+    def get_results(self, key: Tuple) -> Optional[List[CachedHit]]:
+        if not self.results.enabled:
+            return None
+        return self.results.get(key)
+
+    def put_results(self, key: Tuple, hits: List[CachedHit]) -> None:
+        if not self.results.enabled:
+            return
+        nbytes = len(key[1].encode("utf-8")) + len(key[4]) + _HIT_BYTES * len(hits)
+        self.results.put(key, hits, nbytes)
+
+    # ------------------------------------------------------------------
+    # 무효화 / 지표
+    # ------------------------------------------------------------------
+
+    def invalidate_collection(self, name: str) -> None:
+        """인덱스 레지스트리가 컬렉션을 교체할 때 호출 (해당 컬렉션이 포함된 결과 + 쿼리 임베딩 전체)"""
+        self._generations[name] = self._generations.get(name, 0) + 1
+        removed = self.results.invalidate(lambda key: any(collection[0] == name for collection in key[0]))
+        # 새 버전이 다른 임베딩 모델/차원으로 만들어졌을 수 있으므로 쿼리 벡터도 비움
+        removed += self.embeddings.invalidate()
+        if removed:
+            logger.info(f"🧹 {name} 컬렉션 교체로 검색 캐시 {removed}건 무효화")
+
+    def clear(self) -> None:
+        self.embeddings.invalidate()
+        self.results.invalidate()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"embedding": self.embeddings.stats(), "result": self.results.stats()}
+
+
+_default_cache: Optional[RetrievalCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_retrieval_cache() -> RetrievalCache:
+    """프로세스 공용 검색 캐시"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = RetrievalCache()
+    return _default_cache
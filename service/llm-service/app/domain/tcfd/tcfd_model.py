@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 
 class TCFDInput(BaseModel):
@@ -65,6 +65,24 @@ class TCFDRecommendationResponse(BaseModel):
     generated_at: datetime
     llm_provider: str
 
+class TCFDRecommendationBatchRequest(BaseModel):
+    """TCFD 권고사항 일괄 문장 생성 요청 모델 (입력 데이터 조회 1회, 기둥별 RAG 검색 1회)"""
+    company_name: str
+    recommendation_types: Optional[List[str]] = None  # 생략 시 g1 ~ m3 전체 11개
+    user_inputs: Dict[str, str] = {}  # 권고사항별 사용자 입력 (없으면 저장된 TCFD 입력 데이터 사용)
+    llm_provider: str = "openai"  # openai, huggingface
+    context: Optional[str] = None  # 모든 권고사항에 공통으로 붙일 추가 컨텍스트
+
+class TCFDRecommendationBatchResponse(BaseModel):
+    """TCFD 권고사항 일괄 문장 생성 응답 모델 (results 는 요청 순서)"""
+    success: bool  # 모든 권고사항 생성 성공 여부
+    company_name: str
+    llm_provider: str
+    results: List[TCFDRecommendationResponse]
+    elapsed_ms: Dict[str, float] = {}  # 권고사항별 생성 소요 시간 (검색 대기 포함)
+    total_ms: float
+    generated_at: datetime
+
 class TCFDInputData(BaseModel):
     """TCFD 입력 데이터 모델 (데이터베이스용)"""
     id: Optional[int] = None
@@ -1,10 +1,16 @@
 import os
 import json
+import asyncio
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, Iterator, Optional, Tuple
 from ..llm.llm_service import LLMService
+from ..llm.provider_client import DeadlineExceeded
 from ..rag.rag_service import RAGService
-from .tcfd_model import TCFDInput, TCFDReportRequest, TCFDReportResponse, TCFDRecommendationRequest, TCFDRecommendationResponse, TCFDInputData
+from .tcfd_model import (
+    TCFDReportRequest, TCFDReportResponse, TCFDRecommendationRequest, TCFDRecommendationResponse,
+    TCFDRecommendationBatchRequest, TCFDRecommendationBatchResponse, TCFDInputData
+)
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
@@ -12,6 +18,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 권고사항 유형 → tcfd_inputs 컬럼 (기둥은 유형 첫 글자)
+RECOMMENDATION_FIELDS = {
+    "g1": "governance_g1", "g2": "governance_g2",
+    "s1": "strategy_s1", "s2": "strategy_s2", "s3": "strategy_s3",
+    "r1": "risk_management_r1", "r2": "risk_management_r2", "r3": "risk_management_r3",
+    "m1": "metrics_targets_m1", "m2": "metrics_targets_m2", "m3": "metrics_targets_m3",
+}
+RECOMMENDATION_TYPES = list(RECOMMENDATION_FIELDS)
+TCFD_PILLARS = {"g": "거버넌스", "s": "전략", "r": "위험관리", "m": "지표 및 목표"}
+
 class TCFDReportService:
     """TCFD 보고서 생성 서비스"""
     
@@ -75,23 +91,17 @@ class TCFDReportService:
             logger.error(f"❌ TCFD 입력 데이터 조회 실패: {e}")
             return None
 
-    def generate_tcfd_report(self, request: TCFDReportRequest) -> TCFDReportResponse:
+    async def generate_tcfd_report(self, request: TCFDReportRequest) -> TCFDReportResponse:
         """TCFD 보고서 생성"""
         try:
-            # TCFD 권고사항 데이터를 프롬프트에 통합
-            prompt = self._create_tcfd_prompt(request)
-            
-            # RAG를 통한 관련 정보 검색
-            rag_context = self._get_rag_context(request)
-            
-            # 최종 프롬프트 생성
-            final_prompt = self._create_final_prompt(prompt, rag_context, request)
+            # RAG 검색은 동기 호출이므로 이벤트 루프 밖에서 수행
+            final_prompt = await asyncio.to_thread(self._prepare_report_prompt, request)
             
             # LLM을 통한 보고서 생성
             if request.llm_provider == "openai":
-                report_content = self.llm_service.generate_with_openai(final_prompt, request.report_type)
+                report_content = await self.llm_service.generate_with_openai(final_prompt, request.report_type)
             else:
-                report_content = self.llm_service.generate_with_huggingface(final_prompt, request.report_type)
+                report_content = await self.llm_service.generate_with_huggingface(final_prompt, request.report_type)
             
             return TCFDReportResponse(
                 success=True,
@@ -100,7 +110,10 @@ class TCFDReportService:
                 llm_provider=request.llm_provider,
                 report_type=request.report_type
             )
-            
+        
+        except DeadlineExceeded:
+            # 요청 deadline 초과는 라우터에서 504 로 응답
+            raise
         except Exception as e:
             return TCFDReportResponse(
                 success=False,
@@ -110,30 +123,21 @@ class TCFDReportService:
                 report_type=request.report_type
             )
     
-    def generate_tcfd_recommendation(self, request: TCFDRecommendationRequest) -> TCFDRecommendationResponse:
+    async def generate_tcfd_recommendation(self, request: TCFDRecommendationRequest) -> TCFDRecommendationResponse:
         """특정 TCFD 권고사항에 대한 문장 생성 (데이터베이스 데이터 포함)"""
         try:
             logger.info(f"🚀 TCFD 권고사항 생성 시작: {request.company_name} - {request.recommendation_type}")
             
-            # 1. 데이터베이스에서 TCFD 입력 데이터 조회
-            tcfd_data = self.get_tcfd_input_data(request.company_name)
-            
-            # 2. RAG를 통한 관련 정보 검색
-            rag_context = self._get_recommendation_rag_context(request)
-            
-            # 3. 프롬프트 생성 (데이터베이스 데이터 포함)
-            base_prompt = self._create_recommendation_prompt(request, tcfd_data)
-            
-            # 4. 최종 프롬프트 생성 (RAG 컨텍스트 포함)
-            final_prompt = self._create_recommendation_final_prompt(base_prompt, rag_context, request)
+            # 1~4. DB 입력 데이터 + RAG 컨텍스트를 포함한 프롬프트 생성 (DB / RAG 는 이벤트 루프 밖에서)
+            final_prompt = await asyncio.to_thread(self._prepare_recommendation_prompt, request)
             
             logger.info(f"📝 프롬프트 생성 완료, LLM 호출 시작: {request.llm_provider}")
             
             # 5. LLM을 통한 문장 생성
             if request.llm_provider == "openai":
-                generated_text = self.llm_service.generate_with_openai(final_prompt, "recommendation")
+                generated_text = await self.llm_service.generate_with_openai(final_prompt, "recommendation")
             else:
-                generated_text = self.llm_service.generate_with_huggingface(final_prompt, "recommendation")
+                generated_text = await self.llm_service.generate_with_huggingface(final_prompt, "recommendation")
             
             logger.info(f"✅ TCFD 권고사항 생성 완료: {len(generated_text)}자")
             
@@ -144,7 +148,9 @@ class TCFDReportService:
                 generated_at=datetime.now(),
                 llm_provider=request.llm_provider
             )
-            
+        
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ TCFD 권고사항 생성 실패: {e}")
             return TCFDRecommendationResponse(
@@ -155,6 +161,186 @@ class TCFDReportService:
                 llm_provider=request.llm_provider
             )
     
+    def _prepare_report_prompt(self, request: TCFDReportRequest) -> str:
+        """보고서 생성 최종 프롬프트 (TCFD 입력 + RAG 컨텍스트)"""
+        # TCFD 권고사항 데이터를 프롬프트에 통합
+        prompt = self._create_tcfd_prompt(request)
+        
+        # RAG를 통한 관련 정보 검색
+        rag_context = self._get_rag_context(request)
+        
+        # 최종 프롬프트 생성
+        return self._create_final_prompt(prompt, rag_context, request)
+    
+    def _prepare_recommendation_prompt(self, request: TCFDRecommendationRequest) -> str:
+        """권고사항 문장 생성 최종 프롬프트 (DB 입력 데이터 + RAG 컨텍스트)"""
+        # 1. 데이터베이스에서 TCFD 입력 데이터 조회
+        tcfd_data = self.get_tcfd_input_data(request.company_name)
+        
+        # 2. RAG를 통한 관련 정보 검색
+        rag_context = self._get_recommendation_rag_context(request)
+        
+        # 3. 프롬프트 생성 (데이터베이스 데이터 포함)
+        base_prompt = self._create_recommendation_prompt(request, tcfd_data)
+        
+        # 4. 최종 프롬프트 생성 (RAG 컨텍스트 포함)
+        return self._create_recommendation_final_prompt(base_prompt, rag_context, request)
+    
+    def _stream_llm(self, llm_provider: str, prompt: str, report_type: str) -> Iterator[str]:
+        """LLM 제공자별 스트리밍 생성"""
+        if llm_provider == "openai":
+            return self.llm_service.stream_with_openai(prompt, report_type)
+        return self.llm_service.stream_with_huggingface(prompt, report_type)
+    
+    def stream_tcfd_report(self, request: TCFDReportRequest) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """TCFD 보고서를 (event, data) 단위로 스트리밍 생성 (delta → done)"""
+        yield "start", {"company_name": request.company_name, "llm_provider": request.llm_provider}
+        final_prompt = self._prepare_report_prompt(request)
+        
+        report_parts = []
+        for chunk in self._stream_llm(request.llm_provider, final_prompt, request.report_type):
+            report_parts.append(chunk)
+            yield "delta", {"text": chunk}
+        
+        yield "done", TCFDReportResponse(
+            success=True,
+            report_content="".join(report_parts),
+            generated_at=datetime.now(),
+            llm_provider=request.llm_provider,
+            report_type=request.report_type
+        ).model_dump(mode="json")
+    
+    def stream_tcfd_recommendation(self, request: TCFDRecommendationRequest) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """TCFD 권고사항 문장을 (event, data) 단위로 스트리밍 생성 (delta → done)"""
+        logger.info(f"🚀 TCFD 권고사항 스트리밍 생성 시작: {request.company_name} - {request.recommendation_type}")
+        yield "start", {"recommendation_type": request.recommendation_type, "llm_provider": request.llm_provider}
+        final_prompt = self._prepare_recommendation_prompt(request)
+        
+        generated_parts = []
+        for chunk in self._stream_llm(request.llm_provider, final_prompt, "recommendation"):
+            generated_parts.append(chunk)
+            yield "delta", {"text": chunk}
+        
+        generated_text = "".join(generated_parts)
+        logger.info(f"✅ TCFD 권고사항 스트리밍 생성 완료: {len(generated_text)}자")
+        yield "done", TCFDRecommendationResponse(
+            success=True,
+            recommendation_type=request.recommendation_type,
+            generated_text=generated_text,
+            generated_at=datetime.now(),
+            llm_provider=request.llm_provider
+        ).model_dump(mode="json")
+    
+    async def generate_tcfd_recommendations_batch(self, request: TCFDRecommendationBatchRequest) -> TCFDRecommendationBatchResponse:
+        """권고사항 여러 개를 한 번에 생성 (결과는 요청 순서)"""
+        async for event, payload in self._recommendation_batch_events(request):
+            if event == "done":
+                return payload
+        raise RuntimeError("일괄 생성 결과가 없습니다")
+    
+    async def stream_tcfd_recommendations_batch(self, request: TCFDRecommendationBatchRequest) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """권고사항 일괄 생성을 (event, data) 단위로 스트리밍 (start → 완료 순 result → done)"""
+        async for event, payload in self._recommendation_batch_events(request):
+            yield event, payload.model_dump(mode="json") if hasattr(payload, "model_dump") else payload
+    
+    async def _recommendation_batch_events(self, request: TCFDRecommendationBatchRequest):
+        """
+        권고사항 일괄 생성
+        
+        1. tcfd_inputs 조회 1회 (권고사항별 재조회 없음)
+        2. 기둥(G/S/R/M)별 RAG 검색 1회씩 병렬 수행, 같은 기둥 권고사항이 컨텍스트 공유
+        3. 각 권고사항은 자기 기둥 검색이 끝나는 즉시 생성 시작 (제공자별 동시 호출 상한 적용)
+        4. 완료되는 순서대로 result 이벤트, 마지막에 요청 순서로 모은 done
+        """
+        started = time.perf_counter()
+        types = request.recommendation_types or RECOMMENDATION_TYPES
+        logger.info(f"🚀 TCFD 권고사항 일괄 생성 시작: {request.company_name} - {', '.join(types)}")
+        yield "start", {"company_name": request.company_name, "llm_provider": request.llm_provider, "recommendation_types": types}
+        
+        tcfd_data = await asyncio.to_thread(self.get_tcfd_input_data, request.company_name)
+        pillar_contexts = {
+            pillar: asyncio.ensure_future(asyncio.to_thread(
+                self._get_pillar_rag_context, request.company_name, request.llm_provider, pillar
+            ))
+            for pillar in dict.fromkeys(t[0] for t in types)
+        }
+        
+        elapsed_ms: Dict[str, float] = {}
+        
+        async def generate(recommendation_type: str) -> TCFDRecommendationResponse:
+            item_started = time.perf_counter()
+            try:
+                item_request = TCFDRecommendationRequest(
+                    company_name=request.company_name,
+                    recommendation_type=recommendation_type,
+                    user_input=self._batch_user_input(request, tcfd_data, recommendation_type),
+                    llm_provider=request.llm_provider,
+                    context=request.context
+                )
+                rag_context = await pillar_contexts[recommendation_type[0]]
+                final_prompt = self._create_recommendation_final_prompt(
+                    self._create_recommendation_prompt(item_request, tcfd_data), rag_context, item_request
+                )
+                if request.llm_provider == "openai":
+                    generated_text = await self.llm_service.generate_with_openai(final_prompt, "recommendation")
+                else:
+                    generated_text = await self.llm_service.generate_with_huggingface(final_prompt, "recommendation")
+                return TCFDRecommendationResponse(
+                    success=True,
+                    recommendation_type=recommendation_type,
+                    generated_text=generated_text,
+                    generated_at=datetime.now(),
+                    llm_provider=request.llm_provider
+                )
+            except Exception as e:
+                # 권고사항 단위 실패(deadline 초과 포함)는 다른 권고사항 생성에 영향을 주지 않음
+                logger.error(f"❌ TCFD 권고사항 {recommendation_type} 생성 실패: {e}")
+                return TCFDRecommendationResponse(
+                    success=False,
+                    recommendation_type=recommendation_type,
+                    error_message=str(e) or type(e).__name__,
+                    generated_at=datetime.now(),
+                    llm_provider=request.llm_provider
+                )
+            finally:
+                elapsed_ms[recommendation_type] = round((time.perf_counter() - item_started) * 1000, 1)
+        
+        tasks = [asyncio.ensure_future(generate(t)) for t in types]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                result = await completed
+                yield "result", result
+            
+            results = [task.result() for task in tasks]
+            total_ms = round((time.perf_counter() - started) * 1000, 1)
+            logger.info(
+                f"✅ TCFD 권고사항 일괄 생성 완료: {sum(r.success for r in results)}/{len(results)}개 성공, {total_ms}ms"
+            )
+            yield "done", TCFDRecommendationBatchResponse(
+                success=all(r.success for r in results),
+                company_name=request.company_name,
+                llm_provider=request.llm_provider,
+                results=results,
+                elapsed_ms=elapsed_ms,
+                total_ms=total_ms,
+                generated_at=datetime.now()
+            )
+        finally:
+            # 클라이언트가 스트림을 끊으면 남은 생성 / 검색 취소
+            for future in [*tasks, *pillar_contexts.values()]:
+                future.cancel()
+    
+    @staticmethod
+    def _batch_user_input(request: TCFDRecommendationBatchRequest, tcfd_data: Optional[TCFDInputData],
+                          recommendation_type: str) -> str:
+        """요청에 입력이 없으면 저장된 tcfd_inputs 의 해당 권고사항 값 사용"""
+        user_input = request.user_inputs.get(recommendation_type)
+        if user_input:
+            return user_input
+        if tcfd_data:
+            return getattr(tcfd_data, RECOMMENDATION_FIELDS[recommendation_type]) or ""
+        return ""
+    
     def _create_tcfd_prompt(self, request: TCFDReportRequest) -> str:
         """TCFD 보고서 생성을 위한 프롬프트 생성"""
         tcfd_data = request.tcfd_inputs
@@ -295,7 +481,7 @@ class TCFDReportService:
                 search_results = self.rag_service.search_huggingface(query, top_k=5)
             
             # 검색 결과를 컨텍스트로 변환
-            context = "\n\n".join([result.content for result in search_results])
+            context = "\n\n".join([result["content"] for result in search_results])
             return context
             
         except Exception as e:
@@ -304,18 +490,31 @@ class TCFDReportService:
     
     def _get_recommendation_rag_context(self, request: TCFDRecommendationRequest) -> str:
         """특정 TCFD 권고사항에 대한 RAG 컨텍스트 검색"""
+        return self._search_company_context(
+            f"TCFD {request.recommendation_type} 기후변화", request.company_name, request.llm_provider, top_k=3
+        )
+    
+    def _get_pillar_rag_context(self, company_name: str, llm_provider: str, pillar: str) -> str:
+        """TCFD 기둥(G/S/R/M)별 RAG 컨텍스트 검색 (일괄 생성에서 같은 기둥 권고사항이 공유)"""
+        return self._search_company_context(
+            f"TCFD {TCFD_PILLARS.get(pillar, pillar)} 기후변화", company_name, llm_provider, top_k=5
+        )
+    
+    def _search_company_context(self, query: str, company_name: str, llm_provider: str, top_k: int) -> str:
+        """회사 보고서 청크 우선 검색 (회사는 쿼리 문자열이 아니라 메타데이터 필터로 한정)"""
         try:
-            # 권고사항별 검색 쿼리
-            query = f"TCFD {request.recommendation_type} {request.company_name} 기후변화"
+            search = (
+                self.rag_service.search_openai if llm_provider == "openai"
+                else self.rag_service.search_huggingface
+            )
             
-            # RAG 서비스를 통한 관련 정보 검색
-            if request.llm_provider == "openai":
-                search_results = self.rag_service.search_openai(query, top_k=3)
-            else:
-                search_results = self.rag_service.search_huggingface(query, top_k=3)
+            # 해당 회사 보고서 청크가 없으면 전체 코퍼스에서 검색
+            search_results = search(query, top_k=top_k, filters={"company": company_name})
+            if not search_results:
+                search_results = search(f"{query} {company_name}", top_k=top_k)
             
             # 검색 결과를 컨텍스트로 변환
-            context = "\n\n".join([result.content for result in search_results])
+            context = "\n\n".join([result["content"] for result in search_results])
             return context
             
         except Exception as e:
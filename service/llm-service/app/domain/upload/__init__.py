@@ -0,0 +1,12 @@
+"""
+업로드 도메인
+
+대용량 FAISS 인덱스 / 문서 스토어 파일을 청크 단위로 이어받아 디스크에 저장하는 기능을 제공합니다.
+"""
+
+from .chunked_upload import ChunkedUploadManager, UploadError
+
+__all__ = [
+    "ChunkedUploadManager",
+    "UploadError"
+]
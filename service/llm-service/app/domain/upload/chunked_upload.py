@@ -0,0 +1,272 @@
+"""
+청크 단위 재개 가능 업로드 (init → PUT chunk(offset, sha256) → commit)
+- 청크 본문은 스트림으로 받아 바로 디스크에 기록 (메모리 사용량 = 읽기 버퍼 크기)
+- 업로드 상태는 세션 디렉토리의 manifest.json 에 저장되어 프로세스 재시작 후에도 이어받기 가능
+- commit 시 전체 크기 / SHA-256 검증 후 대상 컬렉션의 새 버전 디렉토리(v{n}/)로 이동 (기존 버전 파일은 그대로 유지)
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional
+
+from ..rag.index_versions import IndexVersionStore
+
+logger = logging.getLogger(__name__)
+
+# 업로드 파일 종류 → 인덱스 디렉토리 내 파일명 (RAGService 로딩 경로와 동일)
+UPLOAD_FILE_NAMES = {
+    "index": "index.faiss",
+    "store": "index.pkl",
+}
+
+# 업로드 가능한 인덱스 디렉토리
+UPLOAD_TARGETS = ("sr_corpus", "standards")
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # 클라이언트 권장 청크 크기
+READ_BUFFER_SIZE = 1024 * 1024        # 체크섬 계산 시 읽기 단위
+SESSION_TTL_SECONDS = 24 * 60 * 60    # 방치된 업로드 세션 정리 기준
+
+_UPLOAD_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+class UploadError(Exception):
+    """업로드 프로토콜 오류 (status_code 는 HTTP 응답 코드로 그대로 사용)"""
+
+    def __init__(self, status_code: int, message: str, **extra: Any):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+        self.extra = extra
+
+
+class ChunkedUploadManager:
+    """업로드 세션 관리 (세션당 index / store 두 파일)"""
+
+    def __init__(self, volume_path: str, max_file_size: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 version_store: Optional[IndexVersionStore] = None):
+        self.volume_path = Path(volume_path)
+        self.version_store = version_store or IndexVersionStore(volume_path)
+        self.sessions_path = self.volume_path / ".uploads"
+        self.max_file_size = max_file_size
+        self.chunk_size = chunk_size
+        # 같은 세션에 대한 청크 기록 / commit 직렬화
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    # ------------------------------------------------------------------
+    # 세션
+    # ------------------------------------------------------------------
+
+    def init(self, target: str, files: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """업로드 세션 생성 (files: {"index": {"size": int, "sha256": str}, "store": {...}})"""
+        if target not in UPLOAD_TARGETS:
+            raise UploadError(400, f"지원하지 않는 업로드 대상입니다: {target} (가능: {', '.join(UPLOAD_TARGETS)})")
+        if set(files) != set(UPLOAD_FILE_NAMES):
+            raise UploadError(400, f"index, store 파일 정보가 모두 필요합니다: {sorted(files)}")
+
+        manifest_files = {}
+        for name, info in files.items():
+            size = int(info.get("size", -1))
+            if size < 0 or size > self.max_file_size:
+                raise UploadError(400, f"{name} 파일 크기가 허용 범위를 벗어났습니다: {size} bytes (최대 {self.max_file_size})")
+            sha256 = (info.get("sha256") or "").lower() or None
+            manifest_files[name] = {"size": size, "sha256": sha256, "received": 0}
+
+        self.cleanup_stale_sessions()
+
+        upload_id = uuid.uuid4().hex
+        session_path = self.sessions_path / upload_id
+        session_path.mkdir(parents=True, exist_ok=False)
+        for name in manifest_files:
+            (session_path / f"{name}.part").touch()
+
+        manifest = {
+            "upload_id": upload_id,
+            "target": target,
+            "files": manifest_files,
+            "created_at": time.time(),
+            "updated_at": time.time(),
+        }
+        self._write_manifest(upload_id, manifest)
+        logger.info(f"📦 청크 업로드 시작: {upload_id} ({target}) {manifest_files}")
+        return self._status(manifest)
+
+    def status(self, upload_id: str) -> Dict[str, Any]:
+        """이어받기용 현재 수신 offset 조회"""
+        return self._status(self._read_manifest(upload_id))
+
+    def abort(self, upload_id: str) -> None:
+        self._read_manifest(upload_id)
+        shutil.rmtree(self.sessions_path / upload_id, ignore_errors=True)
+        self._locks.pop(upload_id, None)
+        logger.info(f"🗑️ 청크 업로드 취소: {upload_id}")
+
+    def cleanup_stale_sessions(self) -> int:
+        """SESSION_TTL_SECONDS 동안 갱신되지 않은 세션 삭제"""
+        if not self.sessions_path.exists():
+            return 0
+        removed = 0
+        now = time.time()
+        for session_path in self.sessions_path.iterdir():
+            manifest_path = session_path / "manifest.json"
+            try:
+                updated_at = manifest_path.stat().st_mtime if manifest_path.exists() else session_path.stat().st_mtime
+            except OSError:
+                continue
+            if now - updated_at > SESSION_TTL_SECONDS:
+                shutil.rmtree(session_path, ignore_errors=True)
+                removed += 1
+        if removed:
+            logger.info(f"🧹 방치된 업로드 세션 {removed}개 정리")
+        return removed
+
+    # ------------------------------------------------------------------
+    # 청크 기록
+    # ------------------------------------------------------------------
+
+    async def write_chunk(self, upload_id: str, name: str, offset: int,
+                          chunks: AsyncIterator[bytes], content_length: Optional[int],
+                          chunk_sha256: Optional[str]) -> Dict[str, Any]:
+        """
+        offset 위치에 청크 기록
+        - offset 은 현재 수신 크기와 같아야 함 (다르면 409 + 현재 offset 반환 → 클라이언트가 그 위치부터 재전송)
+        - 이미 받은 구간을 다시 보낸 경우(응답 유실 후 재시도)는 본문을 버리고 현재 상태 반환
+        - 체크섬 불일치 시 기록한 부분을 잘라내고 422
+        """
+        if name not in UPLOAD_FILE_NAMES:
+            raise UploadError(404, f"알 수 없는 업로드 파일입니다: {name}")
+
+        async with self._lock(upload_id):
+            manifest = self._read_manifest(upload_id)
+            file_info = manifest["files"][name]
+            received = file_info["received"]
+
+            if content_length is not None and offset + content_length <= received:
+                async for _ in chunks:
+                    pass
+                return self._status(manifest)
+            if offset != received:
+                raise UploadError(409, f"{name} offset 불일치: 요청 {offset}, 현재 {received}", offset=received)
+            if content_length is not None and received + content_length > file_info["size"]:
+                raise UploadError(400, f"{name} 청크가 선언된 파일 크기를 초과합니다")
+
+            part_path = self.sessions_path / upload_id / f"{name}.part"
+            digest = hashlib.sha256()
+            written = 0
+            with open(part_path, "r+b") as f:
+                f.seek(offset)
+                try:
+                    async for data in chunks:
+                        if not data:
+                            continue
+                        written += len(data)
+                        if received + written > file_info["size"]:
+                            raise UploadError(400, f"{name} 청크가 선언된 파일 크기를 초과합니다")
+                        digest.update(data)
+                        await asyncio.to_thread(f.write, data)
+                    if chunk_sha256 and digest.hexdigest() != chunk_sha256.lower():
+                        raise UploadError(422, f"{name} 청크 체크섬 불일치 (offset {offset})", offset=received)
+                except BaseException:
+                    # 불완전한 청크는 버리고 직전 offset 으로 되돌림
+                    f.truncate(offset)
+                    raise
+                f.truncate(offset + written)
+
+            file_info["received"] = received + written
+            manifest["updated_at"] = time.time()
+            self._write_manifest(upload_id, manifest)
+            return self._status(manifest)
+
+    # ------------------------------------------------------------------
+    # 완료
+    # ------------------------------------------------------------------
+
+    async def commit(self, upload_id: str) -> Dict[str, Any]:
+        """전체 크기 / 체크섬 검증 후 대상 컬렉션의 새 버전으로 기록 (활성화는 호출자가 수행)"""
+        async with self._lock(upload_id):
+            manifest = self._read_manifest(upload_id)
+            session_path = self.sessions_path / upload_id
+
+            for name, file_info in manifest["files"].items():
+                if file_info["received"] != file_info["size"]:
+                    raise UploadError(
+                        409,
+                        f"{name} 업로드가 완료되지 않았습니다: {file_info['received']}/{file_info['size']} bytes",
+                        offset=file_info["received"],
+                    )
+                if file_info["sha256"]:
+                    actual = await asyncio.to_thread(self._file_sha256, session_path / f"{name}.part")
+                    if actual != file_info["sha256"]:
+                        raise UploadError(422, f"{name} 파일 체크섬 불일치: {actual}")
+
+            # 같은 볼륨 내 rename 이므로 복사 없이 이동
+            version = self.version_store.stage(manifest["target"], {
+                file_name: session_path / f"{name}.part" for name, file_name in UPLOAD_FILE_NAMES.items()
+            })
+
+            shutil.rmtree(session_path, ignore_errors=True)
+            self._locks.pop(upload_id, None)
+            logger.info(f"✅ 청크 업로드 완료: {upload_id} → {manifest['target']}@v{version}")
+            return {
+                "upload_id": upload_id,
+                "target": manifest["target"],
+                "version": version,
+                "size": {f"{name}_bytes": info["size"] for name, info in manifest["files"].items()},
+            }
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    def _lock(self, upload_id: str) -> asyncio.Lock:
+        lock = self._locks.get(upload_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[upload_id] = lock
+        return lock
+
+    def _manifest_path(self, upload_id: str) -> Path:
+        if not _UPLOAD_ID_PATTERN.match(upload_id):
+            raise UploadError(404, f"업로드 세션을 찾을 수 없습니다: {upload_id}")
+        return self.sessions_path / upload_id / "manifest.json"
+
+    def _read_manifest(self, upload_id: str) -> Dict[str, Any]:
+        manifest_path = self._manifest_path(upload_id)
+        if not manifest_path.exists():
+            raise UploadError(404, f"업로드 세션을 찾을 수 없습니다: {upload_id}")
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_manifest(self, upload_id: str, manifest: Dict[str, Any]) -> None:
+        manifest_path = self._manifest_path(upload_id)
+        temp_path = manifest_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(temp_path, manifest_path)
+
+    def _status(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        files = manifest["files"]
+        return {
+            "upload_id": manifest["upload_id"],
+            "target": manifest["target"],
+            "chunk_size": self.chunk_size,
+            "files": {
+                name: {"size": info["size"], "received": info["received"], "complete": info["received"] == info["size"]}
+                for name, info in files.items()
+            },
+            "complete": all(info["received"] == info["size"] for info in files.values()),
+        }
+
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(READ_BUFFER_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
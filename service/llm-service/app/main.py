@@ -5,13 +5,20 @@ import logging
 import time
 from typing import Dict, Any
 
-from .common.config import SERVICE_NAME, SERVICE_HOST, SERVICE_PORT, EMBED_DIM, FAISS_INDEX_PATH
+from .common.config import (
+    SERVICE_NAME, SERVICE_HOST, SERVICE_PORT, EMBED_DIM, FAISS_INDEX_PATH, LLM_REQUEST_DEADLINE,
+    HF_API_URL, HF_API_TOKEN
+)
 from .common.schemas import HealthResponse, ErrorResponse
 from .common.utils import generate_request_id, log_request_info, log_response_info
-from .router.rag_router import router as rag_router
+from .router.rag_router import router as rag_router, rag_manager as shared_rag_manager
 from .router.faiss_router import router as faiss_router
+from .router.faiss_upload_router import router as faiss_upload_router
 from .router.tcfd_router import tcfd_router
-from .domain.rag.rag_manager import RAGManager
+from .domain.llm.completion_cache import completion_cache_mode
+from .domain.llm.context_packer import get_tokenizer
+from .domain.llm.hf_endpoint_dispatcher import get_hf_dispatcher
+from .domain.llm.provider_client import close_provider_clients, request_deadline
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -34,10 +41,9 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ vectordb 데이터 복사 실패 (무시): {e}")
     
-    # RAG 매니저 초기화 (환경변수가 설정된 후)
+    # RAG 매니저 (라우터와 같은 인스턴스 사용, 인덱스는 공용 레지스트리에서 한 번만 로딩)
     try:
-        from .domain.rag.rag_manager import RAGManager
-        rag_manager = RAGManager()
+        rag_manager = shared_rag_manager
         logger.info("RAG 매니저 초기화 완료")
         
         # 모든 RAG 서비스의 인덱스 로딩
@@ -50,7 +56,7 @@ async def lifespan(app: FastAPI):
             try:
                 copy_vectordb_data()
                 # 복사 완료 후 인덱스 재로딩
-                load_results = rag_manager.load_all_indices()
+                load_results = rag_manager.load_all_indices(reload=True)
                 logger.info(f"📚 RAG 서비스 인덱스 재로딩 결과: {load_results}")
             except Exception as e:
                 logger.warning(f"⚠️ vectordb 데이터 재복사 실패: {e}")
@@ -59,12 +65,21 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ RAG 서비스 초기화 실패: {e}")
         rag_manager = None
     
+    # Inference Endpoint 상태는 백그라운드에서 주기적으로 점검 (생성 호출마다 헬스체크하지 않음)
+    if HF_API_URL and HF_API_TOKEN:
+        get_hf_dispatcher().start_probe()
+        logger.info("🩺 Inference Endpoint 상태 점검 시작")
+    # 프롬프트 토큰 예산 계산용 토크나이저 백그라운드 로딩
+    get_tokenizer()
+    
     logger.info(f"✅ {SERVICE_NAME} 서비스 시작 완료")
     
     yield
     
     # 종료 시
     logger.info(f"🛑 {SERVICE_NAME} 서비스 종료 중...")
+    await get_hf_dispatcher().aclose()
+    await close_provider_clients()
 
 def copy_vectordb_data():
     """Railway 볼륨에 vectordb 데이터 복사"""
@@ -126,6 +141,30 @@ async def log_requests(request: Request, call_next):
     
     return response
 
+# 미들웨어: 요청 deadline (LLM 제공자 호출의 timeout / 재시도 대기를 남은 시간 안으로 제한)
+@app.middleware("http")
+async def apply_request_deadline(request: Request, call_next):
+    timeout = LLM_REQUEST_DEADLINE
+    header = request.headers.get("x-request-timeout")
+    if header:
+        try:
+            # 게이트웨이 등 호출자가 남은 시간을 전달하면 더 짧은 쪽 적용
+            requested = float(header)
+            if requested > 0:
+                timeout = min(timeout, requested) if timeout > 0 else requested
+        except ValueError:
+            logger.warning(f"⚠️ 잘못된 X-Request-Timeout 헤더 무시: {header}")
+    
+    with request_deadline(timeout):
+        return await call_next(request)
+
+# 미들웨어: LLM 생성 결과 캐시 모드 (?cache=bypass 또는 X-LLM-Cache: bypass 면 캐시를 조회하지 않고 새로 생성)
+@app.middleware("http")
+async def apply_completion_cache_mode(request: Request, call_next):
+    mode = request.query_params.get("cache") or request.headers.get("x-llm-cache")
+    with completion_cache_mode(mode):
+        return await call_next(request)
+
 # 전역 예외 처리
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -161,7 +200,8 @@ async def root():
             "rag_draft": "/rag/draft",
             "rag_polish": "/rag/polish",
             "rag_draft_and_polish": "/rag/draft-and-polish",
-            "faiss_upload": "/rag/faiss/upload"
+            "faiss_upload": "/rag/faiss/upload",
+            "faiss_chunked_upload": "/rag/faiss/uploads"
         }
     }
 
@@ -221,6 +261,9 @@ app.include_router(rag_router)
 # FAISS 라우터 등록
 app.include_router(faiss_router)
 
+# FAISS 청크 업로드 라우터 등록
+app.include_router(faiss_upload_router)
+
 # TCFD 라우터 등록
 app.include_router(tcfd_router)
 
@@ -4,11 +4,14 @@ import logging
 from typing import Optional
 from ..www.jwt_auth_middleware import verify_token
 from ..common.schemas import UploadResponse
-from ..common.utils import generate_request_id
+from ..common.utils import generate_request_id, save_upload_files
+from ..common.config import FAISS_VOLUME_PATH
+from ..domain.rag.index_registry import get_index_registry
+from .rag_router import rag_manager
+import asyncio
 import os
 import shutil
 from pathlib import Path
-import time
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,8 @@ async def upload_faiss_files(
     """
     request_id = generate_request_id()
     logger.info(f"[{request_id}] FAISS 파일 업로드 시작 - 사용자: {user_id}")
+    # 볼륨 내 임시 디렉토리 (성공 / 실패와 관계없이 finally 에서 삭제)
+    staging_dir = Path(FAISS_VOLUME_PATH) / ".uploads" / f"form-{request_id}"
     
     try:
         # 파일 확장자 검증
@@ -42,37 +47,21 @@ async def upload_faiss_files(
         if not store_file.filename.endswith('.pkl'):
             raise HTTPException(status_code=400, detail="스토어 파일은 .pkl 확장자여야 합니다")
         
-        # 업로드 디렉토리 생성
-        upload_dir = Path("./vectordb/sr_corpus")
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        
-        # 파일 저장
-        index_path = upload_dir / "index.faiss"
-        store_path = upload_dir / "index.pkl"
-        
-        # 기존 파일 백업 (있다면)
-        if index_path.exists():
-            backup_path = upload_dir / f"index_backup_{int(time.time())}.faiss"
-            shutil.copy2(index_path, backup_path)
-            logger.info(f"[{request_id}] 기존 인덱스 파일 백업: {backup_path}")
-        
-        if store_path.exists():
-            backup_path = upload_dir / f"index_backup_{int(time.time())}.pkl"
-            shutil.copy2(store_path, backup_path)
-            logger.info(f"[{request_id}] 기존 스토어 파일 백업: {backup_path}")
-        
-        # 새 파일 저장
-        with open(index_path, "wb") as buffer:
-            shutil.copyfileobj(index_file.file, buffer)
-        
-        with open(store_path, "wb") as buffer:
-            shutil.copyfileobj(store_file.file, buffer)
+        # 볼륨 내 임시 디렉토리에 저장 후 sr_corpus 의 새 버전으로 기록 (기존 버전 파일은 수정하지 않음)
+        saved = await asyncio.to_thread(
+            save_upload_files, {"index.faiss": index_file, "index.pkl": store_file}, staging_dir
+        )
+        index_size = saved["index.faiss"].stat().st_size
+        store_size = saved["index.pkl"].stat().st_size
+        version = get_index_registry().versions.stage("sr_corpus", saved)
         
-        # 파일 크기 확인
-        index_size = index_path.stat().st_size
-        store_size = store_path.stat().st_size
+        logger.info(f"[{request_id}] FAISS 파일 업로드 완료 (v{version}) - 인덱스: {index_size} bytes, 스토어: {store_size} bytes")
         
-        logger.info(f"[{request_id}] FAISS 파일 업로드 완료 - 인덱스: {index_size} bytes, 스토어: {store_size} bytes")
+        # 백그라운드 로딩·검증 후 활성 버전 교체 (실패 시 기존 버전 유지)
+        try:
+            load_results = await rag_manager.activate_index("sr_corpus", version)
+        except Exception as e:
+            raise HTTPException(status_code=422, detail=f"인덱스 검증 실패 (기존 버전 유지): {str(e)}")
         
         return UploadResponse(
             ok=True,
@@ -80,22 +69,23 @@ async def upload_faiss_files(
                 "index_file": index_size,
                 "store_file": store_size
             },
-            load_results={
-                "openai": True,
-                "huggingface": True
-            }
+            load_results=load_results,
+            version=version
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"[{request_id}] FAISS 파일 업로드 실패: {e}")
         raise HTTPException(status_code=500, detail=f"파일 업로드 실패: {str(e)}")
     
     finally:
-        # 파일 핸들러 정리
+        # 파일 핸들러 / 임시 디렉토리 정리 (저장·스테이징 실패 시에도 .uploads 에 남지 않도록)
         if index_file.file:
             index_file.file.close()
         if store_file.file:
             store_file.file.close()
+        shutil.rmtree(staging_dir, ignore_errors=True)
 
 @router.get("/status")
 async def get_faiss_status(
@@ -114,7 +104,8 @@ async def get_faiss_status(
     logger.info(f"[{request_id}] FAISS 상태 확인 - 사용자: {user_id}")
     
     try:
-        upload_dir = Path("./vectordb/sr_corpus")
+        registry = get_index_registry()
+        upload_dir = registry.collection_dir("sr_corpus")
         index_path = upload_dir / "index.faiss"
         store_path = upload_dir / "index.pkl"
         
@@ -130,6 +121,7 @@ async def get_faiss_status(
                 "path": str(store_path)
             },
             "upload_directory": str(upload_dir),
+            "active_version": registry.versions.active_version("sr_corpus"),
             "status": "ready" if index_path.exists() and store_path.exists() else "missing_files"
         }
         
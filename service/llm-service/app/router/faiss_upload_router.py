@@ -0,0 +1,127 @@
+"""
+FAISS 인덱스 청크 업로드 라우터 (재개 가능)
+- POST   /rag/faiss/uploads                      : 업로드 세션 생성 (파일 크기 / SHA-256 선언)
+- GET    /rag/faiss/uploads/{upload_id}          : 수신 offset 조회 (중단 후 이어받기)
+- PUT    /rag/faiss/uploads/{upload_id}/{file}   : 청크 전송 (?offset=, X-Chunk-SHA256), 본문은 스트림으로 디스크에 기록
+- POST   /rag/faiss/uploads/{upload_id}/commit   : 검증 후 새 인덱스 버전(v{n})으로 기록, 백그라운드 로딩·검증 후 교체
+- DELETE /rag/faiss/uploads/{upload_id}          : 업로드 취소
+"""
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Header
+from pydantic import BaseModel, Field
+from typing import Optional
+import logging
+
+from ..common.config import FAISS_VOLUME_PATH, MAX_FILE_SIZE
+from ..common.schemas import UploadResponse
+from ..common.utils import generate_request_id, log_request_info, log_response_info
+from ..www.security import verify_admin_token
+from ..domain.upload import ChunkedUploadManager, UploadError
+from ..domain.rag.index_registry import get_index_registry
+from .rag_router import rag_manager
+
+logger = logging.getLogger(__name__)
+router = APIRouter(
+    prefix="/rag/faiss/uploads",
+    tags=["FAISS Chunked Upload"],
+    dependencies=[Depends(verify_admin_token)]
+)
+
+upload_manager = ChunkedUploadManager(FAISS_VOLUME_PATH, MAX_FILE_SIZE, version_store=get_index_registry().versions)
+
+
+class UploadFileSpec(BaseModel):
+    """업로드할 파일 정보"""
+    size: int = Field(..., ge=0, description="파일 전체 크기 (바이트)")
+    sha256: Optional[str] = Field(None, description="파일 전체 SHA-256 (commit 시 검증)")
+
+
+class UploadInitRequest(BaseModel):
+    """청크 업로드 세션 생성 요청"""
+    target: str = Field("sr_corpus", description="교체할 인덱스 디렉토리 (sr_corpus, standards)")
+    index: UploadFileSpec = Field(..., description="FAISS 인덱스 파일 (index.faiss)")
+    store: UploadFileSpec = Field(..., description="문서 스토어 파일 (index.pkl)")
+
+
+def _to_http_exception(e: UploadError) -> HTTPException:
+    detail = {"message": e.message, **e.extra}
+    headers = {"Upload-Offset": str(e.extra["offset"])} if "offset" in e.extra else None
+    return HTTPException(status_code=e.status_code, detail=detail, headers=headers)
+
+
+@router.post("")
+async def init_upload(request: UploadInitRequest):
+    """업로드 세션을 생성합니다."""
+    request_id = generate_request_id()
+    log_request_info(request_id, "POST", "/rag/faiss/uploads", {"target": request.target})
+
+    try:
+        result = upload_manager.init(
+            request.target,
+            {"index": request.index.model_dump(), "store": request.store.model_dump()}
+        )
+        log_response_info(request_id, 200, result)
+        return result
+    except UploadError as e:
+        raise _to_http_exception(e)
+
+
+@router.get("/{upload_id}")
+async def get_upload_status(upload_id: str):
+    """파일별 수신 offset 을 반환합니다."""
+    try:
+        return upload_manager.status(upload_id)
+    except UploadError as e:
+        raise _to_http_exception(e)
+
+
+@router.put("/{upload_id}/{file_name}")
+async def put_upload_chunk(
+    upload_id: str,
+    file_name: str,
+    request: Request,
+    offset: int = Query(..., ge=0, description="청크 시작 위치 (바이트)"),
+    content_length: Optional[int] = Header(None),
+    x_chunk_sha256: Optional[str] = Header(None)
+):
+    """청크를 수신합니다. 본문 전체를 메모리에 올리지 않고 받는 즉시 디스크에 기록합니다."""
+    try:
+        return await upload_manager.write_chunk(
+            upload_id, file_name, offset, request.stream(), content_length, x_chunk_sha256
+        )
+    except UploadError as e:
+        raise _to_http_exception(e)
+
+
+@router.post("/{upload_id}/commit", response_model=UploadResponse)
+async def commit_upload(upload_id: str):
+    """체크섬 검증 후 새 인덱스 버전으로 기록하고, 로딩·검증이 끝나면 활성 버전을 교체합니다."""
+    request_id = generate_request_id()
+    log_request_info(request_id, "POST", f"/rag/faiss/uploads/{upload_id}/commit")
+
+    try:
+        result = await upload_manager.commit(upload_id)
+    except UploadError as e:
+        raise _to_http_exception(e)
+
+    try:
+        load_results = await rag_manager.activate_index(result["target"], result["version"])
+    except Exception as e:
+        raise HTTPException(
+            status_code=422,
+            detail={"message": f"인덱스 검증 실패 (기존 버전 유지): {e}", "version": result["version"]}
+        )
+    response_data = UploadResponse(
+        ok=True, size=result["size"], load_results=load_results, version=result["version"]
+    )
+    log_response_info(request_id, 200, response_data)
+    return response_data
+
+
+@router.delete("/{upload_id}")
+async def abort_upload(upload_id: str):
+    """업로드 세션을 취소하고 임시 파일을 삭제합니다."""
+    try:
+        upload_manager.abort(upload_id)
+        return {"upload_id": upload_id, "aborted": True}
+    except UploadError as e:
+        raise _to_http_exception(e)
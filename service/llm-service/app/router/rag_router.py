@@ -1,5 +1,7 @@
-from fastapi import APIRouter, HTTPException, Depends, Query, UploadFile
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, UploadFile
 from fastapi.responses import JSONResponse
+import asyncio
+import shutil
 import time
 from typing import Dict, Any, List, Optional
 from pathlib import Path
@@ -12,8 +14,13 @@ from ..common.schemas import (
     UploadResponse, ErrorResponse
 )
 from ..common.utils import generate_request_id, log_request_info, log_response_info, timing_decorator
+from ..common.sse import wants_event_stream, sse_response
 from ..www.security import verify_admin_token
 from ..domain.rag.rag_manager import RAGManager
+from ..domain.rag.index_registry import get_index_registry
+from ..domain.llm.completion_cache import get_completion_cache
+from ..domain.llm.hf_endpoint_dispatcher import get_hf_dispatcher
+from ..domain.llm.provider_client import DeadlineExceeded, provider_stats
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/rag", tags=["RAG"])
@@ -21,6 +28,39 @@ router = APIRouter(prefix="/rag", tags=["RAG"])
 # RAG 매니저 인스턴스
 rag_manager = RAGManager()
 
+STREAM_QUERY_DESCRIPTION = "true 면 생성 결과를 SSE(text/event-stream)로 스트리밍"
+
+
+def _stream_draft_events(request: DraftRequest, service: Optional[str]):
+    """초안 생성 SSE 이벤트 (delta → done)"""
+    yield "start", {"stage": "draft", "sections": request.sections, "service": service or "default"}
+    draft_parts = []
+    for event, data in rag_manager.stream_draft(
+        question=request.question,
+        sections=request.sections,
+        top_k=request.top_k,
+        service_name=service
+    ):
+        if event == "delta":
+            draft_parts.append(data["text"])
+        yield event, {"stage": "draft", **data}
+    return "".join(draft_parts)
+
+
+def _stream_polish_events(text: str, tone: str, style_guide: str, service: Optional[str]):
+    """윤문 SSE 이벤트"""
+    yield "start", {"stage": "polish", "service": service or "default"}
+    polished_parts = []
+    for chunk in rag_manager.stream_polish_text(
+        text=text,
+        tone=tone,
+        style_guide=style_guide,
+        service_name=service
+    ):
+        polished_parts.append(chunk)
+        yield "delta", {"stage": "polish", "text": chunk}
+    return "".join(polished_parts)
+
 @router.get("/services")
 async def get_available_services():
     """사용 가능한 RAG 서비스 목록을 반환합니다."""
@@ -43,6 +83,81 @@ async def get_available_services():
         logger.error(f"서비스 목록 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/indices")
+async def get_index_memory():
+    """공용 인덱스 레지스트리의 컬렉션별 상주 메모리와 참조 수를 반환합니다."""
+    request_id = generate_request_id()
+    log_request_info(request_id, "GET", "/rag/indices")
+
+    try:
+        response_data = rag_manager.get_index_memory()
+        log_response_info(request_id, 200, response_data)
+        return response_data
+
+    except Exception as e:
+        logger.error(f"인덱스 메모리 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/cache")
+async def get_cache_stats():
+    """쿼리 임베딩 / 검색 결과 캐시의 크기와 적중률(hit/miss)을 반환합니다."""
+    try:
+        return rag_manager.get_cache_stats()
+    except Exception as e:
+        logger.error(f"검색 캐시 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/providers")
+async def get_provider_stats():
+    """LLM 제공자별 동시 호출 상한 / 진행 중 / 대기 중 호출 수와 Inference Endpoint 배칭 / 상태 점검 결과를 반환합니다."""
+    return {**provider_stats(), "huggingface_endpoint": get_hf_dispatcher().stats()}
+
+@router.get("/completion-cache")
+async def get_completion_cache_stats():
+    """LLM 생성 결과 캐시의 항목 수 / 크기 / 적중률을 반환합니다."""
+    return await asyncio.to_thread(get_completion_cache().stats)
+
+@router.delete("/completion-cache", dependencies=[Depends(verify_admin_token)])
+async def clear_completion_cache():
+    """LLM 생성 결과 캐시를 비웁니다. (관리자 전용)"""
+    try:
+        removed = await asyncio.to_thread(get_completion_cache().clear)
+        return {"success": True, "removed": removed}
+    except Exception as e:
+        logger.error(f"생성 결과 캐시 삭제 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/indices/{name}/versions")
+async def get_index_versions(name: str):
+    """컬렉션의 인덱스 버전 목록과 active / previous 포인터를 반환합니다."""
+    try:
+        return rag_manager.get_index_versions(name)
+    except Exception as e:
+        logger.error(f"인덱스 버전 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/indices/{name}/rollback", dependencies=[Depends(verify_admin_token)])
+async def rollback_index(name: str):
+    """직전 인덱스 버전으로 되돌립니다 (진행 중인 검색은 현재 버전으로 완료)."""
+    request_id = generate_request_id()
+    log_request_info(request_id, "POST", f"/rag/indices/{name}/rollback")
+
+    try:
+        load_results = await rag_manager.rollback_index(name)
+        response_data = {
+            "ok": True,
+            "versions": rag_manager.get_index_versions(name),
+            "load_results": load_results
+        }
+        log_response_info(request_id, 200, response_data)
+        return response_data
+
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        logger.error(f"인덱스 롤백 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/search")
 @timing_decorator
 async def search_documents(
@@ -58,8 +173,9 @@ async def search_documents(
         if service and not rag_manager.is_service_available(service):
             raise HTTPException(status_code=400, detail=f"서비스 {service}를 사용할 수 없습니다")
         
-        # 검색 수행
-        hits, context = rag_manager.search(
+        # 검색 수행 (쿼리 임베딩 / FAISS 검색은 이벤트 루프 밖에서)
+        hits, context = await asyncio.to_thread(
+            rag_manager.search,
             query=request.question,
             top_k=request.top_k,
             service_name=service
@@ -85,7 +201,9 @@ async def search_documents(
 @timing_decorator
 async def generate_draft(
     request: DraftRequest,
-    service: Optional[str] = Query(None, description="사용할 RAG 서비스 (openai, huggingface)")
+    http_request: Request,
+    service: Optional[str] = Query(None, description="사용할 RAG 서비스 (openai, huggingface)"),
+    stream: bool = Query(False, description=STREAM_QUERY_DESCRIPTION)
 ):
     """섹션별 초안을 생성합니다."""
     request_id = generate_request_id()
@@ -96,8 +214,15 @@ async def generate_draft(
         if service and not rag_manager.is_service_available(service):
             raise HTTPException(status_code=400, detail=f"서비스 {service}를 사용할 수 없습니다")
         
-        # 초안 생성
-        draft_content = rag_manager.generate_draft(
+        if wants_event_stream(http_request, stream):
+            def events():
+                draft_content = yield from _stream_draft_events(request, service)
+                yield "done", DraftResponse(draft=draft_content, service_used=service or "default").model_dump()
+            
+            return sse_response(events(), request_id)
+        
+        # 초안 생성 (섹션 병렬)
+        draft_content, timings = await rag_manager.generate_draft_with_timings(
             question=request.question,
             sections=request.sections,
             top_k=request.top_k,
@@ -106,12 +231,18 @@ async def generate_draft(
         
         response_data = DraftResponse(
             draft=draft_content,
-            service_used=service or "default"
+            service_used=service or "default",
+            timings=timings
         )
         
         log_response_info(request_id, 200, response_data)
         return response_data
         
+    except HTTPException:
+        raise
+    except DeadlineExceeded as e:
+        logger.error(f"초안 생성 실패 (deadline 초과): {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"초안 생성 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -120,7 +251,9 @@ async def generate_draft(
 @timing_decorator
 async def polish_text(
     request: PolishRequest,
-    service: Optional[str] = Query(None, description="사용할 RAG 서비스 (openai, huggingface)")
+    http_request: Request,
+    service: Optional[str] = Query(None, description="사용할 RAG 서비스 (openai, huggingface)"),
+    stream: bool = Query(False, description=STREAM_QUERY_DESCRIPTION)
 ):
     """텍스트를 윤문합니다."""
     request_id = generate_request_id()
@@ -131,8 +264,17 @@ async def polish_text(
         if service and not rag_manager.is_service_available(service):
             raise HTTPException(status_code=400, detail=f"서비스 {service}를 사용할 수 없습니다")
         
+        if wants_event_stream(http_request, stream):
+            def events():
+                polished_text = yield from _stream_polish_events(
+                    request.text, request.tone, request.style_guide, service
+                )
+                yield "done", PolishResponse(polished=polished_text, service_used=service or "default").model_dump()
+            
+            return sse_response(events(), request_id)
+        
         # 윤문 수행
-        polished_text = rag_manager.polish_text(
+        polished_text = await rag_manager.polish_text(
             text=request.text,
             tone=request.tone,
             style_guide=request.style_guide,
@@ -147,6 +289,11 @@ async def polish_text(
         log_response_info(request_id, 200, response_data)
         return response_data
         
+    except HTTPException:
+        raise
+    except DeadlineExceeded as e:
+        logger.error(f"윤문 실패 (deadline 초과): {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"윤문 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -155,7 +302,9 @@ async def polish_text(
 @timing_decorator
 async def draft_and_polish(
     request: DraftAndPolishRequest,
-    service: Optional[str] = Query(None, description="사용할 RAG 서비스 (openai, huggingface)")
+    http_request: Request,
+    service: Optional[str] = Query(None, description="사용할 RAG 서비스 (openai, huggingface)"),
+    stream: bool = Query(False, description=STREAM_QUERY_DESCRIPTION)
 ):
     """초안 생성과 윤문을 순차적으로 수행합니다."""
     request_id = generate_request_id()
@@ -166,8 +315,22 @@ async def draft_and_polish(
         if service and not rag_manager.is_service_available(service):
             raise HTTPException(status_code=400, detail=f"서비스 {service}를 사용할 수 없습니다")
         
-        # 1단계: 초안 생성
-        draft_content = rag_manager.generate_draft(
+        if wants_event_stream(http_request, stream):
+            def events():
+                draft_content = yield from _stream_draft_events(request, service)
+                polished_text = yield from _stream_polish_events(
+                    draft_content, request.tone, request.style_guide, service
+                )
+                yield "done", DraftAndPolishResponse(
+                    draft=draft_content,
+                    polished=polished_text,
+                    service_used=service or "default"
+                ).model_dump()
+            
+            return sse_response(events(), request_id)
+        
+        # 1단계: 초안 생성 (섹션 병렬)
+        draft_content, timings = await rag_manager.generate_draft_with_timings(
             question=request.question,
             sections=request.sections,
             top_k=request.top_k,
@@ -175,7 +338,7 @@ async def draft_and_polish(
         )
         
         # 2단계: 윤문 수행
-        polished_text = rag_manager.polish_text(
+        polished_text = await rag_manager.polish_text(
             text=draft_content,
             tone=request.tone,
             style_guide=request.style_guide,
@@ -185,12 +348,18 @@ async def draft_and_polish(
         response_data = DraftAndPolishResponse(
             draft=draft_content,
             polished=polished_text,
-            service_used=service or "default"
+            service_used=service or "default",
+            timings=timings
         )
         
         log_response_info(request_id, 200, response_data)
         return response_data
         
+    except HTTPException:
+        raise
+    except DeadlineExceeded as e:
+        logger.error(f"초안+윤문 실패 (deadline 초과): {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"초안+윤문 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -198,17 +367,20 @@ async def draft_and_polish(
 @router.post("/faiss/upload", dependencies=[Depends(verify_admin_token)])
 async def upload_faiss_files(
     index_file: UploadFile,
-    store_file: UploadFile
+    store_file: UploadFile,
+    target: str = Query("sr_corpus", description="교체할 인덱스 컬렉션 (sr_corpus, standards)")
 ):
-    """FAISS 인덱스와 문서 스토어 파일을 업로드합니다."""
+    """FAISS 인덱스와 문서 스토어 파일을 새 버전으로 업로드하고, 검증 후 활성 버전을 교체합니다."""
     request_id = generate_request_id()
     log_request_info(request_id, "POST", "/rag/faiss/upload", {"index_size": index_file.size, "store_size": store_file.size})
     
+    staging_dir = Path(FAISS_VOLUME_PATH) / ".uploads" / f"form-{request_id}"
     try:
-        from ..common.utils import ensure_directory_exists, validate_file_size, format_file_size
+        from ..common.utils import validate_file_size, save_upload_files
+        from ..domain.upload.chunked_upload import UPLOAD_TARGETS
         
-        # 디렉토리 확인/생성
-        ensure_directory_exists(FAISS_VOLUME_PATH)
+        if target not in UPLOAD_TARGETS:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 업로드 대상입니다: {target}")
         
         # 파일 크기 검증
         if not validate_file_size(index_file.filename, MAX_FILE_SIZE):
@@ -217,27 +389,28 @@ async def upload_faiss_files(
         if not validate_file_size(store_file.filename, MAX_FILE_SIZE):
             raise HTTPException(status_code=400, detail="스토어 파일 크기가 너무 큽니다")
         
-        # 파일 저장
-        index_path = Path(FAISS_VOLUME_PATH) / "my_index.faiss"
-        store_path = Path(FAISS_VOLUME_PATH) / "doc_store.pkl"
-        
-        with open(index_path, "wb") as f:
-            f.write(index_file.file.read())
-        
-        with open(store_path, "wb") as f:
-            f.write(store_file.file.read())
-        
-        # 파일 크기 확인
-        index_size = index_path.stat().st_size
-        store_size = store_path.stat().st_size
+        # 파일 저장 (디스크 쓰기는 이벤트 루프 밖에서)
+        saved = await asyncio.to_thread(
+            save_upload_files, {"index.faiss": index_file, "index.pkl": store_file}, staging_dir
+        )
+        index_size = saved["index.faiss"].stat().st_size
+        store_size = saved["index.pkl"].stat().st_size
         
-        # 모든 RAG 서비스의 인덱스 재로딩
-        load_results = rag_manager.load_all_indices()
+        # 새 버전으로 기록 후 백그라운드 로딩·검증, 완료되면 참조 교체
+        version = get_index_registry().versions.stage(target, saved)
+        try:
+            load_results = await rag_manager.activate_index(target, version)
+        except Exception as e:
+            raise HTTPException(
+                status_code=422,
+                detail={"message": f"인덱스 검증 실패 (기존 버전 유지): {e}", "version": version}
+            )
         
         response_data = UploadResponse(
             ok=True,
             size={"index_bytes": index_size, "store_bytes": store_size},
-            load_results=load_results
+            load_results=load_results,
+            version=version
         )
         
         log_response_info(request_id, 200, response_data)
@@ -248,3 +421,5 @@ async def upload_faiss_files(
     except Exception as e:
         logger.error(f"FAISS 파일 업로드 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
@@ -1,13 +1,19 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from fastapi.security import HTTPBearer
 from typing import Dict, Any
 import logging
 import httpx
 import os
 
-from ..domain.tcfd.tcfd_report_service import TCFDReportService
-from ..domain.tcfd.tcfd_model import TCFDReportRequest, TCFDReportResponse, TCFDRecommendationRequest, TCFDRecommendationResponse
+from ..domain.tcfd.tcfd_report_service import TCFDReportService, RECOMMENDATION_TYPES
+from ..domain.tcfd.tcfd_model import (
+    TCFDReportRequest, TCFDReportResponse, TCFDRecommendationRequest, TCFDRecommendationResponse,
+    TCFDRecommendationBatchRequest, TCFDRecommendationBatchResponse
+)
 from ..www.jwt_auth_middleware import verify_token
+from ..common.sse import wants_event_stream, sse_response
+from ..common.utils import generate_request_id
+from ..domain.llm.provider_client import DeadlineExceeded
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -27,21 +33,29 @@ tcfd_router = APIRouter(
 tcfd_service = TCFDReportService()
 
 @tcfd_router.post("/generate-report", response_model=TCFDReportResponse)
-async def generate_tcfd_report(request: TCFDReportRequest):
+async def generate_tcfd_report(
+    request: TCFDReportRequest,
+    http_request: Request,
+    stream: bool = Query(False, description="true 면 생성 결과를 SSE(text/event-stream)로 스트리밍")
+):
     """
     TCFD 권고사항 데이터를 기반으로 보고서 생성
     
     Args:
         request: TCFD 보고서 생성 요청 데이터
+        stream: SSE 스트리밍 여부 (Accept: text/event-stream 도 동일)
         
     Returns:
-        TCFDReportResponse: 생성된 보고서 내용
+        TCFDReportResponse: 생성된 보고서 내용 (스트리밍 시 delta 이벤트 후 done 이벤트)
     """
     try:
         logger.info(f"TCFD 보고서 생성 요청: {request.company_name}, {request.report_year}")
         
+        if wants_event_stream(http_request, stream):
+            return sse_response(tcfd_service.stream_tcfd_report(request), generate_request_id())
+        
         # TCFD 보고서 생성
-        response = tcfd_service.generate_tcfd_report(request)
+        response = await tcfd_service.generate_tcfd_report(request)
         
         if response.success:
             logger.info(f"TCFD 보고서 생성 성공: {request.company_name}")
@@ -52,7 +66,12 @@ async def generate_tcfd_report(request: TCFDReportRequest):
                 status_code=500,
                 detail=f"보고서 생성 중 오류가 발생했습니다: {response.error_message}"
             )
-            
+    
+    except HTTPException:
+        raise
+    except DeadlineExceeded as e:
+        logger.error(f"TCFD 보고서 생성 deadline 초과: {str(e)}")
+        raise HTTPException(status_code=504, detail=f"보고서 생성 시간이 초과되었습니다: {str(e)}")
     except Exception as e:
         logger.error(f"TCFD 보고서 생성 중 예외 발생: {str(e)}")
         raise HTTPException(
@@ -61,21 +80,29 @@ async def generate_tcfd_report(request: TCFDReportRequest):
         )
 
 @tcfd_router.post("/generate-recommendation", response_model=TCFDRecommendationResponse)
-async def generate_tcfd_recommendation(request: TCFDRecommendationRequest):
+async def generate_tcfd_recommendation(
+    request: TCFDRecommendationRequest,
+    http_request: Request,
+    stream: bool = Query(False, description="true 면 생성 결과를 SSE(text/event-stream)로 스트리밍")
+):
     """
     특정 TCFD 권고사항에 대한 문장 생성
     
     Args:
         request: TCFD 권고사항 문장 생성 요청 데이터
+        stream: SSE 스트리밍 여부 (Accept: text/event-stream 도 동일)
         
     Returns:
-        TCFDRecommendationResponse: 생성된 권고사항 문장
+        TCFDRecommendationResponse: 생성된 권고사항 문장 (스트리밍 시 delta 이벤트 후 done 이벤트)
     """
     try:
         logger.info(f"TCFD 권고사항 문장 생성 요청: {request.recommendation_type}, {request.llm_provider}")
         
+        if wants_event_stream(http_request, stream):
+            return sse_response(tcfd_service.stream_tcfd_recommendation(request), generate_request_id())
+        
         # TCFD 권고사항 문장 생성
-        response = tcfd_service.generate_tcfd_recommendation(request)
+        response = await tcfd_service.generate_tcfd_recommendation(request)
         
         if response.success:
             logger.info(f"TCFD 권고사항 문장 생성 성공: {request.recommendation_type}")
@@ -86,7 +113,12 @@ async def generate_tcfd_recommendation(request: TCFDRecommendationRequest):
                 status_code=500,
                 detail=f"권고사항 문장 생성 중 오류가 발생했습니다: {response.error_message}"
             )
-            
+    
+    except HTTPException:
+        raise
+    except DeadlineExceeded as e:
+        logger.error(f"TCFD 권고사항 문장 생성 deadline 초과: {str(e)}")
+        raise HTTPException(status_code=504, detail=f"권고사항 문장 생성 시간이 초과되었습니다: {str(e)}")
     except Exception as e:
         logger.error(f"TCFD 권고사항 문장 생성 중 예외 발생: {str(e)}")
         raise HTTPException(
@@ -94,6 +126,47 @@ async def generate_tcfd_recommendation(request: TCFDRecommendationRequest):
             detail=f"권고사항 문장 생성 중 오류가 발생했습니다: {str(e)}"
         )
 
+@tcfd_router.post("/generate-recommendations/batch", response_model=TCFDRecommendationBatchResponse)
+async def generate_tcfd_recommendations_batch(
+    request: TCFDRecommendationBatchRequest,
+    http_request: Request,
+    stream: bool = Query(False, description="true 면 완료되는 권고사항부터 SSE(text/event-stream)로 전송")
+):
+    """
+    여러 TCFD 권고사항 문장을 한 번에 생성 (생략 시 g1 ~ m3 전체)
+    
+    회사 TCFD 입력 데이터는 1회, RAG 검색은 기둥(G/S/R/M)별 1회만 수행하고 권고사항 생성은 병렬로 진행합니다.
+    
+    Args:
+        request: 회사명, 권고사항 유형 목록, 권고사항별 사용자 입력
+        stream: SSE 스트리밍 여부 (Accept: text/event-stream 도 동일)
+        
+    Returns:
+        TCFDRecommendationBatchResponse: 요청 순서의 권고사항별 결과 (스트리밍 시 완료 순 result 이벤트 후 done 이벤트)
+    """
+    unknown = [t for t in request.recommendation_types or [] if t not in RECOMMENDATION_TYPES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 권고사항 유형: {', '.join(unknown)}")
+    if request.recommendation_types is not None:
+        if not request.recommendation_types:
+            raise HTTPException(status_code=400, detail="recommendation_types 가 비어 있습니다")
+        request.recommendation_types = list(dict.fromkeys(request.recommendation_types))
+    
+    try:
+        logger.info(f"TCFD 권고사항 일괄 생성 요청: {request.company_name}, {request.llm_provider}")
+        
+        if wants_event_stream(http_request, stream):
+            return sse_response(tcfd_service.stream_tcfd_recommendations_batch(request), generate_request_id())
+        
+        return await tcfd_service.generate_tcfd_recommendations_batch(request)
+    
+    except Exception as e:
+        logger.error(f"TCFD 권고사항 일괄 생성 중 예외 발생: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"권고사항 일괄 생성 중 오류가 발생했습니다: {str(e)}"
+        )
+
 @tcfd_router.get("/inputs")
 async def get_tcfd_inputs():
     """
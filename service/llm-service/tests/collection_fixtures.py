@@ -0,0 +1,29 @@
+"""테스트용 작은 FAISS 컬렉션(index.faiss + 컬럼형 문서 저장소) 생성"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.common.config import DOC_STORE_DIR_NAME
+from app.domain.rag.doc_store import write_columnar_store
+
+EMBED_DIM = 8
+
+
+def write_collection(directory: Path, texts: List[str], metadatas: Optional[List[Dict[str, Any]]] = None,
+                     seed: int = 0) -> np.ndarray:
+    """directory 에 index.faiss / docstore/ 기록 후 벡터 반환 (정규화된 난수 벡터)"""
+    import faiss
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    vectors = np.random.default_rng(seed).normal(size=(len(texts), EMBED_DIM)).astype("float32")
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    index = faiss.IndexFlatL2(EMBED_DIM)
+    index.add(vectors)
+    faiss.write_index(index, str(directory / "index.faiss"))
+
+    metadatas = metadatas or [{} for _ in texts]
+    docs = [{"page_content": text, "metadata": meta} for text, meta in zip(texts, metadatas)]
+    write_columnar_store(docs, None, directory / DOC_STORE_DIR_NAME)
+    return vectors
@@ -0,0 +1,18 @@
+"""테스트 공용 fixture: 임시 벡터 볼륨과 그 볼륨을 보는 인덱스 레지스트리"""
+from pathlib import Path
+
+import pytest
+
+from app.domain.rag.index_registry import IndexRegistry
+
+from collection_fixtures import EMBED_DIM
+
+
+@pytest.fixture
+def volume(tmp_path) -> Path:
+    return tmp_path / "vectordb"
+
+
+@pytest.fixture
+def registry(volume) -> IndexRegistry:
+    return IndexRegistry(str(volume), embed_dim=EMBED_DIM)
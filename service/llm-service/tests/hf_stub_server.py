@@ -0,0 +1,68 @@
+"""
+Hugging Face Inference Endpoint 로컬 스텁 서버 (테스트용)
+- POST {"inputs": str | [str, ...]} → [{"generated_text": ...}] (배열이면 입력 순서대로)
+- reject_arrays=True 면 배열 입력에 422, max_prompt_chars 를 넘는 프롬프트가 있으면 400
+- GET 은 상태 점검용 200
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional
+
+
+class HFStubServer:
+    """별도 스레드에서 동작하는 Inference Endpoint 스텁 (받은 inputs 를 requests 에 기록)"""
+
+    def __init__(self, reject_arrays: bool = False, max_prompt_chars: Optional[int] = None):
+        self.reject_arrays = reject_arrays
+        self.max_prompt_chars = max_prompt_chars
+        self.requests: List[Any] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def __enter__(self) -> "HFStubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _respond(self, inputs: Any):
+        prompts = inputs if isinstance(inputs, list) else [inputs]
+        if isinstance(inputs, list) and self.reject_arrays:
+            return 422, {"error": "Input validation error: `inputs` must be a string"}
+        if self.max_prompt_chars is not None and any(len(p) > self.max_prompt_chars for p in prompts):
+            return 400, {"error": "Input validation error: `inputs` tokens + `max_new_tokens` must be <= 2048"}
+        return 200, [{"generated_text": f"{prompt} => 생성"} for prompt in prompts]
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status: int, body: Any) -> None:
+                data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                self._send(200, {"status": "ok"})
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", "0"))
+                inputs = json.loads(self.rfile.read(length))["inputs"]
+                stub.requests.append(inputs)
+                self._send(*stub._respond(inputs))
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
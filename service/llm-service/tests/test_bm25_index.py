@@ -0,0 +1,97 @@
+"""BM25 역색인: 토큰화 / 점수 순위 / 사전 필터 / 저장·재로딩"""
+import numpy as np
+import pytest
+
+from app.common.config import BM25_FILE_NAME
+from app.domain.rag import bm25_index as bm25_module
+from app.domain.rag.bm25_index import BM25Index, load_or_build_bm25, tokenize
+
+DOCS = [
+    "온실가스 배출량 Scope 1 산정 방법",
+    "기후 리스크 거버넌스와 이사회 감독",
+    "Scope 3 온실가스 배출량 공시 범위와 온실가스 감축 목표",
+    "물리적 리스크 시나리오 분석",
+]
+
+
+def test_tokenize_uses_hangul_bigrams_and_lowercase_words():
+    assert tokenize("온실가스 Scope-3") == ["온실", "실가", "가스", "scope", "3"]
+    assert tokenize("물 ＡＢＣ") == ["물", "abc"]
+    assert tokenize("") == []
+
+
+def test_search_ranks_by_bm25_score():
+    index = BM25Index.build(DOCS)
+    results = index.search("온실가스 배출량", top_k=3)
+
+    ids = [doc_id for doc_id, _ in results]
+    assert set(ids) == {0, 2}
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+    assert index.search("scope", top_k=5)[0][0] in (0, 2)
+
+
+def test_unknown_terms_and_empty_top_k_return_nothing():
+    index = BM25Index.build(DOCS)
+    assert index.search("존재하지않는질의어", top_k=5) == []
+    assert index.search("리스크", top_k=0) == []
+
+
+def test_allowed_mask_filters_documents_before_scoring():
+    index = BM25Index.build(DOCS)
+    allowed = np.array([False, True, True, True])
+    results = index.search("온실가스 리스크", top_k=5, allowed=allowed)
+    assert results and all(allowed[doc_id] for doc_id, _ in results)
+
+
+def test_matches_reference_bm25_formula():
+    index = BM25Index.build(DOCS, k1=1.2, b=0.75)
+    tokenized = [tokenize(doc) for doc in DOCS]
+    avg_length = sum(map(len, tokenized)) / len(tokenized)
+
+    def reference(query_token, doc):
+        df = sum(query_token in tokens for tokens in tokenized)
+        idf = np.log1p((len(DOCS) - df + 0.5) / (df + 0.5))
+        tf = doc.count(query_token)
+        return idf * tf * 2.2 / (tf + 1.2 * (1 - 0.75 + 0.75 * len(doc) / avg_length))
+
+    for doc_id, score in index.search("리스크", top_k=5):
+        assert score == pytest.approx(reference("리스", tokenized[doc_id]) + reference("스크", tokenized[doc_id]),
+                                      rel=1e-5)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = BM25Index.build(DOCS, source={"size": 1})
+    path = tmp_path / "bm25.npz"
+    index.save(path)
+    loaded = BM25Index.load(path)
+
+    assert loaded.vocab == index.vocab and loaded.source == {"size": 1}
+    assert loaded.search("온실가스 감축", top_k=3) == index.search("온실가스 감축", top_k=3)
+
+
+def test_load_rejects_other_tokenizer_version(tmp_path, monkeypatch):
+    path = tmp_path / "bm25.npz"
+    BM25Index.build(DOCS).save(path)
+    monkeypatch.setattr(bm25_module, "TOKENIZER_VERSION", "other")
+    with pytest.raises(ValueError):
+        BM25Index.load(path)
+
+
+def test_load_or_build_rebuilds_only_when_store_changes(tmp_path):
+    store_file = tmp_path / "docs.bin"
+    store_file.write_bytes(b"v1")
+    calls = []
+
+    def texts():
+        calls.append(1)
+        return DOCS
+
+    load_or_build_bm25(tmp_path, store_file, texts)
+    assert (tmp_path / BM25_FILE_NAME).exists()
+    load_or_build_bm25(tmp_path, store_file, texts)
+    assert len(calls) == 1
+
+    store_file.write_bytes(b"version 2")
+    rebuilt = load_or_build_bm25(tmp_path, store_file, texts)
+    assert len(calls) == 2 and rebuilt.num_docs == len(DOCS)
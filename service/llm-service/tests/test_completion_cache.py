@@ -0,0 +1,121 @@
+"""LLM 생성 결과 캐시: 키 정규화 / TTL / 바이트 상한 삭제 / bypass / 실패 결과 미저장"""
+import asyncio
+
+import pytest
+
+from app.domain.llm import completion_cache as cache_module
+from app.domain.llm.completion_cache import (
+    CACHE_BYPASS, CompletionCache, completion_cache_mode, completion_key, normalize_prompt,
+)
+
+PARAMS = {"temperature": 0.2, "max_tokens": 256}
+
+
+@pytest.fixture
+def cache(tmp_path) -> CompletionCache:
+    return CompletionCache(path=str(tmp_path / "llm_cache.sqlite3"), max_bytes=10_000, ttl_seconds=60)
+
+
+def test_key_ignores_whitespace_but_not_parameters():
+    key = completion_key("openai", "gpt", PARAMS, "질문:  기후\r\n\n\n\n리스크 ")
+    assert key == completion_key("openai", "gpt", PARAMS, "질문: 기후\n\n리스크")
+    assert key != completion_key("openai", "gpt", {**PARAMS, "temperature": 0.7}, "질문: 기후\n\n리스크")
+    assert key != completion_key("huggingface", "gpt", PARAMS, "질문: 기후\n\n리스크")
+    assert normalize_prompt("ＡＢＣ  \n  x") == "ABC\nx"
+
+
+def test_chat_messages_are_normalized_per_message():
+    messages = [{"role": "system", "content": "요약  하라"}, {"role": "user", "content": " 본문 "}]
+    assert completion_key("openai", "gpt", PARAMS, messages) == completion_key(
+        "openai", "gpt", PARAMS, [{"role": "system", "content": "요약 하라"}, {"role": "user", "content": "본문"}]
+    )
+
+
+def test_put_get_round_trip_and_persistence(cache, tmp_path):
+    cache.put("k", "openai", "gpt", "초안")
+    assert cache.get("k") == "초안"
+    assert cache.get("missing") is None
+
+    reopened = CompletionCache(path=str(tmp_path / "llm_cache.sqlite3"), max_bytes=10_000, ttl_seconds=60)
+    assert reopened.get("k") == "초안"
+    assert reopened.stats()["bytes"] == cache.stats()["bytes"]
+
+
+def test_expired_entries_are_not_served(cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache.put("k", "openai", "gpt", "초안")
+    now[0] += 61
+    assert cache.get("k") is None
+    assert cache.stats()["expired"] == 1 and cache.stats()["bytes"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = CompletionCache(path=str(tmp_path / "c.sqlite3"), max_bytes=300, ttl_seconds=0)
+    for key in ("a", "b", "c"):
+        now[0] += 1
+        cache.put(key, "openai", "gpt", key * 80)
+    now[0] += 1
+    cache.get("a")
+    now[0] += 1
+    cache.put("d", "openai", "gpt", "d" * 80)
+
+    assert cache.get("b") is None
+    assert [cache.get(key) is not None for key in ("a", "c", "d")] == [True, True, True]
+    assert cache.stats()["bytes"] <= 300 * cache_module._EVICT_TARGET_RATIO
+
+
+def test_bypass_mode_skips_lookup_but_refreshes_entry(cache):
+    cache.put("k", "openai", "gpt", "이전 초안")
+    with completion_cache_mode(CACHE_BYPASS):
+        assert cache.get("k") is None
+    with completion_cache_mode("unknown"):
+        assert cache.get("k") == "이전 초안"
+    assert cache.stats()["bypasses"] == 1
+
+    calls = []
+
+    async def generate():
+        calls.append(1)
+        return "새 초안"
+
+    async def regenerate():
+        with completion_cache_mode(CACHE_BYPASS):
+            return await cache.cached("openai", "gpt", PARAMS, "질문", generate)
+
+    assert asyncio.run(regenerate()) == "새 초안"
+    assert asyncio.run(cache.cached("openai", "gpt", PARAMS, "질문", generate)) == "새 초안"
+    assert len(calls) == 1
+
+
+def test_cached_does_not_store_failures(cache):
+    outputs = iter(["생성에 실패했습니다", "정상 초안"])
+
+    async def generate():
+        return next(outputs)
+
+    def run():
+        return asyncio.run(cache.cached(
+            "huggingface", "polyglot", PARAMS, "질문", generate,
+            is_success=lambda text: not text.startswith("생성에 실패"),
+        ))
+
+    assert run() == "생성에 실패했습니다"
+    assert run() == "정상 초안"
+    assert cache.stats()["writes"] == 1
+
+
+def test_disabled_cache_always_generates(tmp_path):
+    cache = CompletionCache(path=str(tmp_path / "off.sqlite3"), max_bytes=0)
+    calls = []
+
+    async def generate():
+        calls.append(1)
+        return "초안"
+
+    for _ in range(2):
+        asyncio.run(cache.cached("openai", "gpt", PARAMS, "질문", generate))
+    assert len(calls) == 2
+    assert not (tmp_path / "off.sqlite3").exists()
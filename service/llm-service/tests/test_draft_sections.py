@@ -0,0 +1,47 @@
+"""BaseRAGService 섹션 병렬 초안 생성의 섹션별 상태"""
+import asyncio
+
+from app.domain.llm.huggingface_llm_service import HuggingFaceLLMService
+from app.domain.rag.huggingface_rag_service import HuggingFaceRAGService
+
+
+class StubHFLLMService(HuggingFaceLLMService):
+    """섹션명별로 정해진 결과를 반환 (HF 처럼 실패를 안내 문구로 반환)"""
+
+    def __init__(self, outputs):
+        self.outputs = outputs
+
+    async def generate_draft_section(self, question, context, section, style_guide=""):
+        output = self.outputs[section]
+        if isinstance(output, Exception):
+            raise output
+        return output
+
+
+def make_rag_service(outputs) -> HuggingFaceRAGService:
+    service = object.__new__(HuggingFaceRAGService)
+    service.service_name = "huggingface"
+    service.is_loaded = True
+    service.llm_service = StubHFLLMService(outputs)
+    service.search = lambda question, top_k=8, filters=None: ([], "[1] 근거")
+    return service
+
+
+def test_failure_notice_sections_are_marked_failed():
+    service = make_rag_service({
+        "거버넌스": "[1] 이사회는 기후 위험을 감독한다.",
+        "전략": "[연결 오류] Hugging Face Inference Endpoint 연결에 실패했습니다: timeout",
+        "지표": RuntimeError("boom"),
+    })
+    draft, timings = asyncio.run(service.generate_draft_with_timings("질문", ["거버넌스", "전략", "지표"]))
+
+    statuses = {timing.section: timing.status for timing in timings.sections}
+    assert statuses == {"거버넌스": "ok", "전략": "failed", "지표": "failed"}
+    assert timings.sections[1].error.startswith("[연결 오류]")
+    assert "이사회는 기후 위험을 감독한다" in draft
+
+
+def test_citation_prefix_is_not_a_failure_notice():
+    service = StubHFLLMService({})
+    assert not service.is_failure_notice("[1] 근거에 따르면 ...")
+    assert service.is_failure_notice("[오류] 전략 섹션 초안 생성에 실패했습니다: x")
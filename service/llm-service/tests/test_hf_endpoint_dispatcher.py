@@ -0,0 +1,126 @@
+"""HFEndpointDispatcher 배칭 / 배열 거부 처리 (로컬 스텁 서버 대상)"""
+import asyncio
+import time
+
+import pytest
+
+from app.domain.llm.hf_endpoint_dispatcher import ENDPOINT_READY, EndpointResponseError, HFEndpointDispatcher
+from app.domain.llm.provider_client import ProviderClient
+
+from hf_stub_server import HFStubServer
+
+PARAMETERS = {"max_new_tokens": 16}
+
+
+def make_dispatcher(stub: HFStubServer, **kwargs) -> HFEndpointDispatcher:
+    client = ProviderClient("hf-stub", max_concurrency=8, timeout=5, max_retries=0)
+    kwargs.setdefault("max_wait_ms", 50)
+    return HFEndpointDispatcher(url=stub.url, token="test", probe_interval=0, client_factory=lambda: client, **kwargs)
+
+
+async def generate_all(dispatcher: HFEndpointDispatcher, prompts):
+    return await asyncio.gather(
+        *(dispatcher.generate(prompt, PARAMETERS) for prompt in prompts), return_exceptions=True
+    )
+
+
+def test_concurrent_prompts_are_sent_as_one_array():
+    with HFStubServer() as stub:
+        dispatcher = make_dispatcher(stub, max_batch_size=8)
+        results = asyncio.run(generate_all(dispatcher, ["a", "b", "c"]))
+
+    assert results == ["a => 생성", "b => 생성", "c => 생성"]
+    assert stub.requests == [["a", "b", "c"]]
+    assert dispatcher.batches == 1 and dispatcher.max_observed_batch == 3
+
+
+def test_full_batch_is_sent_without_waiting():
+    with HFStubServer() as stub:
+        dispatcher = make_dispatcher(stub, max_batch_size=2, max_wait_ms=10_000)
+        started = time.monotonic()
+        results = asyncio.run(generate_all(dispatcher, ["a", "b", "c", "d"]))
+
+    assert time.monotonic() - started < 5
+    assert results == ["a => 생성", "b => 생성", "c => 생성", "d => 생성"]
+    assert stub.requests == [["a", "b"], ["c", "d"]]
+
+
+def test_array_rejection_falls_back_and_retries_batching_later():
+    with HFStubServer(reject_arrays=True) as stub:
+        dispatcher = make_dispatcher(stub, max_batch_size=8, batch_retry_seconds=0.3)
+
+        async def scenario():
+            first = await generate_all(dispatcher, ["a", "b"])
+            assert not dispatcher.batching
+            second = await generate_all(dispatcher, ["c", "d"])
+            await asyncio.sleep(0.35)
+            assert dispatcher.batching
+            stub.reject_arrays = False
+            third = await generate_all(dispatcher, ["e", "f"])
+            return first, second, third
+
+        first, second, third = asyncio.run(scenario())
+
+    assert first == ["a => 생성", "b => 생성"]
+    assert second == ["c => 생성", "d => 생성"]
+    assert third == ["e => 생성", "f => 생성"]
+    # 거부된 배열 → 개별 재전송 → 대기 중 개별 호출 → 재시도 시각 이후 다시 배열
+    assert stub.requests[0] == ["a", "b"]
+    assert sorted(stub.requests[1:3]) == ["a", "b"]
+    assert sorted(stub.requests[3:5]) == ["c", "d"]
+    assert stub.requests[5] == ["e", "f"]
+    assert dispatcher.batching
+
+
+def test_repeated_array_rejection_doubles_retry_interval():
+    with HFStubServer(reject_arrays=True) as stub:
+        dispatcher = make_dispatcher(stub, max_batch_size=8, batch_retry_seconds=0.2)
+
+        async def scenario():
+            await generate_all(dispatcher, ["a", "b"])
+            await asyncio.sleep(0.25)
+            await generate_all(dispatcher, ["c", "d"])
+            return dispatcher.stats()["batch_retry_in"]
+
+        retry_in = asyncio.run(scenario())
+
+    assert 0.3 < retry_in <= 0.4
+
+
+def test_over_length_prompt_does_not_disable_batching():
+    with HFStubServer(max_prompt_chars=10) as stub:
+        dispatcher = make_dispatcher(stub, max_batch_size=8)
+        results = asyncio.run(generate_all(dispatcher, ["a", "x" * 50, "c"]))
+
+    assert results[0] == "a => 생성" and results[2] == "c => 생성"
+    assert isinstance(results[1], EndpointResponseError)
+    assert results[1].response.status_code == 400
+    assert dispatcher.batching
+    assert dispatcher.stats()["batch_retry_in"] is None
+
+
+def test_batch_size_one_never_batches():
+    with HFStubServer() as stub:
+        dispatcher = make_dispatcher(stub, max_batch_size=1)
+        results = asyncio.run(generate_all(dispatcher, ["a", "b"]))
+
+    assert results == ["a => 생성", "b => 생성"]
+    assert sorted(stub.requests) == ["a", "b"]
+    assert not dispatcher.batching
+
+
+def test_probe_marks_stub_ready():
+    with HFStubServer() as stub:
+        dispatcher = make_dispatcher(stub)
+        assert asyncio.run(dispatcher.probe()) == ENDPOINT_READY
+
+
+@pytest.mark.parametrize("status", [401, 503])
+def test_non_rejection_errors_are_passed_to_every_caller(status):
+    with HFStubServer() as stub:
+        stub._respond = lambda inputs: (status, {"error": "unavailable"})
+        dispatcher = make_dispatcher(stub, max_batch_size=8)
+        results = asyncio.run(generate_all(dispatcher, ["a", "b"]))
+
+    assert all(isinstance(result, EndpointResponseError) for result in results)
+    assert dispatcher.batching
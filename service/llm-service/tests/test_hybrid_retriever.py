@@ -0,0 +1,127 @@
+"""facet 비트맵 사전 필터와 RRF 병합 (벡터 + BM25)"""
+import faiss
+import numpy as np
+import pytest
+
+from app.common.config import DOC_STORE_DIR_NAME
+from app.domain.rag.bm25_index import BM25Index
+from app.domain.rag.doc_store import ColumnarDocStore
+from app.domain.rag.hybrid_retriever import FacetIndex, HybridRetriever, RetrievalCollection
+from app.domain.rag.retrieval_cache import RetrievalCache
+
+from collection_fixtures import write_collection
+
+TEXTS = [
+    "삼성 2022 온실가스 배출량",
+    "삼성 2023 온실가스 감축 목표",
+    "LG 2023 기후 리스크 거버넌스",
+    "LG 2022 물리적 리스크 분석",
+    "SK 2023 온실가스 배출량 Scope 3",
+]
+METADATAS = [
+    {"company": "삼성", "year": 2022, "pillar": "metrics"},
+    {"company": "삼성", "year": "2023", "pillar": "metrics"},
+    {"company": "LG", "year": 2023, "pillar": "governance"},
+    {"company": "LG", "year": 2022},
+    {"company": "SK", "year": 2023, "pillar": "metrics"},
+]
+
+
+class FixedEmbedder:
+    """항상 같은 쿼리 벡터를 돌려주는 임베더 (호출 횟수 기록)"""
+
+    model_name = "fixed"
+
+    def __init__(self, vector: np.ndarray):
+        self.vector = vector.reshape(1, -1).astype("float32")
+        self.calls = 0
+
+    def embed(self, query: str) -> np.ndarray:
+        self.calls += 1
+        return self.vector.copy()
+
+
+@pytest.fixture
+def vectors(tmp_path) -> np.ndarray:
+    return write_collection(tmp_path, TEXTS, METADATAS)
+
+
+@pytest.fixture
+def collection(tmp_path, vectors) -> RetrievalCollection:
+    store = ColumnarDocStore(tmp_path / DOC_STORE_DIR_NAME)
+    index = faiss.read_index(str(tmp_path / "index.faiss"))
+    return RetrievalCollection("tcfd", index, store, None, bm25=BM25Index.build(TEXTS), version=1)
+
+
+def allowed_ids(facets: FacetIndex, filters) -> list:
+    return np.flatnonzero(facets.unpack(facets.packed_mask(filters))).tolist()
+
+
+def test_columnar_facets_match_document_facets(collection):
+    built = FacetIndex.build(METADATAS, len(METADATAS))
+    for name in ("company", "year", "pillar"):
+        assert collection.facets.values(name) == built.values(name)
+        for value in built.values(name):
+            assert np.array_equal(collection.facets.bitmaps[name][value], built.bitmaps[name][value])
+    # 2022 / "2023" 처럼 타입이 달라도 정규화 값으로 합쳐짐
+    assert collection.facets.values("year") == ["2022", "2023"]
+
+
+def test_filter_or_within_field_and_across_fields(collection):
+    facets = collection.facets
+    assert facets.packed_mask(None) is None
+    assert allowed_ids(facets, {"company": ["삼성", "sk"]}) == [0, 1, 4]
+    assert allowed_ids(facets, {"company": ["삼성", "SK"], "year": 2023}) == [1, 4]
+    assert allowed_ids(facets, {"company": "없는회사"}) == []
+
+
+def test_unknown_filter_field_is_rejected(collection):
+    with pytest.raises(ValueError):
+        collection.facets.packed_mask({"unknown": "x"})
+
+
+def test_rrf_sums_reciprocal_ranks(collection):
+    retriever = HybridRetriever(FixedEmbedder(np.zeros(8)), rrf_k=60, cache=RetrievalCache(0, 0))
+    hits = retriever._fuse({
+        "dense": [(collection, 1, 0.9), (collection, 2, 0.8)],
+        "bm25": [(collection, 2, 7.0), (collection, 3, 5.0)],
+    }, top_k=3)
+
+    assert [hit.doc_id for hit in hits] == [2, 1, 3]
+    assert hits[0].score == pytest.approx(1 / 62 + 1 / 61)
+    assert hits[0].ranks == {"dense": 2, "bm25": 1}
+    assert (hits[0].dense_score, hits[0].bm25_score) == (0.8, 7.0)
+    assert hits[1].bm25_score is None and hits[2].dense_score is None
+
+
+def test_hybrid_search_applies_filters_before_scoring(collection, vectors):
+    embedder = FixedEmbedder(vectors[0])
+    retriever = HybridRetriever(embedder, candidates=10, cache=RetrievalCache(0, 0))
+
+    hits = retriever.search([collection], "온실가스 배출량", top_k=5)
+    assert hits[0].doc_id == 0 and set(hits[0].ranks) == {"dense", "bm25"}
+
+    filtered = retriever.search([collection], "온실가스 배출량", top_k=5, filters={"company": "LG"})
+    assert {hit.doc_id for hit in filtered} <= {2, 3}
+    assert all(hit.bm25_score is None for hit in filtered)  # LG 문서에는 질의 토큰이 없음
+
+
+def test_lexical_mode_skips_embedding(collection, vectors):
+    embedder = FixedEmbedder(vectors[0])
+    retriever = HybridRetriever(embedder, cache=RetrievalCache(0, 0))
+    hits = retriever.search([collection], "리스크", top_k=5, mode="lexical")
+    assert {hit.doc_id for hit in hits} == {2, 3}
+    assert embedder.calls == 0
+
+
+def test_failed_embedding_falls_back_to_keywords(collection):
+    class BrokenEmbedder:
+        def embed(self, query):
+            raise RuntimeError("embedding unavailable")
+
+    cache = RetrievalCache()
+    retriever = HybridRetriever(BrokenEmbedder(), cache=cache)
+    hits = retriever.search([collection], "리스크", top_k=5)
+    assert {hit.doc_id for hit in hits} == {2, 3}
+    # 키워드만으로 병합한 결과는 캐시하지 않음
+    assert cache.results.stats()["entries"] == 0
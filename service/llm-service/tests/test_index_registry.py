@@ -0,0 +1,132 @@
+"""IndexRegistry 참조 카운트 / 재로딩 교체와 RAG 서비스의 핸들 교체"""
+import threading
+import time
+
+import pytest
+
+from app.domain.rag import base_rag_service
+from app.domain.rag.base_rag_service import BaseRAGService
+from app.domain.rag.rag_service import RAGService
+
+from collection_fixtures import write_collection
+
+TEXTS = ["이사회는 기후 위험을 감독한다", "탄소중립 목표 2050", "물리적 위험 시나리오 분석"]
+
+
+class StubRAGService(BaseRAGService):
+    async def generate_draft_section(self, question, context, section, style_guide=""):
+        return ""
+
+    async def polish_text(self, text, tone="공식적", style_guide=""):
+        return text
+
+
+@pytest.fixture
+def loaded(registry, volume):
+    write_collection(volume / "sr_corpus", TEXTS)
+    return registry
+
+
+def slow_acquire_if_loaded(registry, monkeypatch):
+    """핸들 획득과 교체 사이를 넓혀 동시 교체 경합을 재현"""
+    acquire_if_loaded = registry.acquire_if_loaded
+
+    def slow(name):
+        handle = acquire_if_loaded(name)
+        time.sleep(0.01)
+        return handle
+
+    monkeypatch.setattr(registry, "acquire_if_loaded", slow)
+
+
+def run_concurrently(func, threads: int = 16):
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        func()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+
+
+def test_acquire_shares_entry_and_counts_references(loaded):
+    first = loaded.acquire("sr_corpus")
+    second = loaded.acquire("sr_corpus")
+    assert first.collection is second.collection
+    assert loaded._entries["sr_corpus"].refcount == 2
+
+    first.release()
+    first.release()  # 중복 반납은 무시
+    assert loaded._entries["sr_corpus"].refcount == 1
+    second.release()
+    assert loaded._entries["sr_corpus"].refcount == 0
+
+
+def test_acquire_if_loaded_does_not_load(loaded):
+    assert loaded.acquire_if_loaded("sr_corpus") is None
+    with loaded.acquire("sr_corpus"):
+        handle = loaded.acquire_if_loaded("sr_corpus")
+        assert handle is not None
+        handle.release()
+
+
+def test_reload_keeps_held_handle_until_released(loaded, volume):
+    held = loaded.acquire("sr_corpus")
+    old_entry = loaded._entries["sr_corpus"]
+    write_collection(volume / "sr_corpus", TEXTS + ["신규 문서"], seed=1)
+    loaded.reload("sr_corpus")
+
+    assert held.stale
+    assert held.collection.index.ntotal == 3
+    assert old_entry in loaded._retired
+    held.release()
+    assert old_entry not in loaded._retired
+    assert old_entry.collection is None
+
+
+def test_concurrent_stale_handle_swap_releases_every_old_handle(loaded, volume, monkeypatch):
+    monkeypatch.setattr(base_rag_service, "get_index_registry", lambda: loaded)
+    service = object.__new__(StubRAGService)
+    service.service_name = "stub"
+    service.collection_name = "sr_corpus"
+    service.handle = None
+    service._handle_lock = threading.Lock()
+    service.handle = loaded.acquire("sr_corpus")
+    old_entry = loaded._entries["sr_corpus"]
+
+    write_collection(volume / "sr_corpus", TEXTS + ["신규 문서"], seed=1)
+    loaded.reload("sr_corpus")
+    slow_acquire_if_loaded(loaded, monkeypatch)
+    run_concurrently(service._current_handle)
+
+    new_entry = loaded._entries["sr_corpus"]
+    assert service.handle.collection is new_entry.collection
+    assert new_entry.refcount == 1
+    assert old_entry.refcount == 0 and old_entry.collection is None
+    assert not loaded._retired
+
+
+def test_rag_service_collections_swap_under_concurrency(loaded, volume, monkeypatch):
+    write_collection(volume / "standards", ["TCFD 권고안"], seed=2)
+    service = object.__new__(RAGService)
+    service.index_name, service.standards_index_name = "sr_corpus", "standards"
+    service.registry = loaded
+    service.handles = {}
+    service._handles_lock = threading.Lock()
+    service.is_index_loaded = False
+    service._load_index()
+    old_entry = loaded._entries["sr_corpus"]
+
+    write_collection(volume / "sr_corpus", TEXTS + ["신규 문서"], seed=1)
+    loaded.reload("sr_corpus")
+    slow_acquire_if_loaded(loaded, monkeypatch)
+    run_concurrently(lambda: service.collections)
+
+    assert loaded._entries["sr_corpus"].refcount == 1
+    assert loaded._entries["standards"].refcount == 1
+    assert old_entry.refcount == 0 and old_entry.collection is None
+    assert [c.index.ntotal for c in service.collections] == [4, 1]
@@ -0,0 +1,131 @@
+"""인덱스 버전 디렉토리: stage / activate / gc 와 레지스트리 publish / rollback"""
+import json
+
+import pytest
+
+from app.common.config import DOC_STORE_DIR_NAME
+from app.domain.rag.index_versions import (
+    ACTIVE, FAILED, LEGACY_VERSION, RETIRED, STAGED, VERSIONS_FILE, IndexVersionStore,
+)
+
+from collection_fixtures import write_collection
+
+TEXTS_V1 = ["이사회는 기후 위험을 감독한다", "탄소중립 목표 2050"]
+TEXTS_V2 = ["물리적 위험 시나리오 분석", "전환 위험 재무 영향", "온실가스 배출량 Scope 3"]
+
+
+def upload(directory, texts, seed=0):
+    """업로드 스테이징 디렉토리에 컬렉션을 만들고 publish 에 넘길 {파일명: 경로} 반환"""
+    write_collection(directory, texts, seed=seed)
+    return {"index.faiss": directory / "index.faiss", DOC_STORE_DIR_NAME: directory / DOC_STORE_DIR_NAME}
+
+
+def test_legacy_layout_is_version_zero(volume):
+    write_collection(volume / "sr_corpus", TEXTS_V1)
+    store = IndexVersionStore(str(volume))
+
+    manifest = store.read_manifest("sr_corpus")
+    assert manifest["active"] == LEGACY_VERSION
+    assert manifest["versions"][str(LEGACY_VERSION)]["status"] == ACTIVE
+    assert store.active_dir("sr_corpus") == volume / "sr_corpus"
+    assert store.read_manifest("missing")["active"] is None
+
+
+def test_stage_moves_files_into_new_version(volume, tmp_path):
+    store = IndexVersionStore(str(volume))
+    files = upload(tmp_path / "upload", TEXTS_V1)
+
+    version = store.stage("sr_corpus", files)
+
+    assert version == 1
+    assert (volume / "sr_corpus" / "v1" / "index.faiss").exists()
+    assert not files["index.faiss"].exists()
+    assert not list((volume / "sr_corpus").glob(".v*.tmp"))
+    manifest = json.loads((volume / "sr_corpus" / VERSIONS_FILE).read_text(encoding="utf-8"))
+    assert manifest["active"] is None and manifest["versions"]["1"]["status"] == STAGED
+    assert store.stage("sr_corpus", upload(tmp_path / "upload2", TEXTS_V2)) == 2
+
+
+def test_activate_records_previous_and_retires_it(volume, tmp_path):
+    store = IndexVersionStore(str(volume))
+    store.stage("sr_corpus", upload(tmp_path / "a", TEXTS_V1))
+    store.stage("sr_corpus", upload(tmp_path / "b", TEXTS_V2))
+
+    assert store.activate("sr_corpus", 1) is None
+    assert store.activate("sr_corpus", 2, {"vectors": 3}) == 1
+
+    manifest = store.read_manifest("sr_corpus")
+    assert (manifest["active"], manifest["previous"]) == (2, 1)
+    assert manifest["versions"]["1"]["status"] == RETIRED
+    assert manifest["versions"]["2"]["status"] == ACTIVE and manifest["versions"]["2"]["vectors"] == 3
+    with pytest.raises(KeyError):
+        store.activate("sr_corpus", 9)
+
+
+def test_mark_failed_never_touches_active_version(volume, tmp_path):
+    store = IndexVersionStore(str(volume))
+    store.stage("sr_corpus", upload(tmp_path / "a", TEXTS_V1))
+    store.stage("sr_corpus", upload(tmp_path / "b", TEXTS_V2))
+    store.activate("sr_corpus", 1)
+
+    store.mark_failed("sr_corpus", 1, "boom")
+    store.mark_failed("sr_corpus", 2, "boom")
+
+    versions = store.read_manifest("sr_corpus")["versions"]
+    assert versions["1"]["status"] == ACTIVE
+    assert (versions["2"]["status"], versions["2"]["error"]) == (FAILED, "boom")
+
+
+def test_gc_keeps_active_previous_and_in_use_versions(volume, tmp_path):
+    store = IndexVersionStore(str(volume))
+    for i, texts in enumerate([TEXTS_V1, TEXTS_V2, TEXTS_V1, TEXTS_V2]):
+        store.stage("sr_corpus", upload(tmp_path / f"u{i}", texts, seed=i))
+    for version in (1, 2, 3):
+        store.activate("sr_corpus", version)
+    store.mark_failed("sr_corpus", 4, "boom")
+    # v1 retired (메모리 사용 중), v2 previous, v3 active, v4 failed
+
+    assert store.gc("sr_corpus", in_use={1}) == [4]
+    assert not (volume / "sr_corpus" / "v4").exists()
+    assert store.gc("sr_corpus", in_use=set()) == [1]
+    assert sorted(store.read_manifest("sr_corpus")["versions"]) == ["2", "3"]
+    assert (volume / "sr_corpus" / "v2").exists() and (volume / "sr_corpus" / "v3").exists()
+
+
+def test_publish_swaps_to_new_version_and_rollback_restores(registry, volume, tmp_path):
+    write_collection(volume / "sr_corpus", TEXTS_V1)
+    with registry.acquire("sr_corpus") as legacy:
+        assert legacy.version == LEGACY_VERSION
+
+        registry.publish("sr_corpus", upload(tmp_path / "upload", TEXTS_V2, seed=1)).result(timeout=30)
+        # 교체 전에 획득한 핸들은 기존 컬렉션을 계속 사용
+        assert legacy.collection.index.ntotal == len(TEXTS_V1)
+        assert legacy.stale
+
+    with registry.acquire("sr_corpus") as current:
+        assert current.version == 1 and current.collection.index.ntotal == len(TEXTS_V2)
+
+    registry.rollback("sr_corpus").result(timeout=30)
+    with registry.acquire("sr_corpus") as restored:
+        assert restored.version == LEGACY_VERSION and restored.collection.index.ntotal == len(TEXTS_V1)
+    manifest = registry.version_report("sr_corpus")
+    assert (manifest["active"], manifest["previous"]) == (LEGACY_VERSION, 1)
+    # 기존 배포 파일은 gc 대상이 아님
+    assert (volume / "sr_corpus" / "index.faiss").exists()
+
+
+def test_invalid_version_is_marked_failed_and_old_version_kept(registry, volume, tmp_path):
+    write_collection(volume / "sr_corpus", TEXTS_V1)
+    registry.acquire("sr_corpus").release()
+
+    files = upload(tmp_path / "upload", TEXTS_V2)
+    files.pop(DOC_STORE_DIR_NAME)
+    with pytest.raises(FileNotFoundError):
+        registry.publish("sr_corpus", files).result(timeout=30)
+
+    report = registry.version_report("sr_corpus")
+    assert report["active"] == LEGACY_VERSION and report["loaded"] == LEGACY_VERSION
+    assert report["versions"]["1"]["status"] == FAILED
+    # 활성화된 적이 없으므로 롤백할 이전 버전도 없음
+    with pytest.raises(ValueError):
+        registry.rollback("sr_corpus")
@@ -0,0 +1,114 @@
+"""검색 캐시: 바이트 상한 LRU / 쿼리 임베딩 캐시 / 결과 캐시 무효화"""
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.domain.rag import retrieval_cache as cache_module
+from app.domain.rag.retrieval_cache import ByteBoundedLRU, RetrievalCache, normalize_query
+
+OVERHEAD = cache_module._ENTRY_OVERHEAD
+
+
+class CountingEmbedder:
+    model_name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed(self, query: str) -> np.ndarray:
+        self.calls += 1
+        return np.full((1, 4), float(len(query)), dtype="float32")
+
+
+def collection(name: str, version: int) -> SimpleNamespace:
+    return SimpleNamespace(name=name, version=version)
+
+
+def test_lru_evicts_least_recently_used_by_bytes():
+    lru = ByteBoundedLRU("test", max_bytes=3 * (OVERHEAD + 10))
+    for key in ("a", "b", "c"):
+        lru.put(key, key.upper(), 10)
+    assert lru.get("a") == "A"
+    lru.put("d", "D", 10)
+
+    assert lru.get("b") is None
+    assert [lru.get(key) for key in ("a", "c", "d")] == ["A", "C", "D"]
+    stats = lru.stats()
+    assert stats["evictions"] == 1 and stats["bytes"] == 3 * (OVERHEAD + 10)
+
+
+def test_lru_replaces_existing_key_and_skips_oversized_values():
+    lru = ByteBoundedLRU("test", max_bytes=OVERHEAD + 100)
+    lru.put("a", 1, 10)
+    lru.put("a", 2, 20)
+    assert lru.get("a") == 2 and lru.stats()["bytes"] == OVERHEAD + 20
+
+    lru.put("big", 3, 101)
+    assert lru.get("big") is None and lru.get("a") == 2
+
+
+def test_lru_invalidate_by_predicate():
+    lru = ByteBoundedLRU("test", max_bytes=10_000)
+    for key in ("x1", "x2", "y1"):
+        lru.put(key, key, 1)
+    assert lru.invalidate(lambda key: key.startswith("x")) == 2
+    assert lru.get("y1") == "y1" and lru.stats()["bytes"] == OVERHEAD + 1
+
+
+def test_disabled_lru_stores_nothing():
+    lru = ByteBoundedLRU("test", max_bytes=0)
+    lru.put("a", 1, 1)
+    assert not lru.enabled and lru.get("a") is None
+
+
+def test_embedding_cache_normalizes_query_and_returns_copies():
+    cache = RetrievalCache()
+    embedder = CountingEmbedder()
+
+    first = cache.embed(embedder, "기후  리스크")
+    first[:] = -1
+    second = cache.embed(embedder, " 기후 리스크 ")
+
+    assert embedder.calls == 1
+    assert normalize_query(" 기후\t리스크 ") == "기후 리스크"
+    assert (second >= 0).all()
+
+
+def test_result_key_includes_version_filters_and_mode():
+    cache = RetrievalCache()
+    base = cache.result_key([collection("a", 1)], "질의", 5, None, "hybrid")
+    assert base == cache.result_key([collection("a", 1)], " 질의 ", 5, None, "hybrid")
+    assert base != cache.result_key([collection("a", 2)], "질의", 5, None, "hybrid")
+    assert base != cache.result_key([collection("a", 1)], "질의", 5, {"year": 2023}, "hybrid")
+    assert base != cache.result_key([collection("a", 1)], "질의", 5, None, "dense")
+    assert (cache.result_key([collection("a", 1), collection("b", 1)], "질의", 5, None, "hybrid")
+            == cache.result_key([collection("b", 1), collection("a", 1)], "질의", 5, None, "hybrid"))
+
+
+def test_invalidate_collection_drops_its_results_and_embeddings():
+    cache = RetrievalCache()
+    embedder = CountingEmbedder()
+    cache.embed(embedder, "질의")
+    key_a = cache.result_key([collection("a", 1)], "질의", 5, None, "hybrid")
+    key_b = cache.result_key([collection("b", 1)], "질의", 5, None, "hybrid")
+    cache.put_results(key_a, [("a", 0, 0.5, 0.9, None, {"dense": 1})])
+    cache.put_results(key_b, [("b", 0, 0.5, 0.9, None, {"dense": 1})])
+
+    cache.invalidate_collection("a")
+
+    assert cache.get_results(key_a) is None
+    assert cache.get_results(key_b) is not None
+    cache.embed(embedder, "질의")
+    assert embedder.calls == 2
+
+
+def test_results_stored_before_invalidation_are_not_served_after():
+    """무효화 전에 시작된 검색이 뒤늦게 저장한 결과는 새 세대 키로 조회되지 않음"""
+    cache = RetrievalCache()
+    stale_key = cache.result_key([collection("a", 1)], "질의", 5, None, "hybrid")
+    cache.invalidate_collection("a")
+    cache.put_results(stale_key, [("a", 0, 0.5, 0.9, None, {})])
+
+    fresh_key = cache.result_key([collection("a", 1)], "질의", 5, None, "hybrid")
+    assert fresh_key != stale_key
+    assert cache.get_results(fresh_key) is None
@@ -0,0 +1,56 @@
+"""
+Single-flight 요청 병합
+- 같은 키로 동시에 들어온 멱등 요청은 한 번만 실행하고 결과를 모든 대기자에게 전달
+- 실행은 별도 태스크로 분리되어 최초 요청자가 연결을 끊어도 나머지 대기자는 결과를 받음
+- 완료 즉시 키를 해제하므로 결과를 보관하지 않음 (캐시가 아님)
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """키 단위 in-flight 요청 병합기"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.executed = 0   # 실제 실행 횟수
+        self.collapsed = 0  # 진행 중인 실행에 합류한 요청 수
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """진행 중인 같은 키의 실행이 있으면 합류, 없으면 fn 실행"""
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda done, key=key: self._forget(key, done))
+            self.executed += 1
+        else:
+            self.collapsed += 1
+            logger.debug(f"single-flight 합류: {key}")
+        # 대기자 한 명이 취소되어도 공유 실행은 취소하지 않음
+        return await asyncio.shield(call)
+
+    def _forget(self, key: Hashable, done: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is done:
+            del self._calls[key]
+        if not done.cancelled():
+            # 모든 대기자가 떠난 뒤 실패한 경우 미회수 예외 경고 방지
+            done.exception()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.executed + self.collapsed
+        return {
+            "in_flight": self.in_flight,
+            "executed": self.executed,
+            "collapsed": self.collapsed,
+            "collapse_rate": round(self.collapsed / total, 4) if total else 0.0,
+        }
@@ -12,6 +12,7 @@ from app.common.database.database import get_db
 import os
 
 from app.domain.tcfd.service.tcfd_service import TCFDService
+from app.common.utility.single_flight import SingleFlight
 from app.domain.tcfd.model.tcfd_model import (
     CompanyInfoRequest, FinancialDataRequest, RiskAssessmentRequest,
     TCFDAnalysisResponse, RiskAssessmentResponse, ReportGenerationResponse
@@ -24,6 +25,8 @@ from ...auth.auth_middleware import get_current_user
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/tcfd", tags=["TCFD"])
 tcfd_service = TCFDService()
+# 동시에 들어온 동일 조회(차트 렌더링, 재무정보 DB 조회) 1회 실행으로 병합
+single_flight = SingleFlight()
 
 # TCFD 표준 정보 조회 엔드포인트 추가 (인증 필요)
 @router.get("/standards", response_model=TCFDStandardsListResponse, summary="TCFD 표준 정보 전체 조회")
@@ -89,6 +92,7 @@ async def health_check():
         "status": "healthy",
         "service": "tcfd-service",
         "architecture": "MSV Pattern with Layered Architecture",
+        "single_flight": single_flight.stats(),
         "layers": [
             "Controller Layer - TCFD API 엔드포인트",
             "Service Layer - TCFD 비즈니스 로직",
@@ -164,7 +168,10 @@ async def get_all_companies():
 async def get_company_financial_data_by_query(company_name: str = Query(...)):
     """쿼리 파라미터로 회사별 재무정보 조회 (Gateway 호환용)"""
     try:
-        result = await tcfd_service.get_company_financial_data(company_name)
+        result = await single_flight.do(
+            ("company-financial-data", company_name),
+            lambda: tcfd_service.get_company_financial_data(company_name),
+        )
         return result
         
     except Exception as e:
@@ -308,14 +315,22 @@ async def generate_climate_chart_image(
         # controller = TCFDController() # This line was removed as per the new_code, as TCFDController is not defined.
         # Assuming the intent was to call a service method directly or that TCFDController is meant to be imported.
         # For now, I'll call tcfd_service directly as TCFDController is not defined.
-        result = await tcfd_service.generate_climate_chart_image(
-            scenario_code=scenario_code,
-            variable_code=variable_code,
-            start_year=start_year,
-            end_year=end_year,
-            additional_years=additional_years,
-            region=region,  # 행정구역 파라미터 추가
-            current_user=current_user
+        # 차트는 사용자와 무관하므로 조회 조건만으로 병합 (matplotlib 렌더링 중복 방지)
+        key = (
+            "chart-image", scenario_code, variable_code, start_year, end_year,
+            tuple(sorted(set(additional_years or []))), region,
+        )
+        result = await single_flight.do(
+            key,
+            lambda: tcfd_service.generate_climate_chart_image(
+                scenario_code=scenario_code,
+                variable_code=variable_code,
+                start_year=start_year,
+                end_year=end_year,
+                additional_years=additional_years,
+                region=region,  # 행정구역 파라미터 추가
+                current_user=current_user
+            ),
         )
         return result
     except Exception as e: